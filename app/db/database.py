@@ -3,14 +3,40 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 
 from typing import AsyncGenerator
 
+from app.db.query_monitor import SlowQueryMonitor
+from app.db.sqlite import embedded_db, is_file_database, is_sqlite_url
 
 
-DATABASE_URL = os.getenv("DATABASE_URL")
+
+# DATABASE_URL이 없고 SQLITE_PATH가 있으면 MySQL 없이 SQLite 파일 하나로 실행 (임베디드 모드)
+DATABASE_URL = os.getenv("DATABASE_URL") or (
+    f"sqlite+aiosqlite:///{os.getenv('SQLITE_PATH')}" if os.getenv("SQLITE_PATH") else None
+)
 
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL 환경 변수가 설정되지 않았습니다.")
 
-engine = create_async_engine(DATABASE_URL, echo=True)
+# 모든 SQL을 출력하는 echo는 처리량을 떨어뜨리므로 필요할 때만 켭니다.
+SQL_ECHO = os.getenv("SQL_ECHO", "false").lower() in ("1", "true", "yes", "on")
+
+EMBEDDED = is_sqlite_url(DATABASE_URL)
+
+if EMBEDDED:
+    # WAL/mmap 등 PRAGMA 적용, 파일 DB는 읽기 전용 연결 풀을 따로 둠 (메모리 DB는 연결 하나를 공유)
+    engine = embedded_db.create_engine(DATABASE_URL, echo=SQL_ECHO)
+    read_engine = (
+        embedded_db.create_engine(DATABASE_URL, read_only=True, echo=SQL_ECHO)
+        if is_file_database(DATABASE_URL) else engine
+    )
+else:
+    engine = create_async_engine(DATABASE_URL, echo=SQL_ECHO)
+    read_engine = engine
+
+# 느린 쿼리 로그 (SLOW_QUERY_THRESHOLD_MS, SLOW_QUERY_EXPLAIN, SLOW_QUERY_BUFFER_SIZE)
+slow_query_monitor = SlowQueryMonitor.from_env()
+slow_query_monitor.attach(engine)
+if read_engine is not engine:
+    slow_query_monitor.attach(read_engine)
 
 
 AsyncSessionLocal = async_sessionmaker(
@@ -19,6 +45,13 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# 검색/조회 전용 세션 (임베디드 파일 DB에서는 읽기 풀, 그 밖에는 AsyncSessionLocal과 같은 엔진)
+ReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
@@ -31,7 +64,24 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
         finally:
             await session.close()
 
+
+async def get_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """읽기 전용 요청(검색/조회)용 세션"""
+    async with ReadSessionLocal() as session:
+        try:
+            yield session
+
+        except Exception:
+            await session.rollback()
+            raise
+        finally:
+            await session.close()
+
+
 async def init_db():
     from app.db.base import Base 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all) 
\ No newline at end of file
+        await conn.run_sync(Base.metadata.create_all)
+        # 임베디드 모드는 FTS5 상표명 색인과 동기화 트리거도 준비
+        if EMBEDDED and await conn.run_sync(embedded_db.init_schema):
+            embedded_db.mark_fts_ready(engine, read_engine)
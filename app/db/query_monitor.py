@@ -0,0 +1,171 @@
+import heapq
+import itertools
+import logging
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger("app.db.slow_query")
+
+# 정규화에 사용하는 패턴 (문자열/숫자 리터럴, IN 목록, 공백)
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*(?:\?|%s|:\w+)\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+# 파라미터 로그 최대 길이 (긴 IN 목록 등이 로그를 오염시키지 않도록)
+MAX_PARAMETER_REPR = 500
+
+
+def normalize_sql(statement: str) -> str:
+    """SQL 문을 비교 가능한 형태로 정규화 (리터럴 치환, 공백 압축)"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass
+class SlowQueryRecord:
+    """느린 쿼리 한 건의 기록"""
+    statement: str
+    parameters: str
+    elapsed_ms: float
+    executed_at: str
+    explain: Optional[List[Any]] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class SlowQueryMonitor:
+    """
+    SQLAlchemy 커서 이벤트로 각 SQL 문의 실행 시간을 측정하는 모니터
+
+    임계값을 넘은 문장은 정규화된 SQL과 파라미터를 로그로 남기고,
+    가장 느린 문장 상위 N개를 링 버퍼(최소 힙)로 보관합니다.
+    """
+    threshold_ms: float = 200.0
+    capture_explain: bool = False
+    buffer_size: int = 50
+    total_statements: int = 0
+    slow_statements: int = 0
+    _worst: List[Any] = field(default_factory=list, repr=False)
+    _sequence: Any = field(default_factory=itertools.count, repr=False)
+    _lock: Any = field(default_factory=threading.Lock, repr=False)
+
+    @classmethod
+    def from_env(cls) -> "SlowQueryMonitor":
+        """환경 변수로부터 모니터 생성"""
+        return cls(
+            threshold_ms=float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200")),
+            capture_explain=_env_flag("SLOW_QUERY_EXPLAIN"),
+            buffer_size=int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "50")),
+        )
+
+    def attach(self, engine: Any) -> None:
+        """엔진(동기/비동기)에 이벤트 리스너 등록"""
+        sync_engine: Engine = getattr(engine, "sync_engine", engine)
+        event.listen(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def detach(self, engine: Any) -> None:
+        """엔진에서 이벤트 리스너 제거"""
+        sync_engine: Engine = getattr(engine, "sync_engine", engine)
+        event.remove(sync_engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(sync_engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start_times = conn.info.get("query_start_time")
+        if not start_times:
+            return
+        elapsed_ms = (time.perf_counter() - start_times.pop()) * 1000
+
+        with self._lock:
+            self.total_statements += 1
+        if elapsed_ms < self.threshold_ms:
+            return
+
+        explain = None
+        if self.capture_explain and not executemany:
+            explain = self._capture_explain(conn, statement, parameters)
+
+        parameters_repr = repr(parameters)
+        if len(parameters_repr) > MAX_PARAMETER_REPR:
+            parameters_repr = parameters_repr[:MAX_PARAMETER_REPR] + "..."
+
+        record = SlowQueryRecord(
+            statement=normalize_sql(statement),
+            parameters=parameters_repr,
+            elapsed_ms=round(elapsed_ms, 3),
+            executed_at=datetime.now().isoformat(timespec="seconds"),
+            explain=explain,
+        )
+        self._remember(record)
+        logger.warning(
+            "느린 쿼리 감지 (%.1fms): %s | params=%s",
+            elapsed_ms, record.statement, record.parameters
+        )
+
+    def _capture_explain(self, conn, statement: str, parameters: Any) -> Optional[List[Any]]:
+        """같은 연결에서 EXPLAIN을 실행해 실행 계획을 수집 (SELECT 문에 한함)"""
+        if not statement.lstrip().upper().startswith("SELECT"):
+            return None
+
+        prefix = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+        explain_cursor = None
+        try:
+            # 원시 DBAPI 커서를 사용하므로 이벤트가 다시 발생하지 않습니다.
+            explain_cursor = conn.connection.cursor()
+            explain_cursor.execute(prefix + statement, parameters)
+            return [list(row) for row in explain_cursor.fetchall()]
+        except Exception as e:
+            logger.debug("EXPLAIN 수집 실패: %s", e)
+            return None
+        finally:
+            if explain_cursor is not None:
+                explain_cursor.close()
+
+    def _remember(self, record: SlowQueryRecord) -> None:
+        """상위 N개의 가장 느린 문장만 유지"""
+        with self._lock:
+            self.slow_statements += 1
+            entry = (record.elapsed_ms, next(self._sequence), record)
+            if len(self._worst) < self.buffer_size:
+                heapq.heappush(self._worst, entry)
+            elif self._worst and entry[0] > self._worst[0][0]:
+                heapq.heapreplace(self._worst, entry)
+
+    def snapshot(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """가장 느린 순서로 정렬된 기록 반환"""
+        with self._lock:
+            records = [entry[2] for entry in sorted(self._worst, key=lambda e: e[0], reverse=True)]
+        if limit is not None:
+            records = records[:limit]
+        return [record.to_dict() for record in records]
+
+    def reset(self) -> None:
+        """기록 및 통계 초기화"""
+        with self._lock:
+            self._worst.clear()
+            self.total_statements = 0
+            self.slow_statements = 0
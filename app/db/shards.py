@@ -0,0 +1,137 @@
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.db.sqlite import embedded_db, is_sqlite_url
+
+
+# 샤드 키: 출원 연도 구간(2000-2009, -1999, 2010-, 2015) 또는 관할(KR, US 등 연도가 아닌 이름)
+_YEAR_RANGE = re.compile(r"^(\d{4})?-(\d{4})?$|^(\d{4})$")
+
+
+@dataclass
+class Shard:
+    """검색 대상 샤드 하나 (연도 샤드는 출원일 조건으로 대상에서 제외할 수 있음)"""
+    name: str
+    url: str
+    year_from: Optional[int] = None
+    year_to: Optional[int] = None
+    engine: Optional[AsyncEngine] = None
+    session_factory: Any = None
+
+    @property
+    def by_year(self) -> bool:
+        return self.year_from is not None or self.year_to is not None
+
+    def may_contain(self, year_from: Optional[int], year_to: Optional[int]) -> bool:
+        """출원 연도 구간 [year_from, year_to]의 행을 가질 수 있는지 (관할 샤드는 항상 True)"""
+        if not self.by_year:
+            return True
+        if year_from is not None and self.year_to is not None and self.year_to < year_from:
+            return False
+        if year_to is not None and self.year_from is not None and self.year_from > year_to:
+            return False
+        return True
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"name": self.name, "year_from": self.year_from, "year_to": self.year_to}
+
+
+def parse_shard(spec: str) -> Shard:
+    """`키=URL` 형식의 샤드 설정 한 항목 해석"""
+    key, separator, url = spec.partition("=")
+    key, url = key.strip(), url.strip()
+    if not separator or not key or not url:
+        raise ValueError(f"샤드 설정 형식이 잘못되었습니다 (키=URL): {spec!r}")
+    match = _YEAR_RANGE.match(key)
+    if match is None:
+        return Shard(name=key, url=url)
+    if match.group(3):
+        year = int(match.group(3))
+        return Shard(name=key, url=url, year_from=year, year_to=year)
+    if not match.group(1) and not match.group(2):
+        raise ValueError(f"샤드 연도 구간이 비어 있습니다: {spec!r}")
+    return Shard(
+        name=key,
+        url=url,
+        year_from=int(match.group(1)) if match.group(1) else None,
+        year_to=int(match.group(2)) if match.group(2) else None,
+    )
+
+
+class ShardRegistry:
+    """
+    설정된 샤드 DB 엔진 모음
+
+    SEARCH_SHARDS에 `키=URL` 항목을 세미콜론(또는 줄바꿈)으로 나열하면 샤드 모드가 켜집니다.
+    예: `-2009=mysql+aiomysql://.../tm_old;2010-=mysql+aiomysql://.../tm_new;US=mysql+aiomysql://.../tm_us`
+    """
+
+    def __init__(self, shards: Optional[List[Shard]] = None, timeout_ms: int = 2000, max_result_window: int = 10000):
+        self.shards: List[Shard] = shards or []
+        self.timeout_ms = timeout_ms
+        # 샤드마다 상위 (offset + size)건을 읽으므로 깊은 페이지 요청의 상한
+        self.max_result_window = max_result_window
+        names = [shard.name for shard in self.shards]
+        if len(set(names)) != len(names):
+            raise ValueError(f"샤드 이름이 중복되었습니다: {names}")
+
+    @classmethod
+    def from_env(cls) -> "ShardRegistry":
+        specs = re.split(r"[;\n]", os.getenv("SEARCH_SHARDS", ""))
+        return cls(
+            [parse_shard(spec) for spec in specs if spec.strip()],
+            timeout_ms=int(os.getenv("SHARD_TIMEOUT_MS", "2000")),
+            max_result_window=int(os.getenv("SHARD_MAX_RESULT_WINDOW", "10000")),
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.shards)
+
+    def connect(self) -> None:
+        """샤드마다 엔진과 세션 팩토리 생성 (이미 연결된 샤드는 유지)"""
+        for shard in self.shards:
+            if shard.session_factory is None:
+                # SQLite 샤드는 임베디드 모드와 같은 PRAGMA/연결 풀 사용
+                shard.engine = (
+                    embedded_db.create_engine(shard.url) if is_sqlite_url(shard.url)
+                    else create_async_engine(shard.url)
+                )
+                shard.session_factory = async_sessionmaker(
+                    bind=shard.engine, class_=AsyncSession, expire_on_commit=False
+                )
+
+    async def init_db(self) -> None:
+        """각 샤드에 테이블 생성"""
+        from app.db.base import Base
+        for shard in self.shards:
+            async with shard.engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+                if is_sqlite_url(shard.url) and await conn.run_sync(embedded_db.init_schema):
+                    embedded_db.mark_fts_ready(shard.engine)
+
+    async def dispose(self) -> None:
+        for shard in self.shards:
+            if shard.engine is not None:
+                await shard.engine.dispose()
+                shard.engine = None
+                shard.session_factory = None
+
+    def select(self, year_from: Optional[int] = None, year_to: Optional[int] = None) -> List[Shard]:
+        """출원 연도 조건으로 행이 있을 수 있는 샤드만 선택"""
+        return [shard for shard in self.shards if shard.may_contain(year_from, year_to)]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "timeout_ms": self.timeout_ms,
+            "shards": [shard.to_dict() for shard in self.shards],
+        }
+
+
+# 프로세스 전역 샤드 설정 (SEARCH_SHARDS가 비어 있으면 단일 DB 모드)
+shard_registry = ShardRegistry.from_env()
@@ -0,0 +1,190 @@
+import os
+import weakref
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+
+# 상표명 부분 일치 검색용 FTS5 색인 (trademarks 테이블을 외부 콘텐츠로 사용, 트리거로 동기화)
+NAME_FTS_TABLE = "trademark_name_fts"
+
+# trigram 토크나이저는 세 글자 단위로 색인하므로 그보다 짧은 검색어는 LIKE로 처리
+FTS_MIN_KEYWORD_LENGTH = 3
+
+_NAME_FTS_DDL = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {NAME_FTS_TABLE} USING fts5(
+    productName, productNameEng,
+    content='trademarks', content_rowid='id', tokenize='trigram'
+)
+"""
+
+_NAME_FTS_TRIGGERS = {
+    f"{NAME_FTS_TABLE}_ai": f"""
+        CREATE TRIGGER {NAME_FTS_TABLE}_ai AFTER INSERT ON trademarks BEGIN
+            INSERT INTO {NAME_FTS_TABLE}(rowid, productName, productNameEng)
+            VALUES (new.id, new.productName, new.productNameEng);
+        END
+    """,
+    f"{NAME_FTS_TABLE}_ad": f"""
+        CREATE TRIGGER {NAME_FTS_TABLE}_ad AFTER DELETE ON trademarks BEGIN
+            INSERT INTO {NAME_FTS_TABLE}({NAME_FTS_TABLE}, rowid, productName, productNameEng)
+            VALUES ('delete', old.id, old.productName, old.productNameEng);
+        END
+    """,
+    f"{NAME_FTS_TABLE}_au": f"""
+        CREATE TRIGGER {NAME_FTS_TABLE}_au AFTER UPDATE OF productName, productNameEng ON trademarks BEGIN
+            INSERT INTO {NAME_FTS_TABLE}({NAME_FTS_TABLE}, rowid, productName, productNameEng)
+            VALUES ('delete', old.id, old.productName, old.productNameEng);
+            INSERT INTO {NAME_FTS_TABLE}(rowid, productName, productNameEng)
+            VALUES (new.id, new.productName, new.productNameEng);
+        END
+    """,
+}
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def is_sqlite_url(url: Optional[str]) -> bool:
+    return bool(url) and make_url(url).get_backend_name() == "sqlite"
+
+
+def is_file_database(url: str) -> bool:
+    database = make_url(url).database
+    return bool(database) and database != ":memory:" and not database.startswith("file::memory:")
+
+
+def fts_match_query(keyword: str) -> str:
+    """검색어를 FTS5 구문 검색식으로 변환 (trigram 구문 일치 = 부분 문자열 일치)"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+@dataclass
+class EmbeddedDatabase:
+    """
+    SQLite 임베디드 모드 설정
+
+    MySQL 없이 단일 노드로 서비스할 때 사용합니다. 연결마다 WAL 저널, mmap 읽기, 페이지 캐시 등의
+    PRAGMA를 적용하고, 파일 DB는 쓰기 엔진과 별도로 읽기 전용(query_only) 연결 풀을 둡니다.
+    WAL에서는 읽기가 쓰기를 막지 않으므로 검색/조회 요청은 읽기 풀에서 동시에 실행됩니다.
+    상표명 검색은 trigram FTS5 색인으로 처리합니다.
+    """
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size_kb: int = 64 * 1024
+    busy_timeout_ms: int = 5000
+    synchronous: str = "NORMAL"
+    read_pool_size: int = 8
+    write_pool_size: int = 2
+    fts_enabled: bool = True
+
+    def __post_init__(self):
+        # FTS 색인이 준비된 엔진 (읽기/쓰기 엔진을 각각 등록)
+        self._fts_engines: "weakref.WeakSet[Any]" = weakref.WeakSet()
+
+    @classmethod
+    def from_env(cls) -> "EmbeddedDatabase":
+        return cls(
+            mmap_size=int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),
+            cache_size_kb=int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024))),
+            busy_timeout_ms=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", "NORMAL").upper(),
+            read_pool_size=int(os.getenv("SQLITE_READ_POOL_SIZE", "8")),
+            write_pool_size=int(os.getenv("SQLITE_WRITE_POOL_SIZE", "2")),
+            fts_enabled=_env_flag("SQLITE_FTS_ENABLED", True),
+        )
+
+    def pragmas(self, read_only: bool = False) -> List[str]:
+        statements = [
+            "PRAGMA journal_mode=WAL",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            # 음수는 KiB 단위 페이지 캐시 크기
+            f"PRAGMA cache_size=-{self.cache_size_kb}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+        if read_only:
+            statements.append("PRAGMA query_only=ON")
+        return statements
+
+    def create_engine(self, url: str, read_only: bool = False, **options: Any) -> AsyncEngine:
+        """PRAGMA를 적용하는 SQLite 엔진 생성 (파일 DB는 연결을 풀에 유지)"""
+        if is_file_database(url):
+            # aiosqlite 파일 DB의 기본 풀(NullPool)은 요청마다 연결과 스레드를 새로 만듦
+            options.setdefault("poolclass", AsyncAdaptedQueuePool)
+            options.setdefault("pool_size", self.read_pool_size if read_only else self.write_pool_size)
+            options.setdefault("max_overflow", 0)
+        engine = create_async_engine(url, **options)
+        statements = self.pragmas(read_only)
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def _apply_pragmas(dbapi_connection: Any, connection_record: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+
+        return engine
+
+    def init_schema(self, conn: Connection) -> bool:
+        """
+        FTS5 상표명 색인과 동기화 트리거 생성 (conn.run_sync로 호출, 색인 사용 가능 여부 반환)
+
+        트리거가 없으면(새 DB이거나 trademarks 테이블을 다시 만든 경우) 트리거를 만들고
+        현재 테이블 내용으로 색인을 다시 구축합니다.
+        """
+        if not self.fts_enabled:
+            return False
+        conn.exec_driver_sql(_NAME_FTS_DDL)
+        existing = {
+            row[0] for row in conn.exec_driver_sql(
+                "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'trademarks'"
+            )
+        }
+        missing = [name for name in _NAME_FTS_TRIGGERS if name not in existing]
+        for name in missing:
+            conn.exec_driver_sql(_NAME_FTS_TRIGGERS[name])
+        if missing:
+            conn.exec_driver_sql(f"INSERT INTO {NAME_FTS_TABLE}({NAME_FTS_TABLE}) VALUES ('rebuild')")
+        return True
+
+    def mark_fts_ready(self, *engines: AsyncEngine) -> None:
+        for engine in engines:
+            self._fts_engines.add(engine.sync_engine)
+
+    def fts_ready(self, bind: Any) -> bool:
+        """세션이 연결된 엔진에서 FTS 상표명 색인을 사용할 수 있는지"""
+        sync_engine = getattr(bind, "sync_engine", None)
+        return sync_engine is not None and sync_engine in self._fts_engines
+
+
+def optimize_for_distribution(conn: Connection) -> None:
+    """
+    미리 구축한 DB 파일을 배포용으로 정리 (AUTOCOMMIT 연결에서 conn.run_sync로 호출)
+
+    통계를 수집하고 FTS 색인 세그먼트를 병합한 뒤, WAL을 본 파일에 반영하고 저널 모드를
+    DELETE로 바꿔 파일 하나로 복사할 수 있게 합니다. 서비스가 파일을 열면 다시 WAL로 전환합니다.
+    """
+    conn.exec_driver_sql("ANALYZE")
+    has_fts = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": NAME_FTS_TABLE}
+    ).first()
+    if has_fts:
+        conn.exec_driver_sql(f"INSERT INTO {NAME_FTS_TABLE}({NAME_FTS_TABLE}) VALUES ('optimize')")
+    conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.exec_driver_sql("PRAGMA journal_mode=DELETE")
+    conn.exec_driver_sql("VACUUM")
+
+
+# 프로세스 전역 임베디드 DB 설정 (DATABASE_URL이 sqlite일 때 사용)
+embedded_db = EmbeddedDatabase.from_env()
@@ -1,15 +1,64 @@
+import asyncio
 from fastapi import FastAPI
 from contextlib import asynccontextmanager
-from app.db.database import init_db
-from app.routers import trademark_routes
+from app.db.database import init_db, AsyncSessionLocal, ReadSessionLocal
+from app.db.shards import shard_registry
+from app.routers import trademark_routes, admin_routes, export_routes, watch_routes
+from app.services.query_planner import column_statistics_cache
+from app.services.dataset_version import dataset_version_cache
+from app.middleware.admission_control import (
+    ADMISSION_CONTROL_ENABLED,
+    AdmissionControlMiddleware,
+    admission_controller,
+)
+from app.search_index.manager import search_index_manager
+from app.services.export_jobs import export_worker
+from app.services.prefetch import page_prefetcher
+from app.services.document_store import document_store
+from app.services.trademark_service import search_flight
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("애플리케이션 시작: DB 초기화 시도...")
     await init_db()
+    # 샤드 모드(SEARCH_SHARDS)이면 샤드마다 엔진을 만들고 테이블 생성
+    if shard_registry.enabled:
+        shard_registry.connect()
+        await shard_registry.init_db()
     print("애플리케이션 시작: DB 초기화 완료.")
+    column_statistics_cache.configure(AsyncSessionLocal)
+    await column_statistics_cache.refresh()
+    # 새 데이터셋이 적재되면 컬럼 통계도 다시 읽음
+    dataset_version_cache.configure(AsyncSessionLocal)
+    dataset_version_cache.add_listener(
+        lambda version: asyncio.ensure_future(column_statistics_cache.refresh())
+    )
+    await dataset_version_cache.refresh()
+    # 워커 간 공유되는 검색 인덱스 세그먼트에 연결 (SEARCH_INDEX_ENABLED)
+    current_version = dataset_version_cache.current
+    await search_index_manager.start(
+        AsyncSessionLocal, current_version.version if current_version else None
+    )
+    # 새 데이터셋이 발행되면 다음 인덱스 세대를 백그라운드로 구축해 교체
+    dataset_version_cache.add_listener(search_index_manager.on_dataset_version)
+    # 내보내기 워커 시작 (중단된 작업은 임대가 만료되면 기록된 위치부터 재개)
+    export_worker.start(AsyncSessionLocal)
+    # 적재 시 렌더링한 상표 문서가 있으면 검색/상세 응답에 그대로 사용 (TRADEMARK_DOCUMENTS_ENABLED)
+    document_store.configure(ReadSessionLocal)
+    await document_store.refresh()
+    dataset_version_cache.add_listener(
+        lambda version: asyncio.ensure_future(document_store.refresh())
+    )
+    # 다음 페이지 프리패치는 요청 세션과 별도의 세션 사용 (SEARCH_PREFETCH_ENABLED)
+    page_prefetcher.configure(ReadSessionLocal)
+    # 동일 검색의 공유 실행도 요청 세션과 별도의 세션 사용 (취소된 요청이 실행 종료를 기다리지 않음)
+    search_flight.configure(ReadSessionLocal)
     yield
     print("애플리케이션 종료...")
+    await export_worker.stop()
+    page_prefetcher.clear()
+    search_index_manager.close()
+    await shard_registry.dispose()
 
 app = FastAPI(
     title="상표 검색 API",
@@ -18,8 +67,15 @@ app = FastAPI(
     lifespan=lifespan
 )
 
+# 트래픽 급증 시 DB 커넥션 풀 앞에서 동시 실행 수를 제한하고 초과 요청은 503으로 빠르게 거절
+if ADMISSION_CONTROL_ENABLED:
+    app.add_middleware(AdmissionControlMiddleware, controller=admission_controller)
+
 # 라우터 등록
 app.include_router(trademark_routes.router)
+app.include_router(admin_routes.router)
+app.include_router(export_routes.router)
+app.include_router(watch_routes.router)
 
 @app.get("/health")
 async def health_check():
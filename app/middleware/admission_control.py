@@ -0,0 +1,283 @@
+import asyncio
+import json
+import os
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+INTERACTIVE = "interactive"
+BATCH = "batch"
+# 높은 우선순위부터
+PRIORITIES = (INTERACTIVE, BATCH)
+
+PRIORITY_HEADER = b"x-request-priority"
+
+# 미들웨어 사용 여부 (끄면 일괄 검색도 검색별 슬롯을 받지 않음)
+ADMISSION_CONTROL_ENABLED = os.getenv("ADMISSION_CONTROL_ENABLED", "true").lower() in ("1", "true", "yes", "on")
+
+
+class AdmissionRejected(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과되어 요청을 거절"""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+@dataclass
+class AdmissionRule:
+    """경로 접두사별 동시 실행 제한 설정"""
+    name: str
+    path_prefix: str
+    max_concurrency: int
+    max_queue: int
+    queue_timeout: float
+    # 배치/내보내기 트래픽이 동시에 차지할 수 있는 최대 슬롯 수와 대기열 길이
+    batch_max_concurrency: int
+    batch_max_queue: int
+    # 이 경로의 기본 우선순위 (헤더로는 낮추기만 가능)
+    default_priority: str = INTERACTIVE
+
+
+class PriorityLimiter:
+    """
+    우선순위 대기열을 가진 동시 실행 제한기
+
+    슬롯이 비면 대화형 요청 대기자에게 먼저 넘겨주고, 대화형 대기자가 없을 때만
+    배치 요청을 깨웁니다. 대기열이 가득 차면 즉시 거절합니다.
+    """
+
+    def __init__(self, rule: AdmissionRule):
+        self.rule = rule
+        self.in_flight: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self.admitted: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self.shed_queue_full: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self.shed_timeout: Dict[str, int] = {priority: 0 for priority in PRIORITIES}
+        self._queues: Dict[str, Deque[asyncio.Future]] = {priority: deque() for priority in PRIORITIES}
+
+    @property
+    def total_in_flight(self) -> int:
+        return sum(self.in_flight.values())
+
+    def _max_concurrency(self, priority: str) -> int:
+        if priority == BATCH:
+            return min(self.rule.batch_max_concurrency, self.rule.max_concurrency)
+        return self.rule.max_concurrency
+
+    def _max_queue(self, priority: str) -> int:
+        return self.rule.batch_max_queue if priority == BATCH else self.rule.max_queue
+
+    def _can_start(self, priority: str) -> bool:
+        if self.total_in_flight >= self.rule.max_concurrency:
+            return False
+        return self.in_flight[priority] < self._max_concurrency(priority)
+
+    def _has_waiters_ahead(self, priority: str) -> bool:
+        """같거나 높은 우선순위 대기자가 있으면 새 요청이 새치기하지 않도록 함"""
+        for queued_priority in PRIORITIES:
+            if self._queues[queued_priority]:
+                return True
+            if queued_priority == priority:
+                break
+        return False
+
+    async def acquire(self, priority: str) -> None:
+        """실행 슬롯 확보 (대기열이 가득 차거나 시간이 초과되면 AdmissionRejected)"""
+        if self._can_start(priority) and not self._has_waiters_ahead(priority):
+            self._start(priority)
+            return
+
+        queue = self._queues[priority]
+        if len(queue) >= self._max_queue(priority):
+            self.shed_queue_full[priority] += 1
+            raise AdmissionRejected("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        queue.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, timeout=self.rule.queue_timeout)
+        except asyncio.TimeoutError:
+            self.shed_timeout[priority] += 1
+            raise AdmissionRejected("queue_timeout")
+        except asyncio.CancelledError:
+            # 슬롯을 넘겨받은 직후 취소되었다면 다음 대기자에게 반환
+            if waiter.done() and not waiter.cancelled():
+                self.release(priority)
+            raise
+        finally:
+            if waiter in queue:
+                queue.remove(waiter)
+
+    def _start(self, priority: str) -> None:
+        self.in_flight[priority] += 1
+        self.admitted[priority] += 1
+
+    def release(self, priority: str) -> None:
+        """실행 슬롯 반환 후 우선순위가 높은 대기자부터 깨움"""
+        self.in_flight[priority] -= 1
+        for queued_priority in PRIORITIES:
+            queue = self._queues[queued_priority]
+            while queue and self._can_start(queued_priority):
+                waiter = queue.popleft()
+                if waiter.done():
+                    continue
+                self._start(queued_priority)
+                waiter.set_result(None)
+                return
+
+    def stats(self) -> Dict[str, Any]:
+        """대기열 길이, 실행 중 요청 수, 거절 횟수 반환"""
+        return {
+            "path_prefix": self.rule.path_prefix,
+            "max_concurrency": self.rule.max_concurrency,
+            "in_flight": dict(self.in_flight),
+            "queue_depth": {priority: len(queue) for priority, queue in self._queues.items()},
+            "admitted": dict(self.admitted),
+            "shed_queue_full": dict(self.shed_queue_full),
+            "shed_timeout": dict(self.shed_timeout),
+        }
+
+
+@dataclass
+class AdmissionController:
+    """경로별 제한기 모음 (가장 긴 경로 접두사가 우선)"""
+    rules: List[AdmissionRule] = field(default_factory=list)
+    retry_after_seconds: int = 1
+
+    def __post_init__(self):
+        self.limiters: List[Tuple[AdmissionRule, PriorityLimiter]] = [
+            (rule, PriorityLimiter(rule))
+            for rule in sorted(self.rules, key=lambda rule: len(rule.path_prefix), reverse=True)
+        ]
+
+    def match(self, path: str) -> Optional[PriorityLimiter]:
+        for rule, limiter in self.limiters:
+            if path.startswith(rule.path_prefix):
+                return limiter
+        return None
+
+    def limiter(self, name: str) -> Optional[PriorityLimiter]:
+        """이름으로 제한기 조회 (경로 하나가 여러 제한기의 슬롯을 쓰는 경우)"""
+        for rule, limiter in self.limiters:
+            if rule.name == name:
+                return limiter
+        return None
+
+    def stats(self) -> Dict[str, Any]:
+        return {rule.name: limiter.stats() for rule, limiter in self.limiters}
+
+    def is_overloaded(self) -> bool:
+        """대기열에 요청이 쌓여 있는 제한기가 있는지 여부 (부가 작업 억제에 사용)"""
+        return any(
+            any(limiter._queues[priority] for priority in PRIORITIES)
+            for _, limiter in self.limiters
+        )
+
+
+def _rule_from_env(name: str, path_prefix: str, **defaults: Any) -> AdmissionRule:
+    """ADMISSION_<NAME>_* 환경 변수로 규칙 생성"""
+    prefix = f"ADMISSION_{name.upper()}_"
+    max_concurrency = int(os.getenv(prefix + "MAX_CONCURRENCY", defaults.get("max_concurrency", 32)))
+    max_queue = int(os.getenv(prefix + "MAX_QUEUE", defaults.get("max_queue", 64)))
+    return AdmissionRule(
+        name=name,
+        path_prefix=path_prefix,
+        max_concurrency=max_concurrency,
+        max_queue=max_queue,
+        queue_timeout=float(os.getenv(prefix + "QUEUE_TIMEOUT_SECONDS", defaults.get("queue_timeout", 2.0))),
+        batch_max_concurrency=int(os.getenv(
+            prefix + "BATCH_MAX_CONCURRENCY", defaults.get("batch_max_concurrency", max(1, max_concurrency // 4))
+        )),
+        batch_max_queue=int(os.getenv(
+            prefix + "BATCH_MAX_QUEUE", defaults.get("batch_max_queue", max(1, max_queue // 4))
+        )),
+        default_priority=defaults.get("default_priority", INTERACTIVE),
+    )
+
+
+def default_admission_controller() -> AdmissionController:
+    """
+    환경 변수 기반 기본 제한 규칙 (검색과 단건 조회를 분리)
+
+    일괄 검색은 검색 여러 건을 각자의 연결로 실행하므로 검색 규칙 대신 자체 규칙(배치 우선순위)으로
+    동시 요청 수를 제한하고, 검색 한 건마다 검색 제한기의 배치 슬롯을 받습니다(batch_search).
+    """
+    return AdmissionController(
+        rules=[
+            _rule_from_env(
+                "batch_search", "/api/trademarks/search/batch",
+                max_concurrency=4, max_queue=8, batch_max_concurrency=4, batch_max_queue=8,
+                default_priority=BATCH
+            ),
+            _rule_from_env("search", "/api/trademarks/search", max_concurrency=32, max_queue=64),
+            _rule_from_env("detail", "/api/trademarks", max_concurrency=64, max_queue=128),
+        ],
+        retry_after_seconds=int(os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1")),
+    )
+
+
+class AdmissionControlMiddleware:
+    """
+    DB 앞단의 승인 제어(admission control) ASGI 미들웨어
+
+    경로별 동시 실행 수를 제한하고, 제한을 넘는 요청은 제한된 대기열에서
+    기다리게 합니다. 대기열이 가득 차거나 대기 시간이 초과되면 커넥션 풀에서
+    오래 기다리게 하는 대신 즉시 503과 Retry-After로 응답합니다.
+    `X-Request-Priority: batch` 헤더로 배치/내보내기 트래픽을 구분합니다. 헤더는 경로의 기본 우선순위를
+    낮추는 데만 쓰이므로 배치 경로의 요청이 헤더로 대화형 대기열에 들어갈 수는 없습니다.
+    """
+
+    def __init__(self, app: Any, controller: AdmissionController):
+        self.app = app
+        self.controller = controller
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        limiter = self.controller.match(scope["path"])
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        priority = self._priority_of(scope, limiter.rule)
+        try:
+            await limiter.acquire(priority)
+        except AdmissionRejected as e:
+            await self._reject(send, e.reason)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release(priority)
+
+    def _priority_of(self, scope, rule: AdmissionRule) -> str:
+        for name, value in scope.get("headers", []):
+            if name == PRIORITY_HEADER:
+                priority = value.decode("latin-1").strip().lower()
+                if priority in PRIORITIES and PRIORITIES.index(priority) > PRIORITIES.index(rule.default_priority):
+                    return priority
+        return rule.default_priority
+
+    async def _reject(self, send, reason: str) -> None:
+        body = json.dumps({
+            "detail": "요청이 많아 잠시 후 다시 시도해 주세요.",
+            "reason": reason
+        }, ensure_ascii=False).encode("utf-8")
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", str(self.controller.retry_after_seconds).encode("latin-1")),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+# 애플리케이션 전역 승인 제어기 (관리자 지표 및 부가 작업 억제에서 참조)
+admission_controller = default_admission_controller()
@@ -1 +1,27 @@
-from .trademark import TradeMark
\ No newline at end of file
+from .trademark import TradeMark
+from .column_statistics import ColumnStatistic
+from .dataset_version import DatasetVersion
+from .trademark_identifier import TrademarkIdentifier
+from .trademark_vienna_code import TrademarkViennaCode
+from .trademark_rollup import TrademarkRollup
+from .trademark_signature import TrademarkSignature
+from .trademark_lsh_bucket import TrademarkLshBucket
+from .export_job import ExportJob
+from .saved_query import SavedQuery, WatchNotification
+from .trademark_document import TrademarkDocument
+from .dataset_record import DatasetRecord
+
+
+# 적재할 때마다 다시 만드는 데이터셋 테이블 (load_data.py)
+# 감시 목록 조건/알림, 내보내기 작업, 직전 적재의 레코드 해시는 사용자 상태이므로 포함하지 않음
+DATASET_TABLES = [
+    TradeMark.__table__,
+    TrademarkIdentifier.__table__,
+    TrademarkViennaCode.__table__,
+    TrademarkSignature.__table__,
+    TrademarkLshBucket.__table__,
+    TrademarkDocument.__table__,
+    TrademarkRollup.__table__,
+    ColumnStatistic.__table__,
+    DatasetVersion.__table__,
+]
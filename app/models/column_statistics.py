@@ -0,0 +1,15 @@
+from sqlalchemy import Column, Integer, String
+from app.db.base import Base
+
+
+class ColumnStatistic(Base):
+    """검색 실행 계획 수립에 사용하는 컬럼 통계 (적재 시 갱신)"""
+    __tablename__ = "column_statistics"
+
+    id = Column(Integer, primary_key=True)
+
+    # 통계 종류 (registerStatus, applicationYear, asignProductMainCode, __total__)
+    column_name = Column(String(50), nullable=False, index=True)
+    # 값 또는 버킷 (상태 값, 출원 연도, 상품 분류 코드)
+    value = Column(String(50), nullable=True)
+    row_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String
+from app.db.base import Base
+
+
+class DatasetRecord(Base):
+    """직전 적재의 레코드별 내용 해시 (다음 적재에서 새 레코드/변경된 레코드를 가려 감시 목록과 대조)"""
+    __tablename__ = "dataset_records"
+
+    application_number = Column(String(50), primary_key=True)
+    # 적재된 레코드 JSON(키 정렬)의 SHA-256
+    record_hash = Column(String(64), nullable=False)
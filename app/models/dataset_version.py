@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from app.db.base import Base
+
+
+class DatasetVersion(Base):
+    """적재된 상표 데이터셋의 버전 기록 (로더가 데이터 커밋과 함께 추가)"""
+    __tablename__ = "dataset_versions"
+
+    id = Column(Integer, primary_key=True)
+
+    # 적재된 레코드 내용으로 계산한 해시
+    version = Column(String(64), nullable=False, index=True)
+    loaded_at = Column(DateTime, nullable=False)
+    row_count = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,29 @@
+from sqlalchemy import Column, DateTime, Integer, JSON, String, Text
+from app.db.base import Base
+
+
+class ExportJob(Base):
+    """검색 결과 내보내기 작업 (재시작 후에도 이어서 처리하도록 상태와 진행 위치를 기록)"""
+    __tablename__ = "export_jobs"
+
+    id = Column(String(32), primary_key=True)
+
+    # queued, running, completed, failed, cancelled
+    status = Column(String(20), nullable=False, default="queued", index=True)
+    format = Column(String(10), nullable=False)
+    params = Column(JSON, nullable=False)
+
+    # 진행 상황 (last_id까지 file_size 바이트가 기록됨)
+    total_count = Column(Integer, nullable=True)
+    exported_count = Column(Integer, nullable=False, default=0)
+    last_id = Column(Integer, nullable=False, default=0)
+    file_path = Column(String(512), nullable=True)
+    file_size = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+
+    # 가져가거나 진행을 기록할 때마다 1씩 증가 (조건부 UPDATE로 작업 소유권 확인)
+    lease_version = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime, nullable=False)
+    updated_at = Column(DateTime, nullable=False)
+    finished_at = Column(DateTime, nullable=True)
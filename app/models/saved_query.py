@@ -0,0 +1,49 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, UniqueConstraint
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+
+class SavedQuery(Base):
+    """감시 목록 검색 조건 (새로 적재되는 상표와 역방향으로 대조)"""
+    __tablename__ = "saved_queries"
+
+    id = Column(Integer, primary_key=True)
+
+    client_id = Column(String(64), nullable=False, index=True)
+    name = Column(String(100), nullable=True)
+
+    # 조건 (지정된 조건을 모두 만족해야 일치, 검색 API의 같은 이름 조건과 같은 의미)
+    keyword = Column(String(100), nullable=True)
+    status = Column(String(50), nullable=True)
+    product_code = Column(String(10), nullable=True)
+
+    created_at = Column(DateTime, nullable=False)
+
+
+class WatchNotification(Base):
+    """감시 목록 검색 조건과 일치한 새 상표 알림 (적재 시 생성)
+
+    상표는 출원번호로 가리킵니다. 상표 id는 데이터셋을 다시 적재할 때마다 바뀌고,
+    데이터셋 테이블만 다시 만들 수 있도록 상표 테이블을 외래 키로 참조하지 않습니다.
+    """
+    __tablename__ = "watch_notifications"
+
+    id = Column(Integer, primary_key=True)
+
+    saved_query_id = Column(Integer, ForeignKey("saved_queries.id", ondelete="CASCADE"), nullable=False, index=True)
+    application_number = Column(String(50), nullable=False)
+    # 알림을 만든 적재의 데이터셋 버전
+    dataset_version = Column(String(64), nullable=True)
+    created_at = Column(DateTime, nullable=False)
+
+    saved_query = relationship("SavedQuery")
+    # 현재 데이터셋에 없는 출원번호면 None
+    trademark = relationship(
+        "TradeMark",
+        primaryjoin="foreign(WatchNotification.application_number) == TradeMark.applicationNumber",
+        viewonly=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint("saved_query_id", "application_number", name="uq_watch_notifications_query_trademark"),
+    )
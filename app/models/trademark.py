@@ -12,6 +12,9 @@ class TradeMark(Base):
     # 상표 정보
     productName = Column(String(255), nullable=True, index=True)
     productNameEng = Column(String(255), nullable=True, index=True)
+    # 적재 시 계산한 정규화 상표명 (NFKC, casefold, 공백/구두점 제거) - 완전/접두 일치 검색용
+    productNameNorm = Column(String(255), nullable=True, index=True)
+    productNameEngNorm = Column(String(255), nullable=True, index=True)
     applicationNumber = Column(String(50), unique=True, index=True, nullable=False)
     applicationDate = Column(Date, nullable=True, index=True)
     registerStatus = Column(String(50), nullable=True, index=True)
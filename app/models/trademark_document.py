@@ -0,0 +1,17 @@
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary, String
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+
+class TrademarkDocument(Base):
+    """상표 응답 문서 (적재 시 렌더링한 상세 응답 JSON과 gzip 압축본, 읽기 전용 모델)"""
+    __tablename__ = "trademark_documents"
+
+    trademark_id = Column(Integer, ForeignKey("trademarks.id", ondelete="CASCADE"), primary_key=True)
+    application_number = Column(String(50), nullable=False, unique=True, index=True)
+
+    # 상세 조회 응답 본문과 같은 UTF-8 JSON (검색 결과 items에도 그대로 이어 붙임)
+    body = Column(LargeBinary, nullable=False)
+    body_gzip = Column(LargeBinary, nullable=False)
+
+    trademark = relationship("TradeMark")
@@ -0,0 +1,23 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+
+class TrademarkIdentifier(Base):
+    """상표에 딸린 각종 번호의 통합 색인 (출원/공고/등록/국제등록/우선권 주장 번호)"""
+    __tablename__ = "trademark_identifiers"
+
+    id = Column(Integer, primary_key=True)
+
+    # 번호 종류 (app.utils.identifiers.IDENTIFIER_TYPES)
+    number_type = Column(String(32), nullable=False)
+    # 구분 기호를 제거하고 대문자로 정규화한 번호
+    number = Column(String(64), nullable=False)
+    trademark_id = Column(Integer, ForeignKey("trademarks.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    trademark = relationship("TradeMark")
+
+    __table_args__ = (
+        # 번호만으로(또는 번호+종류로) 한 번의 인덱스 탐색으로 조회
+        Index("ix_trademark_identifiers_number_type", "number", "number_type"),
+    )
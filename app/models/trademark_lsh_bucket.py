@@ -0,0 +1,22 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, SmallInteger, String
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+
+class TrademarkLshBucket(Base):
+    """MinHash 서명의 LSH 밴드 버킷 (같은 버킷을 공유하는 상표가 유사 상표 후보)"""
+    __tablename__ = "trademark_lsh_buckets"
+
+    id = Column(Integer, primary_key=True)
+
+    band = Column(SmallInteger, nullable=False)
+    # 밴드에 속한 서명 값들의 해시
+    bucket = Column(String(16), nullable=False)
+    trademark_id = Column(Integer, ForeignKey("trademarks.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    trademark = relationship("TradeMark")
+
+    __table_args__ = (
+        # (밴드, 버킷) 탐색으로 후보 조회, 군집 작업은 이 순서로 버킷을 훑음
+        Index("ix_trademark_lsh_buckets_band_bucket", "band", "bucket", "trademark_id"),
+    )
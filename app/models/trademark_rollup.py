@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Index, Integer, String
+from app.db.base import Base
+
+
+class TrademarkRollup(Base):
+    """등록 상태 × 상품 주 분류 × 출원 연도별 상표 수 집계 (로더가 적재 시 증분 갱신)"""
+    __tablename__ = "trademark_rollups"
+
+    id = Column(Integer, primary_key=True)
+
+    # 값이 없으면 빈 문자열/0, 상품 분류 "*"는 분류와 무관한 전체 건수
+    register_status = Column(String(50), nullable=False, default="")
+    main_code = Column(String(20), nullable=False, default="")
+    application_year = Column(Integer, nullable=False, default=0)
+    mark_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ux_trademark_rollups_key", "register_status", "main_code", "application_year", unique=True),
+    )
@@ -0,0 +1,14 @@
+from sqlalchemy import Column, ForeignKey, Integer, LargeBinary
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+
+class TrademarkSignature(Base):
+    """상표명 글자 조각의 MinHash 서명 (유사 상표 후보 검증용)"""
+    __tablename__ = "trademark_signatures"
+
+    trademark_id = Column(Integer, ForeignKey("trademarks.id", ondelete="CASCADE"), primary_key=True)
+    # app.utils.minhash.pack_signature 형식 (NUM_PERMUTATIONS개의 uint32)
+    signature = Column(LargeBinary(256), nullable=False)
+
+    trademark = relationship("TradeMark")
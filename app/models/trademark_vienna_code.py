@@ -0,0 +1,21 @@
+from sqlalchemy import Column, ForeignKey, Index, Integer, String
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+
+
+class TrademarkViennaCode(Base):
+    """상표의 비엔나(도형) 코드 정규화 색인 (계층 접두 검색용)"""
+    __tablename__ = "trademark_vienna_codes"
+
+    id = Column(Integer, primary_key=True)
+
+    # 구분 기호 없는 숫자 코드 (app.utils.vienna.normalize_vienna_code)
+    code = Column(String(6), nullable=False)
+    trademark_id = Column(Integer, ForeignKey("trademarks.id", ondelete="CASCADE"), nullable=False, index=True)
+
+    trademark = relationship("TradeMark")
+
+    __table_args__ = (
+        # 대/중/소분류 접두 조건을 코드 범위 탐색으로 처리하고 상표 id는 인덱스에서 바로 읽음
+        Index("ix_trademark_vienna_codes_code", "code", "trademark_id"),
+    )
@@ -0,0 +1,87 @@
+import os
+import secrets
+from fastapi import APIRouter, Depends, Header, HTTPException, Query
+from fastapi import status as http_status
+from typing import Optional, Dict, Any
+
+from app.db.database import slow_query_monitor
+from app.db.shards import shard_registry
+from app.middleware.admission_control import admission_controller
+from app.search_index.manager import search_index_manager
+from app.services.export_jobs import export_worker
+from app.services.prefetch import page_prefetcher
+from app.services.trademark_service import search_flight, statement_cache
+
+router = APIRouter(
+    prefix="/api/admin",
+    tags=["관리자"]
+)
+
+
+async def verify_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    X-Admin-Token 헤더를 ADMIN_TOKEN 환경 변수와 비교해 검증
+
+    관리자 API는 SQL 파라미터 등 내부 정보를 노출하므로, ADMIN_TOKEN이 설정되지 않았으면
+    열어 두지 않고 경로가 없는 것처럼 404로 응답합니다.
+    """
+    expected = os.getenv("ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail="Not Found"
+        )
+    if x_admin_token is None or not secrets.compare_digest(x_admin_token.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=http_status.HTTP_403_FORBIDDEN,
+            detail="관리자 토큰이 올바르지 않습니다."
+        )
+
+
+@router.get("/slow-queries", dependencies=[Depends(verify_admin_token)])
+async def get_slow_queries_api(
+    limit: int = Query(20, ge=1, le=500, description="반환할 최대 기록 수")
+) -> Dict[str, Any]:
+    """
+    느린 쿼리 조회 API
+
+    임계값을 넘은 SQL 문 중 가장 느린 순서로 정규화된 SQL, 파라미터,
+    실행 시간 및 (활성화된 경우) EXPLAIN 결과를 반환합니다.
+    """
+    return {
+        "threshold_ms": slow_query_monitor.threshold_ms,
+        "total_statements": slow_query_monitor.total_statements,
+        "slow_statements": slow_query_monitor.slow_statements,
+        "items": slow_query_monitor.snapshot(limit)
+    }
+
+
+@router.delete("/slow-queries", dependencies=[Depends(verify_admin_token)])
+async def reset_slow_queries_api() -> Dict[str, str]:
+    """느린 쿼리 기록 초기화 API"""
+    slow_query_monitor.reset()
+    return {"status": "OK"}
+
+
+@router.get("/metrics", dependencies=[Depends(verify_admin_token)])
+async def get_metrics_api() -> Dict[str, Any]:
+    """
+    서비스 내부 지표 조회 API
+
+    - single_flight: 동시 동일 검색 요청 중 합쳐진(coalesced) 요청 수
+    - statement_cache: 쿼리 형태별 문장 캐시 크기와 적중률
+    - admission: 경로별 실행 중 요청 수, 대기열 길이, 거절(shed) 횟수
+    - search_index: 연결된 공유 검색 인덱스 세그먼트의 버전과 크기
+    - exports: 실행 중인 내보내기 워커 수와 완료/실패 작업 수
+    - shards: 샤드 모드 여부, 샤드별 연도 구간과 샤드 기한
+    - prefetch: 다음 페이지 프리패치 예약/적중/취소 수
+    """
+    return {
+        "single_flight": search_flight.stats(),
+        "statement_cache": statement_cache.stats(),
+        "admission": admission_controller.stats(),
+        "search_index": search_index_manager.stats(),
+        "exports": export_worker.stats(),
+        "shards": shard_registry.stats(),
+        "prefetch": page_prefetcher.stats()
+    }
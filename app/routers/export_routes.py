@@ -0,0 +1,122 @@
+import os
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi import status as http_status
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+from app.schemas.export import ExportCreate
+from app.services.export_jobs import JOB_COMPLETED, ExportJobService, export_job_to_dict, export_worker
+from app.services.query_language import QuerySyntaxError, compile_query
+from app.services.trademark_service import SearchParams
+from app.utils.vienna import InvalidViennaCode, parse_vienna_codes
+from app.utils.http_range import RangeNotSatisfiable, file_etag, iter_file_range, parse_range
+
+router = APIRouter(
+    prefix="/api/exports",
+    tags=["내보내기"]
+)
+
+
+async def _get_job_or_404(service: ExportJobService, job_id: str):
+    job = await service.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"내보내기 작업 {job_id}을(를) 찾을 수 없습니다."
+        )
+    return job
+
+
+@router.post("", status_code=http_status.HTTP_202_ACCEPTED)
+async def create_export_api(
+    body: ExportCreate,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    검색 결과 내보내기 작업 등록 API
+
+    검색 API와 같은 조건의 전체 결과를 백그라운드 워커가 gzip 압축 NDJSON/CSV 파일로
+    기록합니다. 진행 상황은 작업 조회 API로, 완료된 파일은 다운로드 API로 받습니다.
+    """
+    if body.q:
+        try:
+            compile_query(body.q)
+        except QuerySyntaxError as e:
+            raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    try:
+        vienna_code = parse_vienna_codes(body.vienna_code) or None
+    except InvalidViennaCode as e:
+        raise HTTPException(status_code=http_status.HTTP_400_BAD_REQUEST, detail=str(e))
+    params = SearchParams(**body.model_dump(exclude={"format", "vienna_code"}), vienna_code=vienna_code)
+    job = await ExportJobService(db).create(params, body.format)
+    export_worker.notify()
+    response.headers["Location"] = f"/api/exports/{job.id}"
+    return export_job_to_dict(job)
+
+
+@router.get("/{job_id}")
+async def get_export_api(job_id: str, db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+    """내보내기 작업 상태/진행률 조회 API"""
+    job = await _get_job_or_404(ExportJobService(db), job_id)
+    return export_job_to_dict(job)
+
+
+@router.delete("/{job_id}")
+async def cancel_export_api(job_id: str, db: AsyncSession = Depends(get_db)) -> Dict[str, Any]:
+    """내보내기 작업 취소 API (완료된 작업은 파일 삭제)"""
+    service = ExportJobService(db)
+    await _get_job_or_404(service, job_id)
+    job = await service.cancel(job_id)
+    return export_job_to_dict(job)
+
+
+@router.get("/{job_id}/download")
+async def download_export_api(request: Request, job_id: str, db: AsyncSession = Depends(get_db)):
+    """
+    내보내기 파일 다운로드 API
+
+    `Range: bytes=start-end` 요청에는 206 부분 응답을 보내므로 연결이 끊겨도 받은 위치부터
+    이어받을 수 있습니다. `If-Range`의 ETag가 현재 파일과 다르면 전체 파일을 보냅니다.
+    """
+    job = await _get_job_or_404(ExportJobService(db), job_id)
+    if job.status != JOB_COMPLETED or not job.file_path or not os.path.exists(job.file_path):
+        raise HTTPException(
+            status_code=http_status.HTTP_409_CONFLICT,
+            detail=f"내보내기 작업이 완료되지 않았습니다 (상태: {job.status})."
+        )
+
+    size = os.path.getsize(job.file_path)
+    etag = file_etag(job.file_path)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": f'attachment; filename="trademarks-{job.id}.{job.format}.gz"',
+    }
+
+    byte_range = None
+    if_range = request.headers.get("if-range")
+    if if_range is None or if_range.strip() == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except RangeNotSatisfiable:
+            raise HTTPException(
+                status_code=http_status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+                detail="요청한 구간이 파일 크기를 벗어났습니다.",
+                headers={"Content-Range": f"bytes */{size}"}
+            )
+
+    start, end = byte_range or (0, size - 1)
+    headers["Content-Length"] = str(end - start + 1 if size else 0)
+    status_code = http_status.HTTP_200_OK
+    if byte_range is not None:
+        status_code = http_status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return StreamingResponse(
+        iter_file_range(job.file_path, start, end),
+        status_code=status_code,
+        media_type="application/gzip",
+        headers=headers
+    )
@@ -1,32 +1,94 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from fastapi import status as http_status
-from typing import Optional, List, Dict, Any
+from typing import Optional, List
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.database import get_db
+from app.db.database import ReadSessionLocal, get_read_db
+from app.schemas.search import BatchSearchRequest
+from app.services.batch_search import BATCH_SEARCH_MAX_QUERIES, run_batch_search
+from app.middleware.admission_control import ADMISSION_CONTROL_ENABLED, admission_controller
 from app.services.trademark_service import (
     TrademarkService, 
     SearchParams,
+    ShardsUnavailable,
+    ResultWindowExceeded,
     search_trademarks,  # 이전 버전 호환용 함수
     get_trademark_by_application_number  # 이전 버전 호환용 함수
 )
 from app.schemas.trademark import TradeMark
+from app.services.dataset_version import dataset_version_cache
+from app.services.query_language import QuerySyntaxError
+from app.services.rollup import DIMENSIONS
+from app.services.deadline import (
+    ENDPOINT_DEADLINES_MS,
+    QueryDeadlineExceeded,
+    ClientDisconnected,
+    run_with_deadline
+)
+from app.utils.identifiers import IDENTIFIER_TYPES
+from app.utils.content_negotiation import document_response, encode_response, negotiate, negotiated_response
+from app.utils.vienna import InvalidViennaCode, parse_vienna_codes
+from app.utils.http_cache import (
+    make_etag,
+    last_modified_of,
+    is_not_modified,
+    apply_cache_headers,
+    not_modified_response
+)
 
 router = APIRouter(
     prefix="/api/trademarks",
     tags=["상표 검색"]
 )
 
+# 클라이언트가 응답 전에 연결을 끊은 경우 (nginx 관례)
+HTTP_499_CLIENT_CLOSED_REQUEST = 499
+
+
+def deadline_http_exception(error: Exception) -> HTTPException:
+    """기한 초과/연결 종료 예외를 HTTP 오류로 변환"""
+    if isinstance(error, ClientDisconnected):
+        return HTTPException(
+            status_code=HTTP_499_CLIENT_CLOSED_REQUEST,
+            detail="클라이언트 연결이 종료되어 요청 처리를 중단했습니다."
+        )
+    return HTTPException(
+        status_code=http_status.HTTP_504_GATEWAY_TIMEOUT,
+        detail=f"요청 처리 시간({error.timeout_ms}ms)이 초과되었습니다. 검색 조건을 좁혀 다시 시도해 주세요."
+    )
+
+def shards_http_exception(error: ShardsUnavailable) -> HTTPException:
+    """샤드 응답 없음을 503으로 변환 (잠시 후 재시도 가능)"""
+    return HTTPException(
+        status_code=http_status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(error),
+        headers={"Retry-After": "1"}
+    )
+
 @router.get("/search")
 async def search_trademarks_api(
+    request: Request,
+    response: Response,
     keyword: Optional[str] = Query(None, description="상표명 검색 키워드 (한글/영문)"),
     status: Optional[str] = Query(None, description="등록 상태 (등록, 실효, 거절, 출원 등)"),
     application_date_from: Optional[str] = Query(None, description="출원일 시작 (YYYYMMDD)", regex=r"^\d{8}$"),
     application_date_to: Optional[str] = Query(None, description="출원일 종료 (YYYYMMDD)", regex=r"^\d{8}$"),
     product_code: Optional[str] = Query(None, description="상품 주 분류 코드"),
+    sub_code: Optional[str] = Query(None, description="유사군 코드 (완전 일치, 예: G0301)"),
+    name: Optional[str] = Query(None, description="정규화 상표명 검색어 (대소문자·공백·구두점 무시)"),
+    name_match: Optional[str] = Query(
+        None, description="상표명 일치 방식 (exact, prefix, contains)", regex=r"^(exact|prefix|contains)$"
+    ),
+    q: Optional[str] = Query(
+        None, max_length=500,
+        description='검색식 (AND/OR/NOT, 괄호, "구", 접두 일치 *, 필드 name/eng/status/class/vienna/date)'
+    ),
+    vienna_code: Optional[List[str]] = Query(
+        None, description="비엔나 코드 (예: 01, 01.01, 01.01.03 - 하위 분류 포함, 반복 또는 쉼표로 여러 개 지정 시 OR)"
+    ),
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=100, description="페이지 당 결과 수"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     상표 검색 API
@@ -36,8 +98,18 @@ async def search_trademarks_api(
     - 등록 상태: 등록, 실효, 거절, 출원 등
     - 출원일 범위: YYYYMMDD 형식
     - 상품 분류 코드: 상품 주 분류 코드
+    - 유사군 코드: 지정상품 유사군 코드와 완전 일치
+    - 정규화 상표명: "FRESCA", "Fresca", "FRES CA"를 같은 이름으로 보고 완전/접두/부분 일치 검색
+    - 검색식: `name:"프레스*" AND class:30 NOT status:거절` 형태의 조건을 하나의 쿼리로 평가
+    - 비엔나 코드: 대분류(01)/중분류(01.01)/소분류(01.01.03) 어느 깊이든 하위 분류까지 일치
     
     결과는 페이징되어 반환됩니다.
+    데이터셋 버전 기반 ETag를 제공하며, `If-None-Match`가 일치하면 검색 없이 304를 반환합니다.
+    `Accept: application/msgpack`이면 null 필드를 뺀 MessagePack으로 응답하고,
+    `Accept-Encoding`에 따라 본문을 gzip/zstd로 스트리밍 압축합니다.
+    처리 기한(`DEADLINE_SEARCH_MS`)을 넘기면 504를 반환합니다.
+    샤드 모드(`SEARCH_SHARDS`)에서 응답하지 않은 샤드가 있으면 `skipped_shards`와 함께 나머지 샤드의 결과를,
+    모든 샤드가 응답하지 않으면 503을 반환합니다.
     """
     try:
         # 검색 파라미터 객체 생성
@@ -47,16 +119,53 @@ async def search_trademarks_api(
             application_date_from=application_date_from,
             application_date_to=application_date_to,
             product_code=product_code,
+            sub_code=sub_code,
+            name=name,
+            name_match=name_match,
+            q=q,
+            vienna_code=parse_vienna_codes(vienna_code) or None,
             page=page,
             size=size
         )
         
+        # 데이터셋이 바뀌지 않았으면 검색 및 직렬화 없이 304 응답
+        representation = negotiate(request)
+        version = dataset_version_cache.get()
+        if version is not None:
+            etag = make_etag(version, "search", search_params.normalized_key(), *representation.etag_parts)
+            last_modified = last_modified_of(version)
+            if is_not_modified(request, etag, last_modified):
+                return not_modified_response(etag, last_modified)
+        
         # 서비스 객체 생성 및 검색 수행
         service = TrademarkService(db)
-        result = await service.search_trademarks(search_params)
+        result = await run_with_deadline(
+            lambda: service.search_trademarks(search_params),
+            timeout_ms=ENDPOINT_DEADLINES_MS["search"],
+            request=request,
+            db=db
+        )
         
-        return result
+        # 일부 샤드가 빠진 부분 결과는 캐시하지 않음
+        if version is not None and not result.get("skipped_shards"):
+            apply_cache_headers(response, etag, last_modified)
+        # 미리 렌더링된 상표 문서는 다시 직렬화하지 않고 그대로 이어 붙여 응답
+        return negotiated_response(result, representation, response)
         
+    except (QueryDeadlineExceeded, ClientDisconnected) as e:
+        raise deadline_http_exception(e)
+    except ShardsUnavailable as e:
+        raise shards_http_exception(e)
+    except QuerySyntaxError as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=f"검색식 오류: {e}"
+        )
+    except (InvalidViennaCode, ResultWindowExceeded) as e:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     except Exception as e:
         # 실제 서비스에서는 로깅 추가
         print(f"검색 중 오류 발생: {str(e)}")
@@ -65,10 +174,190 @@ async def search_trademarks_api(
             detail="검색 처리 중 내부 서버 오류가 발생했습니다."
         )
 
+@router.post("/search/batch")
+async def batch_search_trademarks_api(request: Request, body: BatchSearchRequest) -> Response:
+    """
+    일괄 상표 검색 API
+
+    검색 API의 조건(`page`, `size` 포함) 목록을 받아 한 번의 요청으로 모든 결과를 반환합니다.
+    - 조건이 같은 검색은 한 번만 실행하고 결과를 나눠 씁니다 (`executed`: 실제 실행한 검색 수).
+    - 서로 다른 검색은 검색마다 풀에서 연결 하나를 받아 `BATCH_SEARCH_CONCURRENCY`개까지 동시에 실행합니다.
+      승인 제어를 사용하면 검색마다 검색 API 제한기의 배치 우선순위 슬롯을 받습니다.
+    - 결과는 요청 순서대로 `index`, `status`와 `result` 또는 `error`로 반환하며, 한 건의 오류가
+      다른 검색에 영향을 주지 않습니다.
+    """
+    if len(body.queries) > BATCH_SEARCH_MAX_QUERIES:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=f"한 번에 최대 {BATCH_SEARCH_MAX_QUERIES}건까지 검색할 수 있습니다."
+        )
+    try:
+        result = await run_batch_search(
+            body.queries, ReadSessionLocal, request=request,
+            limiter=admission_controller.limiter("search") if ADMISSION_CONTROL_ENABLED else None
+        )
+        # 결과에 미리 렌더링된 상표 문서가 들어 있으므로 직접 렌더링
+        return encode_response(result, negotiate(request))
+    except ClientDisconnected as e:
+        raise deadline_http_exception(e)
+
+@router.get("/statistics")
+async def get_statistics_api(
+    request: Request,
+    response: Response,
+    group_by: str = Query("status", description=f"집계 기준 (쉼표로 구분: {', '.join(DIMENSIONS)})"),
+    status: Optional[str] = Query(None, description="등록 상태"),
+    product_code: Optional[str] = Query(None, description="상품 주 분류 코드 (완전 일치)"),
+    year_from: Optional[int] = Query(None, ge=1, le=9999, description="출원 연도 시작"),
+    year_to: Optional[int] = Query(None, ge=1, le=9999, description="출원 연도 종료"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    상표 통계 API
+    
+    등록 상태 × 상품 주 분류 × 출원 연도별 상표 수를 반환합니다.
+    로더가 유지하는 집계 테이블만 읽으므로 전체 상표 수와 무관하게 일정한 비용으로 응답합니다.
+    여러 분류를 가진 상표는 `class` 기준 집계에서 각 분류에 한 번씩 포함됩니다.
+    """
+    dimensions = [dimension.strip() for dimension in group_by.split(",") if dimension.strip()]
+    unknown = [dimension for dimension in dimensions if dimension not in DIMENSIONS]
+    if unknown or len(set(dimensions)) != len(dimensions):
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=f"집계 기준이 올바르지 않습니다: {group_by} (사용 가능: {', '.join(DIMENSIONS)})"
+        )
+    
+    representation = negotiate(request)
+    version = dataset_version_cache.get()
+    if version is not None:
+        etag = make_etag(version, "statistics", dimensions, status, product_code, year_from, year_to, *representation.etag_parts)
+        last_modified = last_modified_of(version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+    
+    service = TrademarkService(db)
+    try:
+        result = await run_with_deadline(
+            lambda: service.get_statistics(dimensions, status, product_code, year_from, year_to),
+            timeout_ms=ENDPOINT_DEADLINES_MS["detail"],
+            request=request,
+            db=db
+        )
+    except (QueryDeadlineExceeded, ClientDisconnected) as e:
+        raise deadline_http_exception(e)
+    
+    if version is not None:
+        apply_cache_headers(response, etag, last_modified)
+    return negotiated_response(result, representation, response)
+
+@router.get("/identifiers/{number}")
+async def get_trademarks_by_identifier_api(
+    request: Request,
+    response: Response,
+    number: str,
+    number_type: Optional[str] = Query(
+        None, description=f"번호 종류 ({', '.join(IDENTIFIER_TYPES)}), 생략하면 모든 종류에서 조회"
+    ),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    통합 번호 조회 API
+    
+    출원/공고/등록/국제등록/우선권 주장 번호 중 어느 것으로든 상표를 조회합니다.
+    번호의 구분 기호(`-`, `/`, `,`, 공백)와 대소문자는 무시합니다.
+    
+    Args:
+        number: 조회할 번호
+        number_type: 번호 종류 (선택)
+    """
+    if number_type is not None and number_type not in IDENTIFIER_TYPES:
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 번호 종류입니다: {number_type}"
+        )
+    
+    representation = negotiate(request)
+    version = dataset_version_cache.get()
+    if version is not None:
+        etag = make_etag(version, "identifier", number, number_type, *representation.etag_parts)
+        last_modified = last_modified_of(version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+    
+    service = TrademarkService(db)
+    try:
+        result = await run_with_deadline(
+            lambda: service.get_trademarks_by_identifier(number, number_type),
+            timeout_ms=ENDPOINT_DEADLINES_MS["detail"],
+            request=request,
+            db=db
+        )
+    except (QueryDeadlineExceeded, ClientDisconnected) as e:
+        raise deadline_http_exception(e)
+    
+    if not result["items"]:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"번호 '{number}'에 해당하는 상표를 찾을 수 없습니다."
+        )
+    
+    if version is not None:
+        apply_cache_headers(response, etag, last_modified)
+    return negotiated_response(result, representation, response)
+
+@router.get("/{application_number}/similar")
+async def get_similar_trademarks_api(
+    request: Request,
+    response: Response,
+    application_number: str,
+    threshold: float = Query(0.5, ge=0.1, le=1.0, description="상표명 글자 조각 유사도 임계값 (0.1 ~ 1.0)"),
+    limit: int = Query(20, ge=1, le=100, description="반환할 최대 상표 수"),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    유사 상표 조회 API
+    
+    상표명(한글/영문)의 글자 조각 MinHash 서명이 LSH 버킷을 공유하는 상표만 후보로 읽어
+    유사도가 임계값 이상인 상표를 유사도 순으로 반환합니다.
+    
+    Args:
+        application_number: 기준 상표 출원번호
+    """
+    representation = negotiate(request)
+    version = dataset_version_cache.get()
+    if version is not None:
+        etag = make_etag(version, "similar", application_number, threshold, limit, *representation.etag_parts)
+        last_modified = last_modified_of(version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+    
+    service = TrademarkService(db)
+    try:
+        result = await run_with_deadline(
+            lambda: service.get_similar_trademarks(application_number, threshold, limit),
+            timeout_ms=ENDPOINT_DEADLINES_MS["search"],
+            request=request,
+            db=db
+        )
+    except (QueryDeadlineExceeded, ClientDisconnected) as e:
+        raise deadline_http_exception(e)
+    
+    if result is None:
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"출원번호 '{application_number}'에 해당하는 상표를 찾을 수 없습니다."
+        )
+    
+    if version is not None:
+        apply_cache_headers(response, etag, last_modified)
+    return negotiated_response(result, representation, response)
+
 @router.get("/{application_number}")
 async def get_trademark_api(
+    request: Request,
+    response: Response,
     application_number: str,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     출원번호로 단일 상표 정보 조회 API
@@ -76,8 +365,26 @@ async def get_trademark_api(
     Args:
         application_number: 상표 출원번호
     """
+    representation = negotiate(request)
+    version = dataset_version_cache.get()
+    if version is not None:
+        etag = make_etag(version, "detail", application_number, *representation.etag_parts)
+        last_modified = last_modified_of(version)
+        if is_not_modified(request, etag, last_modified):
+            return not_modified_response(etag, last_modified)
+    
     service = TrademarkService(db)
-    trademark = await service.get_trademark_by_application_number(application_number)
+    try:
+        trademark = await run_with_deadline(
+            lambda: service.get_trademark_detail(application_number),
+            timeout_ms=ENDPOINT_DEADLINES_MS["detail"],
+            request=request,
+            db=db
+        )
+    except (QueryDeadlineExceeded, ClientDisconnected) as e:
+        raise deadline_http_exception(e)
+    except ShardsUnavailable as e:
+        raise shards_http_exception(e)
     
     if not trademark:
         raise HTTPException(
@@ -85,4 +392,9 @@ async def get_trademark_api(
             detail=f"출원번호 '{application_number}'에 해당하는 상표를 찾을 수 없습니다."
         )
     
-    return trademark 
\ No newline at end of file
+    if version is not None:
+        apply_cache_headers(response, etag, last_modified)
+    # 미리 렌더링된 문서는 ORM 변환/직렬화 없이 그대로 전송 (gzip을 협상하면 저장된 압축본)
+    if isinstance(trademark, tuple):
+        return document_response(*trademark, representation, response)
+    return negotiated_response(trademark, representation, response) 
\ No newline at end of file
@@ -0,0 +1,69 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import status as http_status
+from typing import Any, Dict
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import get_db
+from app.schemas.watch import SavedQueryCreate
+from app.services.watchlist import WatchlistService, saved_query_to_dict
+
+router = APIRouter(
+    prefix="/api/watch",
+    tags=["감시 목록"]
+)
+
+
+@router.post("/queries", status_code=http_status.HTTP_201_CREATED)
+async def create_saved_query_api(
+    body: SavedQueryCreate,
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """
+    감시 목록 검색 조건 등록 API
+
+    이후 적재되는 상표 중 조건(검색어 부분 일치, 등록 상태, 상품 분류 코드)을 모두 만족하는
+    상표마다 알림이 생성됩니다.
+    """
+    if not body.has_conditions():
+        raise HTTPException(
+            status_code=http_status.HTTP_400_BAD_REQUEST,
+            detail="keyword, status, product_code 중 하나 이상의 조건이 필요합니다."
+        )
+    query = await WatchlistService(db).create(body)
+    return saved_query_to_dict(query)
+
+
+@router.get("/queries")
+async def list_saved_queries_api(
+    client_id: str = Query(..., min_length=1, max_length=64),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """클라이언트의 감시 목록 검색 조건 조회 API"""
+    queries = await WatchlistService(db).list_queries(client_id)
+    return {"items": [saved_query_to_dict(query) for query in queries]}
+
+
+@router.delete("/queries/{query_id}")
+async def delete_saved_query_api(
+    query_id: int,
+    client_id: str = Query(..., min_length=1, max_length=64),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """감시 목록 검색 조건 삭제 API (알림도 함께 삭제)"""
+    if not await WatchlistService(db).delete(query_id, client_id):
+        raise HTTPException(
+            status_code=http_status.HTTP_404_NOT_FOUND,
+            detail=f"검색 조건 {query_id}을(를) 찾을 수 없습니다."
+        )
+    return {"id": query_id, "deleted": True}
+
+
+@router.get("/notifications")
+async def list_notifications_api(
+    client_id: str = Query(..., min_length=1, max_length=64),
+    since_id: int = Query(0, ge=0, description="이 알림 id 이후의 알림만 조회"),
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_db)
+) -> Dict[str, Any]:
+    """감시 목록 알림 조회 API (next_since_id로 이어서 조회)"""
+    return await WatchlistService(db).list_notifications(client_id, since_id, limit)
@@ -0,0 +1,8 @@
+from pydantic import Field
+
+from app.schemas.search import SearchFilters
+
+
+class ExportCreate(SearchFilters):
+    """검색 결과 내보내기 요청 (검색 API와 같은 조건, 페이지 구분 없이 전체 결과)"""
+    format: str = Field("ndjson", pattern=r"^(ndjson|csv)$")
@@ -0,0 +1,27 @@
+from pydantic import BaseModel, Field
+from typing import Any, List, Optional
+
+
+class SearchFilters(BaseModel):
+    """검색 API와 같은 검색 조건 (요청 본문용)"""
+    keyword: Optional[str] = None
+    status: Optional[str] = None
+    application_date_from: Optional[str] = Field(None, pattern=r"^\d{8}$")
+    application_date_to: Optional[str] = Field(None, pattern=r"^\d{8}$")
+    product_code: Optional[str] = None
+    sub_code: Optional[str] = None
+    name: Optional[str] = None
+    name_match: Optional[str] = Field(None, pattern=r"^(exact|prefix|contains)$")
+    q: Optional[str] = Field(None, max_length=500)
+    vienna_code: Optional[List[str]] = None
+
+
+class SearchQuery(SearchFilters):
+    """일괄 검색의 검색 한 건 (검색 API와 같은 페이지 제한)"""
+    page: int = Field(1, ge=1)
+    size: int = Field(10, ge=1, le=100)
+
+
+class BatchSearchRequest(BaseModel):
+    """일괄 검색 요청 (각 항목은 SearchQuery 형식이며 항목별로 검증)"""
+    queries: List[Any] = Field(..., min_length=1)
@@ -0,0 +1,14 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+
+
+class SavedQueryCreate(BaseModel):
+    """감시 목록 검색 조건 등록 요청 (keyword/status/product_code 중 하나 이상 필요)"""
+    client_id: str = Field(..., min_length=1, max_length=64)
+    name: Optional[str] = Field(None, max_length=100)
+    keyword: Optional[str] = Field(None, max_length=100)
+    status: Optional[str] = Field(None, max_length=50)
+    product_code: Optional[str] = Field(None, max_length=10)
+
+    def has_conditions(self) -> bool:
+        return any((self.keyword, self.status, self.product_code))
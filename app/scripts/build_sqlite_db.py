@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(project_root)
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+import app.models  # noqa: F401 (모든 테이블을 메타데이터에 등록)
+from app.db.base import Base
+from app.db.sqlite import embedded_db, optimize_for_distribution
+from app.utils.data_loader import load_trademarks_from_json
+
+
+def _remove(path: str) -> None:
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+
+async def build(input_path: str, output_path: str, snapshot_path: str = None) -> int:
+    """
+    JSON 데이터로 바로 서비스할 수 있는 SQLite DB 파일을 오프라인으로 구축
+
+    임시 파일에 스키마와 FTS5 색인을 만들고 로더로 적재한 뒤(통계, 데이터셋 버전, 감시 목록 알림 포함)
+    ANALYZE/VACUUM으로 정리해 출력 경로로 원자적으로 교체합니다. 노드는 이 파일과
+    (선택) 검색 인덱스 스냅숏을 받아 적재 없이 바로 시작합니다.
+    """
+    temp_path = output_path + ".building"
+    _remove(temp_path)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+
+    engine = embedded_db.create_engine(f"sqlite+aiosqlite:///{temp_path}")
+    try:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.run_sync(embedded_db.init_schema)
+
+        async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+            loaded_count = await load_trademarks_from_json(db, input_path, snapshot_path)
+        if not loaded_count:
+            raise RuntimeError("적재된 상표가 없습니다.")
+
+        async with engine.connect() as conn:
+            conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+            await conn.run_sync(optimize_for_distribution)
+    except BaseException:
+        await engine.dispose()
+        _remove(temp_path)
+        raise
+    await engine.dispose()
+
+    os.replace(temp_path, output_path)
+    return loaded_count
+
+
+async def main(input_path: str, output_path: str, snapshot_path: str = None):
+    started = time.monotonic()
+    loaded_count = await build(input_path, output_path, snapshot_path)
+    print(
+        f"SQLite DB 구축 완료: {output_path} ({loaded_count}개 항목, "
+        f"{os.path.getsize(output_path)} 바이트, {time.monotonic() - started:.1f}초)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="임베디드 모드용 SQLite DB 파일 구축")
+    parser.add_argument(
+        "--input", default=os.path.join(os.path.dirname(__file__), "trademark_sample.json"), help="상표 JSON 파일 경로"
+    )
+    parser.add_argument("--output", required=True, help="출력 DB 파일 경로 (예: /data/trademarks.db)")
+    parser.add_argument("--snapshot", default=None, help="함께 기록할 검색 인덱스 스냅숏 경로")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.input, args.output, args.snapshot))
@@ -0,0 +1,58 @@
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.append(project_root)
+
+from sqlalchemy import bindparam, select
+
+from app.db.database import AsyncSessionLocal, engine
+from app.models.trademark import TradeMark
+from app.services.near_duplicates import DEFAULT_SIMILARITY_THRESHOLD, MAX_BUCKET_SIZE, find_clusters
+
+_MEMBERS_SELECT = select(
+    TradeMark.id, TradeMark.applicationNumber, TradeMark.productName, TradeMark.productNameEng
+).where(TradeMark.id.in_(bindparam("ids", expanding=True)))
+
+
+async def main(threshold: float, max_bucket_size: int, output: str):
+    """적재 시 기록한 LSH 버킷으로 유사 상표 군집을 계산해 JSON 파일로 저장하는 오프라인 작업"""
+    async with AsyncSessionLocal() as db_session:
+        print(f"유사 상표 군집 계산 시작 (임계값 {threshold})...")
+        clusters = await find_clusters(db_session, threshold=threshold, max_bucket_size=max_bucket_size)
+
+        members = {}
+        ids = sorted({trademark_id for cluster in clusters for trademark_id in cluster})
+        for start in range(0, len(ids), 1000):
+            result = await db_session.execute(_MEMBERS_SELECT, {"ids": ids[start:start + 1000]})
+            for trademark_id, application_number, name, name_eng in result.all():
+                members[trademark_id] = {
+                    "applicationNumber": application_number,
+                    "productName": name,
+                    "productNameEng": name_eng,
+                }
+
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(
+            [[members[trademark_id] for trademark_id in cluster if trademark_id in members] for cluster in clusters],
+            f, ensure_ascii=False, indent=2
+        )
+    print(f"군집 {len(clusters)}개 (상표 {len(ids)}개) 저장 완료: {output}")
+
+    await engine.dispose()
+
+if __name__ == "__main__":
+    if not os.getenv("DATABASE_URL"):
+        print("오류: DATABASE_URL 환경 변수가 설정되지 않았습니다. .env 파일을 확인하세요.")
+        sys.exit(1)
+
+    parser = argparse.ArgumentParser(description="유사 상표 군집 계산")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_SIMILARITY_THRESHOLD, help="유사도 임계값")
+    parser.add_argument("--max-bucket-size", type=int, default=MAX_BUCKET_SIZE, help="후보 쌍을 만들 최대 버킷 크기")
+    parser.add_argument("--output", default="near_duplicate_clusters.json", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.threshold, args.max_bucket_size, args.output))
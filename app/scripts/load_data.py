@@ -5,16 +5,19 @@ import sys
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
 
-from app.db.database import AsyncSessionLocal, engine 
+from app.db.database import AsyncSessionLocal, engine, init_db
 from app.utils.data_loader import load_trademarks_from_json 
+from app.models import DATASET_TABLES
 from app.models.trademark import Base 
 
 async def main():
     """데이터베이스를 초기화하고 JSON 데이터를 로드하는 메인 함수"""
-    print("데이터베이스 테이블 초기화 (기존 테이블 재생성)...")
+    print("데이터베이스 테이블 초기화 (데이터셋 테이블 재생성)...")
+    # 감시 목록 조건/알림과 내보내기 작업 등 사용자 상태 테이블은 유지
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(Base.metadata.drop_all, tables=DATASET_TABLES)
+    # 임베디드(SQLite) 모드는 FTS5 상표명 색인과 트리거도 다시 준비
+    await init_db()
     print("테이블 초기화 완료.")
 
     async with AsyncSessionLocal() as db_session:
@@ -29,7 +32,12 @@ async def main():
     print("데이터베이스 엔진 리소스 해제 완료.")
 
 if __name__ == "__main__":
-    if not os.getenv("DATABASE_URL"):
+    # 미리 구축한 DB 파일(build_sqlite_db.py)로 시작하는 노드는 적재를 건너뜀
+    if os.getenv("LOAD_DATA_ON_START", "true").lower() not in ("1", "true", "yes", "on"):
+        print("LOAD_DATA_ON_START가 꺼져 있어 데이터 적재를 건너뜁니다.")
+        sys.exit(0)
+
+    if not os.getenv("DATABASE_URL") and not os.getenv("SQLITE_PATH"):
         print("오류: DATABASE_URL 환경 변수가 설정되지 않았습니다. .env 파일을 확인하세요.")
         sys.exit(1)
         
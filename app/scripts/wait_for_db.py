@@ -5,10 +5,9 @@ Attempts to connect to the database specified in DATABASE_URL environment variab
 """
 import asyncio
 import os
+import sqlite3
 import sys
 import time
-import aiomysql
-import pymysql
 
 # 프로젝트 루트를 sys.path에 추가
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -59,16 +58,77 @@ def parse_db_url(url):
         'db': db
     }
 
+def parse_sqlite_url(url):
+    """sqlite+aiosqlite:///경로 URL에서 DB 파일 경로를 추출합니다 (메모리 DB는 None)."""
+    if not url or not url.startswith(('sqlite+aiosqlite://', 'sqlite://')):
+        raise ValueError("유효한 sqlite+aiosqlite:// URL이 아닙니다.")
+
+    path = url.split('://', 1)[1]
+    # sqlite:///relative.db -> relative.db, sqlite:////abs.db -> /abs.db
+    if path.startswith('/'):
+        path = path[1:]
+    path = path.split('?', 1)[0]
+    if not path or path == ':memory:':
+        return None
+    return path
+
+def check_sqlite_database(database_url):
+    """임베디드 모드 SQLite 파일을 확인합니다 (없으면 생성될 디렉터리가 있는지 확인)."""
+    try:
+        path = parse_sqlite_url(database_url)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return False
+
+    if path is None:
+        print("메모리 SQLite DB를 사용합니다.")
+        return True
+
+    if not os.path.exists(path):
+        directory = os.path.dirname(os.path.abspath(path))
+        if not os.path.isdir(directory):
+            print(f"오류: DB 파일 디렉터리 {directory}이(가) 없습니다.", file=sys.stderr)
+            return False
+        print(f"DB 파일 {path}이(가) 없어 시작 시 새로 생성됩니다.")
+        return True
+
+    try:
+        conn = sqlite3.connect(path)
+        try:
+            result = conn.execute("SELECT 1").fetchone()
+            # 미리 구축한 DB 파일이 손상되지 않았는지 빠르게 확인
+            check = conn.execute("PRAGMA quick_check").fetchone()
+        finally:
+            conn.close()
+    except sqlite3.Error as e:
+        print(f"SQLite DB 파일을 열 수 없습니다: {e}", file=sys.stderr)
+        return False
+
+    if result and result[0] == 1 and check and check[0] == 'ok':
+        print(f"SQLite DB 파일 확인 완료! ({path})")
+        return True
+    print(f"SQLite DB 파일 검사 실패: {check[0] if check else '알 수 없음'}", file=sys.stderr)
+    return False
+
 async def check_db_connection():
-    """데이터베이스 연결을 확인합니다. 직접 aiomysql을 사용합니다."""
+    """데이터베이스 연결을 확인합니다. 직접 aiomysql을 사용합니다 (SQLite는 파일 확인)."""
     # Get database URL from environment
     database_url = os.getenv("DATABASE_URL")
+    if not database_url and os.getenv("SQLITE_PATH"):
+        database_url = f"sqlite+aiosqlite:///{os.getenv('SQLITE_PATH')}"
     if not database_url:
         print("오류: DATABASE_URL 환경 변수가 설정되지 않았습니다.", file=sys.stderr)
         return False
 
     print(f"데이터베이스 연결 시도 중... ({database_url})")
 
+    if database_url.startswith('sqlite'):
+        return check_sqlite_database(database_url)
+
+    # MySQL 드라이버는 MySQL 모드에서만 필요
+    import aiomysql
+    import pymysql
+
     try:
         db_config = parse_db_url(database_url)
     except ValueError as e:
@@ -0,0 +1 @@
+# 인메모리 검색 인덱스 패키지 
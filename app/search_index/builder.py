@@ -0,0 +1,125 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.trademark import TradeMark
+from app.search_index.layout import IndexWriter
+
+# 한 행의 상표명/영문 상표명을 이어 붙일 때 쓰는 구분자 (검색어에 나타나지 않는 문자)
+NAME_SEPARATOR = "\x1f"
+
+
+@dataclass
+class IndexRow:
+    """인덱스 구축에 필요한 상표 한 건의 컬럼"""
+    id: int
+    product_name: Optional[str] = None
+    product_name_eng: Optional[str] = None
+    application_date: Optional[date] = None
+    register_status: Optional[str] = None
+    main_codes: List[str] = field(default_factory=list)
+    sub_codes: List[str] = field(default_factory=list)
+
+
+def name_grams(text: str) -> Set[str]:
+    """부분 일치 검색용 n-gram (한 글자 + 두 글자)"""
+    grams = set(text)
+    grams.update(text[i:i + 2] for i in range(len(text) - 1))
+    return grams
+
+
+def query_grams(keyword: str) -> Set[str]:
+    """검색어를 찾기 위해 모두 포함되어야 하는 n-gram"""
+    if len(keyword) == 1:
+        return {keyword}
+    return {keyword[i:i + 2] for i in range(len(keyword) - 1)}
+
+
+def date_to_int(value: Optional[date]) -> int:
+    """날짜를 YYYYMMDD 정수로 변환 (없으면 0)"""
+    if value is None:
+        return 0
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+def sort_rows(rows: Iterable[IndexRow]) -> List[IndexRow]:
+    """검색 결과 기본 정렬 순서(출원일 내림차순, 출원일 없는 행은 마지막)로 정렬"""
+    return sorted(
+        rows,
+        key=lambda row: (row.application_date is None, -date_to_int(row.application_date), row.id)
+    )
+
+
+def build_index_bytes(rows: Iterable[IndexRow], dataset_version: str = "") -> bytes:
+    """
+    상표 행으로 검색 인덱스 세그먼트 생성
+
+    행 번호(rank)는 기본 정렬 순서상의 위치이므로, 어떤 필터 결과든 행 번호
+    오름차순이 곧 결과 순서이며 페이지네이션은 n번째 행 번호를 고르는 일이 됩니다.
+    """
+    ordered = sort_rows(rows)
+    writer = IndexWriter(len(ordered), dataset_version)
+
+    grams: Dict[str, List[int]] = defaultdict(list)
+    statuses: Dict[str, List[int]] = defaultdict(list)
+    main_codes: Dict[str, List[int]] = defaultdict(list)
+    sub_codes: Dict[str, List[int]] = defaultdict(list)
+    names: List[str] = []
+
+    for rank, row in enumerate(ordered):
+        fields = [(row.product_name or "").lower(), (row.product_name_eng or "").lower()]
+        names.append(NAME_SEPARATOR.join(fields))
+        row_grams: Set[str] = set()
+        for text in fields:
+            row_grams |= name_grams(text)
+        for gram in row_grams:
+            grams[gram].append(rank)
+        if row.register_status:
+            statuses[row.register_status].append(rank)
+        for code in set(row.main_codes or []):
+            main_codes[code].append(rank)
+        for code in set(row.sub_codes or []):
+            sub_codes[code.upper()].append(rank)
+
+    writer.add_array("row_ids", "I", (row.id for row in ordered))
+    writer.add_array("dates", "i", (date_to_int(row.application_date) for row in ordered))
+    writer.add_strings("names", names)
+    writer.add_postings("name_grams", grams)
+    writer.add_bitmaps("status", statuses)
+    writer.add_bitmaps("main_code", main_codes)
+    # 출원 연도는 비트맵이 필요 없음: 행이 출원일 순이므로 연도/기간은 항상 연속한 행 번호 구간
+    writer.add_bitmaps("sub_code", sub_codes)
+    return writer.to_bytes()
+
+
+async def fetch_index_rows(db: AsyncSession) -> List[IndexRow]:
+    """인덱스 구축에 필요한 컬럼만 스트리밍으로 읽기"""
+    result = await db.stream(
+        select(
+            TradeMark.id,
+            TradeMark.productName,
+            TradeMark.productNameEng,
+            TradeMark.applicationDate,
+            TradeMark.registerStatus,
+            TradeMark.asignProductMainCodeList,
+            TradeMark.asignProductSubCodeList,
+        )
+    )
+    return [
+        IndexRow(
+            id=row_id,
+            product_name=product_name,
+            product_name_eng=product_name_eng,
+            application_date=application_date,
+            register_status=register_status,
+            main_codes=main_codes or [],
+            sub_codes=sub_codes or [],
+        )
+        async for (
+            row_id, product_name, product_name_eng, application_date, register_status, main_codes, sub_codes
+        ) in result
+    ]
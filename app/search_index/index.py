@@ -0,0 +1,217 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from app.search_index.builder import NAME_SEPARATOR, query_grams
+from app.search_index.layout import IndexReader
+from app.search_index.roaring import RoaringBitmap, union_all
+from app.services.query_language import And, Node, Not, QuerySyntaxError, Term, parse_query
+
+# 인덱스 비트맵으로 평가할 수 있는 검색식(q) 필드
+INDEXED_QUERY_FIELDS = ("status", "class")
+
+
+def _parse_date_int(value: Optional[str]) -> Optional[int]:
+    """YYYYMMDD 문자열을 정수로 변환 (형식이 잘못되면 SQL 경로와 같이 필터 무시)"""
+    if not value:
+        return None
+    try:
+        datetime.strptime(value, "%Y%m%d")
+    except ValueError:
+        return None
+    return int(value)
+
+
+@lru_cache(maxsize=256)
+def indexed_query(text: str) -> Optional[Node]:
+    """등록 상태/상품 분류 조건과 AND/OR/NOT만으로 이뤄진 검색식의 구문 트리 (그 밖의 검색식은 None)"""
+    try:
+        node = parse_query(text)
+    except QuerySyntaxError:
+        # 오류 응답은 SQL 경로가 만듦
+        return None
+    return node if _only_indexed_terms(node) else None
+
+
+def _only_indexed_terms(node: Node) -> bool:
+    if isinstance(node, Term):
+        return node.field in INDEXED_QUERY_FIELDS
+    if isinstance(node, Not):
+        return _only_indexed_terms(node.child)
+    return all(_only_indexed_terms(child) for child in node.children)
+
+
+class SearchIndex:
+    """
+    세그먼트 버퍼 위의 읽기 전용 검색 인덱스
+
+    SQL 검색과 같은 조건(부분 일치 키워드, 등록 상태, 출원일 범위, 상품 분류 코드 부분 일치,
+    유사군 코드, 등록 상태/상품 분류만 쓰는 검색식)을 평가해 기본 정렬 순서의 결과 페이지 ID와 전체 건수를 반환합니다.
+    범주형 조건은 압축 비트맵의 AND/OR/NOT으로 결합하고, 결과 비트맵에서 바로 페이지를 고릅니다.
+    """
+
+    # 인덱스로 처리할 수 있는 검색 파라미터
+    SUPPORTED_FILTERS = (
+        "keyword", "status", "application_date_from", "application_date_to", "product_code", "sub_code", "q"
+    )
+
+    def __init__(self, buffer):
+        self.reader = IndexReader(buffer)
+        self.row_count = self.reader.row_count
+        self.dataset_version = self.reader.dataset_version
+        self.row_ids = self.reader.array("row_ids", "I")
+        self.dates = self.reader.array("dates", "i")
+        self.names = self.reader.strings("names")
+        self.name_grams = self.reader.postings("name_grams")
+        self.status = self.reader.bitmaps("status")
+        self.main_code = self.reader.bitmaps("main_code")
+        self.sub_code = self.reader.bitmaps("sub_code")
+        # 출원일은 내림차순이며 출원일이 없는 행(0)은 마지막에 모여 있음
+        self._dated_rows = self._first_rank_below(1)
+
+    # SQL 경로에서 LIKE 패턴으로 비교하는 조건 (와일드카드가 들어 있으면 SQL 경로의 의미를 따름)
+    LIKE_FILTERS = ("keyword", "product_code")
+
+    def supports(self, params: Any) -> bool:
+        """
+        인덱스가 처리할 수 없는 조건이 섞여 있으면 SQL 경로 사용
+
+        인덱스는 검색어를 문자 그대로 비교하므로, LIKE 와일드카드(%, _)가 든 키워드/상품 분류 코드는
+        와일드카드로 해석하는 SQL 경로로 보냅니다(FTS 경로와 같음).
+        """
+        known = set(self.SUPPORTED_FILTERS) | {"page", "size"}
+        if not all(name in known or not value for name, value in vars(params).items()):
+            return False
+        q = getattr(params, "q", None)
+        if q and indexed_query(q) is None:
+            return False
+        return not any(
+            char in (getattr(params, name, None) or "") for name in self.LIKE_FILTERS for char in "%_"
+        )
+
+    def search(self, params: Any) -> Tuple[List[int], int]:
+        """검색 조건에 맞는 결과 페이지의 상표 ID 목록과 전체 건수"""
+        mask = self._filter_mask(params)
+        offset = (params.page - 1) * params.size
+
+        if params.keyword:
+            ranks = self._keyword_ranks(params.keyword.lower(), mask)
+            return [self.row_ids[rank] for rank in ranks[offset:offset + params.size]], len(ranks)
+
+        if mask is None:
+            end = min(offset + params.size, self.row_count)
+            return [self.row_ids[rank] for rank in range(offset, end)], self.row_count
+
+        ranks = mask.select(offset, params.size)
+        return [self.row_ids[rank] for rank in ranks], len(mask)
+
+    def release(self) -> None:
+        """버퍼에 대한 뷰 해제"""
+        self.reader.release()
+
+    def _filter_mask(self, params: Any) -> Optional[RoaringBitmap]:
+        """키워드를 제외한 조건의 행 번호 비트맵 (조건이 없으면 None)"""
+        masks = []
+
+        if params.status:
+            masks.append(self.status.get(params.status))
+
+        date_from = _parse_date_int(params.application_date_from)
+        date_to = _parse_date_int(params.application_date_to)
+        if date_from is not None or date_to is not None:
+            # 행이 출원일 내림차순이므로 기간은 연속한 행 번호 구간
+            start = self._first_rank_below(date_to + 1) if date_to is not None else 0
+            end = self._first_rank_below(date_from) if date_from is not None else self._dated_rows
+            masks.append(RoaringBitmap.from_range(start, end))
+
+        if params.product_code:
+            product_code = params.product_code.lower()
+            masks.append(union_all(
+                self.main_code.get_by_position(position)
+                for position in range(len(self.main_code.keys))
+                if product_code in self.main_code.keys[position].lower()
+            ))
+
+        sub_code = getattr(params, "sub_code", None)
+        if sub_code:
+            masks.append(self.sub_code.get(sub_code.upper()))
+
+        q = getattr(params, "q", None)
+        if q:
+            masks.append(self._query_mask(indexed_query(q)))
+
+        if not masks:
+            return None
+        # 원소가 적은 비트맵부터 교집합
+        masks.sort(key=len)
+        mask = masks[0]
+        for other in masks[1:]:
+            if not mask:
+                break
+            mask = mask & other
+        return mask
+
+    def _query_mask(self, node: Node) -> RoaringBitmap:
+        """검색식 구문 트리의 행 번호 비트맵 (NOT은 NULL 값 행도 포함하는 SQL의 IS NOT TRUE와 같은 전체 보수)"""
+        if isinstance(node, Term):
+            if node.field == "status":
+                return self.status.get(node.value)
+            code = node.value.rstrip("*")
+            keys = self.main_code.keys
+            return union_all(
+                self.main_code.get_by_position(position)
+                for position in range(len(keys))
+                if (keys[position].startswith(code) if node.prefix else keys[position] == code)
+            )
+        if isinstance(node, Not):
+            return self._query_mask(node.child).flip(self.row_count)
+        masks = [self._query_mask(child) for child in node.children]
+        if isinstance(node, And):
+            mask = masks[0]
+            for other in masks[1:]:
+                mask = mask & other
+            return mask
+        return union_all(masks)
+
+    def _first_rank_below(self, value: int) -> int:
+        """출원일이 value보다 작은 첫 행 번호 (내림차순 배열 이진 탐색)"""
+        low, high = 0, self.row_count
+        while low < high:
+            middle = (low + high) // 2
+            if self.dates[middle] >= value:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _keyword_ranks(self, keyword: str, mask: Optional[RoaringBitmap]) -> List[int]:
+        """n-gram 게시 목록 교집합 후 실제 부분 문자열을 확인한 행 번호 (오름차순)"""
+        postings = []
+        for gram in query_grams(keyword):
+            posting = self.name_grams.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+
+        ranks = []
+        for rank in postings[0]:
+            if mask is not None and rank not in mask:
+                continue
+            if not all(_contains(posting, rank) for posting in postings[1:]):
+                continue
+            if any(keyword in name for name in self.names[rank].split(NAME_SEPARATOR)):
+                ranks.append(rank)
+        return ranks
+
+
+def _contains(posting, rank: int) -> bool:
+    """정렬된 게시 목록에 행 번호가 있는지 이진 탐색"""
+    low, high = 0, len(posting)
+    while low < high:
+        middle = (low + high) // 2
+        if posting[middle] < rank:
+            low = middle + 1
+        else:
+            high = middle
+    return low < len(posting) and posting[low] == rank
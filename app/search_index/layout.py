@@ -0,0 +1,241 @@
+import struct
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.search_index.roaring import RoaringBitmap
+
+# 인덱스 세그먼트 바이너리 레이아웃
+#
+#   [헤더][섹션 테이블][섹션 0][섹션 1]...
+#
+# - 헤더: 매직, 포맷 버전, 행 수, 섹션 수, 데이터셋 버전
+# - 섹션 테이블: (이름, 오프셋, 길이) 고정 폭 항목
+# - 섹션: 8바이트 정렬된 원시 바이트 (고정 폭 배열, 문자열 오프셋 테이블, 게시 목록 등)
+#
+# 모든 정수는 리틀 엔디언이며, 읽는 쪽은 memoryview.cast로 복사 없이 접근합니다.
+
+MAGIC = b"TMSIDX\x00\x00"
+FORMAT_VERSION = 2
+
+HEADER = struct.Struct("<8sIII64s")
+SECTION_ENTRY = struct.Struct("<32sQQ")
+ALIGNMENT = 8
+
+
+class IndexFormatError(Exception):
+    """인덱스 세그먼트를 해석할 수 없음 (매직/버전 불일치, 손상 등)"""
+
+
+def _pad(length: int) -> int:
+    return (-length) % ALIGNMENT
+
+
+class IndexWriter:
+    """이름 있는 섹션을 모아 하나의 세그먼트 바이트로 직렬화"""
+
+    def __init__(self, row_count: int, dataset_version: str = ""):
+        self.row_count = row_count
+        self.dataset_version = dataset_version
+        self._sections: List[Tuple[str, bytes]] = []
+
+    def add(self, name: str, data: bytes) -> None:
+        """원시 바이트 섹션 추가"""
+        if len(name.encode("utf-8")) > 32:
+            raise ValueError(f"섹션 이름이 너무 깁니다: {name}")
+        self._sections.append((name, bytes(data)))
+
+    def add_array(self, name: str, typecode: str, values: Iterable[int]) -> None:
+        """고정 폭 정수 배열 섹션 추가 (typecode: struct 형식 문자)"""
+        values = list(values)
+        self.add(name, struct.pack(f"<{len(values)}{typecode}", *values))
+
+    def add_strings(self, name: str, values: Sequence[str]) -> None:
+        """문자열 테이블 추가 (uint32 오프셋 테이블 + UTF-8 데이터)"""
+        offsets = [0]
+        blob = bytearray()
+        for value in values:
+            blob += value.encode("utf-8")
+            offsets.append(len(blob))
+        self.add_array(f"{name}.off", "I", offsets)
+        self.add(f"{name}.dat", bytes(blob))
+
+    def add_postings(self, name: str, postings: Dict[str, Sequence[int]]) -> None:
+        """키(정렬된 문자열) → 정렬된 행 번호 목록 게시 테이블 추가"""
+        keys = sorted(postings)
+        offsets = [0]
+        values: List[int] = []
+        for key in keys:
+            values.extend(sorted(postings[key]))
+            offsets.append(len(values))
+        self.add_strings(f"{name}.key", keys)
+        self.add_array(f"{name}.ptr", "I", offsets)
+        self.add_array(f"{name}.val", "I", values)
+
+    def add_bitmaps(self, name: str, members: Dict[str, Iterable[int]]) -> None:
+        """키(정렬된 문자열) → 행 번호 압축 비트맵(roaring) 테이블 추가"""
+        keys = sorted(members)
+        offsets = [0]
+        blob = bytearray()
+        for key in keys:
+            blob += RoaringBitmap.from_sorted(sorted(set(members[key]))).serialize()
+            offsets.append(len(blob))
+        self.add_strings(f"{name}.key", keys)
+        self.add_array(f"{name}.ptr", "I", offsets)
+        self.add(f"{name}.rbm", bytes(blob))
+
+    def to_bytes(self) -> bytes:
+        """세그먼트 전체 직렬화"""
+        header_size = HEADER.size + SECTION_ENTRY.size * len(self._sections)
+        offset = header_size + _pad(header_size)
+
+        entries = []
+        for name, data in self._sections:
+            entries.append((name, offset, len(data)))
+            offset += len(data) + _pad(len(data))
+
+        out = bytearray(HEADER.pack(
+            MAGIC, FORMAT_VERSION, self.row_count, len(self._sections),
+            self.dataset_version.encode("ascii")[:64]
+        ))
+        for name, section_offset, length in entries:
+            out += SECTION_ENTRY.pack(name.encode("utf-8"), section_offset, length)
+        out += b"\x00" * _pad(len(out))
+        for name, data in self._sections:
+            out += data
+            out += b"\x00" * _pad(len(data))
+        return bytes(out)
+
+
+class StringTable:
+    """오프셋 테이블로 접근하는 문자열 목록 (복사 없이 필요한 항목만 디코딩)"""
+
+    def __init__(self, offsets: memoryview, data: memoryview):
+        self._offsets = offsets
+        self._data = data
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def raw(self, index: int) -> memoryview:
+        return self._data[self._offsets[index]:self._offsets[index + 1]]
+
+    def __getitem__(self, index: int) -> str:
+        return bytes(self.raw(index)).decode("utf-8")
+
+    def find(self, key: str) -> int:
+        """정렬된 테이블에서 키 위치 (없으면 -1)"""
+        encoded = key.encode("utf-8")
+        position = self._bisect(encoded)
+        if position < len(self) and bytes(self.raw(position)) == encoded:
+            return position
+        return -1
+
+    def _bisect(self, encoded: bytes) -> int:
+        low, high = 0, len(self)
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(self.raw(middle)) < encoded:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+
+class IndexReader:
+    """세그먼트 버퍼(bytes, mmap 등) 위에서 섹션을 복사 없이 해석"""
+
+    def __init__(self, buffer):
+        self._buffer = memoryview(buffer)
+        self._views: List[memoryview] = []
+        if len(self._buffer) < HEADER.size:
+            raise IndexFormatError("인덱스 헤더가 잘렸습니다.")
+
+        magic, format_version, row_count, section_count, dataset_version = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC:
+            raise IndexFormatError("인덱스 매직 값이 올바르지 않습니다.")
+        if format_version != FORMAT_VERSION:
+            raise IndexFormatError(f"지원하지 않는 인덱스 포맷 버전입니다: {format_version}")
+
+        self.format_version = format_version
+        self.row_count = row_count
+        self.dataset_version = dataset_version.rstrip(b"\x00").decode("ascii")
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        for position in range(section_count):
+            name, offset, length = SECTION_ENTRY.unpack_from(
+                self._buffer, HEADER.size + SECTION_ENTRY.size * position
+            )
+            if offset + length > len(self._buffer):
+                raise IndexFormatError("인덱스 섹션이 버퍼 범위를 벗어납니다.")
+            self._sections[name.rstrip(b"\x00").decode("utf-8")] = (offset, length)
+
+    def has(self, name: str) -> bool:
+        return name in self._sections
+
+    def section(self, name: str) -> memoryview:
+        """원시 섹션 뷰"""
+        try:
+            offset, length = self._sections[name]
+        except KeyError:
+            raise IndexFormatError(f"인덱스 섹션이 없습니다: {name}")
+        view = self._buffer[offset:offset + length]
+        self._views.append(view)
+        return view
+
+    def array(self, name: str, typecode: str) -> memoryview:
+        """고정 폭 정수 배열 뷰"""
+        view = self.section(name).cast(typecode)
+        self._views.append(view)
+        return view
+
+    def strings(self, name: str) -> StringTable:
+        return StringTable(self.array(f"{name}.off", "I"), self.section(f"{name}.dat"))
+
+    def postings(self, name: str) -> "PostingsTable":
+        return PostingsTable(
+            self.strings(f"{name}.key"), self.array(f"{name}.ptr", "I"), self.array(f"{name}.val", "I")
+        )
+
+    def bitmaps(self, name: str) -> "BitmapTable":
+        return BitmapTable(
+            self.strings(f"{name}.key"), self.array(f"{name}.ptr", "I"), self.section(f"{name}.rbm")
+        )
+
+    def release(self) -> None:
+        """내보낸 뷰를 모두 해제 (mmap을 닫기 전에 호출)"""
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        self._buffer.release()
+
+
+class PostingsTable:
+    """키 → 정렬된 행 번호 목록"""
+
+    def __init__(self, keys: StringTable, pointers: memoryview, values: memoryview):
+        self.keys = keys
+        self._pointers = pointers
+        self._values = values
+
+    def get(self, key: str) -> Optional[memoryview]:
+        position = self.keys.find(key)
+        if position < 0:
+            return None
+        return self._values[self._pointers[position]:self._pointers[position + 1]]
+
+
+class BitmapTable:
+    """키 → 행 번호 압축 비트맵 (조회할 때 해당 키의 비트맵만 복원)"""
+
+    def __init__(self, keys: StringTable, pointers: memoryview, data: memoryview):
+        self.keys = keys
+        self._pointers = pointers
+        self._data = data
+
+    def get_by_position(self, position: int) -> RoaringBitmap:
+        return RoaringBitmap.deserialize(self._data[self._pointers[position]:self._pointers[position + 1]])
+
+    def get(self, key: str) -> RoaringBitmap:
+        """키의 비트맵 (없으면 빈 비트맵)"""
+        position = self.keys.find(key)
+        if position < 0:
+            return RoaringBitmap()
+        return self.get_by_position(position)
@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import os
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from app.search_index.index import SearchIndex
+from app.search_index.shared import SharedIndexSegment, attach_shared_index, default_index_path
+from app.search_index.snapshot import SEARCH_SNAPSHOT_PATH, open_snapshot
+
+
+logger = logging.getLogger("app.search_index.manager")
+
+SEARCH_INDEX_ENABLED = os.getenv("SEARCH_INDEX_ENABLED", "false").lower() in ("1", "true", "yes", "on")
+SEARCH_INDEX_PATH = os.getenv("SEARCH_INDEX_PATH") or default_index_path()
+
+
+class IndexGeneration:
+    """
+    한 데이터셋 버전의 인덱스 세대
+
+    요청이 사용하는 동안 참조 수를 유지하고, 교체(retire)된 뒤 마지막 요청이
+    반환하면 세그먼트를 닫습니다.
+    """
+
+    def __init__(self, segment: SharedIndexSegment, number: int, source: str):
+        self.segment = segment
+        self.number = number
+        self.source = source
+        self.readers = 0
+        self.retired = False
+        self.closed = False
+
+    @property
+    def dataset_version(self) -> str:
+        return self.segment.dataset_version
+
+    def acquire(self) -> SearchIndex:
+        self.readers += 1
+        return self.segment.index
+
+    def release(self) -> None:
+        self.readers -= 1
+        self._close_if_unused()
+
+    def retire(self) -> None:
+        self.retired = True
+        self._close_if_unused()
+
+    def _close_if_unused(self) -> None:
+        if self.retired and self.readers == 0 and not self.closed:
+            self.closed = True
+            self.segment.close()
+
+
+class SearchIndexManager:
+    """
+    이중 버퍼 검색 인덱스 관리자
+
+    로더가 새 데이터셋 버전을 발행하면 백그라운드에서 다음 세대를 구축하고
+    (직렬화와 파일 쓰기는 스레드에서 실행), 완성되면 참조 교체 한 번으로
+    활성 세대를 바꿉니다. 진행 중인 요청은 획득한 이전 세대로 끝까지 처리되며
+    이전 세대는 마지막 요청이 반환한 뒤 닫힙니다.
+    """
+
+    def __init__(self, path: str, enabled: bool = False, snapshot_path: Optional[str] = None):
+        self.path = path
+        self.enabled = enabled
+        self.snapshot_path = snapshot_path
+        self.active: Optional[IndexGeneration] = None
+        self.generations = 0
+        self.reloads = 0
+        self.reload_failures = 0
+        self._session_factory: Optional[Callable[[], Any]] = None
+        self._retired: List[IndexGeneration] = []
+        self._building_version: Optional[str] = None
+        self._target_version: Optional[str] = None
+        self._build_task: Optional[asyncio.Task] = None
+
+    @property
+    def segment(self) -> Optional[SharedIndexSegment]:
+        return self.active.segment if self.active else None
+
+    @property
+    def source(self) -> Optional[str]:
+        return self.active.source if self.active else None
+
+    async def start(self, session_factory: Callable[[], Any], dataset_version: Optional[str]) -> None:
+        """
+        첫 세대 연결 (실패하면 SQL 검색으로 동작)
+
+        로더가 기록한 스냅숏의 버전이 DB와 같으면 그대로 매핑하고,
+        다르면 DB에서 공유 세그먼트를 다시 구축합니다.
+        """
+        self._session_factory = session_factory
+        if not self.enabled:
+            return
+        await self.reload(dataset_version)
+
+    def on_dataset_version(self, version: Any) -> None:
+        """데이터셋 버전 변경 리스너 (다음 세대 구축을 백그라운드로 예약)"""
+        if not self.enabled or self._session_factory is None:
+            return
+        self._target_version = version.version
+        if self._build_task is None or self._build_task.done():
+            self._build_task = asyncio.ensure_future(self._reload_latest())
+
+    async def _reload_latest(self) -> None:
+        """구축 중에 더 새로운 버전이 발행되면 끝난 뒤 최신 버전으로 한 번 더 구축"""
+        while self._target_version is not None:
+            target = self._target_version
+            if self.active is not None and self.active.dataset_version == target:
+                return
+            generation = await self.reload(target)
+            if generation is None and self._target_version == target:
+                return
+
+    async def reload(self, dataset_version: Optional[str]) -> Optional[IndexGeneration]:
+        """다음 세대를 구축해 활성 세대와 교체"""
+        self._building_version = dataset_version
+        try:
+            segment, source = await self._open_or_build(dataset_version)
+        except Exception as e:
+            self.reload_failures += 1
+            logger.warning("검색 인덱스 구축 실패, 기존 세대 또는 SQL 검색을 사용합니다: %s", e)
+            return None
+        finally:
+            if self._building_version == dataset_version:
+                self._building_version = None
+
+        self.generations += 1
+        generation = IndexGeneration(segment, self.generations, source)
+        previous, self.active = self.active, generation
+        if previous is not None:
+            self.reloads += 1
+            previous.retire()
+            if not previous.closed:
+                self._retired.append(previous)
+        self._retired = [retired for retired in self._retired if not retired.closed]
+        logger.info(
+            "검색 인덱스 세대 %d 활성화 (%s, 버전 %s)",
+            generation.number, source, generation.dataset_version[:12]
+        )
+        return generation
+
+    async def _open_or_build(self, dataset_version: Optional[str]):
+        if self.snapshot_path:
+            segment = await asyncio.to_thread(open_snapshot, self.snapshot_path, dataset_version)
+            if segment is not None:
+                return segment, "snapshot"
+        segment = await attach_shared_index(self.path, self._session_factory, dataset_version)
+        return segment, "rebuild"
+
+    @contextmanager
+    def acquire(self, dataset_version: Optional[str]) -> Iterator[Optional[SearchIndex]]:
+        """
+        현재 데이터셋 버전과 일치하는 활성 세대 인덱스 획득
+
+        사용하는 동안에는 세대가 교체되어도 닫히지 않습니다.
+        일치하는 세대가 없으면(구축 중이거나 비활성) None을 돌려줍니다.
+        """
+        generation = self.active
+        if generation is None or dataset_version is None or generation.dataset_version != dataset_version:
+            yield None
+            return
+        index = generation.acquire()
+        try:
+            yield index
+        finally:
+            generation.release()
+
+    def close(self) -> None:
+        if self._build_task is not None and not self._build_task.done():
+            self._build_task.cancel()
+        for generation in [self.active, *self._retired]:
+            if generation is not None:
+                generation.retire()
+        self.active = None
+        self._retired = []
+
+    def stats(self) -> Dict[str, Any]:
+        segment = self.segment
+        return {
+            "enabled": self.enabled,
+            "path": segment.path if segment else self.path,
+            "source": self.source,
+            "generation": self.active.number if self.active else 0,
+            "readers": self.active.readers if self.active else 0,
+            "retired_in_use": len([retired for retired in self._retired if not retired.closed]),
+            "building_version": self._building_version,
+            "reloads": self.reloads,
+            "reload_failures": self.reload_failures,
+            "dataset_version": segment.dataset_version if segment else None,
+            "row_count": segment.index.row_count if segment else 0,
+            "size_bytes": segment.size_bytes if segment else 0,
+        }
+
+
+search_index_manager = SearchIndexManager(
+    path=SEARCH_INDEX_PATH,
+    enabled=SEARCH_INDEX_ENABLED,
+    snapshot_path=SEARCH_SNAPSHOT_PATH
+)
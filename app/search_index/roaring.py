@@ -0,0 +1,293 @@
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Optional, Union
+
+# 롤링(roaring) 방식 압축 비트맵
+#
+# 32비트 행 번호를 상위 16비트(키)로 나눈 컨테이너에 나눠 담습니다.
+# - 배열 컨테이너: 원소가 ARRAY_MAX_SIZE개 이하이면 정렬된 uint16 배열 (원소당 2바이트)
+# - 비트맵 컨테이너: 그보다 많으면 65536비트(8KB) 비트맵 (파이썬 정수로 비트 연산)
+# 희소한 키(드문 유사군 코드)는 배열로, 밀집한 키(등록 상태)는 비트맵으로 저장되어
+# 크기가 원소 수에 비례하면서도 밀집 구간의 AND/OR는 정수 연산 한 번으로 끝납니다.
+#
+# 직렬화 형식 (리틀 엔디언):
+#   [컨테이너 수 uint32][(키 uint16, 종류 uint16, 원소 수 uint32) × 컨테이너 수][본문...]
+#   본문: 배열 컨테이너는 uint16 × 원소 수, 비트맵 컨테이너는 8192바이트
+
+ARRAY_MAX_SIZE = 4096
+CONTAINER_BITS = 1 << 16
+BITMAP_BYTES = CONTAINER_BITS // 8
+_FULL_CONTAINER = (1 << CONTAINER_BITS) - 1
+
+_ARRAY = 0
+_BITMAP = 1
+
+_COUNT = struct.Struct("<I")
+_CONTAINER_HEADER = struct.Struct("<HHI")
+
+# 바이트 값 → 켜진 비트 위치 (비트맵 컨테이너를 배열로 풀 때 사용)
+_BYTE_BITS = [tuple(bit for bit in range(8) if value >> bit & 1) for value in range(256)]
+
+Container = Union[array, int]
+
+
+def _cardinality(container: Container) -> int:
+    return len(container) if isinstance(container, array) else container.bit_count()
+
+
+def _to_bits(container: Container) -> int:
+    if not isinstance(container, array):
+        return container
+    bits = bytearray(BITMAP_BYTES)
+    for value in container:
+        bits[value >> 3] |= 1 << (value & 7)
+    return int.from_bytes(bits, "little")
+
+
+def _bits_to_array(bits: int) -> array:
+    values = array("H")
+    for byte_index, byte in enumerate(bits.to_bytes(BITMAP_BYTES, "little")):
+        if byte:
+            base = byte_index << 3
+            values.extend(base + bit for bit in _BYTE_BITS[byte])
+    return values
+
+
+def _optimize(container: Container) -> Optional[Container]:
+    """원소 수에 맞는 컨테이너 종류로 변환 (빈 컨테이너는 None)"""
+    if isinstance(container, array):
+        if not container:
+            return None
+        if len(container) > ARRAY_MAX_SIZE:
+            return _to_bits(container)
+        return container
+    count = container.bit_count()
+    if count == 0:
+        return None
+    if count <= ARRAY_MAX_SIZE:
+        return _bits_to_array(container)
+    return container
+
+
+def _and(first: Container, second: Container) -> Optional[Container]:
+    if isinstance(first, array) and isinstance(second, array):
+        if len(first) > len(second):
+            first, second = second, first
+        members = set(second)
+        return _optimize(array("H", [value for value in first if value in members]))
+    if isinstance(first, array):
+        return _optimize(array("H", [value for value in first if second >> value & 1]))
+    if isinstance(second, array):
+        return _optimize(array("H", [value for value in second if first >> value & 1]))
+    return _optimize(first & second)
+
+
+def _or(first: Container, second: Container) -> Optional[Container]:
+    if isinstance(first, array) and isinstance(second, array) and len(first) + len(second) <= ARRAY_MAX_SIZE:
+        return _optimize(array("H", sorted(set(first).union(second))))
+    return _optimize(_to_bits(first) | _to_bits(second))
+
+
+def _and_not(first: Container, second: Container) -> Optional[Container]:
+    if isinstance(first, array):
+        if isinstance(second, array):
+            excluded = set(second)
+            return _optimize(array("H", [value for value in first if value not in excluded]))
+        return _optimize(array("H", [value for value in first if not second >> value & 1]))
+    return _optimize(first & ~_to_bits(second) & _FULL_CONTAINER)
+
+
+class RoaringBitmap:
+    """정렬된 행 번호 집합 (AND/OR/AND NOT/보수, 순위 선택)"""
+
+    __slots__ = ("keys", "containers")
+
+    def __init__(self, keys: Optional[List[int]] = None, containers: Optional[List[Container]] = None):
+        self.keys: List[int] = keys or []
+        self.containers: List[Container] = containers or []
+
+    @classmethod
+    def from_sorted(cls, values: Iterable[int]) -> "RoaringBitmap":
+        """오름차순 행 번호로 생성"""
+        bitmap = cls()
+        current_key = -1
+        current = array("H")
+        for value in values:
+            key = value >> 16
+            if key != current_key:
+                bitmap._append(current_key, current)
+                current_key, current = key, array("H")
+            if not current or current[-1] != value & 0xFFFF:
+                current.append(value & 0xFFFF)
+        bitmap._append(current_key, current)
+        return bitmap
+
+    @classmethod
+    def from_range(cls, start: int, end: int) -> "RoaringBitmap":
+        """[start, end) 구간의 행 번호 (연속 구간은 컨테이너 단위 비트 마스크로 생성)"""
+        bitmap = cls()
+        value = start
+        while value < end:
+            key = value >> 16
+            low = value & 0xFFFF
+            high = min(end - (key << 16), CONTAINER_BITS)
+            bitmap._append(key, ((1 << high) - 1) ^ ((1 << low) - 1))
+            value = (key + 1) << 16
+        return bitmap
+
+    def _append(self, key: int, container: Container) -> None:
+        if key < 0:
+            return
+        container = _optimize(container)
+        if container is not None:
+            self.keys.append(key)
+            self.containers.append(container)
+
+    def __len__(self) -> int:
+        return sum(_cardinality(container) for container in self.containers)
+
+    def __bool__(self) -> bool:
+        return bool(self.containers)
+
+    def __contains__(self, value: int) -> bool:
+        position = bisect_left(self.keys, value >> 16)
+        if position == len(self.keys) or self.keys[position] != value >> 16:
+            return False
+        container = self.containers[position]
+        low = value & 0xFFFF
+        if isinstance(container, array):
+            index = bisect_left(container, low)
+            return index < len(container) and container[index] == low
+        return bool(container >> low & 1)
+
+    def __iter__(self) -> Iterator[int]:
+        for key, container in zip(self.keys, self.containers):
+            base = key << 16
+            values = container if isinstance(container, array) else _bits_to_array(container)
+            for value in values:
+                yield base + value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RoaringBitmap):
+            return NotImplemented
+        return self.keys == other.keys and all(
+            _to_bits(first) == _to_bits(second) for first, second in zip(self.containers, other.containers)
+        )
+
+    def __repr__(self) -> str:
+        return f"RoaringBitmap(cardinality={len(self)}, containers={len(self.containers)})"
+
+    def __and__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        result = RoaringBitmap()
+        i = j = 0
+        while i < len(self.keys) and j < len(other.keys):
+            if self.keys[i] < other.keys[j]:
+                i += 1
+            elif self.keys[i] > other.keys[j]:
+                j += 1
+            else:
+                result._append_optimized(self.keys[i], _and(self.containers[i], other.containers[j]))
+                i += 1
+                j += 1
+        return result
+
+    def __or__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        result = RoaringBitmap()
+        i = j = 0
+        while i < len(self.keys) or j < len(other.keys):
+            if j == len(other.keys) or (i < len(self.keys) and self.keys[i] < other.keys[j]):
+                result._append_optimized(self.keys[i], self.containers[i])
+                i += 1
+            elif i == len(self.keys) or self.keys[i] > other.keys[j]:
+                result._append_optimized(other.keys[j], other.containers[j])
+                j += 1
+            else:
+                result._append_optimized(self.keys[i], _or(self.containers[i], other.containers[j]))
+                i += 1
+                j += 1
+        return result
+
+    def __sub__(self, other: "RoaringBitmap") -> "RoaringBitmap":
+        """AND NOT (self에서 other 제외)"""
+        result = RoaringBitmap()
+        j = 0
+        for key, container in zip(self.keys, self.containers):
+            while j < len(other.keys) and other.keys[j] < key:
+                j += 1
+            if j < len(other.keys) and other.keys[j] == key:
+                result._append_optimized(key, _and_not(container, other.containers[j]))
+            else:
+                result._append_optimized(key, container)
+        return result
+
+    def flip(self, universe: int) -> "RoaringBitmap":
+        """[0, universe) 안에서의 보수 (NOT)"""
+        return RoaringBitmap.from_range(0, universe) - self
+
+    def _append_optimized(self, key: int, container: Optional[Container]) -> None:
+        if container is not None:
+            self.keys.append(key)
+            self.containers.append(container)
+
+    def select(self, offset: int, limit: int) -> List[int]:
+        """오름차순 offset번째부터 limit개 (앞 컨테이너는 원소 수만 보고 건너뜀)"""
+        ranks: List[int] = []
+        for key, container in zip(self.keys, self.containers):
+            count = _cardinality(container)
+            if offset >= count:
+                offset -= count
+                continue
+            base = key << 16
+            values = container if isinstance(container, array) else _bits_to_array(container)
+            for value in values[offset:offset + limit - len(ranks)]:
+                ranks.append(base + value)
+            offset = 0
+            if len(ranks) == limit:
+                break
+        return ranks
+
+    def serialize(self) -> bytes:
+        """직렬화 (배열 컨테이너는 uint16 목록, 비트맵 컨테이너는 8KB)"""
+        out = bytearray(_COUNT.pack(len(self.keys)))
+        bodies = []
+        for key, container in zip(self.keys, self.containers):
+            if isinstance(container, array):
+                out += _CONTAINER_HEADER.pack(key, _ARRAY, len(container))
+                bodies.append(struct.pack(f"<{len(container)}H", *container))
+            else:
+                out += _CONTAINER_HEADER.pack(key, _BITMAP, container.bit_count())
+                bodies.append(container.to_bytes(BITMAP_BYTES, "little"))
+        for body in bodies:
+            out += body
+        return bytes(out)
+
+    @classmethod
+    def deserialize(cls, data) -> "RoaringBitmap":
+        """직렬화된 바이트(또는 세그먼트 위의 memoryview)에서 복원"""
+        view = memoryview(data)
+        (count,) = _COUNT.unpack_from(view, 0)
+        offset = _COUNT.size + _CONTAINER_HEADER.size * count
+        bitmap = cls()
+        for position in range(count):
+            key, kind, cardinality = _CONTAINER_HEADER.unpack_from(
+                view, _COUNT.size + _CONTAINER_HEADER.size * position
+            )
+            if kind == _ARRAY:
+                container = array("H", bytes(view[offset:offset + cardinality * 2]))
+                offset += cardinality * 2
+            else:
+                container = int.from_bytes(view[offset:offset + BITMAP_BYTES], "little")
+                offset += BITMAP_BYTES
+            bitmap.keys.append(key)
+            bitmap.containers.append(container)
+        return bitmap
+
+
+def union_all(bitmaps: Iterable[RoaringBitmap]) -> RoaringBitmap:
+    """여러 비트맵의 합집합"""
+    result = RoaringBitmap()
+    for bitmap in bitmaps:
+        result = result | bitmap
+    return result
+
@@ -0,0 +1,115 @@
+import asyncio
+import fcntl
+import logging
+import mmap
+import os
+import tempfile
+from typing import Any, Callable, Optional
+
+from app.search_index.builder import build_index_bytes, fetch_index_rows
+from app.search_index.index import SearchIndex
+from app.search_index.layout import FORMAT_VERSION, HEADER, MAGIC
+
+
+logger = logging.getLogger("app.search_index.shared")
+
+
+def default_index_path() -> str:
+    """공유 메모리(/dev/shm)가 있으면 그곳에, 없으면 임시 디렉터리에 세그먼트 저장"""
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, "trademark_search.idx")
+
+
+class SharedIndexSegment:
+    """
+    읽기 전용 mmap으로 연결한 인덱스 세그먼트
+
+    모든 워커 프로세스가 같은 파일을 매핑하므로 물리 메모리는 페이지 캐시에
+    한 벌만 존재합니다. 세그먼트 파일이 교체되어도 이미 매핑한 프로세스는
+    닫을 때까지 이전 파일을 그대로 읽습니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self.index = SearchIndex(self._mmap)
+        except Exception:
+            self._mmap.close()
+            raise
+
+    @property
+    def dataset_version(self) -> str:
+        return self.index.dataset_version
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._mmap)
+
+    def close(self) -> None:
+        self.index.release()
+        self._mmap.close()
+
+
+def read_segment_version(path: str) -> Optional[str]:
+    """세그먼트 파일의 데이터셋 버전 (파일이 없거나 손상되었으면 None)"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+    except OSError:
+        return None
+    if len(header) < HEADER.size:
+        return None
+    magic, format_version, _, _, dataset_version = HEADER.unpack(header)
+    if magic != MAGIC or format_version != FORMAT_VERSION:
+        return None
+    return dataset_version.rstrip(b"\x00").decode("ascii")
+
+
+def write_segment(path: str, data: bytes) -> None:
+    """임시 파일에 쓴 뒤 rename으로 교체 (읽는 쪽은 완성된 파일만 보게 됨)"""
+    directory = os.path.dirname(path) or "."
+    fd, tmp_path = tempfile.mkstemp(prefix=".trademark_search.", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+async def build_segment(path: str, session_factory: Callable[[], Any], dataset_version: str) -> None:
+    """DB에서 인덱스를 구축해 세그먼트 파일로 저장 (직렬화와 쓰기는 스레드에서 실행)"""
+    async with session_factory() as session:
+        rows = await fetch_index_rows(session)
+    data = await asyncio.to_thread(build_index_bytes, rows, dataset_version)
+    await asyncio.to_thread(write_segment, path, data)
+    logger.info("검색 인덱스 세그먼트 생성: %s (%d건, %d bytes)", path, len(rows), len(data))
+
+
+async def attach_shared_index(
+    path: str,
+    session_factory: Callable[[], Any],
+    dataset_version: Optional[str]
+) -> SharedIndexSegment:
+    """
+    공유 세그먼트에 연결 (필요한 경우 한 프로세스만 구축)
+
+    파일 잠금으로 여러 워커 중 하나만 구축하고, 나머지는 잠금을 기다렸다가
+    구축된 세그먼트를 그대로 매핑합니다. 세그먼트의 데이터셋 버전이 현재 버전과
+    같으면 구축을 생략합니다.
+    """
+    lock_fd = os.open(f"{path}.lock", os.O_CREAT | os.O_RDWR, 0o644)
+    try:
+        await asyncio.to_thread(fcntl.flock, lock_fd, fcntl.LOCK_EX)
+        if dataset_version is None or read_segment_version(path) != dataset_version:
+            await build_segment(path, session_factory, dataset_version or "")
+        return SharedIndexSegment(path)
+    finally:
+        fcntl.flock(lock_fd, fcntl.LOCK_UN)
+        os.close(lock_fd)
@@ -0,0 +1,56 @@
+import logging
+import os
+import time
+from typing import List, Optional
+
+from app.search_index.builder import IndexRow, build_index_bytes
+from app.search_index.shared import SharedIndexSegment, read_segment_version, write_segment
+
+
+logger = logging.getLogger("app.search_index.snapshot")
+
+# 로더가 DB 커밋 직후 기록하는 영속 스냅숏 (컨테이너 재시작 후에도 재사용)
+SEARCH_SNAPSHOT_PATH = os.getenv("SEARCH_SNAPSHOT_PATH") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "trademark_search.snapshot"
+)
+
+
+def write_snapshot(path: str, rows: List[IndexRow], dataset_version: str) -> int:
+    """
+    인덱스 스냅숏 파일 기록
+
+    고정 폭 컬럼, 문자열 오프셋 테이블, 미리 구축한 게시 목록/비트맵을 담은
+    세그먼트를 원자적으로 교체합니다. 기록한 바이트 수를 반환합니다.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    data = build_index_bytes(rows, dataset_version)
+    write_segment(path, data)
+    return len(data)
+
+
+def open_snapshot(path: str, dataset_version: Optional[str]) -> Optional[SharedIndexSegment]:
+    """
+    현재 데이터셋 버전과 일치하는 스냅숏을 mmap으로 열기
+
+    파일이 없거나, 포맷 버전이 다르거나, 데이터셋 버전이 DB와 다르면 None을
+    반환하며 호출 측은 DB에서 다시 구축합니다.
+    """
+    if dataset_version is None:
+        return None
+    snapshot_version = read_segment_version(path)
+    if snapshot_version != dataset_version:
+        if snapshot_version is not None:
+            logger.info("스냅숏 버전 불일치 (스냅숏 %s, DB %s)", snapshot_version[:12], dataset_version[:12])
+        return None
+
+    started = time.perf_counter()
+    try:
+        segment = SharedIndexSegment(path)
+    except Exception as e:
+        logger.warning("스냅숏 열기 실패: %s", e)
+        return None
+    logger.info(
+        "검색 인덱스 스냅숏 연결: %s (%d건, %.1fms)",
+        path, segment.index.row_count, (time.perf_counter() - started) * 1000
+    )
+    return segment
@@ -0,0 +1,128 @@
+import asyncio
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import status as http_status
+from pydantic import ValidationError
+
+from app.middleware.admission_control import BATCH, AdmissionRejected, PriorityLimiter
+from app.schemas.search import SearchQuery
+from app.services.deadline import ENDPOINT_DEADLINES_MS, ClientDisconnected, QueryDeadlineExceeded, run_with_deadline
+from app.services.query_language import QuerySyntaxError
+from app.services.trademark_service import (
+    ResultWindowExceeded,
+    SearchParams,
+    ShardsUnavailable,
+    TrademarkService,
+)
+from app.utils.vienna import InvalidViennaCode, parse_vienna_codes
+
+
+logger = logging.getLogger("app.services.batch_search")
+
+# 요청 한 건에 담을 수 있는 검색 수와 동시에 실행할 검색 수 (검색마다 풀에서 연결 하나를 사용)
+BATCH_SEARCH_MAX_QUERIES = int(os.getenv("BATCH_SEARCH_MAX_QUERIES", "20"))
+BATCH_SEARCH_CONCURRENCY = int(os.getenv("BATCH_SEARCH_CONCURRENCY", "4"))
+
+
+def _error(status_code: int, detail: Any) -> Dict[str, Any]:
+    return {"status": status_code, "error": {"detail": detail}}
+
+
+def _parse_query(raw: Any) -> SearchParams:
+    """요청 본문의 검색 한 건을 SearchParams로 변환 (검증 실패는 예외)"""
+    query = SearchQuery.model_validate(raw)
+    return SearchParams(
+        **query.model_dump(exclude={"vienna_code"}),
+        vienna_code=parse_vienna_codes(query.vienna_code) or None
+    )
+
+
+def _error_of(error: Exception) -> Dict[str, Any]:
+    """검색 한 건의 예외를 응답 항목으로 변환"""
+    if isinstance(error, QuerySyntaxError):
+        return _error(http_status.HTTP_400_BAD_REQUEST, f"검색식 오류: {error}")
+    if isinstance(error, (InvalidViennaCode, ResultWindowExceeded)):
+        return _error(http_status.HTTP_400_BAD_REQUEST, str(error))
+    if isinstance(error, QueryDeadlineExceeded):
+        return _error(http_status.HTTP_504_GATEWAY_TIMEOUT, str(error))
+    if isinstance(error, AdmissionRejected):
+        return _error(http_status.HTTP_503_SERVICE_UNAVAILABLE, f"요청이 많아 잠시 후 다시 시도해 주세요. ({error.reason})")
+    if isinstance(error, ShardsUnavailable):
+        return _error(http_status.HTTP_503_SERVICE_UNAVAILABLE, str(error))
+    logger.exception("일괄 검색 중 오류 발생", exc_info=error)
+    return _error(http_status.HTTP_500_INTERNAL_SERVER_ERROR, "검색 처리 중 오류가 발생했습니다.")
+
+
+async def run_batch_search(
+    queries: List[Any],
+    session_factory: Callable[[], Any],
+    request: Any = None,
+    concurrency: int = BATCH_SEARCH_CONCURRENCY,
+    limiter: Optional[PriorityLimiter] = None
+) -> Dict[str, Any]:
+    """
+    검색 여러 건을 동시에 실행해 요청 순서대로 결과 반환
+
+    정규화한 조건이 같은 검색은 한 번만 실행해 결과를 나눠 쓰고, 서로 다른 검색은 각자의 세션으로
+    최대 concurrency개까지 동시에 실행합니다(AsyncSession은 동시 사용할 수 없으므로 검색마다 세션 하나).
+    각 검색에는 검색 API와 같은 처리 기한이 적용되며, 한 건의 검증 오류나 실패는 그 항목의
+    status/error로만 반환합니다. 클라이언트가 연결을 끊으면 ClientDisconnected를 발생시킵니다.
+
+    limiter(검색 경로의 승인 제어기)가 있으면 검색 한 건마다 배치 우선순위 슬롯을 받아 실행하므로,
+    일괄 검색이 쓰는 연결도 검색 API의 동시 실행 한도 안에 들어갑니다. 슬롯을 받지 못한 검색은 503 항목입니다.
+    """
+    entries: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+    groups: Dict[Tuple[Any, ...], Tuple[SearchParams, List[int]]] = {}
+    for index, raw in enumerate(queries):
+        try:
+            params = _parse_query(raw)
+        except ValidationError as e:
+            entries[index] = _error(
+                http_status.HTTP_422_UNPROCESSABLE_ENTITY, e.errors(include_url=False, include_context=False)
+            )
+            continue
+        except InvalidViennaCode as e:
+            entries[index] = _error_of(e)
+            continue
+        groups.setdefault(params.normalized_key(), (params, []))[1].append(index)
+
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def execute(params: SearchParams) -> Dict[str, Any]:
+        async with semaphore:
+            if limiter is not None:
+                try:
+                    await limiter.acquire(BATCH)
+                except AdmissionRejected as e:
+                    return _error_of(e)
+            try:
+                async with session_factory() as db:
+                    try:
+                        result = await run_with_deadline(
+                            lambda: TrademarkService(db).search_trademarks(params),
+                            timeout_ms=ENDPOINT_DEADLINES_MS["search"],
+                            request=request,
+                            db=db
+                        )
+                    except ClientDisconnected:
+                        raise
+                    except Exception as e:
+                        return _error_of(e)
+            finally:
+                if limiter is not None:
+                    limiter.release(BATCH)
+        return {"status": http_status.HTTP_200_OK, "result": result}
+
+    unique = list(groups.values())
+    outcomes = await asyncio.gather(*(execute(params) for params, _ in unique))
+    for (_, indexes), outcome in zip(unique, outcomes):
+        for index in indexes:
+            # 같은 결과를 나눠 쓰는 항목끼리 영향을 주지 않도록 최상위 키는 분리
+            entries[index] = {**outcome, "result": dict(outcome["result"])} if "result" in outcome else outcome
+
+    return {
+        "results": [{"index": index, **entry} for index, entry in enumerate(entries)],
+        "executed": len(unique),
+    }
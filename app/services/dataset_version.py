@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.dataset_version import DatasetVersion
+
+
+logger = logging.getLogger("app.services.dataset_version")
+
+
+@dataclass(frozen=True)
+class DatasetVersionInfo:
+    """현재 서비스 중인 데이터셋 버전"""
+    version: str
+    loaded_at: datetime
+    row_count: int
+
+
+async def fetch_latest_dataset_version(db: AsyncSession) -> Optional[DatasetVersionInfo]:
+    """가장 최근에 적재된 데이터셋 버전 조회"""
+    result = await db.execute(
+        select(DatasetVersion).order_by(DatasetVersion.id.desc()).limit(1)
+    )
+    row = result.scalar_one_or_none()
+    if row is None:
+        return None
+    return DatasetVersionInfo(version=row.version, loaded_at=row.loaded_at, row_count=row.row_count)
+
+
+class DatasetVersionCache:
+    """
+    프로세스 내 데이터셋 버전 캐시
+
+    요청 경로에서는 캐시된 버전만 사용하고, TTL이 지나면 백그라운드에서
+    버전 테이블을 다시 읽습니다. 버전이 바뀌면 등록된 리스너를 호출합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 5.0):
+        self.ttl_seconds = ttl_seconds
+        self.current: Optional[DatasetVersionInfo] = None
+        self._session_factory: Optional[Callable[[], Any]] = None
+        self._listeners: List[Callable[[DatasetVersionInfo], None]] = []
+        self._loaded_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def configure(self, session_factory: Callable[[], Any]) -> None:
+        """버전을 읽을 때 사용할 세션 팩토리 설정"""
+        self._session_factory = session_factory
+
+    def add_listener(self, listener: Callable[[DatasetVersionInfo], None]) -> None:
+        """데이터셋 버전이 바뀔 때 호출할 콜백 등록"""
+        self._listeners.append(listener)
+
+    async def refresh(self) -> Optional[DatasetVersionInfo]:
+        """버전 테이블을 읽어 캐시 갱신"""
+        if self._session_factory is None:
+            return self.current
+        try:
+            async with self._session_factory() as session:
+                latest = await fetch_latest_dataset_version(session)
+        except Exception as e:
+            logger.warning("데이터셋 버전 조회 실패: %s", e)
+            return self.current
+
+        self._loaded_at = time.monotonic()
+        self.publish(latest)
+        return self.current
+
+    def publish(self, latest: Optional[DatasetVersionInfo]) -> None:
+        """새 버전을 반영하고 변경 시 리스너 호출"""
+        previous = self.current
+        self.current = latest
+        if latest is not None and (previous is None or previous.version != latest.version):
+            logger.info("데이터셋 버전 변경: %s -> %s", previous and previous.version, latest.version)
+            for listener in self._listeners:
+                try:
+                    listener(latest)
+                except Exception as e:
+                    logger.warning("데이터셋 버전 리스너 실행 실패: %s", e)
+
+    def get(self) -> Optional[DatasetVersionInfo]:
+        """캐시된 버전 반환 (만료된 경우 백그라운드 갱신 예약)"""
+        expired = time.monotonic() - self._loaded_at > self.ttl_seconds
+        if expired and self._session_factory is not None and not self._refreshing():
+            self._refresh_task = asyncio.ensure_future(self.refresh())
+        return self.current
+
+    def _refreshing(self) -> bool:
+        return self._refresh_task is not None and not self._refresh_task.done()
+
+
+dataset_version_cache = DatasetVersionCache(
+    ttl_seconds=float(os.getenv("DATASET_VERSION_TTL_SECONDS", "5"))
+)
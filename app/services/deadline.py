@@ -0,0 +1,117 @@
+import asyncio
+import contextvars
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger("app.services.deadline")
+
+# 엔드포인트별 요청 기한 (밀리초)
+ENDPOINT_DEADLINES_MS: Dict[str, int] = {
+    "search": int(os.getenv("DEADLINE_SEARCH_MS", "5000")),
+    "detail": int(os.getenv("DEADLINE_DETAIL_MS", "1000")),
+}
+
+# 클라이언트 연결 종료 확인 주기 (초)
+DISCONNECT_POLL_INTERVAL = float(os.getenv("DISCONNECT_POLL_INTERVAL_SECONDS", "0.1"))
+
+# 현재 요청의 DB 문장 타임아웃 (리포지토리가 MAX_EXECUTION_TIME 힌트로 전달)
+_statement_timeout_ms: contextvars.ContextVar[Optional[int]] = contextvars.ContextVar(
+    "statement_timeout_ms", default=None
+)
+
+
+class QueryDeadlineExceeded(Exception):
+    """요청 기한 안에 검색이 끝나지 않음"""
+
+    def __init__(self, timeout_ms: int):
+        super().__init__(f"{timeout_ms}ms 안에 처리를 완료하지 못했습니다.")
+        self.timeout_ms = timeout_ms
+
+
+class ClientDisconnected(Exception):
+    """처리 도중 클라이언트 연결이 끊어짐"""
+
+
+def current_statement_timeout_ms() -> Optional[int]:
+    """현재 요청에 설정된 DB 문장 타임아웃"""
+    return _statement_timeout_ms.get()
+
+
+async def _wait_for_disconnect(request: Any) -> bool:
+    """클라이언트 연결이 끊어지면 True 반환 (확인할 수 없으면 False)"""
+    while True:
+        try:
+            if await request.is_disconnected():
+                return True
+        except Exception:
+            return False
+        await asyncio.sleep(DISCONNECT_POLL_INTERVAL)
+
+
+async def _invalidate(db: Any) -> None:
+    """취소된 쿼리를 실행하던 연결은 상태를 알 수 없으므로 풀에 돌려보내지 않음"""
+    try:
+        await db.invalidate()
+    except Exception as e:
+        logger.debug("세션 연결 무효화 실패: %s", e)
+
+
+async def run_with_deadline(
+    fn: Callable[[], Awaitable[T]],
+    timeout_ms: int,
+    request: Any = None,
+    db: Any = None
+) -> T:
+    """
+    기한과 클라이언트 연결 종료를 감시하며 작업 실행
+
+    기한이 지나거나 클라이언트가 연결을 끊으면 실행 중인 작업(쿼리)을 취소하고
+    세션 연결을 무효화한 뒤 QueryDeadlineExceeded / ClientDisconnected를 발생시킵니다.
+    작업 안에서는 current_statement_timeout_ms()로 기한을 읽어 DB 문장 타임아웃으로 전달합니다.
+    """
+    token = _statement_timeout_ms.set(timeout_ms)
+    try:
+        work = asyncio.ensure_future(fn())
+    finally:
+        _statement_timeout_ms.reset(token)
+
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request)) if request is not None else None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout_ms / 1000
+    disconnected = False
+
+    try:
+        pending = {work} | ({watcher} if watcher else set())
+        while not work.done():
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            done, _ = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if watcher in done:
+                pending.discard(watcher)
+                if watcher.result():
+                    disconnected = True
+                    break
+    except asyncio.CancelledError:
+        work.cancel()
+        raise
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+
+    if work.done():
+        return work.result()
+
+    work.cancel()
+    await asyncio.gather(work, return_exceptions=True)
+    if db is not None:
+        await _invalidate(db)
+
+    if disconnected:
+        logger.info("클라이언트 연결 종료로 쿼리를 취소했습니다.")
+        raise ClientDisconnected()
+    logger.warning("요청 기한(%dms) 초과로 쿼리를 취소했습니다.", timeout_ms)
+    raise QueryDeadlineExceeded(timeout_ms)
@@ -0,0 +1,53 @@
+import logging
+import os
+from typing import Any, Callable, Optional
+
+from sqlalchemy import select
+
+from app.models.trademark_document import TrademarkDocument
+
+
+logger = logging.getLogger("app.services.document_store")
+
+
+class DocumentStore:
+    """
+    미리 렌더링된 상표 응답 문서(읽기 모델) 사용 여부
+
+    문서는 로더가 적재 시 기록하므로 이 기능 이전에 적재된 데이터에는 없습니다. 시작 시와 새 데이터셋
+    버전이 발행될 때 문서 테이블에 행이 있는지 확인해, 문서가 없는 DB에서는 조회마다 문서를 찾지 않고
+    기존 ORM 변환 경로로 응답합니다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.available = False
+        self._session_factory: Optional[Callable[[], Any]] = None
+
+    @classmethod
+    def from_env(cls) -> "DocumentStore":
+        return cls(enabled=os.getenv("TRADEMARK_DOCUMENTS_ENABLED", "true").lower() in ("1", "true", "yes", "on"))
+
+    def configure(self, session_factory: Callable[[], Any]) -> None:
+        self._session_factory = session_factory
+
+    @property
+    def active(self) -> bool:
+        return self.enabled and self.available
+
+    async def refresh(self) -> bool:
+        """문서 테이블에 행이 있는지 다시 확인"""
+        if not self.enabled or self._session_factory is None:
+            return self.active
+        try:
+            async with self._session_factory() as session:
+                result = await session.execute(select(TrademarkDocument.trademark_id).limit(1))
+                self.available = result.first() is not None
+        except Exception as e:
+            logger.warning("상표 문서 테이블 확인 실패: %s", e)
+            self.available = False
+        return self.active
+
+
+# 프로세스 전역 문서 저장소 상태 (TRADEMARK_DOCUMENTS_ENABLED=false이면 항상 ORM 변환 경로 사용)
+document_store = DocumentStore.from_env()
@@ -0,0 +1,426 @@
+import asyncio
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import bindparam, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.middleware.admission_control import admission_controller
+from app.models.export_job import ExportJob
+from app.models.trademark import TradeMark
+from app.services.trademark_service import SearchParams, TrademarkRepository, statement_cache, trademark_to_dict
+
+
+logger = logging.getLogger("app.services.export_jobs")
+
+EXPORT_DIR = os.getenv("EXPORT_DIR") or os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "exports"
+)
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+EXPORT_WORKERS = int(os.getenv("EXPORT_WORKERS", "1"))
+EXPORT_POLL_INTERVAL_SECONDS = float(os.getenv("EXPORT_POLL_INTERVAL_SECONDS", "2"))
+# 실행 중 작업이 이 시간 동안 진행 기록을 남기지 않으면 다른 워커가 이어받음
+EXPORT_LEASE_SECONDS = float(os.getenv("EXPORT_LEASE_SECONDS", "30"))
+
+EXPORT_FORMATS = ("ndjson", "csv")
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+# CSV 컬럼 (목록 값은 | 로 연결)
+CSV_COLUMNS = [
+    "id", "productName", "productNameEng", "applicationNumber", "applicationDate",
+    "registerStatus", "publicationNumber", "publicationDate", "registrationNumber",
+    "registrationDate", "registrationPubNumber", "registrationPubDate",
+    "internationalRegNumbers", "internationalRegDate", "priorityClaimNumList",
+    "priorityClaimDateList", "asignProductMainCodeList", "asignProductSubCodeList",
+    "viennaCodeList",
+]
+
+
+def _utcnow() -> datetime:
+    # MySQL DATETIME은 초 단위로 저장하므로 어느 백엔드에서나 같은 값이 되도록 맞춤
+    return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+
+
+def export_file_path(job_id: str, format: str, directory: Optional[str] = None) -> str:
+    return os.path.join(directory or EXPORT_DIR, f"{job_id}.{format}.gz")
+
+
+def encode_records(records: List[Dict[str, Any]], format: str) -> bytes:
+    """레코드 묶음을 NDJSON 또는 CSV(헤더 제외) 바이트로 변환"""
+    if format == "ndjson":
+        return "".join(
+            json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records
+        ).encode("utf-8")
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for record in records:
+        writer.writerow([
+            "|".join("" if item is None else str(item) for item in value) if isinstance(value, list)
+            else "" if value is None else value
+            for value in (record.get(column) for column in CSV_COLUMNS)
+        ])
+    return buffer.getvalue().encode("utf-8")
+
+
+def csv_header() -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(CSV_COLUMNS)
+    return buffer.getvalue().encode("utf-8")
+
+
+def append_member(path: str, offset: int, data: bytes) -> int:
+    """
+    파일을 offset 위치로 자른 뒤 데이터를 독립된 gzip 멤버로 덧붙이고 새 크기를 반환
+
+    gzip 멤버를 이어 붙인 파일은 하나의 gzip 스트림으로 해제되므로,
+    배치마다 멤버를 완결해 두면 중단된 배치만 잘라내고 이어서 기록할 수 있습니다.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    mode = "r+b" if os.path.exists(path) else "wb"
+    with open(path, mode) as f:
+        f.truncate(offset)
+        f.seek(offset)
+        f.write(gzip.compress(data, compresslevel=6))
+        f.flush()
+        os.fsync(f.fileno())
+        return f.tell()
+
+
+def export_job_to_dict(job: ExportJob) -> Dict[str, Any]:
+    """작업 상태 응답 변환"""
+    progress = None
+    if job.total_count:
+        progress = round(min(job.exported_count / job.total_count, 1.0), 4)
+    elif job.status == JOB_COMPLETED:
+        progress = 1.0
+    return {
+        "id": job.id,
+        "status": job.status,
+        "format": job.format,
+        "params": job.params,
+        "total_count": job.total_count,
+        "exported_count": job.exported_count,
+        "progress": progress,
+        "file_size": job.file_size,
+        "error": job.error,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "updated_at": job.updated_at.isoformat() if job.updated_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "download_url": f"/api/exports/{job.id}/download" if job.status == JOB_COMPLETED else None,
+    }
+
+
+class ExportLeaseLost(Exception):
+    """작업이 취소되었거나 다른 워커가 이어받아 더 이상 진행할 수 없음"""
+
+
+class ExportJobService:
+    """내보내기 작업 등록/조회/취소"""
+
+    def __init__(self, db: AsyncSession, directory: Optional[str] = None):
+        self.db = db
+        self.directory = directory or EXPORT_DIR
+
+    async def create(self, params: SearchParams, format: str) -> ExportJob:
+        now = _utcnow()
+        job_id = uuid.uuid4().hex
+        job = ExportJob(
+            id=job_id,
+            status=JOB_QUEUED,
+            format=format,
+            params=params.model_dump(exclude={"page", "size"}, exclude_none=True),
+            exported_count=0,
+            last_id=0,
+            file_path=export_file_path(job_id, format, self.directory),
+            file_size=0,
+            lease_version=0,
+            created_at=now,
+            updated_at=now,
+        )
+        self.db.add(job)
+        await self.db.commit()
+        return job
+
+    async def get(self, job_id: str) -> Optional[ExportJob]:
+        return await self.db.get(ExportJob, job_id)
+
+    async def cancel(self, job_id: str) -> Optional[ExportJob]:
+        """
+        작업 취소 (완료된 작업은 파일 삭제)
+
+        실행 중인 작업은 워커가 다음 배치를 기록하기 전에 취소를 확인하고 중단합니다.
+        """
+        job = await self.get(job_id)
+        if job is None:
+            return None
+        if job.status in (JOB_QUEUED, JOB_RUNNING, JOB_COMPLETED):
+            job.status = JOB_CANCELLED
+            job.updated_at = job.finished_at = _utcnow()
+            await self.db.commit()
+        if job.file_path and os.path.exists(job.file_path):
+            os.remove(job.file_path)
+        return job
+
+
+class ExportRunner:
+    """
+    한 작업을 키셋 순서(id 오름차순)로 배치 단위 내보내기
+
+    배치마다 gzip 멤버 하나를 기록하고 (마지막 id, 건수, 파일 크기)를 같은 시점에
+    커밋하므로, 프로세스가 중간에 종료되어도 기록된 위치부터 이어서 진행합니다.
+    진행 기록은 직전 lease_version을 조건으로 갱신해, 취소되거나 다른 워커가 이어받은
+    작업은 더 이상 기록하지 않습니다. (updated_at은 임대 만료 판단에만 사용하며, 초 단위로
+    저장되는 백엔드에서도 비교가 어긋나지 않도록 소유권 확인에는 쓰지 않습니다.)
+    """
+
+    def __init__(self, db: AsyncSession, job: ExportJob, batch_size: int = EXPORT_BATCH_SIZE):
+        self.db = db
+        self.job = job
+        self.batch_size = batch_size
+        self.repository = TrademarkRepository(db)
+
+    def _batch_statement(self, params: SearchParams):
+        builder = self.repository.filtered_builder(params, None)
+        filtered = builder.build()
+        stmt = statement_cache.get_or_build(
+            ("export", filtered),
+            lambda: (filtered
+                .where(TradeMark.id > bindparam("export_last_id"))
+                .order_by(TradeMark.id)
+                .limit(bindparam("export_batch_size")))
+        )
+        return stmt, builder
+
+    async def run(self) -> None:
+        job = self.job
+        params = SearchParams(**job.params)
+        stmt, builder = self._batch_statement(params)
+
+        if job.total_count is None:
+            count_builder = self.repository.filtered_builder(params, None)
+            job.total_count = await self.repository.count(count_builder.build(), count_builder.params)
+            await self._checkpoint()
+        if job.file_size == 0:
+            # 결과가 없어도 내려받을 파일이 있도록 첫 멤버(CSV는 헤더, NDJSON은 빈 멤버)를 먼저 기록
+            header = csv_header() if job.format == "csv" else b""
+            job.file_size = await asyncio.to_thread(append_member, job.file_path, 0, header)
+            await self._checkpoint()
+
+        while True:
+            await self._wait_for_capacity()
+            result = await self.db.execute(stmt, {
+                **builder.params,
+                "export_last_id": job.last_id,
+                "export_batch_size": self.batch_size,
+            })
+            rows = result.scalars().all()
+            if not rows:
+                break
+            data = encode_records([trademark_to_dict(row) for row in rows], job.format)
+            job.file_size = await asyncio.to_thread(append_member, job.file_path, job.file_size, data)
+            job.last_id = rows[-1].id
+            job.exported_count += len(rows)
+            # 다음 배치에서 다시 읽으므로 세션에 ORM 객체를 쌓아 두지 않음
+            self.db.expunge_all()
+            await self._checkpoint()
+
+        job.status = JOB_COMPLETED
+        job.finished_at = _utcnow()
+        await self._checkpoint()
+
+    async def _checkpoint(self) -> None:
+        """진행 상황을 조건부로 기록 (작업 소유권이 없으면 ExportLeaseLost)"""
+        job = self.job
+        now = _utcnow()
+        result = await self.db.execute(
+            update(ExportJob)
+            .where(
+                ExportJob.id == job.id,
+                ExportJob.status == JOB_RUNNING,
+                ExportJob.lease_version == job.lease_version
+            )
+            .values(
+                status=job.status,
+                total_count=job.total_count,
+                exported_count=job.exported_count,
+                last_id=job.last_id,
+                file_size=job.file_size,
+                finished_at=job.finished_at,
+                lease_version=job.lease_version + 1,
+                updated_at=now
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.commit()
+        if result.rowcount != 1:
+            raise ExportLeaseLost(job.id)
+        job.lease_version += 1
+        job.updated_at = now
+
+    async def _wait_for_capacity(self) -> None:
+        """온라인 요청이 대기 중이면 배치 실행을 미룸 (임대는 계속 갱신)"""
+        touched = time.monotonic()
+        while admission_controller.is_overloaded():
+            await asyncio.sleep(0.2)
+            if time.monotonic() - touched > EXPORT_LEASE_SECONDS / 3:
+                await self._checkpoint()
+                touched = time.monotonic()
+
+
+class ExportWorker:
+    """
+    프로세스 내 백그라운드 내보내기 워커
+
+    작업 상태는 export_jobs 테이블에만 있으므로 여러 워커 프로세스가 조건부 UPDATE로
+    작업을 가져가며, 재시작 등으로 임대가 만료된 실행 중 작업은 기록된 위치부터 재개합니다.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = EXPORT_WORKERS,
+        poll_interval: float = EXPORT_POLL_INTERVAL_SECONDS,
+        lease_seconds: float = EXPORT_LEASE_SECONDS,
+        batch_size: int = EXPORT_BATCH_SIZE
+    ):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.batch_size = batch_size
+        self._session_factory: Optional[Callable[[], Any]] = None
+        self._tasks: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self.completed = 0
+        self.failed = 0
+
+    def start(self, session_factory: Callable[[], Any]) -> None:
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._tasks = [asyncio.ensure_future(self._run_loop()) for _ in range(self.concurrency)]
+
+    def notify(self) -> None:
+        """새 작업 등록 시 대기 중인 워커를 깨움"""
+        self._wakeup.set()
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run_loop(self) -> None:
+        while True:
+            try:
+                processed = await self.run_next()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("내보내기 작업 조회 실패: %s", e)
+                processed = False
+            if not processed:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def claim_next(self, db: AsyncSession) -> Optional[ExportJob]:
+        """대기 중이거나 임대가 만료된 작업 하나를 가져옴"""
+        stale_before = _utcnow() - timedelta(seconds=self.lease_seconds)
+        result = await db.execute(
+            select(ExportJob)
+            .where(or_(
+                ExportJob.status == JOB_QUEUED,
+                (ExportJob.status == JOB_RUNNING) & (ExportJob.updated_at < stale_before)
+            ))
+            .order_by(ExportJob.created_at)
+            .limit(1)
+        )
+        job = result.scalar_one_or_none()
+        if job is None:
+            return None
+        # 진행 기록은 조건부 UPDATE로만 반영하므로 세션 추적에서 분리
+        db.expunge(job)
+        now = _utcnow()
+        claimed = await db.execute(
+            update(ExportJob)
+            .where(
+                ExportJob.id == job.id,
+                ExportJob.status == job.status,
+                ExportJob.lease_version == job.lease_version
+            )
+            .values(status=JOB_RUNNING, lease_version=job.lease_version + 1, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        if claimed.rowcount != 1:
+            return None
+        if job.status == JOB_RUNNING:
+            logger.info("내보내기 작업 %s 재개 (%d건 기록됨)", job.id, job.exported_count)
+        job.status = JOB_RUNNING
+        job.lease_version += 1
+        job.updated_at = now
+        return job
+
+    async def run_next(self) -> bool:
+        """작업 하나를 가져와 끝까지 실행 (가져온 작업이 없으면 False)"""
+        async with self._session_factory() as db:
+            job = await self.claim_next(db)
+            if job is None:
+                return False
+            try:
+                await ExportRunner(db, job, self.batch_size).run()
+                self.completed += 1
+            except ExportLeaseLost:
+                logger.info("내보내기 작업 %s 중단 (취소 또는 다른 워커가 이어받음)", job.id)
+                current = await db.get(ExportJob, job.id)
+                # 취소와 마지막 배치 기록이 엇갈려 남은 파일 정리
+                if current is not None and current.status == JOB_CANCELLED and os.path.exists(job.file_path):
+                    os.remove(job.file_path)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # 롤백하면 마지막으로 기록한 임대 버전을 잃으므로 먼저 보관
+                job_id, lease_version = job.id, job.lease_version
+                await db.rollback()
+                # 임대가 만료되어 다른 워커가 이어받은 작업은 실패로 기록하지 않음
+                result = await db.execute(
+                    update(ExportJob)
+                    .where(
+                        ExportJob.id == job_id,
+                        ExportJob.status == JOB_RUNNING,
+                        ExportJob.lease_version == lease_version
+                    )
+                    .values(status=JOB_FAILED, error=str(e)[:1000], updated_at=_utcnow(), finished_at=_utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+                await db.commit()
+                if result.rowcount:
+                    self.failed += 1
+                    logger.warning("내보내기 작업 %s 실패: %s", job_id, e)
+                else:
+                    logger.info("내보내기 작업 %s 실패 (취소 또는 다른 워커가 이어받아 기록하지 않음): %s", job_id, e)
+            return True
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": len([task for task in self._tasks if not task.done()]),
+            "completed": self.completed,
+            "failed": self.failed,
+        }
+
+
+export_worker = ExportWorker()
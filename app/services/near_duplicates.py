@@ -0,0 +1,161 @@
+from itertools import combinations
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import and_, bindparam, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.trademark import TradeMark
+from app.models.trademark_lsh_bucket import TrademarkLshBucket
+from app.models.trademark_signature import TrademarkSignature
+from app.utils.minhash import LSH_BANDS, Signature, estimate_similarity, lsh_buckets, unpack_signature
+
+
+# 기본 유사도 임계값 (글자 조각 자카드 유사도 추정치)
+DEFAULT_SIMILARITY_THRESHOLD = 0.5
+# 한 버킷의 구성원이 이보다 많으면 흔한 조각으로 만들어진 버킷으로 보고 군집 후보 쌍 생성에서 제외
+MAX_BUCKET_SIZE = 500
+_SIGNATURE_CHUNK_SIZE = 1000
+
+# 대상 서명 조회
+_TARGET_SELECT = (
+    select(TradeMark.id, TrademarkSignature.signature)
+    .outerjoin(TrademarkSignature, TrademarkSignature.trademark_id == TradeMark.id)
+    .where(TradeMark.applicationNumber == bindparam("application_number"))
+)
+# 밴드마다 (band, bucket) 인덱스 탐색 한 번으로 후보 수집 (밴드 수가 고정이므로 문장도 하나)
+_CANDIDATE_SELECT = select(TrademarkLshBucket.trademark_id).where(or_(*(
+    and_(TrademarkLshBucket.band == band, TrademarkLshBucket.bucket == bindparam(f"bucket{band}"))
+    for band in range(LSH_BANDS)
+))).distinct()
+_SIGNATURES_SELECT = select(TrademarkSignature.trademark_id, TrademarkSignature.signature).where(
+    TrademarkSignature.trademark_id.in_(bindparam("ids", expanding=True))
+)
+_TRADEMARKS_SELECT = select(TradeMark).where(TradeMark.id.in_(bindparam("ids", expanding=True)))
+_BUCKETS_SCAN = select(
+    TrademarkLshBucket.band, TrademarkLshBucket.bucket, TrademarkLshBucket.trademark_id
+).order_by(TrademarkLshBucket.band, TrademarkLshBucket.bucket, TrademarkLshBucket.trademark_id)
+
+
+async def _load_signatures(db: AsyncSession, ids: Iterable[int]) -> Dict[int, Signature]:
+    ids = sorted(ids)
+    signatures: Dict[int, Signature] = {}
+    for start in range(0, len(ids), _SIGNATURE_CHUNK_SIZE):
+        result = await db.execute(_SIGNATURES_SELECT, {"ids": ids[start:start + _SIGNATURE_CHUNK_SIZE]})
+        signatures.update((trademark_id, unpack_signature(data)) for trademark_id, data in result.all())
+    return signatures
+
+
+async def find_similar(
+    db: AsyncSession,
+    application_number: str,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    limit: int = 20
+) -> Optional[List[Tuple[float, TradeMark]]]:
+    """
+    출원번호 상표와 상표명이 유사한 상표를 (유사도, 상표) 목록으로 조회
+
+    LSH 버킷을 하나 이상 공유하는 상표만 후보로 읽고 서명으로 유사도를 추정하므로
+    전체 행을 훑지 않습니다. 상표가 없으면 None을 반환합니다.
+    """
+    result = await db.execute(_TARGET_SELECT, {"application_number": application_number})
+    target = result.first()
+    if target is None:
+        return None
+    target_id, data = target
+    if data is None:
+        return []
+    signature = unpack_signature(data)
+
+    result = await db.execute(
+        _CANDIDATE_SELECT, {f"bucket{band}": bucket for band, bucket in lsh_buckets(signature)}
+    )
+    candidate_ids = [trademark_id for trademark_id in result.scalars().all() if trademark_id != target_id]
+    if not candidate_ids:
+        return []
+
+    signatures = await _load_signatures(db, candidate_ids)
+    scored = sorted(
+        (
+            (estimate_similarity(signature, candidate), trademark_id)
+            for trademark_id, candidate in signatures.items()
+        ),
+        key=lambda item: (-item[0], item[1])
+    )
+    scored = [(similarity, trademark_id) for similarity, trademark_id in scored if similarity >= threshold][:limit]
+    if not scored:
+        return []
+
+    result = await db.execute(_TRADEMARKS_SELECT, {"ids": [trademark_id for _, trademark_id in scored]})
+    trademarks = {trademark.id: trademark for trademark in result.scalars().all()}
+    return [
+        (similarity, trademarks[trademark_id])
+        for similarity, trademark_id in scored
+        if trademark_id in trademarks
+    ]
+
+
+class _DisjointSet:
+    """합집합-찾기 (큰 군집에서도 재귀 한도에 걸리지 않도록 반복 탐색, 크기 기준 합치기)"""
+
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+        self.size: Dict[int, int] = {}
+
+    def find(self, item: int) -> int:
+        root = self.parent.setdefault(item, item)
+        while self.parent[root] != root:
+            root = self.parent[root]
+        # 경로 압축
+        while item != root:
+            self.parent[item], item = root, self.parent[item]
+        return root
+
+    def union(self, first: int, second: int) -> None:
+        first, second = self.find(first), self.find(second)
+        if first == second:
+            return
+        if self.size.get(first, 1) < self.size.get(second, 1):
+            first, second = second, first
+        self.parent[second] = first
+        self.size[first] = self.size.get(first, 1) + self.size.get(second, 1)
+
+
+async def find_clusters(
+    db: AsyncSession,
+    threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    max_bucket_size: int = MAX_BUCKET_SIZE
+) -> List[List[int]]:
+    """
+    전체 상표의 유사 상표 군집 계산 (오프라인 작업용)
+
+    (밴드, 버킷) 순서로 버킷 테이블을 한 번 훑어 같은 버킷의 상표 쌍만 후보로 만들고,
+    서명으로 검증한 쌍을 합쳐(union-find) 군집을 구성합니다.
+    구성원이 2개 이상인 군집의 상표 id 목록을 큰 군집부터 반환합니다.
+    """
+    pairs = set()
+    current_key = None
+    members: List[int] = []
+
+    def flush() -> None:
+        if 1 < len(members) <= max_bucket_size:
+            pairs.update(combinations(members, 2))
+
+    result = await db.stream(_BUCKETS_SCAN)
+    async for band, bucket, trademark_id in result:
+        if (band, bucket) != current_key:
+            flush()
+            current_key, members = (band, bucket), []
+        members.append(trademark_id)
+    flush()
+
+    signatures = await _load_signatures(db, {trademark_id for pair in pairs for trademark_id in pair})
+    clusters = _DisjointSet()
+    for first, second in pairs:
+        if first in signatures and second in signatures:
+            if estimate_similarity(signatures[first], signatures[second]) >= threshold:
+                clusters.union(first, second)
+
+    groups: Dict[int, List[int]] = {}
+    for trademark_id in clusters.parent:
+        groups.setdefault(clusters.find(trademark_id), []).append(trademark_id)
+    return sorted((sorted(group) for group in groups.values()), key=lambda group: (-len(group), group[0]))
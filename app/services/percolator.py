@@ -0,0 +1,124 @@
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.saved_query import SavedQuery
+from app.search_index.builder import name_grams, query_grams
+
+
+@dataclass(frozen=True)
+class PercolatorQuery:
+    """역방향 대조에 필요한 저장 검색 조건 (keyword, product_code는 소문자)"""
+    id: int
+    keyword: Optional[str] = None
+    status: Optional[str] = None
+    product_code: Optional[str] = None
+
+    @classmethod
+    def of(cls, query: SavedQuery) -> "PercolatorQuery":
+        return cls(
+            id=query.id,
+            keyword=query.keyword.lower() if query.keyword else None,
+            status=query.status or None,
+            product_code=query.product_code.lower() if query.product_code else None,
+        )
+
+    def matches(self, names: List[str], status: Optional[str], codes: Set[str]) -> bool:
+        """
+        지정된 조건을 모두 만족하는지 확인 (names는 소문자 상표명/영문 상표명, codes는 소문자 분류 코드)
+
+        상품 분류 코드는 검색 API와 같이 부분 일치입니다 (예: "3"은 30류, 35류와 일치).
+        """
+        if self.status is not None and status != self.status:
+            return False
+        if self.product_code is not None and not any(self.product_code in code for code in codes):
+            return False
+        if self.keyword is not None and not any(self.keyword in name for name in names):
+            return False
+        return True
+
+
+class Percolator:
+    """
+    저장된 검색 조건에 대한 역방향 대조(percolator)
+
+    상표마다 모든 저장 검색을 실행하는 대신 검색 조건 자체를 색인합니다. 검색어가 있는 조건은
+    검색어가 포함하는 n-gram(query_grams) 중 저장 조건 사이에서 가장 드문 하나를 기준 gram으로,
+    검색어 없이 분류가 있는 조건은 분류 코드 검색어로, 둘 다 없는 조건은 등록 상태로 색인합니다.
+    상표 한 건은 상표명 n-gram·분류 코드의 부분 문자열·상태로 색인을 찾아 나온 후보 조건만 전체 조건으로 확인합니다.
+    """
+
+    def __init__(self, queries: Iterable[PercolatorQuery]):
+        self.by_gram: Dict[str, List[PercolatorQuery]] = defaultdict(list)
+        self.by_code: Dict[str, List[PercolatorQuery]] = defaultdict(list)
+        self.by_status: Dict[str, List[PercolatorQuery]] = defaultdict(list)
+        self.size = 0
+        self.candidates = 0
+
+        queries = list(queries)
+        gram_counts = Counter(
+            gram for query in queries if query.keyword for gram in query_grams(query.keyword)
+        )
+        for query in queries:
+            if query.keyword:
+                anchor = min(query_grams(query.keyword), key=lambda gram: (gram_counts[gram], gram))
+                self.by_gram[anchor].append(query)
+            elif query.product_code:
+                self.by_code[query.product_code].append(query)
+            elif query.status:
+                self.by_status[query.status].append(query)
+            else:
+                # 조건이 없는 검색은 등록 단계에서 거절하므로 색인하지 않음
+                continue
+            self.size += 1
+
+    @classmethod
+    def from_saved_queries(cls, queries: Iterable[SavedQuery]) -> "Percolator":
+        return cls(PercolatorQuery.of(query) for query in queries)
+
+    def match(self, record: Dict[str, Any]) -> List[int]:
+        """상표 레코드와 일치하는 저장 검색 id 목록 (id 오름차순)"""
+        if not self.size:
+            return []
+        names = [(record.get("productName") or "").lower(), (record.get("productNameEng") or "").lower()]
+        status = record.get("registerStatus")
+        codes = {code.lower() for code in record.get("asignProductMainCodeList") or []}
+
+        candidates: Dict[int, PercolatorQuery] = {}
+        if self.by_gram:
+            grams: Set[str] = set()
+            for name in names:
+                grams |= name_grams(name)
+            for gram in grams:
+                for query in self.by_gram.get(gram, ()):
+                    candidates[query.id] = query
+        if self.by_code:
+            # 분류 코드는 짧으므로 부분 문자열을 모두 찾아봄 (검색 API의 부분 일치와 같음)
+            for code in _substrings(codes):
+                for query in self.by_code.get(code, ()):
+                    candidates[query.id] = query
+        for query in self.by_status.get(status, ()):
+            candidates[query.id] = query
+
+        self.candidates += len(candidates)
+        return sorted(
+            query_id for query_id, query in candidates.items() if query.matches(names, status, codes)
+        )
+
+
+def _substrings(values: Iterable[str]) -> Set[str]:
+    return {
+        value[start:end]
+        for value in values
+        for start in range(len(value))
+        for end in range(start + 1, len(value) + 1)
+    }
+
+
+async def load_percolator(db: AsyncSession) -> Percolator:
+    """저장된 모든 검색 조건으로 대조기 구성"""
+    result = await db.execute(select(SavedQuery))
+    return Percolator.from_saved_queries(result.scalars().all())
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from app.middleware.admission_control import admission_controller
+
+
+logger = logging.getLogger("app.services.prefetch")
+
+# fetch(db)는 결과를 반환하며, 캐시하면 안 되는 결과(부분 결과 등)는 None을 반환
+Fetch = Callable[[Any], Awaitable[Optional[Dict[str, Any]]]]
+
+
+async def _invalidate(db: Any) -> None:
+    try:
+        await db.invalidate()
+    except Exception as e:
+        logger.debug("프리패치 세션 연결 무효화 실패: %s", e)
+
+
+class PagePrefetcher:
+    """
+    다음 결과 페이지 예측 프리패치
+
+    N페이지를 응답한 뒤 같은 조건의 N+1페이지를 백그라운드 태스크로 미리 검색해 짧은 TTL의
+    메모리 캐시에 담아 두고, 다음 페이지 요청은 DB를 거치지 않고 캐시에서 응답합니다.
+    프리패치는 부가 작업이므로 동시 실행 수(max_in_flight), 캐시 크기, 페이지 깊이(max_page)를
+    제한하고, 어드미션 제어 대기열이 쌓이면(과부하) 예약하지 않으며 실행 중인 프리패치도 취소합니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        ttl_seconds: float = 30.0,
+        max_entries: int = 256,
+        max_in_flight: int = 4,
+        max_page: int = 20,
+        timeout_seconds: float = 5.0,
+        is_overloaded: Callable[[], bool] = lambda: False,
+    ):
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_in_flight = max_in_flight
+        self.max_page = max_page
+        self.timeout_seconds = timeout_seconds
+        self.is_overloaded = is_overloaded
+        self._session_factory: Optional[Callable[[], Any]] = None
+        self._entries: "OrderedDict[Hashable, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self.scheduled = 0
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+        self.cancelled = 0
+        self.failed = 0
+
+    @classmethod
+    def from_env(cls, is_overloaded: Callable[[], bool]) -> "PagePrefetcher":
+        return cls(
+            enabled=os.getenv("SEARCH_PREFETCH_ENABLED", "false").lower() in ("1", "true", "yes", "on"),
+            ttl_seconds=float(os.getenv("SEARCH_PREFETCH_TTL_SECONDS", "30")),
+            max_entries=int(os.getenv("SEARCH_PREFETCH_MAX_ENTRIES", "256")),
+            max_in_flight=int(os.getenv("SEARCH_PREFETCH_MAX_IN_FLIGHT", "4")),
+            max_page=int(os.getenv("SEARCH_PREFETCH_MAX_PAGE", "20")),
+            timeout_seconds=float(os.getenv("SEARCH_PREFETCH_TIMEOUT_SECONDS", "5")),
+            is_overloaded=is_overloaded,
+        )
+
+    def configure(self, session_factory: Callable[[], Any]) -> None:
+        """프리패치 검색에 사용할 세션 팩토리 설정 (요청 세션은 응답 후 닫히므로 별도 세션 사용)"""
+        self._session_factory = session_factory
+
+    @property
+    def active(self) -> bool:
+        return self.enabled and self._session_factory is not None
+
+    async def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        """프리패치된 결과 (실행 중이면 완료를 기다림, 없거나 만료되었으면 None)"""
+        if not self.active:
+            return None
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            task = self._in_flight.get(key)
+            if task is not None:
+                try:
+                    entry = await asyncio.shield(task)
+                except asyncio.CancelledError:
+                    # 프리패치가 취소된 경우만 미스로 처리 (요청 자체의 취소는 전파)
+                    if not task.cancelled():
+                        raise
+                    entry = None
+                # 기다리는 동안 캐시에 저장되었으면 한 번만 사용
+                self._entries.pop(key, None)
+        if entry is None or time.monotonic() - entry[0] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def schedule(self, key: Hashable, page: int, fetch: Fetch) -> bool:
+        """page 번째 페이지 프리패치 예약 (제한에 걸리거나 과부하이면 예약하지 않음)"""
+        if not self.active:
+            return False
+        if self.is_overloaded():
+            self.cancel_all()
+            self.dropped += 1
+            return False
+        if page > self.max_page or key in self._in_flight or key in self._entries:
+            return False
+        if len(self._in_flight) >= self.max_in_flight:
+            self.dropped += 1
+            return False
+        task = asyncio.ensure_future(self._run(key, fetch))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._forget(key, done))
+        self.scheduled += 1
+        return True
+
+    async def _run(self, key: Hashable, fetch: Fetch) -> Optional[Tuple[float, Dict[str, Any]]]:
+        # 예약과 실행 사이에 부하가 생겼으면 DB에 보내지 않음
+        if self.is_overloaded():
+            self.cancelled += 1
+            return None
+        try:
+            async with self._session_factory() as db:
+                try:
+                    result = await asyncio.wait_for(fetch(db), self.timeout_seconds)
+                except (asyncio.TimeoutError, asyncio.CancelledError):
+                    # 취소된 쿼리를 실행하던 연결은 상태를 알 수 없으므로 풀에 돌려보내지 않음
+                    await _invalidate(db)
+                    raise
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self.failed += 1
+            logger.debug("다음 페이지 프리패치 실패: %s", e)
+            return None
+        if result is None:
+            return None
+        entry = (time.monotonic(), result)
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return entry
+
+    def _forget(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()
+
+    def cancel_all(self) -> None:
+        """실행 중인 프리패치 모두 취소"""
+        for task in list(self._in_flight.values()):
+            if task.cancel():
+                self.cancelled += 1
+
+    def clear(self) -> None:
+        self.cancel_all()
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._entries),
+            "in_flight": len(self._in_flight),
+            "scheduled": self.scheduled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "dropped": self.dropped,
+            "cancelled": self.cancelled,
+            "failed": self.failed,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+# 프로세스 전역 프리패처 (SEARCH_PREFETCH_ENABLED=true일 때만 동작)
+page_prefetcher = PagePrefetcher.from_env(admission_controller.is_overloaded)
@@ -0,0 +1,292 @@
+import re
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy import String, and_, bindparam, or_, select, true
+
+from app.models.trademark import TradeMark
+from app.models.trademark_vienna_code import TrademarkViennaCode
+from app.utils.name_normalization import normalize_name
+from app.utils.vienna import normalize_vienna_code, vienna_prefix_range
+
+
+# 검색식 예: name:"프레스*" AND class:30 NOT status:거절
+#
+#   expr    := or
+#   or      := and ("OR" and)*
+#   and     := unary (["AND"] unary)*      (연산자가 없으면 AND)
+#   unary   := "NOT" unary | primary
+#   primary := "(" expr ")" | [field ":"] (word | "phrase")
+#
+# - 필드: name(한글/영문 상표명), eng(영문 상표명), status, class, vienna, date
+# - 필드가 없으면 name과 같이 처리합니다.
+# - 상표명: 단어는 부분 일치, 따옴표 구는 완전 일치, 끝의 *는 접두 일치 (모두 정규화 상표명 기준)
+# - class: 코드 완전 일치, 끝의 *는 접두 일치
+# - vienna: 대/중/소분류 어느 깊이든 하위 분류까지 일치 (예: vienna:01.01 → 010103 포함)
+# - date: YYYY, YYYYMM, YYYYMMDD 또는 시작..종료 범위 (한쪽 생략 가능)
+
+FIELDS = ("name", "eng", "status", "class", "vienna", "date")
+MAX_TERMS = 32
+
+_TOKEN = re.compile(r'\s*(?:(?P<paren>[()])|(?P<field>\w+):|"(?P<phrase>[^"]*)"|(?P<word>[^\s()"]+))')
+_DATE = re.compile(r"^\d{4}(\d{2}(\d{2})?)?$")
+
+# 검색어의 %, _를 LIKE 와일드카드가 아닌 문자 그대로 비교하기 위한 이스케이프 문자
+LIKE_ESCAPE = "\\"
+
+
+def escape_like(value: str) -> str:
+    """LIKE 패턴에 넣을 값의 와일드카드(%, _)와 이스케이프 문자를 이스케이프"""
+    return value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2).replace("%", LIKE_ESCAPE + "%").replace("_", LIKE_ESCAPE + "_")
+
+
+class QuerySyntaxError(ValueError):
+    """검색식을 해석할 수 없음 (400 응답으로 변환)"""
+
+
+@dataclass(frozen=True)
+class Term:
+    field: str
+    value: str
+    phrase: bool = False
+
+    @property
+    def prefix(self) -> bool:
+        return self.value.endswith("*")
+
+
+@dataclass(frozen=True)
+class Not:
+    child: "Node"
+
+
+@dataclass(frozen=True)
+class And:
+    children: Tuple["Node", ...]
+
+
+@dataclass(frozen=True)
+class Or:
+    children: Tuple["Node", ...]
+
+
+Node = Union[Term, Not, And, Or]
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens: List[Tuple[str, str]] = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise QuerySyntaxError(f"검색식을 해석할 수 없습니다: {text[position:]}")
+        position = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str):
+        self.tokens = _tokenize(text)
+        self.position = 0
+        self.terms = 0
+
+    def peek(self) -> Optional[Tuple[str, str]]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def next(self) -> Tuple[str, str]:
+        token = self.peek()
+        if token is None:
+            raise QuerySyntaxError("검색식이 중간에 끝났습니다.")
+        self.position += 1
+        return token
+
+    def is_operator(self, name: str) -> bool:
+        return self.peek() == ("word", name)
+
+    def parse(self) -> "Node":
+        if not self.tokens:
+            raise QuerySyntaxError("검색식이 비어 있습니다.")
+        node = self.parse_or()
+        if self.peek() is not None:
+            raise QuerySyntaxError(f"예상하지 못한 토큰입니다: {self.peek()[1]}")
+        return node
+
+    def parse_or(self) -> "Node":
+        children = [self.parse_and()]
+        while self.is_operator("OR"):
+            self.next()
+            children.append(self.parse_and())
+        return children[0] if len(children) == 1 else Or(tuple(children))
+
+    def parse_and(self) -> "Node":
+        children = [self.parse_unary()]
+        while self.peek() is not None and self.peek() != ("paren", ")") and not self.is_operator("OR"):
+            if self.is_operator("AND"):
+                self.next()
+            children.append(self.parse_unary())
+        return children[0] if len(children) == 1 else And(tuple(children))
+
+    def parse_unary(self) -> "Node":
+        if self.is_operator("NOT"):
+            self.next()
+            return Not(self.parse_unary())
+        return self.parse_primary()
+
+    def parse_primary(self) -> "Node":
+        kind, value = self.next()
+        if (kind, value) == ("paren", "("):
+            node = self.parse_or()
+            if self.next() != ("paren", ")"):
+                raise QuerySyntaxError("닫는 괄호가 없습니다.")
+            return node
+        if kind == "paren":
+            raise QuerySyntaxError("여는 괄호가 없습니다.")
+
+        field = "name"
+        if kind == "field":
+            field = value.lower()
+            if field not in FIELDS:
+                raise QuerySyntaxError(f"지원하지 않는 필드입니다: {value}")
+            kind, value = self.next()
+            if kind not in ("word", "phrase"):
+                raise QuerySyntaxError(f"'{field}:' 다음에 검색어가 필요합니다.")
+        elif value in ("AND", "OR", "NOT"):
+            raise QuerySyntaxError(f"연산자 위치가 올바르지 않습니다: {value}")
+
+        self.terms += 1
+        if self.terms > MAX_TERMS:
+            raise QuerySyntaxError(f"검색어는 최대 {MAX_TERMS}개까지 사용할 수 있습니다.")
+        return Term(field=field, value=value, phrase=kind == "phrase")
+
+
+def parse_query(text: str) -> "Node":
+    """검색식 문자열을 구문 트리로 변환"""
+    return _Parser(text).parse()
+
+
+def _parse_date_bound(value: str, end: bool) -> Optional[date]:
+    """YYYY, YYYYMM, YYYYMMDD를 구간의 시작일 또는 마지막 날로 변환"""
+    if not value:
+        return None
+    if not _DATE.match(value):
+        raise QuerySyntaxError(f"날짜 형식이 올바르지 않습니다: {value}")
+    try:
+        year = int(value[:4])
+        if len(value) == 4:
+            return date(year, 12, 31) if end else date(year, 1, 1)
+        month = int(value[4:6])
+        if len(value) == 6:
+            start = date(year, month, 1)
+            if not end:
+                return start
+            next_month = date(year + month // 12, month % 12 + 1, 1)
+            return next_month - timedelta(days=1)
+        return date(year, month, int(value[6:8]))
+    except ValueError:
+        raise QuerySyntaxError(f"존재하지 않는 날짜입니다: {value}")
+
+
+class _Compiler:
+    """구문 트리를 바인드 파라미터를 쓰는 SQL 조건과 형태(shape)로 변환"""
+
+    def __init__(self):
+        self.params: Dict[str, Any] = {}
+
+    def bind(self, value: Any) -> Any:
+        name = f"q{len(self.params)}"
+        self.params[name] = value
+        return bindparam(name)
+
+    def compile(self, node: "Node") -> Tuple[Any, Any]:
+        if isinstance(node, And):
+            compiled = [self.compile(child) for child in node.children]
+            return and_(*[clause for clause, _ in compiled]), ("and", tuple(shape for _, shape in compiled))
+        if isinstance(node, Or):
+            compiled = [self.compile(child) for child in node.children]
+            return or_(*[clause for clause, _ in compiled]), ("or", tuple(shape for _, shape in compiled))
+        if isinstance(node, Not):
+            clause, shape = self.compile(node.child)
+            # NULL 컬럼도 "해당하지 않음"으로 포함되도록 IS NOT TRUE 사용
+            return clause.is_not(true()), ("not", shape)
+        return self.compile_term(node)
+
+    def compile_term(self, term: Term) -> Tuple[Any, Any]:
+        if term.field in ("name", "eng"):
+            return self.compile_name(term)
+        if term.field == "status":
+            return TradeMark.registerStatus == self.bind(term.value), ("status",)
+        if term.field == "class":
+            code = escape_like(term.value.rstrip("*"))
+            # JSON 배열 문자열에서 따옴표까지 포함해 비교 (원소 단위 완전/접두 일치)
+            pattern = f'%"{code}%' if term.prefix else f'%"{code}"%'
+            return (
+                TradeMark.asignProductMainCodeList.cast(String).like(self.bind(pattern), escape=LIKE_ESCAPE),
+                ("class", term.prefix)
+            )
+        if term.field == "vienna":
+            return self.compile_vienna(term)
+        return self.compile_date(term)
+
+    def compile_vienna(self, term: Term) -> Tuple[Any, Any]:
+        prefix = normalize_vienna_code(term.value.rstrip("*"))
+        if prefix is None:
+            raise QuerySyntaxError(f"비엔나 코드 형식이 올바르지 않습니다: {term.value}")
+        start, end = vienna_prefix_range(prefix)
+        # 정규화 코드 색인의 범위 탐색 (JSON 컬럼을 훑지 않음)
+        condition = TrademarkViennaCode.code >= self.bind(start)
+        if end is not None:
+            condition = and_(condition, TrademarkViennaCode.code < self.bind(end))
+        matched = select(TrademarkViennaCode.trademark_id).where(condition)
+        return TradeMark.id.in_(matched), ("vienna", end is not None)
+
+    def compile_name(self, term: Term) -> Tuple[Any, Any]:
+        normalized = normalize_name(term.value)
+        if not normalized:
+            raise QuerySyntaxError(f"검색어가 비어 있습니다: {term.value}")
+        columns = [TradeMark.productNameEngNorm] if term.field == "eng" else [
+            TradeMark.productNameNorm, TradeMark.productNameEngNorm
+        ]
+        if term.prefix:
+            mode = "prefix"
+            value = self.bind(f"{normalized}%")
+            clauses = [column.like(value) for column in columns]
+        elif term.phrase:
+            mode = "exact"
+            value = self.bind(normalized)
+            clauses = [column == value for column in columns]
+        else:
+            mode = "contains"
+            value = self.bind(f"%{normalized}%")
+            clauses = [column.like(value) for column in columns]
+        return or_(*clauses), (term.field, mode)
+
+    def compile_date(self, term: Term) -> Tuple[Any, Any]:
+        if ".." in term.value:
+            start, _, end = term.value.partition("..")
+        else:
+            start = end = term.value
+        date_from = _parse_date_bound(start, end=False)
+        date_to = _parse_date_bound(end, end=True)
+        if date_from is None and date_to is None:
+            raise QuerySyntaxError("날짜 범위가 비어 있습니다.")
+        clauses = []
+        if date_from is not None:
+            clauses.append(TradeMark.applicationDate >= self.bind(date_from))
+        if date_to is not None:
+            clauses.append(TradeMark.applicationDate <= self.bind(date_to))
+        return and_(*clauses), ("date", date_from is not None, date_to is not None)
+
+
+def compile_query(text: str) -> Tuple[Any, Dict[str, Any], Any]:
+    """
+    검색식을 (SQL 조건, 바인드 파라미터, 형태)로 컴파일
+
+    형태는 값과 무관한 구조 식별자이므로 같은 구조의 검색식은 문장 캐시를 공유합니다.
+    """
+    compiler = _Compiler()
+    clause, shape = compiler.compile(parse_query(text))
+    return clause, compiler.params, shape
@@ -0,0 +1,283 @@
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.column_statistics import ColumnStatistic
+from app.models.trademark import TradeMark
+
+
+logger = logging.getLogger("app.services.query_planner")
+
+STATUS_COLUMN = "registerStatus"
+YEAR_COLUMN = "applicationYear"
+CLASS_COLUMN = "asignProductMainCode"
+TOTAL_COLUMN = "__total__"
+NULL_VALUE = "__null__"
+
+# 필터별 구동 인덱스 (인덱스가 없거나 선행 와일드카드라 인덱스를 쓸 수 없는 필터는 None)
+FILTER_INDEXES: Dict[str, Optional[str]] = {
+    "status": "ix_trademarks_registerStatus",
+    "application_date": "ix_trademarks_applicationDate",
+    "keyword": None,
+    "product_code": None,
+    # 정규화 상표명은 한글/영문 두 인덱스를 병합(index merge)해야 하므로 단일 인덱스로 고정하지 않음
+    "name": None,
+}
+
+# 정규화 상표명 일치 방식별 예상 선택도 (부분 일치는 통계로 추정할 수 없음)
+NAME_MATCH_SELECTIVITY: Dict[str, float] = {
+    "exact": 0.001,
+    "prefix": 0.01,
+}
+
+# 통계로 선택도를 추정하지 않는 필터 (검색식, 비엔나 코드/유사군 코드 하위 쿼리)
+# 이런 필터가 있으면 옵티마이저가 하위 쿼리나 PRIMARY 조회로 구동할 수 있도록 인덱스를 강제하지 않음
+UNESTIMATED_FILTERS = ("q", "vienna_code", "sub_code")
+
+# 예상 선택도가 이 값보다 크면 인덱스를 강제하지 않고 옵티마이저에 맡김
+MAX_DRIVING_SELECTIVITY = float(os.getenv("PLANNER_MAX_DRIVING_SELECTIVITY", "0.3"))
+
+# 통계를 추정할 수 없는 필터(부분 일치 키워드 등)에 사용하는 기본 선택도
+DEFAULT_SELECTIVITY = 0.5
+
+
+@dataclass
+class ColumnStatistics:
+    """상태 값 분포, 출원 연도 히스토그램, 상품 분류 코드 빈도"""
+    total_rows: int = 0
+    status_counts: Dict[str, int] = field(default_factory=dict)
+    year_histogram: Dict[int, int] = field(default_factory=dict)
+    class_counts: Dict[str, int] = field(default_factory=dict)
+
+    def status_selectivity(self, status: str) -> float:
+        """등록 상태 필터의 예상 선택도"""
+        if not self.total_rows:
+            return DEFAULT_SELECTIVITY
+        return self.status_counts.get(status, 0) / self.total_rows
+
+    def date_range_selectivity(self, date_from: Optional[date], date_to: Optional[date]) -> float:
+        """출원일 범위 필터의 예상 선택도 (연도 버킷 내부는 균등 분포로 가정)"""
+        if not self.total_rows:
+            return DEFAULT_SELECTIVITY
+
+        matched = 0.0
+        for year, count in self.year_histogram.items():
+            year_start = date(year, 1, 1)
+            year_end = date(year, 12, 31)
+            start = max(year_start, date_from) if date_from else year_start
+            end = min(year_end, date_to) if date_to else year_end
+            if start > end:
+                continue
+            covered_days = (end - start).days + 1
+            year_days = (year_end - year_start).days + 1
+            matched += count * covered_days / year_days
+        return matched / self.total_rows
+
+    def product_code_selectivity(self, product_code: str) -> float:
+        """
+        상품 분류 코드 필터의 예상 선택도
+
+        검색 필터는 분류 코드 부분 일치(대소문자 무시)이므로 검색어를 포함하는 모든 코드의 빈도를 더합니다.
+        여러 코드가 일치하는 행은 중복 집계되므로 1을 넘지 않는 상한 추정입니다.
+        """
+        if not self.total_rows:
+            return DEFAULT_SELECTIVITY
+        needle = product_code.lower()
+        matched = sum(count for code, count in self.class_counts.items() if needle in code.lower())
+        return min(matched / self.total_rows, 1.0)
+
+
+@dataclass
+class QueryPlan:
+    """검색 조건 조합에 대해 선택된 실행 계획"""
+    driving_filter: Optional[str] = None
+    driving_index: Optional[str] = None
+    filter_order: List[str] = field(default_factory=list)
+    estimates: Dict[str, float] = field(default_factory=dict)
+
+    def describe(self) -> str:
+        estimates = ", ".join(f"{name}={value:.4f}" for name, value in self.estimates.items())
+        index = self.driving_index or "옵티마이저 선택"
+        return f"구동 인덱스={index}, 필터 순서={self.filter_order}, 예상 선택도=({estimates})"
+
+
+def _parse_yyyymmdd(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, "%Y%m%d").date()
+    except ValueError:
+        return None
+
+
+class QueryPlanner:
+    """컬럼 통계를 바탕으로 필터 적용 순서와 구동 인덱스를 결정"""
+
+    def __init__(self, statistics: ColumnStatistics):
+        self.statistics = statistics
+
+    def plan(self, params: Any) -> QueryPlan:
+        """검색 파라미터에 대한 실행 계획 수립"""
+        estimates: Dict[str, float] = {}
+
+        if params.keyword:
+            estimates["keyword"] = DEFAULT_SELECTIVITY
+        if getattr(params, "name", None):
+            estimates["name"] = NAME_MATCH_SELECTIVITY.get(params.name_match, DEFAULT_SELECTIVITY)
+        if params.status:
+            estimates["status"] = self.statistics.status_selectivity(params.status)
+
+        date_from = _parse_yyyymmdd(params.application_date_from)
+        date_to = _parse_yyyymmdd(params.application_date_to)
+        if date_from or date_to:
+            estimates["application_date"] = self.statistics.date_range_selectivity(date_from, date_to)
+
+        if params.product_code:
+            estimates["product_code"] = self.statistics.product_code_selectivity(params.product_code)
+
+        # 선택도가 높은(예상 행 수가 적은) 필터를 먼저 적용
+        filter_order = sorted(estimates, key=lambda name: estimates[name])
+
+        plan = QueryPlan(filter_order=filter_order, estimates=estimates)
+        indexed = [name for name in filter_order if FILTER_INDEXES.get(name)]
+        # 정규화 상표명 완전/접두 일치가 가장 선택적이면 이름 인덱스를 쓰도록 힌트를 주지 않음
+        name_drives = filter_order[:1] == ["name"] and params.name_match in NAME_MATCH_SELECTIVITY
+        unestimated = any(getattr(params, name, None) for name in UNESTIMATED_FILTERS)
+        if indexed and not name_drives and not unestimated and estimates[indexed[0]] <= MAX_DRIVING_SELECTIVITY:
+            plan.driving_filter = indexed[0]
+            plan.driving_index = FILTER_INDEXES[indexed[0]]
+
+        if estimates:
+            logger.debug("검색 실행 계획: %s", plan.describe())
+        return plan
+
+
+async def collect_column_statistics(db: AsyncSession) -> ColumnStatistics:
+    """상표 테이블을 한 번 훑어 컬럼 통계 계산"""
+    status_counts: Counter = Counter()
+    year_histogram: Counter = Counter()
+    class_counts: Counter = Counter()
+    total_rows = 0
+
+    result = await db.stream(
+        select(
+            TradeMark.registerStatus,
+            TradeMark.applicationDate,
+            TradeMark.asignProductMainCodeList
+        )
+    )
+    async for status, application_date, main_codes in result:
+        total_rows += 1
+        status_counts[status or NULL_VALUE] += 1
+        if application_date:
+            year_histogram[application_date.year] += 1
+        for code in set(main_codes or []):
+            class_counts[code] += 1
+
+    return ColumnStatistics(
+        total_rows=total_rows,
+        status_counts=dict(status_counts),
+        year_histogram=dict(year_histogram),
+        class_counts=dict(class_counts),
+    )
+
+
+async def save_column_statistics(db: AsyncSession, statistics: ColumnStatistics) -> None:
+    """컬럼 통계 테이블을 새 통계로 교체"""
+    await db.execute(delete(ColumnStatistic))
+
+    rows = [ColumnStatistic(column_name=TOTAL_COLUMN, value=None, row_count=statistics.total_rows)]
+    rows += [
+        ColumnStatistic(column_name=STATUS_COLUMN, value=value, row_count=count)
+        for value, count in statistics.status_counts.items()
+    ]
+    rows += [
+        ColumnStatistic(column_name=YEAR_COLUMN, value=str(year), row_count=count)
+        for year, count in statistics.year_histogram.items()
+    ]
+    rows += [
+        ColumnStatistic(column_name=CLASS_COLUMN, value=code, row_count=count)
+        for code, count in statistics.class_counts.items()
+    ]
+    db.add_all(rows)
+    await db.commit()
+
+
+async def load_column_statistics(db: AsyncSession) -> ColumnStatistics:
+    """컬럼 통계 테이블에서 통계 읽기"""
+    result = await db.execute(select(ColumnStatistic))
+    statistics = ColumnStatistics()
+    for row in result.scalars():
+        if row.column_name == TOTAL_COLUMN:
+            statistics.total_rows = row.row_count
+        elif row.column_name == STATUS_COLUMN:
+            statistics.status_counts[row.value] = row.row_count
+        elif row.column_name == YEAR_COLUMN:
+            statistics.year_histogram[int(row.value)] = row.row_count
+        elif row.column_name == CLASS_COLUMN:
+            statistics.class_counts[row.value] = row.row_count
+    return statistics
+
+
+async def refresh_column_statistics(db: AsyncSession) -> ColumnStatistics:
+    """데이터 적재 후 컬럼 통계를 다시 계산해 저장"""
+    statistics = await collect_column_statistics(db)
+    await save_column_statistics(db, statistics)
+    return statistics
+
+
+class ColumnStatisticsCache:
+    """
+    프로세스 내 컬럼 통계 캐시
+
+    요청 경로에서는 DB를 조회하지 않고 캐시된 통계만 사용하며,
+    TTL이 지나면 백그라운드에서 통계 테이블을 다시 읽습니다.
+    """
+
+    def __init__(self, ttl_seconds: float = 300.0):
+        self.ttl_seconds = ttl_seconds
+        self.statistics: Optional[ColumnStatistics] = None
+        self._session_factory: Optional[Callable[[], Any]] = None
+        self._loaded_at = 0.0
+        self._refresh_task: Optional[asyncio.Task] = None
+
+    def configure(self, session_factory: Callable[[], Any]) -> None:
+        """통계를 읽을 때 사용할 세션 팩토리 설정"""
+        self._session_factory = session_factory
+
+    async def refresh(self) -> Optional[ColumnStatistics]:
+        """통계 테이블을 읽어 캐시 갱신"""
+        if self._session_factory is None:
+            return self.statistics
+        try:
+            async with self._session_factory() as session:
+                statistics = await load_column_statistics(session)
+        except Exception as e:
+            logger.warning("컬럼 통계 로딩 실패: %s", e)
+            return self.statistics
+        self.statistics = statistics if statistics.total_rows else None
+        self._loaded_at = time.monotonic()
+        return self.statistics
+
+    def get(self) -> Optional[ColumnStatistics]:
+        """캐시된 통계 반환 (만료된 경우 백그라운드 갱신 예약)"""
+        expired = time.monotonic() - self._loaded_at > self.ttl_seconds
+        if expired and self._session_factory is not None and not self._refreshing():
+            self._refresh_task = asyncio.ensure_future(self.refresh())
+        return self.statistics
+
+    def _refreshing(self) -> bool:
+        return self._refresh_task is not None and not self._refresh_task.done()
+
+
+column_statistics_cache = ColumnStatisticsCache(
+    ttl_seconds=float(os.getenv("PLANNER_STATS_TTL_SECONDS", "300"))
+)
@@ -0,0 +1,110 @@
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.trademark_rollup import TrademarkRollup
+
+
+# 집계 차원 → 집계 테이블 컬럼
+DIMENSIONS = {
+    "status": TrademarkRollup.register_status,
+    "class": TrademarkRollup.main_code,
+    "year": TrademarkRollup.application_year,
+}
+
+# 분류와 무관한 전체 건수 행 (여러 분류를 가진 상표가 중복 집계되지 않도록 별도 보관)
+ALL_CLASSES = "*"
+
+RollupKey = Tuple[str, str, int]
+
+
+def rollup_keys(record: Dict[str, Any]) -> List[RollupKey]:
+    """상표 레코드가 기여하는 집계 키 목록 (분류별 키 + 전체 키)"""
+    status = record.get("registerStatus") or ""
+    application_date = record.get("applicationDate")
+    year = int(str(application_date)[:4]) if application_date else 0
+    codes = sorted(set(record.get("asignProductMainCodeList") or [])) or [""]
+    return [(status, ALL_CLASSES, year)] + [(status, code, year) for code in codes]
+
+
+class RollupAccumulator:
+    """적재 중 집계 증분을 모았다가 한 번에 반영"""
+
+    def __init__(self):
+        self.deltas: Counter = Counter()
+
+    def add(self, record: Dict[str, Any], count: int = 1) -> None:
+        for key in rollup_keys(record):
+            self.deltas[key] += count
+
+    async def apply(self, db: AsyncSession) -> int:
+        """
+        증분을 집계 테이블에 반영 (커밋은 호출 측 트랜잭션에서)
+
+        기존 행은 건수를 더하고 없는 키는 새로 추가합니다.
+        반영한 키 수를 반환합니다.
+        """
+        if not self.deltas:
+            return 0
+        result = await db.execute(select(TrademarkRollup))
+        existing = {
+            (row.register_status, row.main_code, row.application_year): row
+            for row in result.scalars()
+        }
+        for key, delta in self.deltas.items():
+            row = existing.get(key)
+            if row is None:
+                status, code, year = key
+                db.add(TrademarkRollup(
+                    register_status=status, main_code=code, application_year=year, mark_count=delta
+                ))
+            else:
+                row.mark_count += delta
+        applied = len(self.deltas)
+        self.deltas.clear()
+        return applied
+
+
+async def query_rollups(
+    db: AsyncSession,
+    group_by: Iterable[str],
+    status: Optional[str] = None,
+    main_code: Optional[str] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    집계 테이블만 읽어 차원별 상표 수 계산
+
+    집계 테이블의 크기는 (상태 수 × 분류 수 × 연도 수)로 제한되므로
+    전체 상표 수와 무관하게 일정한 비용으로 응답합니다.
+    """
+    group_by = list(group_by)
+    columns = [DIMENSIONS[dimension] for dimension in group_by]
+    stmt = select(*columns, func.sum(TrademarkRollup.mark_count))
+
+    if "class" in group_by or main_code:
+        stmt = stmt.where(TrademarkRollup.main_code != ALL_CLASSES)
+    else:
+        stmt = stmt.where(TrademarkRollup.main_code == ALL_CLASSES)
+    if status:
+        stmt = stmt.where(TrademarkRollup.register_status == status)
+    if main_code:
+        stmt = stmt.where(TrademarkRollup.main_code == main_code)
+    if year_from:
+        stmt = stmt.where(TrademarkRollup.application_year >= year_from)
+    if year_to:
+        stmt = stmt.where(TrademarkRollup.application_year.between(1, year_to))
+    if columns:
+        stmt = stmt.group_by(*columns).order_by(*columns)
+
+    result = await db.execute(stmt)
+    items = []
+    for row in result.all():
+        # 빈 문자열/0으로 저장한 "값 없음"은 None으로 반환
+        item = {dimension: value or None for dimension, value in zip(group_by, row)}
+        item["count"] = int(row[-1] or 0)
+        items.append(item)
+    return items
@@ -0,0 +1,127 @@
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger("app.services.single_flight")
+
+
+class _Call:
+    """실행 중인 작업과 그 결과를 기다리는 요청 수"""
+
+    def __init__(self, task: asyncio.Future, detached: bool):
+        self.task = task
+        self.waiters = 0
+        # 작업이 flight 소유 세션으로 실행되는지 (취소된 요청이 작업 종료를 기다릴 필요 없음)
+        self.detached = detached
+
+
+class SingleFlight:
+    """
+    동일한 키의 동시 요청을 하나의 실행으로 합치는 single-flight 레이어
+
+    첫 요청(리더)만 실제 작업을 실행하고, 실행 중에 도착한 같은 키의 요청은
+    그 결과를 함께 받습니다. 작업은 별도 태스크로 실행되므로 리더 요청이
+    취소되어도 대기 중인 다른 요청에는 영향을 주지 않으며, 기다리는 요청이
+    모두 취소되면 작업도 취소됩니다.
+
+    세션 팩토리를 설정하면(configure) do_in_session의 작업은 요청 세션 대신 flight가 연 세션으로
+    실행되므로 취소된 리더도 즉시 반환합니다. 마지막 대기자가 떠나 작업이 취소되면 flight가
+    그 세션의 연결을 무효화합니다(취소된 쿼리를 실행하던 연결은 상태를 알 수 없음).
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, _Call] = {}
+        self._session_factory: Optional[Callable[[], Any]] = None
+        self.executions = 0
+        self.coalesced = 0
+        self.cancelled = 0
+
+    def configure(self, session_factory: Callable[[], Any]) -> None:
+        self._session_factory = session_factory
+
+    @property
+    def owns_sessions(self) -> bool:
+        return self._session_factory is not None
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        키에 해당하는 작업을 실행하거나 실행 중인 작업의 결과를 기다림
+
+        작업은 리더 요청의 세션을 사용하므로 취소된 리더는 작업이 끝날 때까지 세션을 유지합니다.
+        """
+        return await self._join(key, fn, detached=False)
+
+    async def do_in_session(self, key: Hashable, fn: Callable[[Any], Awaitable[T]]) -> T:
+        """키에 해당하는 작업을 flight 소유 세션으로 fn(db) 실행하거나 실행 중인 작업의 결과를 기다림"""
+        if self._session_factory is None:
+            raise RuntimeError("SingleFlight 세션 팩토리가 설정되지 않았습니다.")
+        return await self._join(key, lambda: self._run_in_session(fn), detached=True)
+
+    async def _join(self, key: Hashable, fn: Callable[[], Awaitable[T]], detached: bool) -> T:
+        call = self._in_flight.get(key)
+        is_owner = call is None
+        if is_owner:
+            call = _Call(asyncio.ensure_future(fn()), detached)
+            self._in_flight[key] = call
+            self.executions += 1
+            call.task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            result = await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            call.waiters -= 1
+            if not call.task.done():
+                await self._abandon(call, is_owner)
+            raise
+        except BaseException:
+            call.waiters -= 1
+            raise
+        call.waiters -= 1
+        return result
+
+    async def _run_in_session(self, fn: Callable[[Any], Awaitable[T]]) -> T:
+        async with self._session_factory() as db:
+            try:
+                return await fn(db)
+            except asyncio.CancelledError:
+                try:
+                    await db.invalidate()
+                except Exception as e:
+                    logger.debug("single-flight 세션 연결 무효화 실패: %s", e)
+                raise
+
+    async def _abandon(self, call: _Call, is_owner: bool) -> None:
+        """취소된 요청 정리 (남은 대기자가 없으면 작업 취소)"""
+        if call.waiters == 0:
+            call.task.cancel()
+            self.cancelled += 1
+        elif not is_owner:
+            return
+        if call.detached:
+            return
+        # 작업은 리더 요청의 세션을 사용하므로 작업이 끝날 때까지 세션을 유지
+        await asyncio.gather(call.task, return_exceptions=True)
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        call = self._in_flight.get(key)
+        if call is not None and call.task is task:
+            del self._in_flight[key]
+        # 아무도 기다리지 않는 태스크의 예외가 경고로 남지 않도록 소비
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        """합쳐진 요청 수 등 지표 반환"""
+        total = self.executions + self.coalesced
+        return {
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "cancelled": self.cancelled,
+            "in_flight": len(self._in_flight),
+            "coalesced_ratio": round(self.coalesced / total, 4) if total else 0.0
+        }
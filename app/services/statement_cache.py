@@ -0,0 +1,51 @@
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+
+class StatementCache:
+    """
+    필터 조합(쿼리 형태)별로 만들어 둔 SQLAlchemy 문장을 재사용하는 LRU 캐시
+
+    값은 모두 바인드 파라미터로 분리되어 있으므로 같은 형태의 요청은 같은
+    문장 객체를 공유합니다. SQLAlchemy는 문장 객체의 캐시 키를 객체에
+    메모이즈하고 컴파일 결과를 엔진 캐시에 보관하므로, 요청마다 문장을
+    구성하고 캐시 키를 계산하고 컴파일하는 비용이 사라집니다.
+    """
+
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._statements: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """키에 해당하는 문장을 반환 (없으면 factory로 만들어 저장)"""
+        statement = self._statements.get(key)
+        if statement is not None:
+            self._statements.move_to_end(key)
+            self.hits += 1
+            return statement
+
+        self.misses += 1
+        statement = factory()
+        self._statements[key] = statement
+        if len(self._statements) > self.max_size:
+            self._statements.popitem(last=False)
+        return statement
+
+    def clear(self) -> None:
+        """캐시 및 통계 초기화"""
+        self._statements.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중률 등 지표 반환"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._statements),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
@@ -1,13 +1,51 @@
-from typing import List, Tuple, Optional, Any, Dict, TypedDict
-from sqlalchemy import select, func, or_, and_, cast, String, case
+import asyncio
+import heapq
+import logging
+import os
+from contextlib import contextmanager
+from itertools import islice
+from functools import lru_cache
+from typing import List, Tuple, Optional, Any, Dict, Iterator, NotRequired, TypedDict, Union
+from sqlalchemy import select, func, or_, and_, cast, String, case, bindparam, column, literal_column, table
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql.expression import cast
 from datetime import datetime, date
 from fastapi import status as http_status
 from pydantic import BaseModel 
 
+from app.db.shards import Shard, ShardRegistry, shard_registry
+from app.db.sqlite import FTS_MIN_KEYWORD_LENGTH, NAME_FTS_TABLE, embedded_db, fts_match_query
 from app.models.trademark import TradeMark
+from app.models.trademark_document import TrademarkDocument
+from app.models.trademark_identifier import TrademarkIdentifier
+from app.models.trademark_vienna_code import TrademarkViennaCode
 from app.schemas.trademark import TradeMarkCreate
+from app.services.single_flight import SingleFlight
+from app.services.prefetch import page_prefetcher
+from app.services.query_planner import QueryPlan, QueryPlanner, column_statistics_cache
+from app.services.statement_cache import StatementCache
+from app.services.deadline import current_statement_timeout_ms
+from app.services.dataset_version import dataset_version_cache
+from app.services.document_store import document_store
+from app.search_index.index import SearchIndex
+from app.search_index.manager import search_index_manager
+from app.utils.identifiers import normalize_identifier
+from app.utils.name_normalization import normalize_name
+from app.utils.vienna import parse_vienna_codes, vienna_prefix_range
+from app.services.query_language import LIKE_ESCAPE, compile_query, escape_like
+from app.services.rollup import query_rollups
+from app.services.near_duplicates import DEFAULT_SIMILARITY_THRESHOLD, find_similar
+from app.utils.documents import RawJSON, render_document
+
+logger = logging.getLogger("app.services.trademark_service")
+
+
+# 정규화 상표명 일치 방식
+NAME_MATCH_EXACT = "exact"
+NAME_MATCH_PREFIX = "prefix"
+NAME_MATCH_CONTAINS = "contains"
+NAME_MATCH_MODES = (NAME_MATCH_EXACT, NAME_MATCH_PREFIX, NAME_MATCH_CONTAINS)
 
 
 # 검색 파라미터 타입 정의
@@ -17,41 +55,231 @@ class SearchParams(BaseModel):
     application_date_from: Optional[str] = None
     application_date_to: Optional[str] = None
     product_code: Optional[str] = None
+    # 유사군 코드 (완전 일치, 예: G0301)
+    sub_code: Optional[str] = None
+    # 정규화 상표명 검색어와 일치 방식 (exact, prefix, contains - 기본 contains)
+    name: Optional[str] = None
+    name_match: Optional[str] = None
+    # 검색식 (예: name:"프레스*" AND class:30 NOT status:거절)
+    q: Optional[str] = None
+    # 비엔나 코드 (대/중/소분류 어느 깊이든, 여러 개는 OR)
+    vienna_code: Optional[List[str]] = None
     page: int = 1
     size: int = 10
 
+    def normalized_key(self) -> Tuple[Any, ...]:
+        """같은 결과를 내는 검색 조건이 같은 키를 갖도록 정규화"""
+        def normalize(value: Any) -> Any:
+            # 빈 문자열은 필터가 적용되지 않으므로 None과 동일하게 취급
+            if isinstance(value, str):
+                return value or None
+            # 목록 조건은 순서와 중복에 무관
+            if isinstance(value, list):
+                return tuple(sorted(set(value))) or None
+            return value
+
+        return tuple(
+            (name, normalize(value))
+            for name, value in sorted(self.model_dump().items())
+        )
+
 
 # 검색 결과 타입 정의
 class SearchResult(TypedDict):
-    items: List[Dict[str, Any]]
+    # 응답 문서를 사용하면 딕셔너리 대신 렌더링된 JSON(RawJSON)
+    items: List[Union[Dict[str, Any], RawJSON]]
     total_count: int
     page: int
     size: int
     pages_count: int
+    # 샤드 모드에서 응답하지 않아 제외된 샤드 (부분 결과일 때만)
+    skipped_shards: NotRequired[List[str]]
+
+
+# 필터 절은 값 대신 바인드 파라미터를 사용하므로 한 번만 만들어 모든 요청이 공유합니다.
+_KEYWORD_FILTER = or_(
+    TradeMark.productName.ilike(bindparam("keyword_pattern")),
+    TradeMark.productNameEng.ilike(bindparam("keyword_pattern"))
+)
+# 임베디드(SQLite) 모드의 trigram FTS5 색인 탐색 (상표명/영문 상표명 부분 일치와 같은 결과)
+_NAME_FTS = table(NAME_FTS_TABLE, column("rowid"))
+_KEYWORD_FTS_FILTER = TradeMark.id.in_(
+    select(_NAME_FTS.c.rowid).where(literal_column(NAME_FTS_TABLE).op("MATCH")(bindparam("keyword_fts")))
+)
+_NAME_EXACT_FILTER = or_(
+    TradeMark.productNameNorm == bindparam("name_normalized"),
+    TradeMark.productNameEngNorm == bindparam("name_normalized")
+)
+# 접두/부분 일치는 정규화 컬럼에 대한 LIKE (접두 일치는 인덱스 범위 탐색)
+# 정규화가 구두점(%, _ 포함)을 제거하므로 검색어에 LIKE 와일드카드가 남지 않습니다.
+_NAME_LIKE_FILTER = or_(
+    TradeMark.productNameNorm.like(bindparam("name_pattern")),
+    TradeMark.productNameEngNorm.like(bindparam("name_pattern"))
+)
+_STATUS_FILTER = TradeMark.registerStatus == bindparam("status")
+_DATE_FROM_FILTER = TradeMark.applicationDate >= bindparam("date_from")
+_DATE_TO_FILTER = TradeMark.applicationDate <= bindparam("date_to")
+_PRODUCT_CODE_FILTER = TradeMark.asignProductMainCodeList.cast(String).ilike(
+    bindparam("product_code_pattern")
+)
+# 유사군 코드는 목록 원소와 완전 일치해야 하므로 따옴표까지 포함한 패턴 사용 (%, _는 문자 그대로 비교)
+_SUB_CODE_FILTER = TradeMark.asignProductSubCodeList.cast(String).like(
+    bindparam("sub_code_pattern"), escape=LIKE_ESCAPE
+)
+
+
+@lru_cache(maxsize=32)
+def _vienna_code_filter(count: int, open_ended: Tuple[int, ...] = ()) -> Any:
+    """
+    비엔나 코드 접두 구간 count개 중 하나에 해당하는 상표 (정규화 코드 인덱스 범위 탐색)
+
+    open_ended의 구간(모두 9인 접두 코드)은 끝 없이 시작 이상만 비교합니다.
+    """
+    return TradeMark.id.in_(
+        select(TrademarkViennaCode.trademark_id).where(or_(*(
+            TrademarkViennaCode.code >= bindparam(f"vienna_from{index}") if index in open_ended else and_(
+                TrademarkViennaCode.code >= bindparam(f"vienna_from{index}"),
+                TrademarkViennaCode.code < bindparam(f"vienna_to{index}")
+            )
+            for index in range(count)
+        )))
+    )
+
+
+_ORDER_BY = (
+    case(
+        (TradeMark.applicationDate == None, 1),
+        else_=0
+    ),
+    TradeMark.applicationDate.desc(),
+    # 출원일이 같은 행의 순서를 고정 (검색 인덱스 정렬, 샤드 병합 순서와 같음)
+    TradeMark.id
+)
+_BASE_SELECT = select(TradeMark)
+
+_DETAIL_SELECT = select(TradeMark).where(
+    TradeMark.applicationNumber == bindparam("application_number")
+)
+
+# 정규화된 번호로 통합 번호 색인을 한 번 탐색해 상표를 조회
+_IDENTIFIER_SELECT = (
+    select(TrademarkIdentifier.number_type, TradeMark)
+    .join(TradeMark, TradeMark.id == TrademarkIdentifier.trademark_id)
+    .where(TrademarkIdentifier.number == bindparam("number"))
+    .order_by(TrademarkIdentifier.number_type, TradeMark.id)
+)
+_IDENTIFIER_TYPED_SELECT = _IDENTIFIER_SELECT.where(
+    TrademarkIdentifier.number_type == bindparam("number_type")
+)
+
+# 검색 인덱스가 고른 결과 페이지의 행을 한 번에 읽는 문장
+_BY_IDS_SELECT = select(TradeMark).where(
+    TradeMark.id.in_(bindparam("ids", expanding=True))
+)
+
+# 미리 렌더링된 응답 문서 조회 (상세 조회는 압축본 포함)
+_DOCUMENT_SELECT = select(TrademarkDocument.body, TrademarkDocument.body_gzip).where(
+    TrademarkDocument.application_number == bindparam("application_number")
+)
+_DOCUMENTS_BY_IDS_SELECT = select(TrademarkDocument.trademark_id, TrademarkDocument.body).where(
+    TrademarkDocument.trademark_id.in_(bindparam("ids", expanding=True))
+)
+
+
+def with_max_execution_time(stmt: Any, timeout_ms: int) -> Any:
+    """MySQL 서버가 기한이 지난 SELECT를 스스로 중단하도록 옵티마이저 힌트 추가"""
+    return stmt.prefix_with(f"/*+ MAX_EXECUTION_TIME({int(timeout_ms)}) */", dialect="mysql")
+
+
+# 쿼리 형태(필터 조합, 실행 계획, 정렬/페이지네이션 여부)별 문장 캐시
+statement_cache = StatementCache(max_size=int(os.getenv("STATEMENT_CACHE_SIZE", "256")))
 
 
 class TrademarkQueryBuilder:
-    """상표 검색 쿼리 빌더 클래스"""
+    """상표 검색 쿼리 빌더 클래스
     
-    def __init__(self):
-        self.stmt = select(TradeMark)
+    필터 값은 `params`에 바인드 파라미터로 모으고, 같은 필터 조합의 문장은
+    `statement_cache`에서 재사용합니다. 실행 시 `build()` 결과와 `params`를
+    함께 전달해야 합니다.
+    """
+    
+    def __init__(self, use_cache: bool = True):
+        self.stmt = _BASE_SELECT
         self.filters = []
+        self.filter_keys: List[str] = []
+        self.filter_shapes: List[Any] = []
+        self.params: Dict[str, Any] = {}
+        self.plan: Optional[QueryPlan] = None
+        self.use_cache = use_cache
+        self._paginated = False
+        self._ordered = False
+        self._max_execution_ms: Optional[int] = None
     
-    def with_keyword(self, keyword: Optional[str]) -> 'TrademarkQueryBuilder':
-        """키워드 검색 필터 추가"""
-        if keyword:
-            self.filters.append(
-                or_(
-                    TradeMark.productName.ilike(f"%{keyword}%"),
-                    TradeMark.productNameEng.ilike(f"%{keyword}%")
-                )
+    def _add_filter(self, key: str, clause: Any, shape: Any = None, **params: Any) -> None:
+        """필터 추가 (shape는 캐시 키에 쓰이는 형태 식별자, 기본값은 파라미터 이름)"""
+        self.filters.append(clause)
+        self.filter_keys.append(key)
+        self.filter_shapes.append(shape if shape is not None else tuple(sorted(params)))
+        self.params.update(params)
+    
+    def with_keyword(self, keyword: Optional[str], fts: bool = False) -> 'TrademarkQueryBuilder':
+        """키워드 검색 필터 추가 (fts이면 세 글자 이상 검색어는 FTS5 색인으로 탐색)"""
+        if not keyword:
+            return self
+        # LIKE 와일드카드가 든 검색어는 기존 의미를 유지하도록 LIKE로 처리
+        if fts and len(keyword) >= FTS_MIN_KEYWORD_LENGTH and not any(char in keyword for char in "%_"):
+            self._add_filter("keyword", _KEYWORD_FTS_FILTER, keyword_fts=fts_match_query(keyword))
+        else:
+            self._add_filter("keyword", _KEYWORD_FILTER, keyword_pattern=f"%{keyword}%")
+        return self
+    
+    def with_name(self, name: Optional[str], match: Optional[str] = None) -> 'TrademarkQueryBuilder':
+        """정규화 상표명 필터 추가 (검색어도 적재 시와 같은 방식으로 정규화)"""
+        normalized = normalize_name(name)
+        if not normalized:
+            return self
+        match = match or NAME_MATCH_CONTAINS
+        if match == NAME_MATCH_EXACT:
+            self._add_filter("name", _NAME_EXACT_FILTER, shape=("name", match), name_normalized=normalized)
+        elif match == NAME_MATCH_PREFIX:
+            self._add_filter(
+                "name", _NAME_LIKE_FILTER, shape=("name", match), name_pattern=f"{normalized}%"
+            )
+        else:
+            self._add_filter(
+                "name", _NAME_LIKE_FILTER, shape=("name", match), name_pattern=f"%{normalized}%"
+            )
+        return self
+    
+    def with_query(self, query: Optional[str]) -> 'TrademarkQueryBuilder':
+        """검색식 필터 추가 (구조가 같은 검색식은 같은 문장을 재사용, 잘못된 식은 QuerySyntaxError)"""
+        if query and query.strip():
+            clause, params, shape = compile_query(query)
+            self._add_filter("query", clause, shape=("query", shape), **params)
+        return self
+    
+    def with_vienna_code(self, codes: Optional[List[str]]) -> 'TrademarkQueryBuilder':
+        """비엔나 코드 필터 추가 (잘못된 코드는 InvalidViennaCode)"""
+        prefixes = parse_vienna_codes(codes)
+        if prefixes:
+            params: Dict[str, Any] = {}
+            open_ended = []
+            for index, prefix in enumerate(prefixes):
+                params[f"vienna_from{index}"], end = vienna_prefix_range(prefix)
+                if end is None:
+                    open_ended.append(index)
+                else:
+                    params[f"vienna_to{index}"] = end
+            self._add_filter(
+                "vienna_code", _vienna_code_filter(len(prefixes), tuple(open_ended)),
+                shape=("vienna_code", len(prefixes), *open_ended), **params
             )
         return self
     
     def with_status(self, status: Optional[str]) -> 'TrademarkQueryBuilder':
         """등록 상태 필터 추가"""
         if status:
-            self.filters.append(TradeMark.registerStatus == status)
+            self._add_filter("status", _STATUS_FILTER, status=status)
         return self
     
     def with_application_date_range(
@@ -63,14 +291,14 @@ class TrademarkQueryBuilder:
         if date_from:
             try:
                 parsed_date = datetime.strptime(date_from, "%Y%m%d").date()
-                self.filters.append(TradeMark.applicationDate >= parsed_date)
+                self._add_filter("application_date", _DATE_FROM_FILTER, date_from=parsed_date)
             except ValueError:
                 pass
                 
         if date_to:
             try:
                 parsed_date = datetime.strptime(date_to, "%Y%m%d").date()
-                self.filters.append(TradeMark.applicationDate <= parsed_date)
+                self._add_filter("application_date", _DATE_TO_FILTER, date_to=parsed_date)
             except ValueError:
                 pass
         
@@ -79,31 +307,82 @@ class TrademarkQueryBuilder:
     def with_product_code(self, product_code: Optional[str]) -> 'TrademarkQueryBuilder':
         """상품 분류 코드 필터 추가"""
         if product_code:
-            self.filters.append(
-                TradeMark.asignProductMainCodeList.cast(String).ilike(f"%{product_code}%")
+            self._add_filter(
+                "product_code",
+                _PRODUCT_CODE_FILTER,
+                product_code_pattern=f"%{product_code}%"
             )
         return self
     
+    def with_sub_code(self, sub_code: Optional[str]) -> 'TrademarkQueryBuilder':
+        """유사군 코드 필터 추가"""
+        if sub_code:
+            self._add_filter("sub_code", _SUB_CODE_FILTER, sub_code_pattern=f'%"{escape_like(sub_code.upper())}"%')
+        return self
+    
     def with_pagination(self, page: int, size: int) -> 'TrademarkQueryBuilder':
         """페이지네이션 적용"""
-        self.stmt = self.stmt.offset((page - 1) * size).limit(size)
+        self._paginated = True
+        self.params["offset"] = (page - 1) * size
+        self.params["limit"] = size
         return self
     
     def with_order_by(self) -> 'TrademarkQueryBuilder':
         """정렬 조건 적용 (MySQL 호환)"""
-        self.stmt = self.stmt.order_by(
-            case(
-                (TradeMark.applicationDate == None, 1),
-                else_=0
-            ),
-            TradeMark.applicationDate.desc()
-        )
+        self._ordered = True
+        return self
+    
+    def with_max_execution_time(self, timeout_ms: Optional[int]) -> 'TrademarkQueryBuilder':
+        """DB 문장 타임아웃 적용 (MySQL MAX_EXECUTION_TIME 힌트)"""
+        self._max_execution_ms = timeout_ms
+        return self
+    
+    def with_plan(self, plan: Optional[QueryPlan]) -> 'TrademarkQueryBuilder':
+        """실행 계획 적용 (선택도 순 필터 정렬, MySQL 인덱스 힌트)"""
+        self.plan = plan
         return self
     
+    def _ordered_filters(self) -> List[Tuple[str, Any, Any]]:
+        """실행 계획의 필터 순서대로 (필터 키, 형태, 필터 절) 정렬"""
+        filters = list(zip(self.filter_keys, self.filter_shapes, self.filters))
+        if self.plan:
+            order = {key: rank for rank, key in enumerate(self.plan.filter_order)}
+            filters.sort(key=lambda item: order.get(item[0], len(order)))
+        return filters
+    
+    def cache_key(self) -> Tuple[Any, ...]:
+        """문장 캐시 키 (값과 무관한 쿼리 형태)"""
+        return (
+            tuple(shape for _, shape, _ in self._ordered_filters()),
+            self.plan.driving_index if self.plan else None,
+            self._ordered,
+            self._paginated,
+            self._max_execution_ms,
+        )
+    
+    def _compose(self) -> Any:
+        stmt = select(TradeMark)
+        if self.plan and self.plan.driving_index:
+            stmt = stmt.with_hint(
+                TradeMark, f"USE INDEX ({self.plan.driving_index})", "mysql"
+            )
+        filters = [clause for _, _, clause in self._ordered_filters()]
+        if filters:
+            stmt = stmt.where(and_(*filters))
+        if self._ordered:
+            stmt = stmt.order_by(*_ORDER_BY)
+        if self._paginated:
+            stmt = stmt.offset(bindparam("offset")).limit(bindparam("limit"))
+        if self._max_execution_ms:
+            stmt = with_max_execution_time(stmt, self._max_execution_ms)
+        return stmt
+    
     def build(self) -> Any:
         """최종 쿼리 빌드"""
-        if self.filters:
-            self.stmt = self.stmt.where(and_(*self.filters))
+        if self.use_cache:
+            self.stmt = statement_cache.get_or_build(self.cache_key(), self._compose)
+        else:
+            self.stmt = self._compose()
         return self.stmt
 
 
@@ -113,74 +392,426 @@ class TrademarkRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
     
-    async def count(self, stmt: Any) -> int:
+    async def count(self, stmt: Any, params: Optional[Dict[str, Any]] = None) -> int:
         """쿼리 결과 개수 조회"""
-        count_stmt = select(func.count()).select_from(stmt.subquery())
-        result = await self.db.execute(count_stmt)
+        timeout_ms = current_statement_timeout_ms()
+        
+        def build_count() -> Any:
+            count_stmt = select(func.count()).select_from(stmt.subquery())
+            if timeout_ms:
+                count_stmt = with_max_execution_time(count_stmt, timeout_ms)
+            return count_stmt
+        
+        count_stmt = statement_cache.get_or_build(("count", stmt, timeout_ms), build_count)
+        result = await self.db.execute(count_stmt, params or {})
         return result.scalar_one_or_none() or 0
     
-    async def search(self, params: SearchParams) -> Tuple[List[TradeMark], int]:
-        """상표 검색 수행"""
-        # 쿼리 빌더로 쿼리 구성
-        query = (TrademarkQueryBuilder()
-            .with_keyword(params.keyword)
+    def plan(self, params: SearchParams) -> Optional[QueryPlan]:
+        """캐시된 컬럼 통계로 실행 계획 수립 (통계가 없으면 옵티마이저에 맡김)"""
+        statistics = column_statistics_cache.get()
+        if statistics is None:
+            return None
+        return QueryPlanner(statistics).plan(params)
+    
+    def filtered_builder(self, params: SearchParams, plan: Optional[QueryPlan]) -> TrademarkQueryBuilder:
+        """검색 조건의 필터만 적용한 쿼리 빌더 (정렬/페이지네이션은 호출자가 추가, 내보내기 작업도 사용)"""
+        return (TrademarkQueryBuilder()
+            .with_keyword(params.keyword, fts=embedded_db.fts_ready(getattr(self.db, "bind", None)))
+            .with_name(params.name, params.name_match)
+            .with_query(params.q)
+            .with_vienna_code(params.vienna_code)
             .with_status(params.status)
             .with_application_date_range(params.application_date_from, params.application_date_to)
             .with_product_code(params.product_code)
-            .build()
+            .with_sub_code(params.sub_code)
+            .with_plan(plan)
         )
+    
+    @contextmanager
+    def search_index(self, params: SearchParams) -> Iterator[Optional[SearchIndex]]:
+        """현재 데이터셋 버전으로 구축된 검색 인덱스 세대 획득 (사용할 수 없으면 None)"""
+        version = dataset_version_cache.get()
+        with search_index_manager.acquire(version.version if version else None) as index:
+            yield index if index is not None and index.supports(params) else None
+    
+    async def search_with_index(self, index: SearchIndex, params: SearchParams) -> Tuple[List[TradeMark], int]:
+        """인덱스로 결과 페이지 ID와 전체 건수를 구하고, 해당 행만 DB에서 조회"""
+        row_ids, total_count = index.search(params)
+        if not row_ids:
+            return [], total_count
+        
+        result = await self.db.execute(_BY_IDS_SELECT, {"ids": row_ids})
+        rows = {item.id: item for item in result.scalars().all()}
+        # IN 조회는 순서를 보장하지 않으므로 인덱스 순서로 재정렬
+        items = [rows[row_id] for row_id in row_ids if row_id in rows]
+        return items, total_count
+    
+    async def _count_and_page(self, params: SearchParams) -> Tuple[int, TrademarkQueryBuilder]:
+        """전체 건수를 조회하고 결과 페이지 쿼리 빌더 반환"""
+        plan = self.plan(params)
+        
+        # 쿼리 빌더로 쿼리 구성
+        count_builder = self.filtered_builder(params, plan)
+        query = count_builder.build()
         
         # 전체 개수 계산
-        total_count = await self.count(query)
+        total_count = await self.count(query, count_builder.params)
         
         # 페이지네이션 및 정렬 적용
-        final_query = (TrademarkQueryBuilder()
-            .with_keyword(params.keyword)
-            .with_status(params.status)
-            .with_application_date_range(params.application_date_from, params.application_date_to)
-            .with_product_code(params.product_code)
+        page_builder = (self.filtered_builder(params, plan)
             .with_pagination(params.page, params.size)
             .with_order_by()
-            .build()
+            .with_max_execution_time(current_statement_timeout_ms())
         )
+        return total_count, page_builder
+    
+    async def search(self, params: SearchParams) -> Tuple[List[TradeMark], int]:
+        """상표 검색 수행"""
+        with self.search_index(params) as index:
+            if index is not None:
+                return await self.search_with_index(index, params)
+        
+        total_count, page_builder = await self._count_and_page(params)
+        final_query = page_builder.build()
         
         # 쿼리 실행
-        result = await self.db.execute(final_query)
+        result = await self.db.execute(final_query, page_builder.params)
         items = result.scalars().all()
         
         return items, total_count
     
+    async def search_documents(self, params: SearchParams) -> Tuple[List[Tuple[int, Optional[bytes]]], int]:
+        """
+        상표 검색 결과 페이지를 (상표 id, 응답 문서) 목록으로 조회
+        
+        결과 페이지 쿼리에 문서 테이블을 외부 조인해 ORM 객체 대신 렌더링된 바이트를 읽습니다.
+        문서가 없는 상표(이 기능 이전에 적재된 행)는 문서 자리에 None을 반환합니다.
+        """
+        with self.search_index(params) as index:
+            if index is not None:
+                row_ids, total_count = index.search(params)
+                return await self.documents_by_ids(row_ids), total_count
+        
+        total_count, page_builder = await self._count_and_page(params)
+        final_query = page_builder.build()
+        stmt = statement_cache.get_or_build(
+            ("documents", final_query),
+            lambda: (final_query
+                .with_only_columns(TradeMark.id, TrademarkDocument.body)
+                .outerjoin(TrademarkDocument, TrademarkDocument.trademark_id == TradeMark.id))
+        )
+        result = await self.db.execute(stmt, page_builder.params)
+        return [tuple(row) for row in result.all()], total_count
+    
+    async def documents_by_ids(self, row_ids: List[int]) -> List[Tuple[int, Optional[bytes]]]:
+        """상표 id 순서대로 (상표 id, 응답 문서) 목록 조회"""
+        if not row_ids:
+            return []
+        result = await self.db.execute(_DOCUMENTS_BY_IDS_SELECT, {"ids": row_ids})
+        bodies = dict(result.all())
+        return [(row_id, bodies.get(row_id)) for row_id in row_ids]
+    
+    async def get_by_ids(self, row_ids: List[int]) -> List[TradeMark]:
+        """상표 id 목록으로 행 조회 (순서 무관)"""
+        result = await self.db.execute(_BY_IDS_SELECT, {"ids": row_ids})
+        return list(result.scalars().all())
+    
+    async def get_document(self, application_number: str) -> Optional[Tuple[bytes, bytes]]:
+        """출원번호로 미리 렌더링된 (응답 문서, gzip 압축본) 조회"""
+        result = await self.db.execute(_DOCUMENT_SELECT, {"application_number": application_number})
+        row = result.first()
+        return (row.body, row.body_gzip) if row is not None else None
+    
     async def get_by_application_number(self, application_number: str) -> Optional[TradeMark]:
         """출원번호로 상표 조회"""
-        stmt = select(TradeMark).where(TradeMark.applicationNumber == application_number)
-        result = await self.db.execute(stmt)
+        timeout_ms = current_statement_timeout_ms()
+        stmt = _DETAIL_SELECT
+        if timeout_ms:
+            stmt = statement_cache.get_or_build(
+                ("detail", timeout_ms),
+                lambda: with_max_execution_time(_DETAIL_SELECT, timeout_ms)
+            )
+        result = await self.db.execute(stmt, {"application_number": application_number})
         return result.scalar_one_or_none()
+    
+    async def find_by_identifier(
+        self,
+        number: str,
+        number_type: Optional[str] = None
+    ) -> List[Tuple[str, TradeMark]]:
+        """정규화된 번호로 (번호 종류, 상표) 목록 조회"""
+        timeout_ms = current_statement_timeout_ms()
+        base = _IDENTIFIER_TYPED_SELECT if number_type else _IDENTIFIER_SELECT
+        stmt = base
+        if timeout_ms:
+            stmt = statement_cache.get_or_build(
+                ("identifier", bool(number_type), timeout_ms),
+                lambda: with_max_execution_time(base, timeout_ms)
+            )
+        params = {"number": number}
+        if number_type:
+            params["number_type"] = number_type
+        result = await self.db.execute(stmt, params)
+        return [(matched_type, trademark) for matched_type, trademark in result.all()]
+
+
+
+# 샤드 조회 실패 표시 (조회 결과 None과 구분)
+_SHARD_FAILED = object()
+
+
+class ShardsUnavailable(Exception):
+    """검색 대상 샤드가 모두 응답하지 않음"""
+
+    def __init__(self, shard_names: List[str]):
+        super().__init__(f"모든 샤드가 응답하지 않았습니다: {', '.join(shard_names)}")
+        self.shard_names = shard_names
+
+
+class ResultWindowExceeded(ValueError):
+    """샤드 모드에서 요청한 페이지 끝(offset + size)이 SHARD_MAX_RESULT_WINDOW를 넘음 (400 응답으로 변환)"""
+
+    def __init__(self, window: int, max_result_window: int):
+        super().__init__(
+            f"샤드 검색은 결과 앞 {max_result_window}건까지만 조회할 수 있습니다 "
+            f"(요청한 범위: {window}건). 검색 조건을 좁혀 다시 시도해 주세요."
+        )
+        self.window = window
+        self.max_result_window = max_result_window
+
+
+def _merge_order_key(trademark: TradeMark) -> Tuple[bool, int, int]:
+    """_ORDER_BY와 같은 순서 (출원일 없는 행은 마지막, 출원일 내림차순, id 오름차순)"""
+    if trademark.applicationDate is None:
+        return True, 0, trademark.id
+    return False, -trademark.applicationDate.toordinal(), trademark.id
+
+
+def _year_bounds(params: SearchParams) -> Tuple[Optional[int], Optional[int]]:
+    """출원일 조건의 연도 구간 (잘못된 날짜는 SQL 경로와 같이 조건 없음)"""
+    def year_of(value: Optional[str]) -> Optional[int]:
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, "%Y%m%d").year
+        except ValueError:
+            return None
+
+    return year_of(params.application_date_from), year_of(params.application_date_to)
+
+
+class _ShardRepository(TrademarkRepository):
+    """샤드 하나의 SQL 검색 (공유 검색 인덱스는 기본 DB 기준이므로 사용하지 않음)"""
+
+    @contextmanager
+    def search_index(self, params: SearchParams) -> Iterator[Optional[SearchIndex]]:
+        yield None
+
+
+class ShardedTrademarkRepository(TrademarkRepository):
+    """
+    샤드 모드 상표 데이터 접근 레이어 (검색과 출원번호 조회를 샤드에 나눠 보냄)
+
+    검색을 출원 연도 조건에 해당하는 샤드들에 동시에 보내고(scatter), 각 샤드의 정렬된
+    상위 (page × size)건을 출원일 순서로 k-way 병합해 요청한 페이지를 잘라냅니다(gather).
+    전체 건수는 샤드별 건수의 합입니다. page × size가 SHARD_MAX_RESULT_WINDOW를 넘으면
+    샤드에 보내지 않고 ResultWindowExceeded를 발생시킵니다. 기한(SHARD_TIMEOUT_MS) 안에 응답하지 않거나 연결에
+    실패한 샤드는 제외하고 skipped_shards에 기록하며, 모든 샤드가 실패하면 ShardsUnavailable을 발생시킵니다.
+    """
+
+    def __init__(self, db: AsyncSession, registry: ShardRegistry = shard_registry):
+        super().__init__(db)
+        self.registry = registry
+        self.skipped_shards: List[str] = []
+
+    async def _on_shard(self, shard: Shard, fn: Any) -> Any:
+        """샤드 세션으로 fn(repository) 실행 (기한 초과나 DB 오류는 _SHARD_FAILED)"""
+        async with shard.session_factory() as db:
+            try:
+                return await asyncio.wait_for(fn(_ShardRepository(db)), self.registry.timeout_ms / 1000)
+            except asyncio.TimeoutError:
+                logger.warning("샤드 %s가 %dms 안에 응답하지 않아 제외합니다.", shard.name, self.registry.timeout_ms)
+                # 취소된 쿼리를 실행하던 연결은 상태를 알 수 없으므로 풀에 돌려보내지 않음
+                try:
+                    await db.invalidate()
+                except Exception as e:
+                    logger.debug("샤드 %s 연결 무효화 실패: %s", shard.name, e)
+            except (SQLAlchemyError, OSError) as e:
+                logger.warning("샤드 %s 조회 실패로 제외합니다: %s", shard.name, e)
+        return _SHARD_FAILED
+
+    async def _scatter(self, shards: List[Shard], fn: Any) -> List[Tuple[Shard, Any]]:
+        """샤드별 결과 (응답한 샤드만), 제외된 샤드는 skipped_shards에 기록"""
+        results = await asyncio.gather(*(self._on_shard(shard, fn) for shard in shards))
+        self.skipped_shards = [shard.name for shard, result in zip(shards, results) if result is _SHARD_FAILED]
+        if shards and len(self.skipped_shards) == len(shards):
+            raise ShardsUnavailable(self.skipped_shards)
+        return [(shard, result) for shard, result in zip(shards, results) if result is not _SHARD_FAILED]
+
+    async def search(self, params: SearchParams) -> Tuple[List[TradeMark], int]:
+        """상표 검색 수행 (샤드 scatter-gather)"""
+        # 검색식 오류 등은 샤드에 보내기 전에 한 번만 발생시킴
+        self.filtered_builder(params, None)
+        offset = (params.page - 1) * params.size
+        if offset + params.size > self.registry.max_result_window:
+            raise ResultWindowExceeded(offset + params.size, self.registry.max_result_window)
+        shards = self.registry.select(*_year_bounds(params))
+        # 병합 후 offset 뒤 size건을 잘라내려면 각 샤드에서 상위 offset + size건이 필요
+        shard_params = params.model_copy(update={"page": 1, "size": offset + params.size})
+
+        results = await self._scatter(shards, lambda repository: repository.search(shard_params))
+        total_count = sum(count for _, (_, count) in results)
+        # 샤드 목록 순서가 같은 출원일끼리의 순서를 정함 (heapq.merge는 안정 병합)
+        merged = heapq.merge(*(items for _, (items, _) in results), key=_merge_order_key)
+        return list(islice(merged, offset, offset + params.size)), total_count
+
+    async def get_by_application_number(self, application_number: str) -> Optional[TradeMark]:
+        """출원번호로 상표 조회 (모든 샤드에 동시에 조회)"""
+        results = await self._scatter(
+            self.registry.shards,
+            lambda repository: repository.get_by_application_number(application_number)
+        )
+        for _, trademark in results:
+            if trademark is not None:
+                return trademark
+        # 응답하지 않은 샤드에 있을 수 있으므로 없다고 단정하지 않음
+        if self.skipped_shards:
+            raise ShardsUnavailable(self.skipped_shards)
+        return None
+
+
+# 동일한 검색 조건의 동시 요청을 하나의 DB 실행으로 합치는 프로세스 전역 레이어
+SINGLE_FLIGHT_ENABLED = os.getenv("SEARCH_SINGLE_FLIGHT", "true").lower() in ("1", "true", "yes", "on")
+search_flight = SingleFlight()
+
+
+def _prefetch_key(params: SearchParams) -> Tuple[Any, ...]:
+    """프리패치 캐시 키 (데이터셋이 바뀌면 이전 결과를 쓰지 않도록 버전 포함)"""
+    version = dataset_version_cache.get()
+    return (version.version if version else None, params.normalized_key())
+
+
+def trademark_to_dict(model: TradeMark) -> Dict[str, Any]:
+    """ORM 모델을 응답 딕셔너리로 변환 (서비스 밖의 적재/감시 알림에서도 사용)"""
+    # 날짜 필드 처리를 위한 헬퍼 함수
+    def format_date(date_value):
+        if not date_value:
+            return None
+        if isinstance(date_value, (datetime, date)):
+            return date_value.isoformat()
+        return date_value  # 이미 문자열이거나 다른 형식인 경우 그대로 반환
+        
+    return {
+        "id": model.id,
+        "productName": model.productName,
+        "productNameEng": model.productNameEng,
+        "applicationNumber": model.applicationNumber,
+        "applicationDate": format_date(model.applicationDate),
+        "registerStatus": model.registerStatus,
+        "publicationNumber": model.publicationNumber,
+        "publicationDate": format_date(model.publicationDate),
+        "registrationNumber": model.registrationNumber,
+        "registrationDate": model.registrationDate,
+        "registrationPubNumber": getattr(model, "registrationPubNumber", None),
+        "registrationPubDate": getattr(model, "registrationPubDate", None),
+        "internationalRegNumbers": model.internationalRegNumbers,
+        "internationalRegDate": format_date(model.internationalRegDate),
+        "priorityClaimNumList": model.priorityClaimNumList,
+        "priorityClaimDateList": model.priorityClaimDateList,
+        "asignProductMainCodeList": model.asignProductMainCodeList,
+        "asignProductSubCodeList": model.asignProductSubCodeList,
+        "viennaCodeList": model.viennaCodeList
+    }
 
 
 class TrademarkService:
     """상표 검색 비즈니스 로직 레이어"""
     
     def __init__(self, db: AsyncSession):
-        self.repository = TrademarkRepository(db)
+        # SEARCH_SHARDS가 설정되면 검색과 출원번호 조회를 샤드에 나눠 보냄
+        if shard_registry.enabled:
+            self.repository = ShardedTrademarkRepository(db)
+        else:
+            self.repository = TrademarkRepository(db)
     
     async def search_trademarks(self, params: SearchParams) -> SearchResult:
-        """상표 검색 수행"""
-        items, total_count = await self.repository.search(params)
+        """상표 검색 수행 (동일 조건의 동시 요청은 결과를 공유, 프리패치된 페이지는 캐시에서 응답)"""
+        result = await page_prefetcher.get(_prefetch_key(params))
+        if result is None:
+            if not SINGLE_FLIGHT_ENABLED:
+                result = await self._search_trademarks(params)
+            elif search_flight.owns_sessions:
+                # 공유 실행은 flight 소유 세션으로 실행 (취소된 리더가 실행 종료를 기다리지 않음)
+                result = await search_flight.do_in_session(
+                    params.normalized_key(),
+                    lambda db: TrademarkService(db)._search_trademarks(params)
+                )
+            else:
+                result = await search_flight.do(
+                    params.normalized_key(),
+                    lambda: self._search_trademarks(params)
+                )
+        self._prefetch_next_page(params, result)
+        # 공유된 결과를 요청별로 분리 (최상위 키 수정이 서로 영향을 주지 않도록)
+        return dict(result)
+    
+    def _prefetch_next_page(self, params: SearchParams, result: SearchResult) -> None:
+        """다음 페이지가 있으면 백그라운드 프리패치 예약 (SEARCH_PREFETCH_ENABLED)"""
+        if not page_prefetcher.active or result["page"] >= result["pages_count"] or result.get("skipped_shards"):
+            return
+        next_params = params.model_copy(update={"page": params.page + 1})
         
-        # ORM 객체를 딕셔너리로 변환
-        items_dict = [self._convert_to_dict(item) for item in items]
+        async def fetch(db: AsyncSession) -> Optional[SearchResult]:
+            next_result = await TrademarkService(db)._search_trademarks(next_params)
+            # 일부 샤드가 빠진 부분 결과는 캐시하지 않음
+            return None if next_result.get("skipped_shards") else next_result
+        
+        page_prefetcher.schedule(_prefetch_key(next_params), next_params.page, fetch)
+    
+    def _use_documents(self) -> bool:
+        """미리 렌더링된 응답 문서로 응답할지 (문서는 기본 DB에만 있으므로 샤드 모드 제외)"""
+        return document_store.active and not isinstance(self.repository, ShardedTrademarkRepository)
+    
+    async def _documents_of(self, rows: List[Tuple[int, Optional[bytes]]]) -> List[RawJSON]:
+        """(상표 id, 문서) 목록을 응답 문서로 변환 (문서가 없는 행만 조회해 렌더링)"""
+        missing = [row_id for row_id, body in rows if body is None]
+        rendered: Dict[int, RawJSON] = {}
+        if missing:
+            for item in await self.repository.get_by_ids(missing):
+                rendered[item.id] = render_document(self._convert_to_dict(item))
+        return [
+            RawJSON(body) if body is not None else rendered[row_id]
+            for row_id, body in rows
+            if body is not None or row_id in rendered
+        ]
+    
+    async def _search_trademarks(self, params: SearchParams) -> SearchResult:
+        """상표 검색 실행 (응답 문서가 있으면 ORM 변환 없이 렌더링된 문서를 items로 사용)"""
+        if self._use_documents():
+            rows, total_count = await self.repository.search_documents(params)
+            items_dict = await self._documents_of(rows)
+        else:
+            items, total_count = await self.repository.search(params)
+            
+            # ORM 객체를 딕셔너리로 변환
+            items_dict = [self._convert_to_dict(item) for item in items]
         
         # 결과 페이지 수 계산
         pages_count = (total_count + params.size - 1) // params.size if total_count > 0 else 0
         
         # 최종 결과 생성
-        return {
+        result = {
             "items": items_dict,
             "total_count": total_count,
             "page": params.page,
             "size": params.size,
             "pages_count": pages_count
         }
+        # 응답하지 않은 샤드가 있으면 부분 결과임을 알림
+        skipped_shards = getattr(self.repository, "skipped_shards", None)
+        if skipped_shards:
+            result["skipped_shards"] = skipped_shards
+        return result
     
     async def get_trademark_by_application_number(self, application_number: str) -> Optional[Dict[str, Any]]:
         """출원번호로 상표 조회"""
@@ -189,37 +820,79 @@ class TrademarkService:
             return None
         return self._convert_to_dict(trademark)
     
-    def _convert_to_dict(self, model: TradeMark) -> Dict[str, Any]:
-        """ORM 모델을 딕셔너리로 변환"""
-        # 날짜 필드 처리를 위한 헬퍼 함수
-        def format_date(date_value):
-            if not date_value:
-                return None
-            if isinstance(date_value, (datetime, date)):
-                return date_value.isoformat()
-            return date_value  # 이미 문자열이거나 다른 형식인 경우 그대로 반환
-            
+    async def get_trademark_detail(
+        self,
+        application_number: str
+    ) -> Union[Tuple[bytes, bytes], Dict[str, Any], None]:
+        """
+        상세 조회 응답 (미리 렌더링된 (문서, gzip 압축본) 또는 딕셔너리)
+        
+        문서가 있으면 ORM 객체를 만들지 않고 적재 시 렌더링한 바이트를 반환하며,
+        문서가 없으면 기존처럼 조회해 딕셔너리로 변환합니다.
+        """
+        if self._use_documents():
+            document = await self.repository.get_document(application_number)
+            if document is not None:
+                return document
+        return await self.get_trademark_by_application_number(application_number)
+    
+    async def get_trademarks_by_identifier(
+        self,
+        number: str,
+        number_type: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """등록/국제등록/우선권 주장 번호 등 어떤 번호로든 상표 조회"""
+        normalized = normalize_identifier(number)
+        matches = await self.repository.find_by_identifier(normalized, number_type) if normalized else []
+        return {
+            "number": normalized,
+            "items": [
+                {"number_type": matched_type, **self._convert_to_dict(trademark)}
+                for matched_type, trademark in matches
+            ]
+        }
+    
+    async def get_statistics(
+        self,
+        group_by: List[str],
+        status: Optional[str] = None,
+        product_code: Optional[str] = None,
+        year_from: Optional[int] = None,
+        year_to: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """집계 테이블에서 상태 × 분류 × 연도별 상표 수 조회"""
+        items = await query_rollups(
+            self.repository.db, group_by,
+            status=status, main_code=product_code, year_from=year_from, year_to=year_to
+        )
         return {
-            "id": model.id,
-            "productName": model.productName,
-            "productNameEng": model.productNameEng,
-            "applicationNumber": model.applicationNumber,
-            "applicationDate": format_date(model.applicationDate),
-            "registerStatus": model.registerStatus,
-            "publicationNumber": model.publicationNumber,
-            "publicationDate": format_date(model.publicationDate),
-            "registrationNumber": model.registrationNumber,
-            "registrationDate": model.registrationDate,
-            "registrationPubNumber": getattr(model, "registrationPubNumber", None),
-            "registrationPubDate": getattr(model, "registrationPubDate", None),
-            "internationalRegNumbers": model.internationalRegNumbers,
-            "internationalRegDate": format_date(model.internationalRegDate),
-            "priorityClaimNumList": model.priorityClaimNumList,
-            "priorityClaimDateList": model.priorityClaimDateList,
-            "asignProductMainCodeList": model.asignProductMainCodeList,
-            "asignProductSubCodeList": model.asignProductSubCodeList,
-            "viennaCodeList": model.viennaCodeList
+            "group_by": group_by,
+            "items": items,
+            "total_count": sum(item["count"] for item in items)
         }
+    
+    async def get_similar_trademarks(
+        self,
+        application_number: str,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        limit: int = 20
+    ) -> Optional[Dict[str, Any]]:
+        """상표명이 거의 같은 상표 조회 (MinHash/LSH 버킷 후보만 비교)"""
+        matches = await find_similar(self.repository.db, application_number, threshold, limit)
+        if matches is None:
+            return None
+        return {
+            "applicationNumber": application_number,
+            "threshold": threshold,
+            "items": [
+                {"similarity": round(similarity, 4), **self._convert_to_dict(trademark)}
+                for similarity, trademark in matches
+            ]
+        }
+    
+    def _convert_to_dict(self, model: TradeMark) -> Dict[str, Any]:
+        """ORM 모델을 딕셔너리로 변환"""
+        return trademark_to_dict(model)
 
 
 # 이전 버전 호환을 위한 함수들 (라우터에서 직접 호출 가능)
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.saved_query import SavedQuery, WatchNotification
+from app.schemas.watch import SavedQueryCreate
+from app.services.trademark_service import trademark_to_dict
+
+
+def saved_query_to_dict(query: SavedQuery) -> Dict[str, Any]:
+    return {
+        "id": query.id,
+        "client_id": query.client_id,
+        "name": query.name,
+        "keyword": query.keyword,
+        "status": query.status,
+        "product_code": query.product_code,
+        "created_at": query.created_at.isoformat() if query.created_at else None,
+    }
+
+
+class WatchlistService:
+    """감시 목록 검색 조건 등록/조회/삭제와 알림 조회"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, body: SavedQueryCreate) -> SavedQuery:
+        query = SavedQuery(
+            client_id=body.client_id,
+            name=body.name,
+            # 빈 문자열 조건은 지정하지 않은 것으로 처리 (검색 API와 같음)
+            keyword=body.keyword or None,
+            status=body.status or None,
+            product_code=body.product_code or None,
+            created_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        )
+        self.db.add(query)
+        await self.db.commit()
+        return query
+
+    async def list_queries(self, client_id: str) -> List[SavedQuery]:
+        result = await self.db.execute(
+            select(SavedQuery).where(SavedQuery.client_id == client_id).order_by(SavedQuery.id)
+        )
+        return list(result.scalars().all())
+
+    async def delete(self, query_id: int, client_id: str) -> bool:
+        """검색 조건과 그 알림 삭제 (다른 클라이언트의 조건이면 False)"""
+        query = await self.db.get(SavedQuery, query_id)
+        if query is None or query.client_id != client_id:
+            return False
+        await self.db.execute(delete(WatchNotification).where(WatchNotification.saved_query_id == query_id))
+        await self.db.delete(query)
+        await self.db.commit()
+        return True
+
+    async def list_notifications(
+        self,
+        client_id: str,
+        since_id: int = 0,
+        limit: int = 50
+    ) -> Dict[str, Any]:
+        """
+        클라이언트의 알림을 id 오름차순으로 조회
+
+        응답의 next_since_id를 다음 요청의 since_id로 넘기면 이후 생성된 알림만 받습니다(키셋 페이지).
+        """
+        result = await self.db.execute(
+            select(WatchNotification)
+            .join(SavedQuery, WatchNotification.saved_query_id == SavedQuery.id)
+            .where(SavedQuery.client_id == client_id, WatchNotification.id > since_id)
+            .options(selectinload(WatchNotification.saved_query), selectinload(WatchNotification.trademark))
+            .order_by(WatchNotification.id)
+            .limit(limit)
+        )
+        notifications = result.scalars().all()
+        items = [
+            {
+                "id": notification.id,
+                "saved_query_id": notification.saved_query_id,
+                "saved_query_name": notification.saved_query.name,
+                "dataset_version": notification.dataset_version,
+                "created_at": notification.created_at.isoformat() if notification.created_at else None,
+                # 이후 적재에서 빠진 상표면 None
+                "trademark": (
+                    trademark_to_dict(notification.trademark) if notification.trademark is not None else None
+                ),
+            }
+            for notification in notifications
+        ]
+        next_since_id: Optional[int] = notifications[-1].id if notifications else since_id
+        return {"items": items, "next_since_id": next_since_id}
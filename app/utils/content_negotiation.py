@@ -0,0 +1,329 @@
+import json
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+
+from app.utils.documents import RawJSON, contains_documents, iter_json
+
+try:  # 선택 의존성: 없으면 순수 파이썬 인코더 사용
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:  # 선택 의존성: 없으면 zstd를 협상하지 않음
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+_MSGPACK_ALIASES = (MSGPACK_MEDIA_TYPE, "application/x-msgpack")
+
+# 협상 결과에 따라 본문이 달라지므로 공유 캐시가 두 헤더를 키에 포함해야 함
+VARY_HEADER = "Accept, Accept-Encoding"
+
+RESPONSE_COMPRESSION_ENABLED = os.getenv("RESPONSE_COMPRESSION_ENABLED", "true").lower() in ("1", "true", "yes", "on")
+# 이보다 작은 본문은 압축 이득보다 비용이 커서 그대로 전송
+RESPONSE_COMPRESSION_MIN_BYTES = int(os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", "1024"))
+RESPONSE_GZIP_LEVEL = int(os.getenv("RESPONSE_GZIP_LEVEL", "6"))
+RESPONSE_ZSTD_LEVEL = int(os.getenv("RESPONSE_ZSTD_LEVEL", "3"))
+# 압축기에 넘기는 조각 크기 (JSON 조각을 모아 압축 호출 횟수를 줄임)
+_COMPRESS_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class Representation:
+    """Accept/Accept-Encoding 협상 결과 (응답 형식과 콘텐츠 인코딩)"""
+    media_type: str = JSON_MEDIA_TYPE
+    encoding: Optional[str] = None
+
+    @property
+    def is_default(self) -> bool:
+        return self.media_type == JSON_MEDIA_TYPE and self.encoding is None
+
+    @property
+    def etag_parts(self) -> Tuple[str, ...]:
+        """ETag에 더할 표현 구분값 (기본 JSON 응답은 기존 ETag 유지)"""
+        return () if self.is_default else (self.media_type, self.encoding or "identity")
+
+
+def _qualities(header: Optional[str]) -> Dict[str, float]:
+    """Accept 계열 헤더를 {값: q} 딕셔너리로 변환"""
+    qualities: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        value, *params = [token.strip() for token in part.split(";")]
+        if not value:
+            continue
+        quality = 1.0
+        for param in params:
+            name, _, raw = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(raw)
+                except ValueError:
+                    quality = 0.0
+        qualities[value.lower()] = quality
+    return qualities
+
+
+def _negotiate_media_type(accept: Optional[str]) -> str:
+    """MessagePack을 명시적으로 요청하고 JSON보다 낮게 두지 않았으면 MessagePack"""
+    qualities = _qualities(accept)
+    msgpack_quality = max((qualities.get(alias, 0.0) for alias in _MSGPACK_ALIASES), default=0.0)
+    if msgpack_quality > 0 and msgpack_quality >= qualities.get(JSON_MEDIA_TYPE, 0.0):
+        return MSGPACK_MEDIA_TYPE
+    return JSON_MEDIA_TYPE
+
+
+def _negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """허용된 인코딩 중 q가 가장 높은 것 (같으면 zstd 우선, zstandard가 없으면 gzip만)"""
+    if not RESPONSE_COMPRESSION_ENABLED:
+        return None
+    qualities = _qualities(accept_encoding)
+    supported = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+    best, best_quality = None, 0.0
+    for coding in supported:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def negotiate(request: Optional[Request]) -> Representation:
+    """요청 헤더로 응답 형식과 압축 방식 결정"""
+    if request is None:
+        return Representation()
+    return Representation(
+        media_type=_negotiate_media_type(request.headers.get("accept")),
+        encoding=_negotiate_encoding(request.headers.get("accept-encoding"))
+    )
+
+
+# 그대로 인코딩할 수 있는 값 (정확한 타입으로 비교해 isinstance 연쇄 비용을 줄임)
+_PLAIN_TYPES = frozenset((str, int, float, bool))
+
+
+def _without_nulls(obj: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in obj.items() if value is not None}
+
+
+def compact(value: Any) -> Any:
+    """MessagePack으로 보낼 값으로 변환 (null 필드 생략, 렌더링된 문서는 다시 해석)"""
+    if value is None or type(value) in _PLAIN_TYPES:
+        return value
+    if isinstance(value, RawJSON):
+        return json.loads(value, object_hook=_without_nulls)
+    if isinstance(value, dict):
+        return {
+            str(key): item if type(item) in _PLAIN_TYPES else compact(item)
+            for key, item in value.items() if item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [item if type(item) in _PLAIN_TYPES else compact(item) for item in value]
+    return compact(jsonable_encoder(value))
+
+
+def _pack_into(buffer: bytearray, value: Any) -> None:
+    """MessagePack 규격대로 값을 가장 짧은 형식으로 기록 (msgpack 패키지와 같은 바이트)"""
+    if value is None:
+        buffer.append(0xC0)
+    elif value is True:
+        buffer.append(0xC3)
+    elif value is False:
+        buffer.append(0xC2)
+    elif isinstance(value, int):
+        if 0 <= value < 0x80 or -32 <= value < 0:
+            buffer.append(value & 0xFF)
+        elif value > 0:
+            if value <= 0xFF:
+                buffer += struct.pack(">BB", 0xCC, value)
+            elif value <= 0xFFFF:
+                buffer += struct.pack(">BH", 0xCD, value)
+            elif value <= 0xFFFFFFFF:
+                buffer += struct.pack(">BI", 0xCE, value)
+            else:
+                buffer += struct.pack(">BQ", 0xCF, value)
+        elif value >= -0x80:
+            buffer += struct.pack(">Bb", 0xD0, value)
+        elif value >= -0x8000:
+            buffer += struct.pack(">Bh", 0xD1, value)
+        elif value >= -0x80000000:
+            buffer += struct.pack(">Bi", 0xD2, value)
+        else:
+            buffer += struct.pack(">Bq", 0xD3, value)
+    elif isinstance(value, float):
+        buffer += struct.pack(">Bd", 0xCB, value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        size = len(data)
+        if size < 32:
+            buffer.append(0xA0 | size)
+        elif size <= 0xFF:
+            buffer += struct.pack(">BB", 0xD9, size)
+        elif size <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xDA, size)
+        else:
+            buffer += struct.pack(">BI", 0xDB, size)
+        buffer += data
+    elif isinstance(value, (bytes, bytearray)):
+        size = len(value)
+        if size <= 0xFF:
+            buffer += struct.pack(">BB", 0xC4, size)
+        elif size <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xC5, size)
+        else:
+            buffer += struct.pack(">BI", 0xC6, size)
+        buffer += value
+    elif isinstance(value, (list, tuple)):
+        size = len(value)
+        if size < 16:
+            buffer.append(0x90 | size)
+        elif size <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xDC, size)
+        else:
+            buffer += struct.pack(">BI", 0xDD, size)
+        for item in value:
+            _pack_into(buffer, item)
+    elif isinstance(value, dict):
+        size = len(value)
+        if size < 16:
+            buffer.append(0x80 | size)
+        elif size <= 0xFFFF:
+            buffer += struct.pack(">BH", 0xDE, size)
+        else:
+            buffer += struct.pack(">BI", 0xDF, size)
+        for key, item in value.items():
+            _pack_into(buffer, key)
+            _pack_into(buffer, item)
+    else:
+        raise TypeError(f"MessagePack으로 인코딩할 수 없는 값입니다: {type(value).__name__}")
+
+
+def pack(value: Any) -> bytes:
+    """순수 파이썬 MessagePack 인코더"""
+    buffer = bytearray()
+    _pack_into(buffer, value)
+    return bytes(buffer)
+
+
+def encode_msgpack(content: Any) -> bytes:
+    """응답 내용을 null 필드를 뺀 MessagePack 바이트로 인코딩 (msgpack 패키지가 있으면 사용)"""
+    value = compact(content)
+    if msgpack is not None:
+        return msgpack.packb(value, use_bin_type=True)
+    return pack(value)
+
+
+def _compressor(encoding: str) -> Any:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=RESPONSE_ZSTD_LEVEL).compressobj()
+    # wbits=31: gzip 헤더/트레일러 (mtime은 0으로 기록되어 같은 본문은 같은 바이트)
+    return zlib.compressobj(RESPONSE_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+
+def _chunked(pieces: Iterable[bytes]) -> Iterator[bytes]:
+    """작은 조각을 모아 일정 크기 이상으로 전달"""
+    buffer: List[bytes] = []
+    size = 0
+    for piece in pieces:
+        buffer.append(piece)
+        size += len(piece)
+        if size >= _COMPRESS_CHUNK_BYTES:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def compress_stream(pieces: Iterable[bytes], encoding: str) -> Iterator[bytes]:
+    """본문 조각을 받는 대로 압축해 내보내는 스트리밍 압축"""
+    compressor = _compressor(encoding)
+    for chunk in _chunked(pieces):
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _body_response(pieces: Iterator[bytes], media_type: str, encoding: Optional[str]) -> Response:
+    """
+    본문 조각으로 응답 생성
+
+    압축할 때는 최소 크기만큼 먼저 읽어 보고, 그보다 작으면 압축하지 않고 그대로 보냅니다.
+    크면 이미 읽은 조각과 나머지를 이어서 압축하며 스트리밍합니다.
+    """
+    headers = {"Vary": VARY_HEADER}
+    if encoding is None:
+        return Response(content=b"".join(pieces), media_type=media_type, headers=headers)
+    head: List[bytes] = []
+    size = 0
+    for piece in pieces:
+        head.append(piece)
+        size += len(piece)
+        if size >= RESPONSE_COMPRESSION_MIN_BYTES:
+            break
+    else:
+        return Response(content=b"".join(head), media_type=media_type, headers=headers)
+    headers["Content-Encoding"] = encoding
+    return StreamingResponse(compress_stream(chain(head, pieces), encoding), media_type=media_type, headers=headers)
+
+
+def _with_headers_of(encoded: Response, response: Optional[Response]) -> Response:
+    """라우터가 주입된 응답에 설정한 헤더(캐시 헤더 등)를 새 응답으로 옮김"""
+    if response is not None:
+        encoded.raw_headers.extend(
+            (name, value) for name, value in response.raw_headers
+            if name not in (b"content-length", b"vary")
+        )
+    return encoded
+
+
+def encode_response(content: Any, representation: Representation, response: Optional[Response] = None) -> Response:
+    """협상한 형식(JSON/MessagePack)과 압축 방식으로 응답 생성"""
+    if representation.media_type == MSGPACK_MEDIA_TYPE:
+        pieces = iter((encode_msgpack(content),))
+    else:
+        pieces = iter_json(content)
+    return _with_headers_of(
+        _body_response(pieces, representation.media_type, representation.encoding), response
+    )
+
+
+def negotiated_response(content: Any, representation: Representation, response: Optional[Response] = None) -> Any:
+    """
+    협상 결과에 맞는 응답 반환
+
+    압축하지 않는 JSON이고 렌더링된 문서가 없으면 기존처럼 내용을 그대로 반환해 FastAPI가 직렬화하게 하고,
+    그 밖에는 직접 인코딩한 응답을 반환합니다.
+    """
+    if representation.is_default and not (isinstance(content, dict) and contains_documents(content)):
+        if response is not None:
+            response.headers["Vary"] = VARY_HEADER
+        return content
+    return encode_response(content, representation, response)
+
+
+def document_response(
+    body: bytes,
+    body_gzip: bytes,
+    representation: Representation,
+    response: Optional[Response] = None
+) -> Response:
+    """미리 렌더링된 상표 문서 응답 (gzip을 협상했고 저장된 압축본이 원본보다 작으면 압축본을 그대로 전송)"""
+    if representation.media_type == JSON_MEDIA_TYPE and representation.encoding == "gzip" \
+            and len(body_gzip) < len(body):
+        encoded = Response(
+            content=body_gzip,
+            media_type=JSON_MEDIA_TYPE,
+            headers={"Vary": VARY_HEADER, "Content-Encoding": "gzip"}
+        )
+        return _with_headers_of(encoded, response)
+    return encode_response(RawJSON(body), representation, response)
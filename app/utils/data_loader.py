@@ -1,10 +1,35 @@
+import hashlib
 import json
 import os
-from typing import List, Dict, Any
-from datetime import date
+from typing import List, Dict, Any, Iterable, Optional, Set, Tuple
+from datetime import date, datetime, timezone
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.schemas.trademark import TradeMarkCreate # 데이터 유효성 검사 및 변환용 스키마
 from app.models.trademark import TradeMark as TradeMarkModel # DB 저장을 위한 SQLAlchemy 모델
+from app.models.dataset_version import DatasetVersion # 데이터셋 버전 (HTTP 캐시 검증용)
+from app.models.trademark_identifier import TrademarkIdentifier # 통합 번호 색인
+from app.utils.identifiers import extract_identifiers
+from app.models.trademark_vienna_code import TrademarkViennaCode # 비엔나 코드 계층 색인
+from app.utils.vienna import normalize_vienna_code
+from app.utils.name_normalization import normalize_name
+from app.models.trademark_signature import TrademarkSignature # 유사 상표 검색용 MinHash 서명
+from app.models.trademark_lsh_bucket import TrademarkLshBucket
+from app.utils.minhash import lsh_buckets, minhash_signature, name_shingles, pack_signature
+from app.services.rollup import RollupAccumulator # 대시보드용 상태×분류×연도 집계
+from app.services.query_planner import refresh_column_statistics # 실행 계획용 컬럼 통계
+from app.search_index.builder import fetch_index_rows # 검색 인덱스 스냅숏용 컬럼
+from app.search_index.snapshot import SEARCH_SNAPSHOT_PATH, write_snapshot
+from app.models.saved_query import WatchNotification # 감시 목록 알림
+from app.models.dataset_record import DatasetRecord # 직전 적재의 레코드 해시 (새/변경 레코드 판별)
+from app.services.percolator import Percolator, load_percolator
+from app.models.trademark_document import TrademarkDocument # 미리 렌더링한 응답 문서 (읽기 모델)
+from app.services.trademark_service import trademark_to_dict
+from app.utils.documents import compress_document, render_document
+
+
+# 날짜 컬럼 (JSON 직렬화된 레코드 대신 date 객체로 바인딩해야 SQLite에도 적재 가능)
+DATE_COLUMNS = {"applicationDate", "publicationDate", "registrationPubDate", "internationalRegDate"}
 
 
 # date 객체를 문자열로 변환하는 JSON 인코더
@@ -15,11 +40,38 @@ class DateEncoder(json.JSONEncoder):
         return super().default(obj)
     
 
+NOTIFIED_LOOKUP_CHUNK = 500
+
+
+async def _notified_pairs(db: AsyncSession, pairs: Iterable[Tuple[int, str]]) -> Set[Tuple[int, str]]:
+    """이미 알림이 있는 (검색 조건 id, 출원번호) 조합 (바뀐 레코드가 같은 조건과 다시 일치한 경우)"""
+    application_numbers = sorted({application_number for _, application_number in pairs})
+    notified: Set[Tuple[int, str]] = set()
+    for start in range(0, len(application_numbers), NOTIFIED_LOOKUP_CHUNK):
+        result = await db.execute(
+            select(WatchNotification.saved_query_id, WatchNotification.application_number).where(
+                WatchNotification.application_number.in_(application_numbers[start:start + NOTIFIED_LOOKUP_CHUNK])
+            )
+        )
+        notified.update((saved_query_id, application_number) for saved_query_id, application_number in result)
+    return notified
+
+
 async def load_trademarks_from_json(
     db: AsyncSession,
-    file_path: str = "/data/trademark_sample.json"
+    file_path: str = "/data/trademark_sample.json",
+    snapshot_path: Optional[str] = SEARCH_SNAPSHOT_PATH
 ) -> int:
-    """JSON 파일에서 상표 데이터를 읽어 데이터베이스에 적재합니다."""
+    """JSON 파일에서 상표 데이터를 읽어 데이터베이스에 적재합니다.
+
+    레코드마다 상세 응답과 같은 JSON 문서(와 gzip 압축본)를 함께 기록해 조회 API가 그대로 응답합니다.
+    직전 적재에 없던 레코드와 내용이 바뀐 레코드(출원번호별 레코드 해시 비교)만 저장된 감시 목록
+    검색 조건과 역방향으로 대조해(percolator), 이미 알린 조합을 뺀 일치 조건마다 알림을
+    데이터와 같은 트랜잭션으로 기록합니다.
+
+    커밋 후에는 같은 데이터셋 버전으로 검색 인덱스 스냅숏(`snapshot_path`)을 기록해
+    서비스가 재시작 시 DB에서 인덱스를 다시 구축하지 않도록 합니다.
+    """
     loaded_count = 0
     print(f"데이터 파일 경로: {file_path}")
 
@@ -53,6 +105,25 @@ async def load_trademarks_from_json(
 
     print("데이터베이스에 항목 추가 시작...")
 
+    # 적재된 레코드 내용으로 데이터셋 버전(해시) 계산
+    version_hash = hashlib.sha256()
+    rollups = RollupAccumulator()
+    loaded_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    # 감시 목록 대조기와 직전 적재의 레코드 해시 (해시가 같은 레코드는 이미 대조했으므로 건너뜀)
+    try:
+        percolator = await load_percolator(db)
+        previous_hashes = dict((await db.execute(
+            select(DatasetRecord.application_number, DatasetRecord.record_hash)
+        )).all())
+    except Exception as e:
+        print(f"감시 목록 조건 조회 중 오류 발생 (알림 생성 생략): {e}")
+        percolator = Percolator([])
+        previous_hashes = {}
+    record_hashes: Dict[str, str] = {}
+    matches: Dict[Tuple[int, str], None] = {}
+    trademarks: List[TradeMarkModel] = []
+
     for idx, item in enumerate(raw_data):
         try:
             # 진행 상황 로깅 (100개 단위)
@@ -60,22 +131,139 @@ async def load_trademarks_from_json(
                 print(f"진행 중: {idx}/{len(raw_data)} 항목 처리...")
 
             trademark_data = TradeMarkCreate.model_validate(item)
-            db_trademark = TradeMarkModel(**trademark_data.model_dump(mode='json', exclude_unset=True))
+            record = trademark_data.model_dump(mode='json', exclude_unset=True)
+            db_trademark = TradeMarkModel(
+                **{**record, **trademark_data.model_dump(include=DATE_COLUMNS, exclude_unset=True)},
+                productNameNorm=normalize_name(record.get("productName")),
+                productNameEngNorm=normalize_name(record.get("productNameEng"))
+            )
             db.add(db_trademark)
+            trademarks.append(db_trademark)
+            # 등록/국제등록/우선권 주장 번호 등을 정규화해 통합 번호 색인에 추가
+            db.add_all([
+                TrademarkIdentifier(number_type=number_type, number=number, trademark=db_trademark)
+                for number_type, number in extract_identifiers(record)
+            ])
+            # 비엔나 코드를 정규화해 접두 범위 탐색용 색인에 추가
+            db.add_all([
+                TrademarkViennaCode(code=code, trademark=db_trademark)
+                for code in sorted({
+                    normalize_vienna_code(code) for code in record.get("viennaCodeList") or []
+                } - {None})
+            ])
+            # 상표명 글자 조각의 MinHash 서명과 LSH 밴드 버킷 (유사 상표 후보 검색용)
+            signature = minhash_signature(name_shingles(record.get("productName"), record.get("productNameEng")))
+            if signature is not None:
+                db.add(TrademarkSignature(signature=pack_signature(signature), trademark=db_trademark))
+                db.add_all([
+                    TrademarkLshBucket(band=band, bucket=bucket, trademark=db_trademark)
+                    for band, bucket in lsh_buckets(signature)
+                ])
+            canonical = json.dumps(record, sort_keys=True, ensure_ascii=False).encode("utf-8")
+            record_hash = hashlib.sha256(canonical).hexdigest()
+            record_hashes[db_trademark.applicationNumber] = record_hash
+            # 새 레코드이거나 바뀐 레코드만 후보 조건을 확인해 일치한 감시 목록 기록
+            if previous_hashes.get(db_trademark.applicationNumber) != record_hash:
+                for saved_query_id in percolator.match(record):
+                    matches[(saved_query_id, db_trademark.applicationNumber)] = None
+            version_hash.update(canonical)
+            rollups.add(record)
             loaded_count += 1
 
         except Exception as e:
             print(f"데이터 항목 처리 중 오류 발생: {item.get('applicationNumber', '알 수 없음')}, 오류: {e}")
             continue
 
+    # 상표 id가 정해지도록 반영한 뒤 상세 응답과 같은 JSON 문서와 gzip 압축본을 렌더링
+    # (조회 시 ORM 변환과 직렬화 없이 바이트를 그대로 응답)
+    try:
+        await db.flush()
+        for db_trademark in trademarks:
+            body = render_document(trademark_to_dict(db_trademark))
+            db.add(TrademarkDocument(
+                trademark_id=db_trademark.id,
+                application_number=db_trademark.applicationNumber,
+                body=body,
+                body_gzip=compress_document(body)
+            ))
+    except Exception as e:
+        await db.rollback()
+        print(f"상표 응답 문서 생성 중 오류 발생: {e}")
+        return 0
+
+    # 데이터와 같은 트랜잭션으로 새 데이터셋 버전 기록
+    dataset_version = DatasetVersion(
+        version=version_hash.hexdigest(),
+        loaded_at=loaded_at,
+        row_count=loaded_count
+    )
+    db.add(dataset_version)
+
+    # 이미 알린 (조건, 출원번호) 조합은 빼고 알림 기록, 다음 적재가 비교할 레코드 해시 교체
+    try:
+        notified = await _notified_pairs(db, matches)
+        notifications = [
+            WatchNotification(
+                saved_query_id=saved_query_id,
+                application_number=application_number,
+                dataset_version=dataset_version.version,
+                created_at=loaded_at
+            )
+            for saved_query_id, application_number in matches if (saved_query_id, application_number) not in notified
+        ]
+        db.add_all(notifications)
+        await db.execute(delete(DatasetRecord))
+        db.add_all([
+            DatasetRecord(application_number=application_number, record_hash=record_hash)
+            for application_number, record_hash in record_hashes.items()
+        ])
+    except Exception as e:
+        await db.rollback()
+        print(f"감시 목록 알림 기록 중 오류 발생: {e}")
+        return 0
+    if percolator.size:
+        changed = sum(
+            1 for application_number, record_hash in record_hashes.items()
+            if previous_hashes.get(application_number) != record_hash
+        )
+        print(
+            f"감시 목록 대조 완료: 조건 {percolator.size}개, 새/변경 레코드 {changed}건, "
+            f"후보 {percolator.candidates}건, 알림 {len(notifications)}건"
+        )
+
+    # 집계 테이블 증분 반영 (데이터와 같은 트랜잭션)
+    try:
+        await rollups.apply(db)
+    except Exception as e:
+        await db.rollback()
+        print(f"집계 테이블 갱신 중 오류 발생: {e}")
+        return 0
+
     print(f"데이터베이스 커밋 시작 (총 {loaded_count}개 항목)...")
     try:
         await db.commit()
-        print("데이터베이스 커밋 성공!")
+        print(f"데이터베이스 커밋 성공! (데이터셋 버전 {dataset_version.version[:12]})")
     except Exception as e:
         await db.rollback()
         print(f"데이터베이스 커밋 중 오류 발생: {e}")
         return 0
 
+    # 적재된 데이터 기준으로 컬럼 통계 갱신 (검색 실행 계획에 사용)
+    try:
+        statistics = await refresh_column_statistics(db)
+        print(f"컬럼 통계 갱신 완료 (총 {statistics.total_rows}개 행)")
+    except Exception as e:
+        await db.rollback()
+        print(f"컬럼 통계 갱신 중 오류 발생: {e}")
+
+    # 커밋된 데이터로 검색 인덱스 스냅숏 기록 (실패해도 서비스는 시작 시 다시 구축)
+    if snapshot_path:
+        try:
+            rows = await fetch_index_rows(db)
+            size = write_snapshot(snapshot_path, rows, dataset_version.version)
+            print(f"검색 인덱스 스냅숏 기록 완료: {snapshot_path} ({size} 바이트)")
+        except Exception as e:
+            print(f"검색 인덱스 스냅숏 기록 중 오류 발생: {e}")
+
     print(f"데이터 적재 완료! (총 {loaded_count}개)")
     return loaded_count
\ No newline at end of file
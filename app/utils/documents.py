@@ -0,0 +1,59 @@
+import gzip
+import json
+from typing import Any, Dict, Iterator
+
+from fastapi.encoders import jsonable_encoder
+
+
+class RawJSON(bytes):
+    """이미 JSON으로 렌더링된 값 (render_json이 다시 직렬화하지 않고 그대로 이어 붙임)"""
+
+
+def _dumps(content: Any) -> bytes:
+    # FastAPI JSONResponse와 같은 형식 (응답 본문이 기존 직렬화 결과와 바이트 단위로 같도록)
+    return json.dumps(
+        jsonable_encoder(content), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+    ).encode("utf-8")
+
+
+def render_document(data: Dict[str, Any]) -> RawJSON:
+    """상표 한 건의 응답 딕셔너리를 정규 JSON 바이트로 렌더링"""
+    return RawJSON(_dumps(data))
+
+
+def compress_document(body: bytes) -> bytes:
+    """문서 gzip 압축본 (같은 본문은 같은 바이트가 되도록 mtime 고정)"""
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def iter_json(content: Any) -> Iterator[bytes]:
+    """RawJSON 값은 그대로 두고 나머지만 직렬화하며 응답 본문을 조각 단위로 생성"""
+    if isinstance(content, RawJSON):
+        yield bytes(content)
+    elif isinstance(content, dict):
+        separator = b"{"
+        for key, value in content.items():
+            yield separator + _dumps(str(key)) + b":"
+            yield from iter_json(value)
+            separator = b","
+        yield b"{}" if separator == b"{" else b"}"
+    elif isinstance(content, (list, tuple)):
+        separator = b"["
+        for value in content:
+            yield separator
+            yield from iter_json(value)
+            separator = b","
+        yield b"[]" if separator == b"[" else b"]"
+    else:
+        yield _dumps(content)
+
+
+def render_json(content: Any) -> bytes:
+    """RawJSON 값은 그대로 두고 나머지만 직렬화해 응답 본문 생성"""
+    return b"".join(iter_json(content))
+
+
+def contains_documents(result: Dict[str, Any]) -> bool:
+    """검색 결과 items가 미리 렌더링된 문서인지"""
+    items = result.get("items")
+    return bool(items) and isinstance(items[0], RawJSON)
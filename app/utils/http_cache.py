@@ -0,0 +1,74 @@
+import hashlib
+import os
+from datetime import timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response
+from fastapi import status as http_status
+
+from app.services.dataset_version import DatasetVersionInfo
+from app.utils.content_negotiation import VARY_HEADER
+
+# CDN/브라우저가 재검증 없이 응답을 재사용할 수 있는 시간(초)
+HTTP_CACHE_MAX_AGE = int(os.getenv("HTTP_CACHE_MAX_AGE", "60"))
+
+
+def make_etag(version: DatasetVersionInfo, *parts: Any) -> str:
+    """데이터셋 버전과 요청 식별 정보로 ETag 생성"""
+    digest = hashlib.sha1(version.version.encode("utf-8"))
+    for part in parts:
+        digest.update(b"\x1f")
+        digest.update(repr(part).encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def last_modified_of(version: DatasetVersionInfo) -> str:
+    """데이터셋 적재 시각을 HTTP 날짜 형식으로 변환"""
+    loaded_at = version.loaded_at
+    if loaded_at.tzinfo is None:
+        loaded_at = loaded_at.replace(tzinfo=timezone.utc)
+    return format_datetime(loaded_at.replace(microsecond=0), usegmt=True)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 약한 비교"""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def is_not_modified(request: Optional[Request], etag: str, last_modified: str) -> bool:
+    """조건부 요청 헤더로 보아 클라이언트 사본이 최신인지 판단"""
+    if request is None:
+        return False
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # If-None-Match가 있으면 If-Modified-Since는 무시 (RFC 9110)
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def apply_cache_headers(response: Optional[Response], etag: str, last_modified: str) -> None:
+    """ETag, Last-Modified, Cache-Control 헤더 설정"""
+    if response is None:
+        return
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = last_modified
+    response.headers["Cache-Control"] = f"public, max-age={HTTP_CACHE_MAX_AGE}"
+
+
+def not_modified_response(etag: str, last_modified: str) -> Response:
+    """본문 없는 304 응답 생성 (200 응답과 같은 Vary로 캐시가 표현별로 구분하게 함)"""
+    response = Response(status_code=http_status.HTTP_304_NOT_MODIFIED, headers={"Vary": VARY_HEADER})
+    apply_cache_headers(response, etag, last_modified)
+    return response
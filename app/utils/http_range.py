@@ -0,0 +1,59 @@
+import os
+import re
+from typing import Iterator, Optional, Tuple
+
+_BYTE_RANGE = re.compile(r"^\s*bytes\s*=\s*(\d*)\s*-\s*(\d*)\s*$")
+
+# 파일 응답을 읽어 보내는 단위
+RANGE_CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(ValueError):
+    """요청한 구간이 파일 범위를 벗어남 (416 응답으로 변환)"""
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Range 헤더를 [start, end] (양끝 포함) 구간으로 변환
+
+    단일 바이트 구간만 지원하며 헤더가 없거나 해석할 수 없는 형식(다중 구간 등)이면
+    None을 반환해 전체 응답을 보냅니다 (RFC 9110은 Range를 무시하는 것을 허용).
+    """
+    if not header:
+        return None
+    match = _BYTE_RANGE.match(header)
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # bytes=-N : 마지막 N바이트
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = int(last) if last else size - 1
+    if start >= size or end < start:
+        raise RangeNotSatisfiable(header)
+    return start, min(end, size - 1)
+
+
+def iter_file_range(path: str, start: int, end: int, chunk_size: int = RANGE_CHUNK_SIZE) -> Iterator[bytes]:
+    """파일의 [start, end] 구간을 조각 단위로 읽기 (동기 제너레이터는 스레드 풀에서 실행됨)"""
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def file_etag(path: str) -> str:
+    """파일 크기와 수정 시각으로 만든 강한 ETag (If-Range 비교용)"""
+    stat = os.stat(path)
+    return f'"{stat.st_size:x}-{stat.st_mtime_ns:x}"'
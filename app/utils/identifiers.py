@@ -0,0 +1,46 @@
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 번호 종류 → 원본 레코드 필드
+IDENTIFIER_TYPES: Dict[str, str] = {
+    "application": "applicationNumber",
+    "publication": "publicationNumber",
+    "registration": "registrationNumber",
+    "registration_publication": "registrationPubNumber",
+    "international_registration": "internationalRegNumbers",
+    "priority_claim": "priorityClaimNumList",
+}
+
+_SEPARATORS = re.compile(r"[^0-9A-Za-z]")
+
+
+def normalize_identifier(number: Optional[str]) -> str:
+    """
+    번호 정규화 (구분 기호와 공백 제거, 대문자 변환)
+
+    예: "75/554,461" → "75554461", "jp-t-2008-00002493" → "JPT200800002493"
+    """
+    if not number:
+        return ""
+    return _SEPARATORS.sub("", number).upper()
+
+
+def _as_list(value: Any) -> Iterable[str]:
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [item for item in value if item]
+
+
+def extract_identifiers(record: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """레코드에서 (번호 종류, 정규화된 번호) 목록 추출 (중복 제거)"""
+    identifiers: List[Tuple[str, str]] = []
+    seen = set()
+    for number_type, field_name in IDENTIFIER_TYPES.items():
+        for number in _as_list(record.get(field_name)):
+            normalized = normalize_identifier(number)
+            if normalized and (number_type, normalized) not in seen:
+                seen.add((number_type, normalized))
+                identifiers.append((number_type, normalized))
+    return identifiers
@@ -0,0 +1,80 @@
+import hashlib
+import random
+import struct
+from typing import List, Optional, Sequence, Set, Tuple
+
+from app.utils.name_normalization import normalize_name
+
+
+# 서명 길이 = 밴드 수 × 밴드당 행 수
+# 16 × 4 구성에서 후보가 될 확률은 유사도 0.5일 때 약 0.65, 0.8일 때 약 1.0, 0.3일 때 약 0.12
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = NUM_PERMUTATIONS // LSH_BANDS
+
+# 한글 상표명은 음절 하나가 정보량이 커서 2글자 조각을 사용
+SHINGLE_SIZE = 2
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# 적재 시와 조회 시 같은 해시 함수를 쓰도록 고정 시드로 생성 (바꾸면 서명을 다시 계산해야 함)
+_random = random.Random(20240101)
+_PERMUTATIONS = [
+    (_random.randrange(1, _MERSENNE_PRIME), _random.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+_SIGNATURE_FORMAT = f"<{NUM_PERMUTATIONS}I"
+
+Signature = Tuple[int, ...]
+
+
+def name_shingles(*names: Optional[str], size: int = SHINGLE_SIZE) -> Set[str]:
+    """정규화한 상표명(한글/영문)의 글자 조각 집합 (조각보다 짧은 이름은 이름 전체)"""
+    shingles: Set[str] = set()
+    for name in names:
+        normalized = normalize_name(name)
+        if not normalized:
+            continue
+        if len(normalized) <= size:
+            shingles.add(normalized)
+            continue
+        shingles.update(normalized[i:i + size] for i in range(len(normalized) - size + 1))
+    return shingles
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def minhash_signature(shingles: Set[str]) -> Optional[Signature]:
+    """조각 집합의 MinHash 서명 (조각이 없으면 None)"""
+    if not shingles:
+        return None
+    hashes = [_shingle_hash(shingle) for shingle in shingles]
+    return tuple(
+        min(((a * value + b) % _MERSENNE_PRIME) & _MAX_HASH for value in hashes)
+        for a, b in _PERMUTATIONS
+    )
+
+
+def lsh_buckets(signature: Signature) -> List[Tuple[int, str]]:
+    """서명을 밴드로 나눠 (밴드 번호, 버킷 키) 목록으로 변환"""
+    buckets = []
+    for band in range(LSH_BANDS):
+        rows = signature[band * LSH_ROWS:(band + 1) * LSH_ROWS]
+        digest = hashlib.blake2b(struct.pack(f"<{LSH_ROWS}I", *rows), digest_size=8).hexdigest()
+        buckets.append((band, digest))
+    return buckets
+
+
+def estimate_similarity(first: Sequence[int], second: Sequence[int]) -> float:
+    """두 서명이 일치하는 위치의 비율 (글자 조각 집합의 자카드 유사도 추정치)"""
+    return sum(1 for a, b in zip(first, second) if a == b) / NUM_PERMUTATIONS
+
+
+def pack_signature(signature: Signature) -> bytes:
+    return struct.pack(_SIGNATURE_FORMAT, *signature)
+
+
+def unpack_signature(data: bytes) -> Signature:
+    return struct.unpack(_SIGNATURE_FORMAT, data)
@@ -0,0 +1,20 @@
+import unicodedata
+from typing import Optional
+
+
+def normalize_name(name: Optional[str]) -> Optional[str]:
+    """
+    상표명 정규화 (적재 시와 검색 시 동일하게 적용)
+
+    NFKC 정규화 후 대소문자를 접고(casefold), 공백·구두점·기호를 제거합니다.
+    예: "FRESCA", "Fresca", "FRES CA", "ＦＲＥＳ-ＣＡ" → "fresca"
+    """
+    if not name:
+        return None
+    folded = unicodedata.normalize("NFKC", name).casefold()
+    normalized = "".join(
+        char for char in folded
+        if unicodedata.category(char)[0] not in ("Z", "P", "S", "C")
+    )
+    return normalized or None
+
@@ -0,0 +1,52 @@
+import re
+from typing import Iterable, List, Optional, Tuple
+
+_NON_DIGITS = re.compile(r"\D")
+
+# 비엔나 코드 깊이: 대분류(2자리), 중분류(4자리), 소분류(6자리)
+VIENNA_CODE_LENGTHS = (2, 4, 6)
+
+
+class InvalidViennaCode(ValueError):
+    """비엔나 코드 형식이 올바르지 않음 (400 응답으로 변환)"""
+
+
+def normalize_vienna_code(code: Optional[str]) -> Optional[str]:
+    """
+    비엔나 코드를 구분 기호 없는 숫자 문자열로 정규화 (깊이가 맞지 않으면 None)
+
+    예: "01.01.03" → "010103", "26.1" 같은 자릿수가 맞지 않는 코드 → None
+    """
+    if not code:
+        return None
+    digits = _NON_DIGITS.sub("", code)
+    return digits if len(digits) in VIENNA_CODE_LENGTHS else None
+
+
+def parse_vienna_codes(values: Optional[Iterable[str]]) -> List[str]:
+    """쉼표 또는 반복 파라미터로 받은 비엔나 코드 목록 정규화 (중복 제거, 잘못된 코드는 InvalidViennaCode)"""
+    codes = set()
+    for value in values or []:
+        for code in value.split(","):
+            if not code.strip():
+                continue
+            normalized = normalize_vienna_code(code)
+            if normalized is None:
+                raise InvalidViennaCode(f"비엔나 코드 형식이 올바르지 않습니다: {code.strip()}")
+            codes.add(normalized)
+    return sorted(codes)
+
+
+def vienna_prefix_range(prefix: str) -> Tuple[str, Optional[str]]:
+    """
+    접두 코드에 해당하는 [시작, 끝) 문자열 구간 (끝이 None이면 위로 열린 구간)
+
+    정규화 코드 인덱스에서 code >= 시작 AND code < 끝 범위 탐색 한 번으로
+    하위 분류를 모두 찾습니다. 끝은 같은 자릿수의 다음 숫자 코드(자리올림 포함)라
+    숫자만 비교하므로 DB 콜레이션과 관계없이 같은 구간입니다.
+    예: "0101" → ("0101", "0102"), "0199" → ("0199", "0200"), "99" → ("99", None)
+    """
+    carried = prefix.rstrip("9")
+    if not carried:
+        return prefix, None
+    return prefix, carried[:-1] + str(int(carried[-1]) + 1) + "0" * (len(prefix) - len(carried))
@@ -2,10 +2,32 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
 
 from app.models.trademark import TradeMark
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="실행 시간을 비교하는 benchmark 마커 테스트도 실행 (측정 환경에 따라 결과가 달라 기본 제외)"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: 벽시계 시간 비교 검증 (--benchmark를 지정할 때만 실행)")
+
+
+def pytest_collection_modifyitems(config, items):
+    """--benchmark가 없으면 benchmark 마커 테스트를 선택에서 제외"""
+    if config.getoption("--benchmark"):
+        return
+    deselected = [item for item in items if item.get_closest_marker("benchmark")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not item.get_closest_marker("benchmark")]
+
+
 @pytest.fixture
 def mock_db_session():
     """데이터베이스 세션을 목업하는 픽스처"""
@@ -13,6 +35,18 @@ def mock_db_session():
     return mock_session
 
 
+@pytest.fixture
+def make_request():
+    """지정한 헤더를 가진 HTTP 요청 객체를 만드는 픽스처"""
+    def _make_request(headers=None, path="/"):
+        raw_headers = [
+            (name.lower().encode("latin-1"), value.encode("latin-1"))
+            for name, value in (headers or {}).items()
+        ]
+        return Request({"type": "http", "method": "GET", "path": path, "headers": raw_headers})
+    return _make_request
+
+
 @pytest.fixture
 def sample_trademark_data():
     """샘플 상표 데이터"""
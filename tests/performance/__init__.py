@@ -0,0 +1 @@
+# 성능 테스트 패키지 
@@ -0,0 +1,139 @@
+"""압축 비트맵 인덱스 다중 조건 검색 벤치마크
+
+등록 상태, 상품 주 분류, 유사군 코드, 출원일 기간을 조합한 검색을 SQL 경로
+(`TrademarkRepository.search`의 개수 + 목록 쿼리)와 비트맵 인덱스 경로(비트맵 AND 후
+결과 페이지 행만 조회)로 각각 실행해 결과가 같은지 확인하고 요청당 시간을 비교합니다.
+
+    pytest tests/performance -s               # 측정값 출력과 결과 일치 검증
+    pytest tests/performance -s --benchmark   # 비트맵 인덱스가 더 빠른지 시간 비교까지 검증
+"""
+import random
+import time
+from contextlib import nullcontext
+from datetime import date, timedelta
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.models.trademark import TradeMark
+from app.search_index.builder import IndexRow, build_index_bytes
+from app.search_index.index import SearchIndex
+from app.services.trademark_service import SearchParams, TrademarkRepository
+
+ROW_COUNT = 20_000
+ITERATIONS = 20
+
+STATUSES = ["등록", "출원", "거절", "실효"]
+MAIN_CODES = [f"{code:02d}" for code in range(1, 46)]
+SUB_CODES = [f"G{code:04d}" for code in range(100)]
+
+QUERIES = [
+    {"status": "등록", "sub_code": "G0007"},
+    {"status": "등록", "product_code": "30", "sub_code": "G0030"},
+    {"status": "출원", "application_date_from": "20150101", "application_date_to": "20191231", "sub_code": "G0001"},
+    {"product_code": "09", "application_date_from": "20180101", "page": 3},
+    {"status": "거절", "product_code": "25", "sub_code": "G0025", "application_date_to": "20121231"},
+]
+
+
+def _generate_rows():
+    generator = random.Random(42)
+    start = date(2000, 1, 1)
+    rows = []
+    for row_id in range(1, ROW_COUNT + 1):
+        main_codes = generator.sample(MAIN_CODES, generator.randint(1, 3))
+        rows.append({
+            "id": row_id,
+            "applicationNumber": f"40{row_id:011d}",
+            "productName": f"상표{row_id}",
+            "productNameEng": f"MARK{row_id}",
+            "applicationDate": start + timedelta(days=generator.randrange(9000)),
+            "registerStatus": generator.choice(STATUSES),
+            "asignProductMainCodeList": main_codes,
+            "asignProductSubCodeList": generator.sample(SUB_CODES, generator.randint(1, 4)),
+        })
+    return rows
+
+
+@pytest_asyncio.fixture
+async def dataset(tmp_path):
+    rows = _generate_rows()
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/bench.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(TradeMark), rows)
+    index = SearchIndex(build_index_bytes(
+        (
+            IndexRow(
+                id=row["id"],
+                product_name=row["productName"],
+                product_name_eng=row["productNameEng"],
+                application_date=row["applicationDate"],
+                register_status=row["registerStatus"],
+                main_codes=row["asignProductMainCodeList"],
+                sub_codes=row["asignProductSubCodeList"],
+            )
+            for row in rows
+        ),
+        dataset_version="bench",
+    ))
+    yield async_sessionmaker(engine, expire_on_commit=False), index
+    await engine.dispose()
+
+
+async def _measure(repo: TrademarkRepository, index, params: SearchParams):
+    """요청 1건당 평균 소요 시간(밀리초)과 마지막 결과 (index가 None이면 SQL 경로)"""
+    repo.search_index = lambda _params: nullcontext(index)
+    await repo.search(params)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        items, total = await repo.search(params)
+    elapsed = (time.perf_counter() - started) / ITERATIONS * 1000
+    return elapsed, ([item.id for item in items], total)
+
+
+async def _compare(dataset):
+    """조건 조합마다 (조건, SQL 경로 (시간, 결과), 비트맵 인덱스 경로 (시간, 결과))"""
+    session_factory, index = dataset
+    measured = []
+    async with session_factory() as db:
+        repo = TrademarkRepository(db)
+        for conditions in QUERIES:
+            params = SearchParams(**conditions)
+            sql_ms, sql_result = await _measure(repo, None, params)
+            index_ms, index_result = await _measure(repo, index, params)
+            print(
+                f"\n[{conditions}] 결과 {sql_result[1]}건"
+                f"\n  SQL {sql_ms:.2f}ms / 비트맵 인덱스 {index_ms:.2f}ms ({sql_ms / index_ms:.1f}배)"
+            )
+            measured.append((conditions, (sql_ms, sql_result), (index_ms, index_result)))
+    return measured
+
+
+class TestBitmapIndexPerformance:
+    """다중 조건 검색의 SQL 경로 대비 비트맵 인덱스 경로 비교"""
+
+    @pytest.mark.asyncio
+    async def test_bitmap_index_matches_sql(self, dataset):
+        """조건 조합마다 SQL 경로와 같은 결과를 반환하는지 확인 (시간은 출력만)"""
+        # 실행 (Act)
+        measured = await _compare(dataset)
+
+        # 검증 (Assert)
+        for _, (_, sql_result), (_, index_result) in measured:
+            assert index_result == sql_result
+            assert sql_result[1] > 0
+
+    @pytest.mark.benchmark
+    @pytest.mark.asyncio
+    async def test_bitmap_index_beats_sql(self, dataset):
+        """조건 조합마다 비트맵 인덱스 경로가 SQL 경로보다 빠른지 측정"""
+        # 실행 (Act)
+        measured = await _compare(dataset)
+
+        # 검증 (Assert)
+        for _, (sql_ms, _), (index_ms, _) in measured:
+            assert index_ms < sql_ms
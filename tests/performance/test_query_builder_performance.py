@@ -0,0 +1,115 @@
+"""쿼리 빌더 및 컴파일 오버헤드 마이크로벤치마크
+
+요청 1건당 (개수 + 목록) 두 문장을 만들고 실행하는 비용을 빈 SQLite 테이블에서
+측정합니다. 실행 비용이 거의 없으므로 측정값은 대부분 문장 구성, 캐시 키 계산,
+컴파일 캐시 조회 등 SQLAlchemy 쪽 CPU 비용입니다.
+
+    pytest tests/performance -s               # 측정값 출력과 캐시 적중률 검증
+    pytest tests/performance -s --benchmark   # 캐시 사용 시 더 빠른지 시간 비교까지 검증
+"""
+import time
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base
+from app.services.trademark_service import TrademarkQueryBuilder, statement_cache
+
+ITERATIONS = 300
+
+
+def _run_request(session: Session, use_cache: bool, page: int) -> None:
+    """검색 요청 1건이 실행하는 두 문장을 구성하고 실행"""
+    count_builder = (TrademarkQueryBuilder(use_cache=use_cache)
+        .with_keyword("테스트")
+        .with_status("등록")
+        .with_application_date_range("20200101", "20201231")
+    )
+    query = count_builder.build()
+    if use_cache:
+        count_stmt = statement_cache.get_or_build(
+            ("count", query),
+            lambda: select(func.count()).select_from(query.subquery())
+        )
+    else:
+        count_stmt = select(func.count()).select_from(query.subquery())
+    session.execute(count_stmt, count_builder.params).scalar_one()
+
+    page_builder = (TrademarkQueryBuilder(use_cache=use_cache)
+        .with_keyword("테스트")
+        .with_status("등록")
+        .with_application_date_range("20200101", "20201231")
+        .with_pagination(page, 10)
+        .with_order_by()
+    )
+    session.execute(page_builder.build(), page_builder.params).scalars().all()
+
+
+def _measure(session: Session, use_cache: bool) -> float:
+    """요청 1건당 평균 소요 시간(마이크로초)"""
+    _run_request(session, use_cache, 1)  # 워밍업
+    started = time.perf_counter()
+    for i in range(ITERATIONS):
+        _run_request(session, use_cache, i % 10 + 1)
+    return (time.perf_counter() - started) / ITERATIONS * 1_000_000
+
+
+def _measure_build_only(use_cache: bool) -> float:
+    """문장 구성만의 요청 1건당 평균 소요 시간(마이크로초)"""
+    started = time.perf_counter()
+    for i in range(ITERATIONS):
+        (TrademarkQueryBuilder(use_cache=use_cache)
+            .with_keyword("테스트")
+            .with_status("등록")
+            .with_pagination(i % 10 + 1, 10)
+            .with_order_by()
+            .build()
+        )
+    return (time.perf_counter() - started) / ITERATIONS * 1_000_000
+
+
+def _compare(session: Session):
+    """캐시 미사용/사용 시 (문장 구성, 구성+실행) 요청당 평균 시간(마이크로초)"""
+    statement_cache.clear()
+    uncached_build = _measure_build_only(use_cache=False)
+    cached_build = _measure_build_only(use_cache=True)
+    uncached = _measure(session, use_cache=False)
+    cached = _measure(session, use_cache=True)
+
+    print(
+        f"\n[문장 구성] 캐시 미사용 {uncached_build:.1f}us / 캐시 사용 {cached_build:.1f}us"
+        f"\n[구성+실행] 캐시 미사용 {uncached:.1f}us / 캐시 사용 {cached:.1f}us"
+        f"\n[캐시] {statement_cache.stats()}"
+    )
+    return (uncached_build, cached_build), (uncached, cached)
+
+
+class TestQueryBuilderPerformance:
+    """문장 캐시 사용 여부에 따른 요청당 오버헤드 비교"""
+
+    @pytest.fixture
+    def session(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            yield session
+        engine.dispose()
+
+    def test_statement_cache_hit_rate(self, session):
+        """반복 요청의 문장이 캐시에서 재사용되는지 측정값과 함께 확인"""
+        # 실행 (Act)
+        _compare(session)
+
+        # 검증 (Assert)
+        assert statement_cache.stats()["hit_rate"] > 0.9
+
+    @pytest.mark.benchmark
+    def test_statement_cache_reduces_per_request_overhead(self, session):
+        """캐시된 문장이 요청당 구성/컴파일 비용을 줄이는지 측정"""
+        # 실행 (Act)
+        (uncached_build, cached_build), (uncached, cached) = _compare(session)
+
+        # 검증 (Assert)
+        assert cached_build < uncached_build
+        assert cached < uncached
@@ -0,0 +1,110 @@
+"""응답 형식별 페이로드 크기와 인코딩 시간 마이크로벤치마크
+
+샘플 데이터 100건으로 만든 검색 결과 한 페이지를 JSON, 미리 렌더링된 문서를 이어 붙인 JSON,
+null 필드를 뺀 MessagePack으로 인코딩하고, 각 본문을 gzip/zstd로 압축했을 때의 크기와
+결과 100건당 평균 소요 시간을 비교합니다. msgpack/zstandard가 설치되어 있지 않으면 해당 항목은 생략합니다.
+
+    pytest tests/performance -s               # 측정값 출력과 본문/크기 검증
+    pytest tests/performance -s --benchmark   # 문서 이어 붙이기가 더 빠른지 시간 비교까지 검증
+"""
+import json
+import os
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+from fastapi.responses import JSONResponse
+
+from app.utils import content_negotiation
+from app.utils.content_negotiation import compact, compress_stream, pack
+from app.utils.documents import render_document, render_json
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, "app", "scripts", "trademark_sample.json"
+)
+
+RESULTS = 100
+ITERATIONS = 50
+
+
+def _page() -> Dict[str, Any]:
+    """샘플 데이터 100건으로 만든 검색 결과 한 페이지"""
+    with open(SAMPLE_PATH, encoding="utf-8") as f:
+        records = json.load(f)[:RESULTS]
+    return {
+        "items": [{"id": index, **record} for index, record in enumerate(records, start=1)],
+        "total_count": len(records),
+        "page": 1,
+        "size": RESULTS,
+        "pages_count": 1
+    }
+
+
+def _measure(encode: Callable[[], bytes]) -> Tuple[bytes, float]:
+    """(본문, 결과 100건당 평균 소요 시간(마이크로초))"""
+    body = encode()  # 워밍업
+    started = time.perf_counter()
+    for _ in range(ITERATIONS):
+        encode()
+    return body, (time.perf_counter() - started) / ITERATIONS * 1_000_000
+
+
+def _encodings() -> List[str]:
+    """측정할 압축 방식 (zstandard가 없으면 gzip만)"""
+    return ["gzip"] + (["zstd"] if content_negotiation.zstandard is not None else [])
+
+
+def _compare():
+    """형식별 (본문, 시간)과 (형식, 압축 방식)별 (압축 본문, 추가 시간)"""
+    page = _page()
+    documents = {**page, "items": [render_document(item) for item in page["items"]]}
+    encoders: List[Tuple[str, Callable[[], bytes]]] = [
+        ("JSON (JSONResponse)", lambda: JSONResponse(page).body),
+        ("JSON (문서 이어 붙이기)", lambda: render_json(documents)),
+        ("MessagePack (순수 파이썬)", lambda: pack(compact(page))),
+    ]
+    if content_negotiation.msgpack is not None:
+        encoders.append(("MessagePack (msgpack)", lambda: content_negotiation.msgpack.packb(compact(page))))
+
+    measured = {name: _measure(encode) for name, encode in encoders}
+    compressed = {
+        (name, encoding): _measure(lambda: b"".join(compress_stream([body], encoding)))
+        for name, (body, _) in measured.items()
+        for encoding in _encodings()
+    }
+
+    lines = [f"\n[결과 {RESULTS}건당] 형식 / 크기(바이트) / 인코딩 시간(us)"]
+    for name, (body, elapsed) in measured.items():
+        lines.append(f"  {name}: {len(body)} / {elapsed:.1f}")
+        for encoding in _encodings():
+            compressed_body, compress_elapsed = compressed[(name, encoding)]
+            lines.append(f"    + {encoding}: {len(compressed_body)} / +{compress_elapsed:.1f}")
+    print("\n".join(lines))
+    return measured, compressed
+
+
+class TestResponseFormatPerformance:
+    """응답 형식과 압축 방식별 크기/시간 비교"""
+
+    def test_payload_size(self):
+        """문서 이어 붙이기는 같은 본문, MessagePack은 JSON보다 작고, 압축은 크기를 줄이는지 확인"""
+        # 실행 (Act)
+        measured, compressed = _compare()
+
+        # 검증 (Assert)
+        json_body, _ = measured["JSON (JSONResponse)"]
+        spliced_body, _ = measured["JSON (문서 이어 붙이기)"]
+        packed_body, _ = measured["MessagePack (순수 파이썬)"]
+        assert spliced_body == json_body
+        assert len(packed_body) < len(json_body) * 0.8
+        for encoding in _encodings():
+            assert len(compressed[("JSON (JSONResponse)", encoding)][0]) < len(json_body) / 4
+
+    @pytest.mark.benchmark
+    def test_spliced_documents_encode_faster(self):
+        """미리 렌더링된 문서를 이어 붙이는 것이 직렬화보다 빠른지 측정"""
+        # 실행 (Act)
+        measured, _ = _compare()
+
+        # 검증 (Assert)
+        assert measured["JSON (문서 이어 붙이기)"][1] < measured["JSON (JSONResponse)"][1]
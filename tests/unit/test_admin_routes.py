@@ -0,0 +1,38 @@
+"""관리자 API 토큰 검증 단위 테스트"""
+from unittest.mock import patch
+
+import pytest
+from fastapi import HTTPException
+
+from app.routers.admin_routes import verify_admin_token
+
+
+class TestVerifyAdminToken:
+    """verify_admin_token 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_closed_without_configured_token(self):
+        """ADMIN_TOKEN이 없으면 헤더와 관계없이 404"""
+        # 실행 및 검증 (Act & Assert)
+        with patch.dict("os.environ", {"ADMIN_TOKEN": ""}):
+            for header in (None, "", "anything"):
+                with pytest.raises(HTTPException) as exc_info:
+                    await verify_admin_token(x_admin_token=header)
+                assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_wrong_or_missing_token_forbidden(self):
+        """토큰이 없거나 다르면 403"""
+        # 실행 및 검증 (Act & Assert)
+        with patch.dict("os.environ", {"ADMIN_TOKEN": "secret"}):
+            for header in (None, "", "wrong"):
+                with pytest.raises(HTTPException) as exc_info:
+                    await verify_admin_token(x_admin_token=header)
+                assert exc_info.value.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_matching_token_allowed(self):
+        """설정된 토큰과 같으면 통과"""
+        # 실행 및 검증 (Act & Assert)
+        with patch.dict("os.environ", {"ADMIN_TOKEN": "secret"}):
+            assert await verify_admin_token(x_admin_token="secret") is None
@@ -0,0 +1,196 @@
+"""승인 제어(admission control) 미들웨어 단위 테스트"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.middleware.admission_control import (
+    AdmissionControlMiddleware,
+    AdmissionController,
+    AdmissionRejected,
+    AdmissionRule,
+    PriorityLimiter,
+    default_admission_controller,
+    BATCH,
+    INTERACTIVE,
+)
+
+
+def make_rule(**overrides):
+    """테스트용 제한 규칙"""
+    values = dict(
+        name="search", path_prefix="/api/trademarks/search",
+        max_concurrency=1, max_queue=1, queue_timeout=1.0,
+        batch_max_concurrency=1, batch_max_queue=1,
+    )
+    values.update(overrides)
+    return AdmissionRule(**values)
+
+
+class TestPriorityLimiter:
+    """PriorityLimiter 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_queue_full(self):
+        """대기열이 가득 차면 즉시 거절하는지 테스트"""
+        # 준비 (Arrange)
+        limiter = PriorityLimiter(make_rule())
+        await limiter.acquire(INTERACTIVE)
+        waiting = asyncio.ensure_future(limiter.acquire(INTERACTIVE))
+        await asyncio.sleep(0)
+
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await limiter.acquire(INTERACTIVE)
+        assert excinfo.value.reason == "queue_full"
+        assert limiter.stats()["shed_queue_full"][INTERACTIVE] == 1
+
+        limiter.release(INTERACTIVE)
+        await waiting
+        assert limiter.in_flight[INTERACTIVE] == 1
+
+    @pytest.mark.asyncio
+    async def test_rejects_after_queue_timeout(self):
+        """대기 시간이 초과되면 거절하는지 테스트"""
+        # 준비 (Arrange)
+        limiter = PriorityLimiter(make_rule(queue_timeout=0.01))
+        await limiter.acquire(INTERACTIVE)
+
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(AdmissionRejected) as excinfo:
+            await limiter.acquire(INTERACTIVE)
+        assert excinfo.value.reason == "queue_timeout"
+        assert limiter.stats()["queue_depth"][INTERACTIVE] == 0
+
+    @pytest.mark.asyncio
+    async def test_interactive_waiters_go_first(self):
+        """슬롯이 비면 대화형 대기자가 배치 대기자보다 먼저 실행되는지 테스트"""
+        # 준비 (Arrange)
+        limiter = PriorityLimiter(make_rule())
+        await limiter.acquire(INTERACTIVE)
+        order = []
+
+        async def wait(priority):
+            await limiter.acquire(priority)
+            order.append(priority)
+
+        batch = asyncio.ensure_future(wait(BATCH))
+        await asyncio.sleep(0)
+        interactive = asyncio.ensure_future(wait(INTERACTIVE))
+        await asyncio.sleep(0)
+
+        # 실행 (Act)
+        limiter.release(INTERACTIVE)
+        await interactive
+        limiter.release(INTERACTIVE)
+        await batch
+
+        # 검증 (Assert)
+        assert order == [INTERACTIVE, BATCH]
+
+    @pytest.mark.asyncio
+    async def test_batch_concurrency_is_capped(self):
+        """배치 트래픽이 배치 슬롯 한도를 넘지 않는지 테스트"""
+        # 준비 (Arrange)
+        limiter = PriorityLimiter(make_rule(max_concurrency=4, batch_max_concurrency=1))
+        await limiter.acquire(BATCH)
+
+        # 실행 (Act)
+        waiting = asyncio.ensure_future(limiter.acquire(BATCH))
+        await asyncio.sleep(0)
+        await limiter.acquire(INTERACTIVE)
+
+        # 검증 (Assert)
+        assert not waiting.done()
+        assert limiter.in_flight == {INTERACTIVE: 1, BATCH: 1}
+        limiter.release(BATCH)
+        await waiting
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        """대기 중 취소된 요청이 대기열에서 제거되는지 테스트"""
+        # 준비 (Arrange)
+        limiter = PriorityLimiter(make_rule())
+        await limiter.acquire(INTERACTIVE)
+        waiting = asyncio.ensure_future(limiter.acquire(INTERACTIVE))
+        await asyncio.sleep(0)
+
+        # 실행 (Act)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        limiter.release(INTERACTIVE)
+
+        # 검증 (Assert)
+        assert limiter.stats()["queue_depth"][INTERACTIVE] == 0
+        assert limiter.total_in_flight == 0
+
+
+class TestAdmissionControlMiddleware:
+    """AdmissionControlMiddleware 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sheds_with_503_and_retry_after(self):
+        """한도를 넘는 요청에 503과 Retry-After를 반환하는지 테스트"""
+        # 준비 (Arrange)
+        release = asyncio.Event()
+
+        async def slow_app(scope, receive, send):
+            await release.wait()
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        controller = AdmissionController(
+            rules=[make_rule(max_queue=0)], retry_after_seconds=3
+        )
+        app = AdmissionControlMiddleware(slow_app, controller)
+
+        async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+            first = asyncio.ensure_future(client.get("/api/trademarks/search"))
+            await asyncio.sleep(0.01)
+
+            # 실행 (Act)
+            rejected = await client.get("/api/trademarks/search")
+            unrelated = asyncio.ensure_future(client.get("/health"))
+            release.set()
+            accepted = await first
+            await unrelated
+
+        # 검증 (Assert)
+        assert rejected.status_code == 503
+        assert rejected.headers["retry-after"] == "3"
+        assert accepted.status_code == 200
+        assert controller.stats()["search"]["shed_queue_full"][INTERACTIVE] == 1
+
+    @pytest.mark.parametrize("default_priority, header, expected", [
+        (INTERACTIVE, b"batch", BATCH),
+        (INTERACTIVE, b"unknown", INTERACTIVE),
+        (BATCH, b"interactive", BATCH),
+        (BATCH, None, BATCH),
+    ])
+    def test_header_can_only_lower_priority(self, default_priority, header, expected):
+        """우선순위 헤더는 경로의 기본 우선순위를 낮추기만 하고 높일 수는 없음"""
+        # 준비 (Arrange)
+        middleware = AdmissionControlMiddleware(None, AdmissionController(rules=[]))
+        scope = {"headers": [(b"x-request-priority", header)] if header else []}
+
+        # 실행 (Act)
+        priority = middleware._priority_of(scope, make_rule(default_priority=default_priority))
+
+        # 검증 (Assert)
+        assert priority == expected
+
+    def test_batch_route_has_own_batch_rule(self):
+        """일괄 검색 경로는 검색 규칙보다 긴 접두사의 배치 우선순위 규칙에 해당"""
+        # 준비 (Arrange)
+        controller = default_admission_controller()
+
+        # 실행 (Act)
+        batch = controller.match("/api/trademarks/search/batch")
+        search = controller.match("/api/trademarks/search")
+
+        # 검증 (Assert)
+        assert batch.rule.name == "batch_search"
+        assert batch.rule.default_priority == BATCH
+        assert batch._max_concurrency(BATCH) == batch.rule.max_concurrency
+        assert search is controller.limiter("search")
@@ -0,0 +1,196 @@
+"""일괄 검색 단위 테스트"""
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.middleware.admission_control import BATCH, AdmissionRule, PriorityLimiter
+from app.models.trademark import TradeMark
+from app.routers.trademark_routes import batch_search_trademarks_api
+from app.schemas.search import BatchSearchRequest
+from app.services.batch_search import run_batch_search
+from app.services.trademark_service import TrademarkService
+
+
+MARKS = [
+    ("4020200000001", "테스트 하나", date(2020, 1, 1), "등록"),
+    ("4020210000002", "테스트 둘", date(2021, 1, 1), "출원"),
+    ("4020220000003", "마크", date(2022, 1, 1), "등록"),
+]
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    # 검색마다 별도 세션(연결)을 쓰므로 메모리 DB 대신 파일 DB 사용
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/batch.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(TradeMark), [
+            {"applicationNumber": number, "productName": name, "applicationDate": day, "registerStatus": status}
+            for number, name, day, status in MARKS
+        ])
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+class TestBatchSearch:
+    """일괄 검색 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_results_in_order_with_per_query_errors(self, session_factory):
+        """요청 순서대로 결과를 반환하고 잘못된 검색은 그 항목만 오류"""
+        # 준비 (Arrange)
+        queries = [
+            {"keyword": "테스트"},
+            {"status": "등록", "size": 1},
+            {"q": "name:(테스트"},
+            {"size": 1000},
+            {"vienna_code": ["1"]},
+            "잘못된 항목",
+        ]
+
+        # 실행 (Act)
+        response = await run_batch_search(queries, session_factory)
+
+        # 검증 (Assert)
+        results = response["results"]
+        assert [entry["index"] for entry in results] == list(range(len(queries)))
+        assert [entry["status"] for entry in results] == [200, 200, 400, 422, 400, 422]
+        assert results[0]["result"]["total_count"] == 2
+        assert results[1]["result"]["total_count"] == 2
+        assert len(results[1]["result"]["items"]) == 1
+        assert results[3]["error"]["detail"][0]["loc"] == ("size",)
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_run_once(self, session_factory):
+        """정규화한 조건이 같은 검색은 한 번만 실행하고 결과를 나눠 씀"""
+        # 준비 (Arrange)
+        queries = [
+            {"keyword": "테스트", "status": ""},
+            {"keyword": "테스트"},
+            {"keyword": "마크"},
+            {"keyword": "테스트", "page": 1, "size": 10},
+        ]
+
+        # 실행 (Act)
+        response = await run_batch_search(queries, session_factory)
+
+        # 검증 (Assert)
+        results = response["results"]
+        assert response["executed"] == 2
+        assert results[0]["result"] == results[1]["result"] == results[3]["result"]
+        assert results[0]["result"] is not results[1]["result"]
+        assert results[2]["result"]["total_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, session_factory):
+        """동시에 실행되는 검색 수가 concurrency를 넘지 않음"""
+        # 준비 (Arrange)
+        running = 0
+        peak = 0
+
+        async def search(service, params):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return {"items": [], "total_count": 0, "page": params.page, "size": params.size, "pages_count": 0}
+
+        # 실행 (Act)
+        with patch.object(TrademarkService, "search_trademarks", search):
+            response = await run_batch_search(
+                [{"keyword": f"상표{i}"} for i in range(10)], session_factory, concurrency=3
+            )
+
+        # 검증 (Assert)
+        assert response["executed"] == 10
+        assert peak == 3
+        assert all(entry["status"] == 200 for entry in response["results"])
+
+    @pytest.mark.asyncio
+    async def test_each_query_takes_a_batch_slot(self, session_factory):
+        """검색 제한기가 있으면 검색마다 배치 슬롯을 받고, 배치 한도를 넘게 실행하지 않음"""
+        # 준비 (Arrange)
+        limiter = PriorityLimiter(AdmissionRule(
+            name="search", path_prefix="/api/trademarks/search",
+            max_concurrency=8, max_queue=8, queue_timeout=1.0,
+            batch_max_concurrency=2, batch_max_queue=8,
+        ))
+        peak = 0
+
+        async def search(service, params):
+            nonlocal peak
+            peak = max(peak, limiter.in_flight[BATCH])
+            await asyncio.sleep(0.01)
+            return {"items": [], "total_count": 0, "page": params.page, "size": params.size, "pages_count": 0}
+
+        # 실행 (Act)
+        with patch.object(TrademarkService, "search_trademarks", search):
+            response = await run_batch_search(
+                [{"keyword": f"상표{i}"} for i in range(6)], session_factory, concurrency=4, limiter=limiter
+            )
+
+        # 검증 (Assert)
+        assert all(entry["status"] == 200 for entry in response["results"])
+        assert limiter.admitted[BATCH] == 6
+        assert peak == 2
+        assert limiter.total_in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_rejected_slot_is_reported_per_query(self, session_factory):
+        """배치 대기열이 가득 차 슬롯을 받지 못한 검색만 503"""
+        # 준비 (Arrange)
+        limiter = PriorityLimiter(AdmissionRule(
+            name="search", path_prefix="/api/trademarks/search",
+            max_concurrency=1, max_queue=1, queue_timeout=1.0,
+            batch_max_concurrency=1, batch_max_queue=1,
+        ))
+
+        async def search(service, params):
+            await asyncio.sleep(0.01)
+            return {"items": [], "total_count": 0, "page": params.page, "size": params.size, "pages_count": 0}
+
+        # 실행 (Act)
+        with patch.object(TrademarkService, "search_trademarks", search):
+            response = await run_batch_search(
+                [{"keyword": f"상표{i}"} for i in range(3)], session_factory, concurrency=3, limiter=limiter
+            )
+
+        # 검증 (Assert)
+        assert sorted(entry["status"] for entry in response["results"]) == [200, 200, 503]
+        assert limiter.shed_queue_full[BATCH] == 1
+
+    @pytest.mark.asyncio
+    async def test_failure_is_reported_per_query(self, session_factory):
+        """예기치 않은 오류는 해당 검색만 500"""
+        # 준비 (Arrange)
+        async def search(service, params):
+            if params.keyword == "오류":
+                raise RuntimeError("boom")
+            return {"items": [], "total_count": 0, "page": 1, "size": 10, "pages_count": 0}
+
+        # 실행 (Act)
+        with patch.object(TrademarkService, "search_trademarks", search):
+            response = await run_batch_search([{"keyword": "오류"}, {"keyword": "정상"}], session_factory)
+
+        # 검증 (Assert)
+        assert [entry["status"] for entry in response["results"]] == [500, 200]
+
+    @pytest.mark.asyncio
+    async def test_too_many_queries_rejected(self, make_request):
+        """최대 검색 수를 넘는 요청은 400"""
+        # 준비 (Arrange)
+        body = BatchSearchRequest(queries=[{"keyword": str(i)} for i in range(21)])
+
+        # 실행 및 검증 (Act & Assert)
+        with patch("app.routers.trademark_routes.BATCH_SEARCH_MAX_QUERIES", 20):
+            with pytest.raises(HTTPException) as exc_info:
+                await batch_search_trademarks_api(request=make_request(), body=body)
+        assert exc_info.value.status_code == 400
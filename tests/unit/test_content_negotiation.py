@@ -0,0 +1,217 @@
+"""응답 형식(JSON/MessagePack) 및 압축 협상 단위 테스트"""
+import gzip
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi import Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from app.routers.trademark_routes import search_trademarks_api
+from app.services.dataset_version import DatasetVersionInfo, dataset_version_cache
+from app.services.trademark_service import TrademarkService
+from app.utils import content_negotiation
+from app.utils.content_negotiation import (
+    MSGPACK_MEDIA_TYPE,
+    Representation,
+    compact,
+    negotiate,
+    negotiated_response,
+    pack,
+)
+from app.utils.documents import render_document
+
+
+def make_items(count):
+    return [
+        {
+            "id": index,
+            "productName": f"상표{index}",
+            "applicationNumber": f"40202000{index:05d}",
+            "registerStatus": "등록",
+            "internationalRegNumbers": None,
+            "priorityClaimNumList": None,
+            "asignProductMainCodeList": ["30", "43"],
+        }
+        for index in range(count)
+    ]
+
+
+async def body_of(response):
+    if isinstance(response, StreamingResponse):
+        return b"".join([chunk async for chunk in response.body_iterator])
+    return response.body
+
+
+class TestNegotiation:
+    """Accept/Accept-Encoding 협상 테스트"""
+
+    def test_media_type(self, make_request):
+        """MessagePack은 명시적으로 요청하고 JSON보다 낮지 않을 때만 선택"""
+        # 실행 및 검증 (Act & Assert)
+        assert negotiate(make_request({"Accept": "application/msgpack"})).media_type == MSGPACK_MEDIA_TYPE
+        assert negotiate(make_request({"Accept": "application/x-msgpack, */*"})).media_type == MSGPACK_MEDIA_TYPE
+        assert negotiate(make_request({"Accept": "application/json, application/msgpack;q=0.5"})).is_default
+        assert negotiate(make_request({"Accept": "*/*"})).is_default
+        assert negotiate(make_request()).is_default
+
+    def test_encoding(self, make_request):
+        """q가 가장 높은 인코딩을 선택하고 zstandard가 없으면 zstd는 협상하지 않음"""
+        # 준비 (Arrange)
+        def encoding_of(header):
+            return negotiate(make_request({"Accept-Encoding": header})).encoding
+
+        # 실행 및 검증 (Act & Assert)
+        with patch.object(content_negotiation, "zstandard", None):
+            assert encoding_of("gzip, deflate, br") == "gzip"
+            assert encoding_of("zstd") is None
+            assert encoding_of("br;q=1.0, *;q=0.5") == "gzip"
+            assert encoding_of("gzip;q=0") is None
+        with patch.object(content_negotiation, "zstandard", object()):
+            assert encoding_of("gzip, zstd") == "zstd"
+            assert encoding_of("gzip, zstd;q=0.5") == "gzip"
+
+    def test_etag_parts_distinguish_representations(self):
+        """기본 JSON 응답은 ETag 구분값이 없고 다른 표현은 서로 다른 값"""
+        # 실행 및 검증 (Act & Assert)
+        assert Representation().etag_parts == ()
+        assert Representation(encoding="gzip").etag_parts != Representation(MSGPACK_MEDIA_TYPE, "gzip").etag_parts
+
+
+class TestMessagePack:
+    """MessagePack 인코딩 테스트"""
+
+    def test_pack_uses_shortest_formats(self):
+        """규격의 가장 짧은 형식으로 인코딩"""
+        # 실행 및 검증 (Act & Assert)
+        assert pack({"a": 1}) == b"\x81\xa1a\x01"
+        assert pack([None, True, False, -1, -33, 200, 70000]) == (
+            b"\x97\xc0\xc3\xc2\xff\xd0\xdf\xcc\xc8\xce\x00\x01\x11\x70"
+        )
+        assert pack("가" * 11) == b"\xd9\x21" + ("가" * 11).encode("utf-8")
+        assert pack(0.5) == b"\xcb\x3f\xe0\x00\x00\x00\x00\x00\x00"
+        assert pack(list(range(16)))[:3] == b"\xdc\x00\x10"
+
+    def test_pack_matches_msgpack_package(self):
+        """설치되어 있으면 msgpack 패키지와 같은 바이트"""
+        # 준비 (Arrange)
+        msgpack = pytest.importorskip("msgpack")
+        content = compact({"items": make_items(20), "total_count": 20, "similarity": 0.75, "page": -1})
+
+        # 실행 및 검증 (Act & Assert)
+        assert pack(content) == msgpack.packb(content, use_bin_type=True)
+
+    @pytest.mark.parametrize("value", [
+        # 정수 형식 경계 (fixint, uint8~64, int8~64)
+        0, 127, 128, 255, 256, 65535, 65536, 2 ** 32 - 1, 2 ** 32, 2 ** 64 - 1,
+        -1, -32, -33, -128, -129, -32768, -32769, -(2 ** 31), -(2 ** 31) - 1, -(2 ** 63),
+        # 문자열/바이트 길이 경계 (fixstr, str8~32, bin8~32)
+        "", "a" * 31, "a" * 32, "a" * 255, "a" * 256, "a" * 65535, "a" * 65536, "가나다",
+        b"", b"x" * 255, b"x" * 256, b"x" * 65536,
+        # 배열/맵 길이 경계 (fixarray/fixmap, 16, 32)
+        list(range(15)), list(range(16)), list(range(65536)), (1, 2),
+        {str(key): key for key in range(15)}, {str(key): key for key in range(16)},
+        {str(key): key for key in range(65536)},
+        # 실수, 불리언, null, 중첩
+        0.0, -1.5, 1e300, True, False, None, {"a": [None, {"b": [True, 1.25]}]},
+    ])
+    def test_fallback_encoder_is_byte_identical(self, value):
+        """msgpack 패키지가 없을 때 쓰는 순수 파이썬 인코더가 형식 경계마다 같은 바이트를 만듦"""
+        # 준비 (Arrange)
+        msgpack = pytest.importorskip("msgpack")
+
+        # 실행 및 검증 (Act & Assert)
+        assert pack(value) == msgpack.packb(value, use_bin_type=True)
+
+    def test_compact_omits_nulls_and_decodes_documents(self):
+        """null 필드는 생략하고 미리 렌더링된 문서는 다시 해석"""
+        # 준비 (Arrange)
+        item = make_items(1)[0]
+
+        # 실행 (Act)
+        result = compact({"items": [render_document(item)], "skipped_shards": None})
+
+        # 검증 (Assert)
+        assert result == {"items": [{key: value for key, value in item.items() if value is not None}]}
+
+
+class TestNegotiatedResponse:
+    """협상 결과에 따른 응답 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_default_returns_content(self):
+        """기본 JSON 응답은 내용을 그대로 반환하고 Vary만 설정"""
+        # 준비 (Arrange)
+        response = Response()
+        content = {"items": make_items(2)}
+
+        # 실행 (Act)
+        result = negotiated_response(content, Representation(), response)
+
+        # 검증 (Assert)
+        assert result is content
+        assert response.headers["Vary"] == "Accept, Accept-Encoding"
+
+    @pytest.mark.asyncio
+    async def test_gzip_is_streamed_above_threshold(self):
+        """최소 크기 이상이면 스트리밍 압축하고, 작으면 그대로 전송"""
+        # 준비 (Arrange)
+        response = Response()
+        response.headers["ETag"] = '"v1"'
+        large = {"items": make_items(100)}
+        small = {"items": make_items(1)}
+
+        # 실행 (Act)
+        compressed = negotiated_response(large, Representation(encoding="gzip"), response)
+        plain = negotiated_response(small, Representation(encoding="gzip"), response)
+
+        # 검증 (Assert)
+        assert isinstance(compressed, StreamingResponse)
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["etag"] == '"v1"'
+        assert gzip.decompress(await body_of(compressed)) == JSONResponse(large).body
+        assert "content-encoding" not in plain.headers
+        assert await body_of(plain) == JSONResponse(small).body
+
+    @pytest.mark.asyncio
+    async def test_msgpack_response(self):
+        """MessagePack 응답은 null 필드를 뺀 내용을 인코딩"""
+        # 준비 (Arrange)
+        content = {"items": [render_document(item) for item in make_items(3)], "total_count": 3}
+
+        # 실행 (Act)
+        result = negotiated_response(content, Representation(MSGPACK_MEDIA_TYPE))
+
+        # 검증 (Assert)
+        assert result.media_type == MSGPACK_MEDIA_TYPE
+        assert result.body == pack(compact(content))
+        assert len(result.body) < len(json.dumps(compact(content), ensure_ascii=False).encode("utf-8"))
+
+    @pytest.mark.asyncio
+    async def test_search_route_negotiates(self, mock_db_session, make_request):
+        """검색 API가 MessagePack으로 응답하고 표현마다 다른 ETag 사용"""
+        # 준비 (Arrange)
+        result = {"items": make_items(3), "total_count": 3, "page": 1, "size": 10, "pages_count": 1}
+        version = DatasetVersionInfo(version="v1", loaded_at=datetime(2024, 1, 1), row_count=3)
+
+        async def search(headers, response):
+            return await search_trademarks_api(
+                request=make_request(headers), response=response,
+                keyword="상표", status=None, application_date_from=None, application_date_to=None,
+                product_code=None, sub_code=None, name=None, name_match=None, q=None, vienna_code=None,
+                page=1, size=10, db=mock_db_session
+            )
+
+        # 실행 (Act)
+        default_response = Response()
+        with patch.object(TrademarkService, "search_trademarks", return_value=result), \
+                patch.object(dataset_version_cache, "current", version):
+            default = await search({}, default_response)
+            packed = await search({"Accept": "application/msgpack"}, Response())
+
+        # 검증 (Assert)
+        assert default == result
+        assert packed.body == pack(compact(result))
+        assert packed.headers["vary"] == "Accept, Accept-Encoding"
+        assert packed.headers["etag"] != default_response.headers["ETag"]
@@ -0,0 +1,37 @@
+"""요청별 DB 세션 의존성 단위 테스트"""
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import database
+
+
+class TestSessionDependencies:
+    """get_db/get_read_db 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("dependency, factory", [
+        (database.get_db, "AsyncSessionLocal"),
+        (database.get_read_db, "ReadSessionLocal"),
+    ])
+    async def test_rolls_back_and_closes_on_error(self, dependency, factory):
+        """요청 처리 중 예외가 나면 롤백한 뒤 세션을 닫고 예외를 다시 발생"""
+        # 준비 (Arrange)
+        session = AsyncMock(spec=AsyncSession)
+
+        @asynccontextmanager
+        async def session_factory():
+            yield session
+
+        # 실행 (Act)
+        with patch.object(database, factory, session_factory):
+            generator = dependency()
+            assert await generator.__anext__() is session
+            with pytest.raises(RuntimeError):
+                await generator.athrow(RuntimeError("boom"))
+
+        # 검증 (Assert)
+        session.rollback.assert_awaited_once()
+        session.close.assert_awaited_once()
@@ -0,0 +1,156 @@
+"""요청 기한 및 클라이언트 연결 종료 처리 단위 테스트"""
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import HTTPException, Response
+from sqlalchemy.dialects import mysql
+
+from app.routers.trademark_routes import search_trademarks_api
+from app.services.deadline import (
+    ClientDisconnected,
+    QueryDeadlineExceeded,
+    current_statement_timeout_ms,
+    run_with_deadline,
+)
+from app.services.single_flight import SingleFlight
+from app.services.trademark_service import TrademarkQueryBuilder, TrademarkService
+
+
+class _DisconnectingRequest:
+    """두 번째 확인부터 연결이 끊어진 것으로 보이는 요청 대역"""
+
+    def __init__(self):
+        self.checks = 0
+
+    async def is_disconnected(self):
+        self.checks += 1
+        return self.checks > 1
+
+
+class TestRunWithDeadline:
+    """run_with_deadline 함수 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_and_exposes_timeout(self):
+        """기한 안에 끝나면 결과를 반환하고 작업에서 타임아웃 값을 읽을 수 있는지 테스트"""
+        # 준비 (Arrange)
+        async def work():
+            return current_statement_timeout_ms()
+
+        # 실행 (Act)
+        result = await run_with_deadline(work, timeout_ms=1500)
+
+        # 검증 (Assert)
+        assert result == 1500
+        assert current_statement_timeout_ms() is None
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_work_and_invalidates_session(self, mock_db_session):
+        """기한을 넘기면 작업을 취소하고 연결을 무효화하는지 테스트"""
+        # 준비 (Arrange)
+        cancelled = asyncio.Event()
+
+        async def slow_query():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(QueryDeadlineExceeded) as excinfo:
+            await run_with_deadline(slow_query, timeout_ms=20, db=mock_db_session)
+
+        assert excinfo.value.timeout_ms == 20
+        assert cancelled.is_set()
+        mock_db_session.invalidate.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_client_disconnect_cancels_work(self, mock_db_session):
+        """클라이언트가 연결을 끊으면 작업을 취소하는지 테스트"""
+        # 준비 (Arrange)
+        async def slow_query():
+            await asyncio.sleep(10)
+
+        # 실행 및 검증 (Act & Assert)
+        with patch("app.services.deadline.DISCONNECT_POLL_INTERVAL", 0.001):
+            with pytest.raises(ClientDisconnected):
+                await run_with_deadline(
+                    slow_query, timeout_ms=5000,
+                    request=_DisconnectingRequest(), db=mock_db_session
+                )
+        mock_db_session.invalidate.assert_awaited_once()
+
+
+class TestStatementTimeoutHint:
+    """MAX_EXECUTION_TIME 힌트 테스트"""
+
+    def test_builder_renders_mysql_hint(self):
+        """빌더가 MySQL 옵티마이저 힌트를 추가하는지 테스트"""
+        # 실행 (Act)
+        stmt = (TrademarkQueryBuilder()
+            .with_status("등록")
+            .with_max_execution_time(2500)
+            .build()
+        )
+
+        # 검증 (Assert)
+        sql = str(stmt.compile(dialect=mysql.dialect()))
+        assert sql.startswith("SELECT /*+ MAX_EXECUTION_TIME(2500) */")
+
+
+class TestSingleFlightCancellation:
+    """모든 대기 요청이 취소되면 공유 작업도 취소되는지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cancels_task_when_all_waiters_leave(self):
+        """대기 요청이 모두 취소되면 작업을 취소하는지 테스트"""
+        # 준비 (Arrange)
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.ensure_future(flight.do("key", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        # 실행 (Act)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+
+        # 검증 (Assert)
+        assert cancelled.is_set()
+        assert flight.stats()["cancelled"] == 1
+        assert flight.stats()["in_flight"] == 0
+
+
+class TestSearchDeadlineResponse:
+    """검색 API의 기한 초과 응답 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_search_timeout_returns_504(self, mock_db_session, make_request):
+        """기한 초과 시 500 대신 504를 반환하는지 테스트"""
+        # 준비 (Arrange)
+        async def slow_search(self, params):
+            await asyncio.sleep(10)
+
+        with patch.dict("app.routers.trademark_routes.ENDPOINT_DEADLINES_MS", {"search": 10}):
+            with patch.object(TrademarkService, "search_trademarks", slow_search):
+                # 실행 및 검증 (Act & Assert)
+                with pytest.raises(HTTPException) as excinfo:
+                    await search_trademarks_api(
+                        request=make_request(), response=Response(),
+                        keyword="테스트", status=None, application_date_from=None,
+                        application_date_to=None, product_code=None, sub_code=None, name=None, name_match=None, q=None, vienna_code=None, page=1, size=10,
+                        db=mock_db_session
+                    )
+
+        assert excinfo.value.status_code == 504
+        assert "10ms" in excinfo.value.detail
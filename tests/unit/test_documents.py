@@ -0,0 +1,164 @@
+"""미리 렌더링된 상표 응답 문서(읽기 모델) 단위 테스트"""
+import gzip
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from fastapi.responses import JSONResponse
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.models.trademark import TradeMark
+from app.models.trademark_document import TrademarkDocument
+from app.routers.trademark_routes import get_trademark_api
+from app.services.document_store import DocumentStore, document_store
+from app.services.trademark_service import SearchParams, TrademarkService
+from app.utils.data_loader import load_trademarks_from_json
+from app.utils.documents import RawJSON, contains_documents, render_document, render_json
+
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, "app", "scripts", "trademark_sample.json"
+)
+
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    """샘플 데이터 일부를 로더로 적재한 파일 DB 세션 팩토리"""
+    with open(SAMPLE_PATH, encoding="utf-8") as f:
+        sample = json.load(f)[:40]
+    input_path = tmp_path / "sample.json"
+    input_path.write_text(json.dumps(sample, ensure_ascii=False), encoding="utf-8")
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/documents.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db:
+        assert await load_trademarks_from_json(db, str(input_path), None) == len(sample)
+    yield factory
+    await engine.dispose()
+
+
+def response_body(content):
+    return JSONResponse(content=content).body
+
+
+class TestRenderJson:
+    """렌더링 헬퍼 테스트"""
+
+    def test_raw_values_are_spliced(self):
+        """RawJSON은 그대로 이어 붙이고 나머지는 JSONResponse와 같은 형식으로 직렬화"""
+        # 준비 (Arrange)
+        item = {"id": 1, "productName": "상표", "viennaCodeList": None}
+        content = {"items": [item, item], "total_count": 2, "page": 1}
+        rendered = {**content, "items": [render_document(item), render_document(item)]}
+
+        # 실행 (Act)
+        body = render_json(rendered)
+
+        # 검증 (Assert)
+        assert contains_documents(rendered)
+        assert not contains_documents(content)
+        assert body == response_body(content)
+
+
+class TestTrademarkDocuments:
+    """적재 시 문서 생성과 문서 기반 응답 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_loader_writes_canonical_documents(self, session_factory):
+        """문서는 DB에서 다시 읽은 상표의 상세 응답 본문과 같고 압축본은 같은 내용"""
+        # 준비 (Arrange)
+        async with session_factory() as db:
+            trademarks = (await db.execute(select(TradeMark).order_by(TradeMark.id))).scalars().all()
+            documents = {
+                document.trademark_id: document
+                for document in (await db.execute(select(TrademarkDocument))).scalars()
+            }
+
+            # 실행 (Act)
+            expected = {
+                trademark.id: response_body(TrademarkService(db)._convert_to_dict(trademark))
+                for trademark in trademarks
+            }
+
+        # 검증 (Assert)
+        assert len(documents) == len(trademarks)
+        for trademark_id, body in expected.items():
+            assert documents[trademark_id].body == body
+            assert gzip.decompress(documents[trademark_id].body_gzip) == body
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("params", [
+        SearchParams(status="등록", size=15),
+        SearchParams(vienna_code=["26"], page=1, size=5),
+    ])
+    async def test_search_from_documents_matches_orm_path(self, session_factory, params):
+        """문서로 만든 검색 응답은 ORM 변환 경로와 바이트 단위로 같고, 문서가 없는 행은 렌더링해 채움"""
+        # 준비 (Arrange)
+        async with session_factory() as db:
+            expected = response_body(await TrademarkService(db)._search_trademarks(params))
+            first = json.loads(expected)["items"][0]["id"]
+            await db.execute(delete(TrademarkDocument).where(TrademarkDocument.trademark_id == first))
+            await db.commit()
+
+        # 실행 (Act)
+        with patch.object(document_store, "available", True):
+            async with session_factory() as db:
+                result = await TrademarkService(db)._search_trademarks(params)
+
+        # 검증 (Assert)
+        assert all(isinstance(item, RawJSON) for item in result["items"])
+        assert render_json(result) == expected
+
+    @pytest.mark.asyncio
+    async def test_detail_streams_stored_bytes(self, session_factory, make_request):
+        """상세 조회는 저장된 문서를 그대로 전송하고 gzip을 허용하면 압축본 전송"""
+        # 준비 (Arrange)
+        async with session_factory() as db:
+            document = (await db.execute(select(TrademarkDocument).limit(1))).scalar_one()
+
+        # 실행 (Act)
+        with patch.object(document_store, "available", True), \
+                patch("app.routers.trademark_routes.dataset_version_cache.get", return_value=None):
+            async with session_factory() as db:
+                plain = await get_trademark_api(
+                    request=make_request(), response=None,
+                    application_number=document.application_number, db=db
+                )
+                compressed = await get_trademark_api(
+                    request=make_request({"Accept-Encoding": "gzip, br"}), response=None,
+                    application_number=document.application_number, db=db
+                )
+
+        # 검증 (Assert)
+        assert plain.body == document.body
+        assert "content-encoding" not in plain.headers
+        assert compressed.body == document.body_gzip
+        assert compressed.headers["content-encoding"] == "gzip"
+        assert compressed.headers["vary"] == "Accept, Accept-Encoding"
+
+    @pytest.mark.asyncio
+    async def test_store_without_documents_is_inactive(self, session_factory):
+        """문서가 없는 DB이거나 비활성화하면 ORM 변환 경로 사용"""
+        # 준비 (Arrange)
+        store = DocumentStore()
+        store.configure(session_factory)
+        disabled = DocumentStore(enabled=False)
+        disabled.configure(session_factory)
+
+        # 실행 (Act)
+        available = await store.refresh()
+        async with session_factory() as db:
+            await db.execute(delete(TrademarkDocument))
+            await db.commit()
+        emptied = await store.refresh()
+
+        # 검증 (Assert)
+        assert available
+        assert not emptied
+        assert not await disabled.refresh()
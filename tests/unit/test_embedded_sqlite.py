@@ -0,0 +1,166 @@
+"""SQLite 임베디드 모드 단위 테스트"""
+import os
+import sqlite3
+from datetime import date
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert, text, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.db.base import Base
+from app.db.sqlite import EmbeddedDatabase, embedded_db, fts_match_query
+from app.models.trademark import TradeMark
+from app.scripts.build_sqlite_db import build
+from app.scripts.wait_for_db import parse_sqlite_url
+from app.services.trademark_service import SearchParams, TrademarkQueryBuilder, TrademarkRepository
+
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, "app", "scripts", "trademark_sample.json"
+)
+
+MARKS = [
+    ("4020200000001", "마크클라우드", "MarkCloud", date(2020, 1, 1)),
+    ("4020210000002", "클라우드 커피", "Cloud Coffee", date(2021, 1, 1)),
+    ("4020220000003", "커피 100%", None, date(2022, 1, 1)),
+    ("4020230000004", "다른 상표", "other_mark", None),
+]
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    """FTS 색인을 준비한 쓰기/읽기 엔진 (사전 적재한 행은 색인 재구축으로 반영)"""
+    embedded = EmbeddedDatabase(read_pool_size=2, write_pool_size=1)
+    url = f"sqlite+aiosqlite:///{tmp_path}/embedded.db"
+    engine = embedded.create_engine(url)
+    read_engine = embedded.create_engine(url, read_only=True)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(TradeMark), [
+            {"applicationNumber": number, "productName": name, "productNameEng": name_eng, "applicationDate": day}
+            for number, name, name_eng, day in MARKS[:2]
+        ])
+        assert await conn.run_sync(embedded.init_schema)
+        # 색인 준비 후 추가된 행은 트리거로 반영
+        await conn.execute(insert(TradeMark), [
+            {"applicationNumber": number, "productName": name, "productNameEng": name_eng, "applicationDate": day}
+            for number, name, name_eng, day in MARKS[2:]
+        ])
+    # 리포지토리는 전역 설정으로 세션 엔진의 FTS 사용 여부를 판단
+    embedded_db.mark_fts_ready(engine, read_engine)
+    yield engine, read_engine
+    embedded_db._fts_engines.discard(engine.sync_engine)
+    embedded_db._fts_engines.discard(read_engine.sync_engine)
+    await read_engine.dispose()
+    await engine.dispose()
+
+
+async def search_numbers(engine, params):
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        items, total = await TrademarkRepository(db).search(params)
+    return [item.applicationNumber for item in items], total
+
+
+class TestEmbeddedDatabase:
+    """PRAGMA, 읽기 풀, FTS5 상표명 색인 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_pragmas_and_read_only_pool(self, engines):
+        """WAL 저널과 mmap이 적용되고 읽기 엔진은 쓰기를 거절"""
+        # 준비 (Arrange)
+        _, read_engine = engines
+
+        # 실행 (Act)
+        async with read_engine.connect() as conn:
+            journal_mode = (await conn.exec_driver_sql("PRAGMA journal_mode")).scalar()
+            mmap_size = (await conn.exec_driver_sql("PRAGMA mmap_size")).scalar()
+
+        # 검증 (Assert)
+        assert journal_mode == "wal"
+        assert mmap_size > 0
+        with pytest.raises(OperationalError):
+            async with read_engine.begin() as conn:
+                await conn.execute(update(TradeMark).values(registerStatus="등록"))
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("keyword", ["클라우드", "cloud", "Coffee", "우드 커", "100%", "r_m", "커피", "없는상표"])
+    async def test_fts_results_match_like(self, engines, keyword):
+        """FTS 색인 검색 결과가 LIKE 검색 결과와 같음 (짧거나 와일드카드가 든 검색어는 LIKE)"""
+        # 준비 (Arrange)
+        _, read_engine = engines
+        params = SearchParams(keyword=keyword)
+
+        # 실행 (Act)
+        actual = await search_numbers(read_engine, params)
+        embedded_db._fts_engines.discard(read_engine.sync_engine)
+        expected = await search_numbers(read_engine, params)
+
+        # 검증 (Assert)
+        assert actual == expected
+
+    def test_builder_uses_fts_only_for_eligible_keywords(self):
+        """세 글자 이상이고 LIKE 와일드카드가 없는 검색어만 FTS 색인 사용"""
+        # 실행 및 검증 (Act & Assert)
+        assert "keyword_fts" in TrademarkQueryBuilder().with_keyword("클라우드", fts=True).params
+        assert "keyword_pattern" in TrademarkQueryBuilder().with_keyword("커피", fts=True).params
+        assert "keyword_pattern" in TrademarkQueryBuilder().with_keyword("100%", fts=True).params
+        assert "keyword_pattern" in TrademarkQueryBuilder().with_keyword("클라우드").params
+
+    @pytest.mark.asyncio
+    async def test_triggers_keep_index_in_sync(self, engines):
+        """상표명 변경/삭제가 색인에 반영됨"""
+        # 준비 (Arrange)
+        engine, _ = engines
+        query = text("SELECT rowid FROM trademark_name_fts WHERE trademark_name_fts MATCH :q")
+
+        # 실행 (Act)
+        async with engine.begin() as conn:
+            await conn.execute(
+                update(TradeMark).where(TradeMark.applicationNumber == MARKS[0][0]).values(productName="새이름상표")
+            )
+            await conn.execute(text("DELETE FROM trademarks WHERE applicationNumber = :n"), {"n": MARKS[1][0]})
+            renamed = (await conn.execute(query, {"q": fts_match_query("새이름")})).all()
+            removed = (await conn.execute(query, {"q": fts_match_query("클라우드")})).all()
+
+        # 검증 (Assert)
+        assert len(renamed) == 1
+        assert removed == []
+
+
+class TestOfflineBuild:
+    """오프라인 DB 파일 구축 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_build_ready_to_serve_file(self, tmp_path):
+        """샘플 데이터로 FTS 색인과 데이터셋 버전을 포함한 단일 DB 파일 생성"""
+        # 준비 (Arrange)
+        output = tmp_path / "artifact" / "trademarks.db"
+
+        # 실행 (Act)
+        loaded = await build(SAMPLE_PATH, str(output))
+
+        # 검증 (Assert)
+        assert loaded == 500
+        assert not os.path.exists(f"{output}.building")
+        conn = sqlite3.connect(output)
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+            assert conn.execute("SELECT count(*) FROM dataset_versions").fetchone()[0] == 1
+            assert conn.execute(
+                "SELECT count(*) FROM trademark_name_fts WHERE trademark_name_fts MATCH '\"프레스\"'"
+            ).fetchone()[0] == 1
+            # 날짜 컬럼이 date로 저장됨
+            assert conn.execute("SELECT applicationDate FROM trademarks WHERE id = 1").fetchone()[0] == "1995-11-17"
+        finally:
+            conn.close()
+
+    def test_parse_sqlite_url(self):
+        """wait_for_db가 SQLite URL의 파일 경로를 해석"""
+        # 실행 및 검증 (Act & Assert)
+        assert parse_sqlite_url("sqlite+aiosqlite:////data/trademarks.db") == "/data/trademarks.db"
+        assert parse_sqlite_url("sqlite+aiosqlite:///local.db") == "local.db"
+        assert parse_sqlite_url("sqlite+aiosqlite:///:memory:") is None
+        with pytest.raises(ValueError):
+            parse_sqlite_url("mysql+aiomysql://user@host/db")
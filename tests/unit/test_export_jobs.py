@@ -0,0 +1,349 @@
+"""내보내기 작업 단위 테스트"""
+import csv
+import gzip
+import io
+import json
+from datetime import date, datetime, timedelta
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from starlette.requests import Request
+
+from app.db.base import Base
+from app.models.export_job import ExportJob
+from app.models.trademark import TradeMark
+from app.routers.export_routes import download_export_api
+from app.services import export_jobs
+from app.services.export_jobs import (
+    JOB_CANCELLED,
+    JOB_COMPLETED,
+    JOB_FAILED,
+    JOB_RUNNING,
+    ExportJobService,
+    ExportRunner,
+    ExportWorker,
+)
+from app.services.trademark_service import SearchParams
+from app.utils.http_range import RangeNotSatisfiable, parse_range
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db:
+        db.add_all([
+            TradeMark(
+                applicationNumber=f"40{index:04d}",
+                productName=f"상표{index}",
+                registerStatus="등록" if index % 2 else "거절",
+                applicationDate=date(2020, 1, 1) + timedelta(days=index),
+                asignProductMainCodeList=["30"]
+            )
+            for index in range(1, 8)
+        ])
+        await db.commit()
+    yield factory
+    await engine.dispose()
+
+
+def read_ndjson(path):
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+async def submit(factory, tmp_path, format="ndjson", **filters):
+    async with factory() as db:
+        return await ExportJobService(db, directory=str(tmp_path)).create(SearchParams(**filters), format)
+
+
+async def fetch_job(factory, job_id):
+    async with factory() as db:
+        return await db.get(ExportJob, job_id)
+
+
+def make_request(headers):
+    return Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+async def read_body(response):
+    return b"".join([chunk async for chunk in response.body_iterator])
+
+
+class TestParseRange:
+    """Range 헤더 해석 테스트"""
+
+    @pytest.mark.parametrize("header, expected", [
+        (None, None),
+        ("bytes=0-9", (0, 9)),
+        ("bytes=10-", (10, 99)),
+        ("bytes=-10", (90, 99)),
+        ("bytes=50-500", (50, 99)),
+        ("bytes=0-1,5-6", None),
+        ("items=0-1", None),
+    ])
+    def test_ranges(self, header, expected):
+        """단일 구간은 양끝 포함 구간으로, 지원하지 않는 형식은 None"""
+        # 검증 (Assert)
+        assert parse_range(header, 100) == expected
+
+    @pytest.mark.parametrize("header", ["bytes=100-", "bytes=5-1", "bytes=-0"])
+    def test_unsatisfiable(self, header):
+        """파일 범위를 벗어난 구간은 RangeNotSatisfiable"""
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range(header, 100)
+
+
+class TestExportWorker:
+    """내보내기 작업 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_exports_matching_rows_in_keyset_order(self, session_factory, tmp_path):
+        """검색 조건에 맞는 전체 결과를 id 순서로 배치 단위 기록"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path, status="등록")
+        worker = ExportWorker(concurrency=0, batch_size=2)
+        worker._session_factory = session_factory
+
+        # 실행 (Act)
+        processed = await worker.run_next()
+        finished = await fetch_job(session_factory, job.id)
+
+        # 검증 (Assert)
+        assert processed is True
+        assert finished.status == JOB_COMPLETED
+        assert finished.total_count == finished.exported_count == 4
+        records = read_ndjson(finished.file_path)
+        assert [record["applicationNumber"] for record in records] == ["400001", "400003", "400005", "400007"]
+        assert await worker.run_next() is False
+
+    @pytest.mark.asyncio
+    async def test_csv_export_has_single_header(self, session_factory, tmp_path):
+        """CSV는 헤더를 한 번만 기록하고 목록 값은 | 로 연결"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path, format="csv")
+        worker = ExportWorker(concurrency=0, batch_size=3)
+        worker._session_factory = session_factory
+
+        # 실행 (Act)
+        await worker.run_next()
+        finished = await fetch_job(session_factory, job.id)
+        with gzip.open(finished.file_path, "rt", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        # 검증 (Assert)
+        assert len(rows) == 7
+        assert rows[0]["applicationNumber"] == "400001"
+        assert rows[0]["asignProductMainCodeList"] == "30"
+
+    @pytest.mark.asyncio
+    async def test_resumes_interrupted_job_without_duplicates(self, session_factory, tmp_path, monkeypatch):
+        """중단된 작업은 임대 만료 후 마지막 기록 위치부터 재개 (중단된 배치는 잘라냄)"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path)
+        worker = ExportWorker(concurrency=0, batch_size=2, lease_seconds=60)
+        worker._session_factory = session_factory
+
+        original_append = export_jobs.append_member
+        calls = []
+
+        def crash_on_second_batch(path, offset, data):
+            calls.append(offset)
+            # 첫 호출은 빈 시작 멤버, 세 번째가 두 번째 배치
+            if len(calls) == 3:
+                # 기록 도중 종료된 것처럼 불완전한 바이트만 남김
+                with open(path, "ab") as f:
+                    f.write(gzip.compress(data)[:10])
+                raise SystemError("worker killed")
+            return original_append(path, offset, data)
+
+        monkeypatch.setattr(export_jobs, "append_member", crash_on_second_batch)
+        async with session_factory() as db:
+            claimed = await worker.claim_next(db)
+            with pytest.raises(SystemError):
+                await ExportRunner(db, claimed, batch_size=2).run()
+        monkeypatch.setattr(export_jobs, "append_member", original_append)
+
+        interrupted = await fetch_job(session_factory, job.id)
+        assert interrupted.status == JOB_RUNNING
+        assert interrupted.exported_count == 2
+
+        # 실행 (Act) - 임대가 남아 있으면 가져가지 않고, 만료되면 재개
+        assert await worker.run_next() is False
+        async with session_factory() as db:
+            await db.execute(
+                update(ExportJob)
+                .where(ExportJob.id == job.id)
+                .values(updated_at=interrupted.updated_at - timedelta(minutes=5))
+            )
+            await db.commit()
+        assert await worker.run_next() is True
+        finished = await fetch_job(session_factory, job.id)
+
+        # 검증 (Assert)
+        assert finished.status == JOB_COMPLETED
+        assert finished.exported_count == 7
+        numbers = [record["applicationNumber"] for record in read_ndjson(finished.file_path)]
+        assert numbers == [f"40{index:04d}" for index in range(1, 8)]
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_with_second_truncated_timestamps(self, session_factory, tmp_path, monkeypatch):
+        """초 단위로 저장된 시각이 같아도 여러 번 진행을 기록하고, 이어받은 작업의 이전 소유자는 기록하지 못함"""
+        # 준비 (Arrange) - MySQL DATETIME처럼 초 단위로 잘린 같은 시각만 반환
+        monkeypatch.setattr(export_jobs, "_utcnow", lambda: datetime(2024, 1, 1, 9, 0, 0))
+        job = await submit(session_factory, tmp_path)
+        worker = ExportWorker(concurrency=0, batch_size=2)
+        worker._session_factory = session_factory
+        async with session_factory() as db:
+            stale = await worker.claim_next(db)
+        async with session_factory() as db:
+            await db.execute(
+                update(ExportJob).where(ExportJob.id == job.id).values(updated_at=datetime(2023, 1, 1))
+            )
+            await db.commit()
+
+        # 실행 (Act) - 임대가 만료된 작업을 다른 워커가 이어받아 완료
+        assert await worker.run_next() is True
+        finished = await fetch_job(session_factory, job.id)
+        async with session_factory() as db:
+            with pytest.raises(export_jobs.ExportLeaseLost):
+                await ExportRunner(db, stale, batch_size=2)._checkpoint()
+
+        # 검증 (Assert)
+        assert finished.status == JOB_COMPLETED
+        assert finished.exported_count == 7
+        # 가져가기 2번 + 건수 1번 + 시작 멤버 1번 + 배치 4번 + 완료 1번
+        assert finished.lease_version == 9
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("taken_over, expected_status", [(False, JOB_FAILED), (True, JOB_RUNNING)])
+    async def test_failure_is_recorded_only_by_lease_holder(
+        self, session_factory, tmp_path, monkeypatch, taken_over, expected_status
+    ):
+        """실패한 작업은 실패로 기록하되, 그사이 다른 워커가 이어받았으면 기록하지 않음"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path)
+        worker = ExportWorker(concurrency=0, batch_size=2)
+        worker._session_factory = session_factory
+
+        async def fail(runner):
+            if taken_over:
+                async with session_factory() as other:
+                    await other.execute(
+                        update(ExportJob)
+                        .where(ExportJob.id == job.id)
+                        .values(lease_version=ExportJob.lease_version + 1)
+                    )
+                    await other.commit()
+            raise RuntimeError("disk full")
+
+        monkeypatch.setattr(ExportRunner, "run", fail)
+
+        # 실행 (Act)
+        processed = await worker.run_next()
+        current = await fetch_job(session_factory, job.id)
+
+        # 검증 (Assert)
+        assert processed is True
+        assert current.status == expected_status
+        assert worker.failed == (0 if taken_over else 1)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_not_claimed(self, session_factory, tmp_path):
+        """취소된 작업은 워커가 가져가지 않음"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path)
+        async with session_factory() as db:
+            await ExportJobService(db).cancel(job.id)
+        worker = ExportWorker(concurrency=0)
+        worker._session_factory = session_factory
+
+        # 실행 (Act)
+        processed = await worker.run_next()
+
+        # 검증 (Assert)
+        assert processed is False
+        assert (await fetch_job(session_factory, job.id)).status == JOB_CANCELLED
+
+
+class TestExportDownload:
+    """내보내기 파일 다운로드 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_range_requests_resume_download(self, session_factory, tmp_path):
+        """Range 요청은 206 부분 응답, 이어 받은 조각을 합치면 전체 파일"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path)
+        worker = ExportWorker(concurrency=0, batch_size=3)
+        worker._session_factory = session_factory
+        await worker.run_next()
+
+        async with session_factory() as db:
+            # 실행 (Act)
+            full = await download_export_api(make_request({}), job.id, db)
+            full_body = await read_body(full)
+            head = await download_export_api(make_request({"Range": "bytes=0-99"}), job.id, db)
+            head_body = await read_body(head)
+            tail = await download_export_api(
+                make_request({"Range": "bytes=100-", "If-Range": full.headers["etag"]}), job.id, db
+            )
+            tail_body = await read_body(tail)
+            stale = await download_export_api(
+                make_request({"Range": "bytes=100-", "If-Range": '"other"'}), job.id, db
+            )
+
+            with pytest.raises(HTTPException) as exc_info:
+                await download_export_api(make_request({"Range": f"bytes={len(full_body)}-"}), job.id, db)
+
+        # 검증 (Assert)
+        assert full.status_code == 200
+        assert full.headers["accept-ranges"] == "bytes"
+        assert head.status_code == 206
+        assert head.headers["content-range"] == f"bytes 0-99/{len(full_body)}"
+        assert tail.status_code == 206
+        assert head_body + tail_body == full_body
+        assert len(gzip.decompress(full_body).splitlines()) == 7
+        assert stale.status_code == 200
+        assert exc_info.value.status_code == 416
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("format, expected", [("ndjson", b""), ("csv", export_jobs.csv_header())])
+    async def test_empty_export_is_downloadable(self, session_factory, tmp_path, format, expected):
+        """일치하는 행이 없는 작업도 완료 후 빈 파일(CSV는 헤더만)을 내려받음"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path, format=format, keyword="없는상표")
+        worker = ExportWorker(concurrency=0)
+        worker._session_factory = session_factory
+        await worker.run_next()
+
+        # 실행 (Act)
+        async with session_factory() as db:
+            response = await download_export_api(make_request({}), job.id, db)
+            body = await read_body(response)
+
+        # 검증 (Assert)
+        assert (await fetch_job(session_factory, job.id)).status == JOB_COMPLETED
+        assert response.status_code == 200
+        assert gzip.decompress(body) == expected
+
+    @pytest.mark.asyncio
+    async def test_download_before_completion_conflicts(self, session_factory, tmp_path):
+        """완료되지 않은 작업의 다운로드는 409"""
+        # 준비 (Arrange)
+        job = await submit(session_factory, tmp_path)
+
+        # 실행 및 검증 (Act & Assert)
+        async with session_factory() as db:
+            with pytest.raises(HTTPException) as exc_info:
+                await download_export_api(make_request({}), job.id, db)
+        assert exc_info.value.status_code == 409
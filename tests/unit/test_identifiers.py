@@ -0,0 +1,100 @@
+"""통합 번호 색인 단위 테스트"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException, Response
+
+from app.routers.trademark_routes import get_trademarks_by_identifier_api
+from app.services.trademark_service import TrademarkRepository, TrademarkService
+from app.utils.identifiers import extract_identifiers, normalize_identifier
+
+
+class TestIdentifierNormalization:
+    """번호 정규화 및 추출 테스트"""
+
+    @pytest.mark.parametrize("number, expected", [
+        ("4003600590000", "4003600590000"),
+        ("75/554,461", "75554461"),
+        ("jp-t-2008-00002493", "JPT200800002493"),
+        (" 433 553 ", "433553"),
+        (None, ""),
+    ])
+    def test_normalize_identifier(self, number, expected):
+        """구분 기호와 공백을 제거하고 대문자로 변환"""
+        # 실행 및 검증 (Act & Assert)
+        assert normalize_identifier(number) == expected
+
+    def test_extract_identifiers(self, sample_trademark_data):
+        """단일 값과 리스트 필드에서 번호 종류별로 추출"""
+        # 준비 (Arrange)
+        record = dict(sample_trademark_data, registrationNumber=["4000123456"], internationalRegNumbers="1234567")
+
+        # 실행 (Act)
+        identifiers = extract_identifiers(record)
+
+        # 검증 (Assert)
+        assert ("application", "4020200012345") in identifiers
+        assert ("registration", "4000123456") in identifiers
+        assert ("international_registration", "1234567") in identifiers
+        assert ("priority_claim", "US123456") in identifiers
+        assert ("priority_claim", "EU654321") in identifiers
+        assert len(identifiers) == len(set(identifiers))
+
+
+class TestIdentifierLookup:
+    """번호 조회 서비스 및 API 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_service_normalizes_before_lookup(self, mock_db_session, sample_trademark_orm):
+        """조회 전에 번호를 정규화하고 번호 종류를 결과에 포함"""
+        # 준비 (Arrange)
+        with patch.object(
+            TrademarkRepository,
+            "find_by_identifier",
+            AsyncMock(return_value=[("priority_claim", sample_trademark_orm)])
+        ) as mock_find:
+            # 실행 (Act)
+            result = await TrademarkService(mock_db_session).get_trademarks_by_identifier("us-123456")
+
+        # 검증 (Assert)
+        mock_find.assert_awaited_once_with("US123456", None)
+        assert result["number"] == "US123456"
+        assert result["items"][0]["number_type"] == "priority_claim"
+        assert result["items"][0]["applicationNumber"] == "4020200012345"
+
+    @pytest.mark.asyncio
+    async def test_repository_uses_typed_statement(self, mock_db_session, sample_trademark_orm):
+        """번호 종류를 지정하면 종류 조건이 포함된 문장으로 조회"""
+        # 준비 (Arrange)
+        mock_result = MagicMock()
+        mock_result.all.return_value = [("registration", sample_trademark_orm)]
+        mock_db_session.execute.return_value = mock_result
+
+        # 실행 (Act)
+        matches = await TrademarkRepository(mock_db_session).find_by_identifier("4000123456", "registration")
+
+        # 검증 (Assert)
+        stmt, params = mock_db_session.execute.call_args.args
+        assert params == {"number": "4000123456", "number_type": "registration"}
+        assert "number_type" in str(stmt)
+        assert matches == [("registration", sample_trademark_orm)]
+
+    @pytest.mark.asyncio
+    async def test_api_rejects_unknown_type_and_missing_number(self, mock_db_session, make_request):
+        """지원하지 않는 번호 종류는 400, 결과가 없으면 404"""
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(HTTPException) as excinfo:
+            await get_trademarks_by_identifier_api(
+                request=make_request(), response=Response(), number="1", number_type="bogus", db=mock_db_session
+            )
+        assert excinfo.value.status_code == 400
+
+        with patch.object(
+            TrademarkService,
+            "get_trademarks_by_identifier",
+            AsyncMock(return_value={"number": "1", "items": []})
+        ):
+            with pytest.raises(HTTPException) as excinfo:
+                await get_trademarks_by_identifier_api(
+                    request=make_request(), response=Response(), number="1", number_type=None, db=mock_db_session
+                )
+        assert excinfo.value.status_code == 404
@@ -0,0 +1,137 @@
+"""MinHash/LSH 유사 상표 검색 단위 테스트"""
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.db.base import Base
+from app.models.trademark import TradeMark
+from app.models.trademark_lsh_bucket import TrademarkLshBucket
+from app.models.trademark_signature import TrademarkSignature
+from app.services.near_duplicates import _DisjointSet, find_clusters, find_similar
+from app.utils.minhash import (
+    LSH_BANDS,
+    estimate_similarity,
+    lsh_buckets,
+    minhash_signature,
+    name_shingles,
+    pack_signature,
+    unpack_signature,
+)
+
+
+MARKS = [
+    ("1", "프레스카", "FRESCA"),
+    ("2", "프레스카", "Fresca"),
+    ("3", "프레스카 골드", "FRESCA GOLD"),
+    ("4", "구글", "GOOGLE"),
+    ("5", None, "GOOGLE MAPS"),
+    ("6", "삼성", "SAMSUNG"),
+    ("7", None, None),
+]
+
+
+def signature_of(name, name_eng):
+    return minhash_signature(name_shingles(name, name_eng))
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        for number, name, name_eng in MARKS:
+            trademark = TradeMark(applicationNumber=number, productName=name, productNameEng=name_eng)
+            db.add(trademark)
+            signature = signature_of(name, name_eng)
+            if signature is not None:
+                db.add(TrademarkSignature(signature=pack_signature(signature), trademark=trademark))
+                db.add_all([
+                    TrademarkLshBucket(band=band, bucket=bucket, trademark=trademark)
+                    for band, bucket in lsh_buckets(signature)
+                ])
+        await db.commit()
+        yield db
+    await engine.dispose()
+
+
+class TestMinHash:
+    """MinHash 서명 및 LSH 버킷 테스트"""
+
+    def test_normalized_names_share_signature(self):
+        """대소문자·공백·구두점만 다른 상표명은 같은 서명"""
+        # 검증 (Assert)
+        assert signature_of(None, "FRESCA") == signature_of(None, "Fres-ca")
+        assert signature_of(None, None) is None
+
+    def test_estimate_tracks_jaccard(self):
+        """서명 일치 비율이 글자 조각 자카드 유사도에 가까움"""
+        # 준비 (Arrange)
+        first = name_shingles("abcdefghijklmnop")
+        second = name_shingles("abcdefghijklmnxy")
+        jaccard = len(first & second) / len(first | second)
+
+        # 실행 (Act)
+        estimate = estimate_similarity(minhash_signature(first), minhash_signature(second))
+
+        # 검증 (Assert)
+        assert abs(estimate - jaccard) < 0.2
+
+    def test_buckets_and_packing(self):
+        """밴드마다 버킷 하나, 서명은 바이트로 왕복 변환"""
+        # 준비 (Arrange)
+        signature = signature_of("프레스카", "FRESCA")
+
+        # 실행 (Act)
+        buckets = lsh_buckets(signature)
+
+        # 검증 (Assert)
+        assert [band for band, _ in buckets] == list(range(LSH_BANDS))
+        assert unpack_signature(pack_signature(signature)) == signature
+
+
+class TestNearDuplicateSearch:
+    """LSH 버킷 기반 유사 상표 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_similar_marks_ranked_by_similarity(self, session):
+        """버킷을 공유하고 임계값을 넘는 상표만 유사도 순으로 반환"""
+        # 실행 (Act)
+        matches = await find_similar(session, "1", threshold=0.5)
+
+        # 검증 (Assert)
+        numbers = [trademark.applicationNumber for _, trademark in matches]
+        assert numbers[0] == "2"
+        assert matches[0][0] == 1.0
+        assert "1" not in numbers
+        assert not {"4", "5", "6"} & set(numbers)
+
+    @pytest.mark.asyncio
+    async def test_missing_mark_and_mark_without_name(self, session):
+        """없는 상표는 None, 상표명이 없는 상표는 빈 목록"""
+        # 실행 및 검증 (Act & Assert)
+        assert await find_similar(session, "없음") is None
+        assert await find_similar(session, "7") == []
+
+    @pytest.mark.asyncio
+    async def test_clusters(self, session):
+        """검증된 후보 쌍을 합쳐 군집 구성"""
+        # 실행 (Act)
+        clusters = await find_clusters(session, threshold=0.9)
+
+        # 검증 (Assert)
+        assert clusters == [[1, 2]]
+
+    def test_long_chain_does_not_recurse(self):
+        """재귀 한도보다 긴 연결도 하나의 군집으로 합침"""
+        # 준비 (Arrange)
+        clusters = _DisjointSet()
+        count = 20_000
+
+        # 실행 (Act)
+        for item in range(count - 1, 0, -1):
+            clusters.union(item, item + 1)
+
+        # 검증 (Assert)
+        assert {clusters.find(item) for item in range(1, count + 1)} == {clusters.find(1)}
+        assert clusters.size[clusters.find(1)] == count
@@ -0,0 +1,262 @@
+"""감시 목록 역방향 대조(percolator) 단위 테스트"""
+import json
+import os
+import random
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.models import DATASET_TABLES
+from app.models.saved_query import SavedQuery, WatchNotification
+from app.routers.watch_routes import create_saved_query_api
+from app.schemas.watch import SavedQueryCreate
+from app.services.percolator import Percolator, PercolatorQuery
+from app.services.watchlist import WatchlistService
+from app.utils.data_loader import load_trademarks_from_json
+
+
+SAMPLE_PATH = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, "app", "scripts", "trademark_sample.json"
+)
+STATUSES = ["등록", "실효", "거절", "출원"]
+
+
+def sample_records():
+    with open(SAMPLE_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def brute_force(queries, record):
+    """저장 검색을 상표마다 모두 확인하는 기준 구현"""
+    names = [(record.get("productName") or "").lower(), (record.get("productNameEng") or "").lower()]
+    codes = {code.lower() for code in record.get("asignProductMainCodeList") or []}
+    return sorted(
+        query.id for query in queries
+        if (query.keyword or query.status or query.product_code)
+        and query.matches(names, record.get("registerStatus"), codes)
+    )
+
+
+def random_queries(records, count, seed=7):
+    rng = random.Random(seed)
+    names = [name for record in records for name in (record.get("productName"), record.get("productNameEng")) if name]
+    queries = []
+    for query_id in range(1, count + 1):
+        keyword = status = product_code = None
+        if rng.random() < 0.7:
+            name = rng.choice(names).lower()
+            start = rng.randrange(len(name))
+            keyword = name[start:start + rng.randint(1, 4)]
+        if rng.random() < 0.4:
+            status = rng.choice(STATUSES)
+        if rng.random() < 0.4:
+            product_code = f"{rng.randint(1, 45):02d}"
+        queries.append(PercolatorQuery(query_id, keyword, status, product_code))
+    return queries
+
+
+class TestPercolator:
+    """대조 결과가 전체 검색 조건 확인 결과와 같은지 검증"""
+
+    def test_matches_equal_brute_force(self):
+        """후보 조건만 확인해도 모든 조건을 확인한 결과와 같음"""
+        # 준비 (Arrange)
+        records = sample_records()
+        queries = random_queries(records, 300)
+        percolator = Percolator(queries)
+
+        # 실행 (Act)
+        actual = [percolator.match(record) for record in records]
+
+        # 검증 (Assert)
+        assert actual == [brute_force(queries, record) for record in records]
+        assert any(actual)
+        # 상표마다 전체 조건 수보다 훨씬 적은 후보만 확인
+        assert percolator.candidates < len(records) * len(queries) / 4
+
+    def test_index_by_anchor_gram_class_and_status(self):
+        """검색어 조건은 가장 드문 gram 하나, 나머지는 분류 또는 상태로 색인"""
+        # 준비 (Arrange)
+        queries = [
+            PercolatorQuery(1, keyword="마크"),
+            PercolatorQuery(2, keyword="클라우드"),
+            PercolatorQuery(3, keyword="우드", status="등록"),
+            PercolatorQuery(4, product_code="09", status="등록"),
+            PercolatorQuery(5, status="출원"),
+            PercolatorQuery(6),
+        ]
+
+        # 실행 (Act)
+        percolator = Percolator(queries)
+
+        # 검증 (Assert)
+        assert percolator.size == 5
+        assert percolator.by_gram["마크"] == [queries[0]]
+        # "우드"는 두 조건이 공유하므로 "클라우드"는 다른 gram으로 색인
+        assert queries[1] not in percolator.by_gram["우드"]
+        assert percolator.by_code["09"] == [queries[3]]
+        assert percolator.by_status["출원"] == [queries[4]]
+
+    def test_keyword_is_case_insensitive_substring(self):
+        """검색어는 상표명/영문 상표명 어디든 대소문자 구분 없이 부분 일치"""
+        # 준비 (Arrange)
+        percolator = Percolator([PercolatorQuery(1, keyword="cloud"), PercolatorQuery(2, keyword="x")])
+
+        # 실행 및 검증 (Act & Assert)
+        assert percolator.match({"productName": "마크", "productNameEng": "MarkCloud"}) == [1]
+        assert percolator.match({"productName": "클라우드"}) == []
+        assert percolator.match({"productNameEng": "X"}) == [2]
+
+
+    def test_product_code_is_substring_like_search(self):
+        """상품 분류 코드는 검색 API와 같이 부분 일치 (저장 조건 "3"은 30류, 35류와 일치)"""
+        # 준비 (Arrange)
+        percolator = Percolator([
+            PercolatorQuery(1, product_code="3"),
+            PercolatorQuery(2, product_code="35", status="등록"),
+        ])
+
+        # 실행 및 검증 (Act & Assert)
+        assert percolator.match({"asignProductMainCodeList": ["30"]}) == [1]
+        assert percolator.match({"asignProductMainCodeList": ["09", "35"], "registerStatus": "등록"}) == [1, 2]
+        assert percolator.match({"asignProductMainCodeList": ["09"]}) == []
+
+@pytest_asyncio.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/watch.db")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def write_records(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(records, f, ensure_ascii=False)
+    return str(path)
+
+
+class TestWatchlist:
+    """감시 목록 등록과 적재 시 알림 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_loader_creates_notifications(self, session_factory, tmp_path):
+        """적재된 상표 중 조건과 일치한 상표마다 알림을 만들고 키셋으로 조회"""
+        # 준비 (Arrange)
+        records = [
+            {"applicationNumber": "4020250000001", "productName": "마크클라우드", "registerStatus": "출원",
+             "asignProductMainCodeList": ["09", "42"]},
+            {"applicationNumber": "4020250000002", "productNameEng": "MARKCLOUD", "registerStatus": "등록",
+             "asignProductMainCodeList": ["35"]},
+            {"applicationNumber": "4020250000003", "productName": "다른 상표", "registerStatus": "출원",
+             "asignProductMainCodeList": ["09"]},
+        ]
+        async with session_factory() as db:
+            service = WatchlistService(db)
+            cloud = await service.create(SavedQueryCreate(client_id="a", keyword="클라우드"))
+            software = await service.create(SavedQueryCreate(client_id="a", product_code="09", status="출원"))
+            english = await service.create(SavedQueryCreate(client_id="b", keyword="markcloud"))
+
+        # 실행 (Act)
+        async with session_factory() as db:
+            loaded = await load_trademarks_from_json(db, write_records(tmp_path / "new.json", records), None)
+        async with session_factory() as db:
+            service = WatchlistService(db)
+            first = await service.list_notifications("a", limit=2)
+            rest = await service.list_notifications("a", since_id=first["next_since_id"])
+            other = await service.list_notifications("b")
+
+        # 검증 (Assert)
+        assert loaded == 3
+        pairs = [(item["saved_query_id"], item["trademark"]["applicationNumber"]) for item in first["items"] + rest["items"]]
+        assert sorted(pairs) == [
+            (cloud.id, "4020250000001"),
+            (software.id, "4020250000001"),
+            (software.id, "4020250000003"),
+        ]
+        assert len(first["items"]) == 2
+        assert [item["saved_query_id"] for item in other["items"]] == [english.id]
+        assert first["items"][0]["dataset_version"]
+
+    @pytest.mark.asyncio
+    async def test_reload_notifies_only_new_or_changed_records(self, session_factory, tmp_path):
+        """데이터셋 테이블만 다시 만들어 재적재하면 새 레코드/바뀐 레코드만 대조하고 기존 알림은 유지"""
+        # 준비 (Arrange)
+        first = [
+            {"applicationNumber": "4020250000001", "productName": "마크클라우드", "registerStatus": "출원"},
+            {"applicationNumber": "4020250000002", "productName": "클라우드 상표", "registerStatus": "출원"},
+            {"applicationNumber": "4020250000003", "productName": "다른 상표", "registerStatus": "출원"},
+        ]
+        second = [
+            first[0],
+            {**first[1], "registerStatus": "등록"},
+            {**first[2], "registerStatus": "등록"},
+            {"applicationNumber": "4020250000004", "productName": "새 클라우드", "registerStatus": "출원"},
+        ]
+        async with session_factory() as db:
+            service = WatchlistService(db)
+            cloud = await service.create(SavedQueryCreate(client_id="a", keyword="클라우드"))
+            registered = await service.create(SavedQueryCreate(client_id="a", status="등록"))
+            await load_trademarks_from_json(db, write_records(tmp_path / "first.json", first), None)
+        async with session_factory() as db:
+            # 첫 적재 후 일치한 조건으로 알림을 만든 뒤 다음 적재 전에 저장 조건을 하나 더 등록
+            late = await WatchlistService(db).create(SavedQueryCreate(client_id="a", keyword="마크"))
+        engine = session_factory.kw["bind"]
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all, tables=DATASET_TABLES)
+            await conn.run_sync(Base.metadata.create_all)
+
+        # 실행 (Act)
+        async with session_factory() as db:
+            loaded = await load_trademarks_from_json(db, write_records(tmp_path / "second.json", second), None)
+        async with session_factory() as db:
+            result = await WatchlistService(db).list_notifications("a")
+
+        # 검증 (Assert)
+        assert loaded == 4
+        pairs = [(item["saved_query_id"], item["trademark"]["applicationNumber"]) for item in result["items"]]
+        assert pairs[:2] == [(cloud.id, "4020250000001"), (cloud.id, "4020250000002")]
+        # 바뀌지 않은 0000001은 나중에 등록한 조건과 대조하지 않고, 바뀐 0000002는 이미 알린 조건에 다시 알리지 않음
+        assert sorted(pairs[2:]) == sorted([
+            (cloud.id, "4020250000004"),
+            (registered.id, "4020250000002"),
+            (registered.id, "4020250000003"),
+        ])
+        assert late.id not in {saved_query_id for saved_query_id, _ in pairs}
+        # 재적재로 바뀐 상표 id와 관계없이 기존 알림이 현재 상표 내용을 가리킴
+        assert result["items"][1]["trademark"]["registerStatus"] == "등록"
+
+    @pytest.mark.asyncio
+    async def test_delete_removes_query_and_notifications(self, session_factory, tmp_path):
+        """다른 클라이언트의 조건은 삭제할 수 없고, 삭제하면 알림도 함께 삭제"""
+        # 준비 (Arrange)
+        async with session_factory() as db:
+            query = await WatchlistService(db).create(SavedQueryCreate(client_id="a", status="등록"))
+            await load_trademarks_from_json(db, write_records(tmp_path / "new.json", [
+                {"applicationNumber": "4020250000009", "productName": "상표", "registerStatus": "등록"}
+            ]), None)
+
+        # 실행 (Act)
+        async with session_factory() as db:
+            service = WatchlistService(db)
+            denied = await service.delete(query.id, "b")
+            deleted = await service.delete(query.id, "a")
+            remaining = await db.scalar(select(func.count()).select_from(WatchNotification))
+            queries = await db.scalar(select(func.count()).select_from(SavedQuery))
+
+        # 검증 (Assert)
+        assert not denied and deleted
+        assert remaining == 0 and queries == 0
+
+    @pytest.mark.asyncio
+    async def test_query_without_conditions_rejected(self, mock_db_session):
+        """조건이 하나도 없는 검색 조건은 400"""
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(HTTPException) as exc_info:
+            await create_saved_query_api(body=SavedQueryCreate(client_id="a", keyword=""), db=mock_db_session)
+        assert exc_info.value.status_code == 400
+        mock_db_session.add.assert_not_called()
@@ -0,0 +1,192 @@
+"""다음 페이지 프리패치 단위 테스트"""
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.services import trademark_service
+from app.services.prefetch import PagePrefetcher
+from app.services.trademark_service import SearchParams, TrademarkRepository, TrademarkService
+
+
+@asynccontextmanager
+async def fake_session():
+    yield MagicMock()
+
+
+def make_prefetcher(**options):
+    options.setdefault("enabled", True)
+    prefetcher = PagePrefetcher(**options)
+    prefetcher.configure(fake_session)
+    return prefetcher
+
+
+def result_for(page):
+    async def fetch(db):
+        return {"page": page}
+    return fetch
+
+
+class TestPagePrefetcher:
+    """프리패치 캐시 및 제한 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_prefetched_result_is_served_once(self):
+        """예약한 페이지는 캐시에서 한 번 응답하고 이후에는 미스"""
+        # 준비 (Arrange)
+        prefetcher = make_prefetcher()
+
+        # 실행 (Act)
+        assert prefetcher.schedule("key", 2, result_for(2))
+        first = await prefetcher.get("key")
+        second = await prefetcher.get("key")
+
+        # 검증 (Assert)
+        assert first == {"page": 2}
+        assert second is None
+        assert prefetcher.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_miss(self):
+        """TTL이 지난 결과는 사용하지 않음"""
+        # 준비 (Arrange)
+        prefetcher = make_prefetcher(ttl_seconds=0)
+        prefetcher.schedule("key", 2, result_for(2))
+        await asyncio.sleep(0.01)
+
+        # 실행 및 검증 (Act & Assert)
+        assert await prefetcher.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_limits(self):
+        """동시 실행 수, 페이지 깊이, 비활성 상태에서는 예약하지 않음"""
+        # 준비 (Arrange)
+        prefetcher = make_prefetcher(max_in_flight=1, max_page=3)
+        disabled = make_prefetcher(enabled=False)
+
+        # 실행 및 검증 (Act & Assert)
+        assert prefetcher.schedule("a", 2, result_for(2))
+        assert not prefetcher.schedule("a", 2, result_for(2))
+        assert not prefetcher.schedule("b", 3, result_for(3))
+        assert not prefetcher.schedule("c", 4, result_for(4))
+        assert not disabled.schedule("a", 2, result_for(2))
+        assert prefetcher.stats()["dropped"] == 1
+        prefetcher.clear()
+
+    @pytest.mark.asyncio
+    async def test_overload_cancels_in_flight_prefetch(self):
+        """과부하가 되면 새 예약을 거절하고 실행 중인 프리패치를 취소"""
+        # 준비 (Arrange)
+        overloaded = False
+        prefetcher = make_prefetcher(is_overloaded=lambda: overloaded)
+        started = asyncio.Event()
+
+        async def slow_fetch(db):
+            started.set()
+            await asyncio.sleep(10)
+
+        prefetcher.schedule("slow", 2, slow_fetch)
+        await started.wait()
+
+        # 실행 (Act)
+        overloaded = True
+        accepted = prefetcher.schedule("other", 2, result_for(2))
+        result = await prefetcher.get("slow")
+
+        # 검증 (Assert)
+        assert not accepted
+        assert result is None
+        assert prefetcher.stats()["cancelled"] == 1
+        assert prefetcher.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_timed_out_or_cancelled_prefetch_invalidates_connection(self):
+        """기한 초과나 취소로 중단된 프리패치는 세션 연결을 풀에 돌려보내지 않고 무효화"""
+        # 준비 (Arrange)
+        sessions = []
+
+        @asynccontextmanager
+        async def recording_session():
+            db = MagicMock()
+            db.invalidate = AsyncMock()
+            sessions.append(db)
+            yield db
+
+        timed_out = make_prefetcher(timeout_seconds=0.01)
+        timed_out.configure(recording_session)
+        cancelled = make_prefetcher()
+        cancelled.configure(recording_session)
+        started = asyncio.Event()
+
+        async def slow_fetch(db):
+            started.set()
+            await asyncio.sleep(10)
+
+        # 실행 (Act)
+        timed_out.schedule("key", 2, slow_fetch)
+        timed_out_result = await timed_out.get("key")
+        started.clear()
+        cancelled.schedule("key", 2, slow_fetch)
+        await started.wait()
+        cancelled.clear()
+        await asyncio.sleep(0.01)
+
+        # 검증 (Assert)
+        assert timed_out_result is None
+        assert timed_out.stats()["failed"] == 1
+        assert [db.invalidate.await_count for db in sessions] == [1, 1]
+
+    @pytest.mark.asyncio
+    async def test_request_waits_for_in_flight_prefetch(self):
+        """프리패치가 실행 중이면 새로 검색하지 않고 완료를 기다림"""
+        # 준비 (Arrange)
+        prefetcher = make_prefetcher()
+        release = asyncio.Event()
+
+        async def fetch(db):
+            await release.wait()
+            return {"page": 2}
+
+        prefetcher.schedule("key", 2, fetch)
+
+        # 실행 (Act)
+        waiter = asyncio.ensure_future(prefetcher.get("key"))
+        await asyncio.sleep(0)
+        release.set()
+
+        # 검증 (Assert)
+        assert await waiter == {"page": 2}
+
+
+class TestServicePrefetch:
+    """검색 서비스의 다음 페이지 프리패치 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_next_page_is_served_from_prefetch(self, mock_db_session, sample_trademark_orm):
+        """1페이지 응답 후 2페이지를 미리 검색하고, 2페이지 요청은 리포지토리를 거치지 않음"""
+        # 준비 (Arrange)
+        prefetcher = make_prefetcher()
+        searched_pages = []
+
+        async def search(repository, params):
+            searched_pages.append(params.page)
+            return [sample_trademark_orm], 25
+
+        with patch.object(trademark_service, "page_prefetcher", prefetcher), \
+                patch.object(TrademarkRepository, "search", search):
+            service = TrademarkService(mock_db_session)
+
+            # 실행 (Act)
+            first = await service.search_trademarks(SearchParams(keyword="테스트", page=1, size=10))
+            await asyncio.gather(*prefetcher._in_flight.values())
+            second = await service.search_trademarks(SearchParams(keyword="테스트", page=2, size=10))
+            await asyncio.gather(*prefetcher._in_flight.values())
+            last = await service.search_trademarks(SearchParams(keyword="테스트", page=3, size=10))
+
+        # 검증 (Assert)
+        assert first["page"] == 1 and second["page"] == 2 and last["page"] == 3
+        # 1페이지 검색, 2/3페이지는 프리패치, 마지막 페이지 뒤로는 예약하지 않음
+        assert searched_pages == [1, 2, 3]
+        assert prefetcher.stats()["hits"] == 2
+        assert prefetcher.stats()["in_flight"] == 0
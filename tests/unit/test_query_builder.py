@@ -6,8 +6,13 @@ from datetime import datetime
 from sqlalchemy import select, and_, or_, case
 from sqlalchemy.sql import ClauseElement
 
-from app.services.trademark_service import TrademarkQueryBuilder
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.db.base import Base
+from app.services.trademark_service import TrademarkQueryBuilder, statement_cache
 from app.models.trademark import TradeMark
+from app.models.trademark_vienna_code import TrademarkViennaCode
+from app.utils.vienna import InvalidViennaCode
 
 
 class TestTrademarkQueryBuilder:
@@ -112,6 +117,14 @@ class TestTrademarkQueryBuilder:
         assert result is builder
         assert len(builder.filters) == 1
     
+    def test_with_sub_code_escapes_like_wildcards(self):
+        """유사군 코드의 %, _는 인덱스 경로와 같이 문자 그대로 비교"""
+        # 실행 (Act)
+        builder = TrademarkQueryBuilder().with_sub_code("g03_1")
+
+        # 검증 (Assert)
+        assert builder.params["sub_code_pattern"] == '%"G03\\_1"%'
+    
     def test_with_pagination(self):
         """페이지네이션 적용 테스트"""
         # 준비 (Arrange)
@@ -161,4 +174,175 @@ class TestTrademarkQueryBuilder:
         
         # 검증 (Assert)
         assert isinstance(stmt, ClauseElement)
-        # 빌드된 쿼리는 단순 select 문이어야 함 
\ No newline at end of file
+        # 빌드된 쿼리는 단순 select 문이어야 함
+    
+    def test_build_reuses_cached_statement(self):
+        """같은 필터 조합은 같은 문장 객체를 재사용하는지 테스트"""
+        # 준비 (Arrange)
+        first = TrademarkQueryBuilder().with_keyword("가").with_status("등록")
+        second = TrademarkQueryBuilder().with_keyword("나").with_status("거절")
+        
+        # 실행 (Act)
+        first_stmt = first.build()
+        second_stmt = second.build()
+        
+        # 검증 (Assert)
+        assert first_stmt is second_stmt
+        assert first.params == {"keyword_pattern": "%가%", "status": "등록"}
+        assert second.params == {"keyword_pattern": "%나%", "status": "거절"}
+    
+    def test_build_different_shapes_are_cached_separately(self):
+        """필터 조합이 다르면 다른 문장인지 테스트"""
+        # 실행 (Act)
+        keyword_stmt = TrademarkQueryBuilder().with_keyword("가").build()
+        status_stmt = TrademarkQueryBuilder().with_status("등록").build()
+        paged_stmt = TrademarkQueryBuilder().with_status("등록").with_pagination(1, 10).build()
+        
+        # 검증 (Assert)
+        assert keyword_stmt is not status_stmt
+        assert status_stmt is not paged_stmt
+    
+    def test_build_counts_cache_hits(self):
+        """캐시 적중 횟수 집계 테스트"""
+        # 준비 (Arrange)
+        statement_cache.clear()
+        
+        # 실행 (Act)
+        for page in range(1, 4):
+            TrademarkQueryBuilder().with_status("등록").with_pagination(page, 10).build()
+        
+        # 검증 (Assert)
+        stats = statement_cache.stats()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 2
+    
+    def test_pagination_uses_bound_parameters(self):
+        """페이지네이션 값이 바인드 파라미터로 전달되는지 테스트"""
+        # 실행 (Act)
+        builder = TrademarkQueryBuilder().with_pagination(3, 20)
+        
+        # 검증 (Assert)
+        assert builder.params == {"offset": 40, "limit": 20}
+    
+    @pytest.mark.parametrize("name", ["FRESCA", "Fresca", "FRES CA", "ＦＲＥＳ-ＣＡ"])
+    def test_with_name_normalizes_query(self, name):
+        """표기가 다른 상표명이 같은 정규화 값으로 검색되는지 테스트"""
+        # 실행 (Act)
+        builder = TrademarkQueryBuilder().with_name(name, "exact")
+        
+        # 검증 (Assert)
+        assert builder.params == {"name_normalized": "fresca"}
+        assert "productNameNorm" in str(builder.build())
+    
+    def test_with_name_prefix_strips_wildcards(self):
+        """검색어의 LIKE 와일드카드는 정규화로 제거되고 일치 방식별 패턴 사용"""
+        # 실행 (Act)
+        prefix = TrademarkQueryBuilder().with_name("Fres_%", "prefix")
+        contains = TrademarkQueryBuilder().with_name("Fres_%", None)
+        
+        # 검증 (Assert)
+        assert prefix.params == {"name_pattern": "fres%"}
+        assert contains.params == {"name_pattern": "%fres%"}
+        assert prefix.cache_key() != contains.cache_key()
+    
+    def test_with_name_ignores_punctuation_only_query(self):
+        """정규화 후 빈 검색어는 필터를 추가하지 않음"""
+        # 실행 (Act)
+        builder = TrademarkQueryBuilder().with_name(" - ", "exact")
+        
+        # 검증 (Assert)
+        assert builder.filters == []
+    
+    def test_with_vienna_code_prefix_ranges(self):
+        """깊이가 다른 비엔나 코드를 정규화해 코드 범위 파라미터로 변환"""
+        # 실행 (Act)
+        builder = TrademarkQueryBuilder().with_vienna_code(["01.01", "26,260111"])
+        
+        # 검증 (Assert)
+        assert builder.params == {
+            "vienna_from0": "0101", "vienna_to0": "0102",
+            "vienna_from1": "26", "vienna_to1": "27",
+            "vienna_from2": "260111", "vienna_to2": "260112",
+        }
+        assert builder.filter_shapes == [("vienna_code", 3)]
+        assert "trademark_vienna_codes" in str(builder.build())
+    
+    @pytest.mark.asyncio
+    async def test_with_vienna_code_prefix_ending_in_nine(self):
+        """9로 끝나는 접두 코드는 자리올림한 숫자 코드를 끝으로, 모두 9면 끝 없는 구간으로 탐색"""
+        # 준비 (Arrange)
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        rows = {"1": ["010915"], "2": ["011001"], "3": ["019901"], "4": ["020101"], "5": ["990101"]}
+        async with async_sessionmaker(engine)() as session:
+            for number, codes in rows.items():
+                trademark = TradeMark(applicationNumber=number)
+                session.add(trademark)
+                session.add_all([TrademarkViennaCode(code=code, trademark=trademark) for code in codes])
+            await session.commit()
+
+            async def matched(codes):
+                builder = TrademarkQueryBuilder(use_cache=False).with_vienna_code(codes)
+                stmt = builder.build().with_only_columns(TradeMark.applicationNumber)
+                result = await session.execute(stmt, builder.params)
+                return builder, set(result.scalars().all())
+
+            # 실행 (Act)
+            ranges, _ = await matched(["01.09", "01.99", "99"])
+            division, division_matched = await matched(["01.09"])
+            _, carried = await matched(["01.99"])
+            _, top = await matched(["99"])
+        await engine.dispose()
+
+        # 검증 (Assert)
+        assert ranges.params == {
+            "vienna_from0": "0109", "vienna_to0": "0110",
+            "vienna_from1": "0199", "vienna_to1": "0200",
+            "vienna_from2": "99",
+        }
+        assert ranges.filter_shapes == [("vienna_code", 3, 2)]
+        assert division.filter_shapes == [("vienna_code", 1)]
+        assert division_matched == {"1"}
+        assert carried == {"3"}
+        assert top == {"5"}
+
+    def test_with_vienna_code_invalid(self):
+        """자릿수가 맞지 않는 비엔나 코드는 InvalidViennaCode"""
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(InvalidViennaCode):
+            TrademarkQueryBuilder().with_vienna_code(["01.1"])
+    
+    @pytest.mark.asyncio
+    async def test_with_vienna_code_matches_subcategories(self):
+        """대/중/소분류 접두 코드가 하위 분류 상표를 찾는지 테스트"""
+        # 준비 (Arrange)
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        rows = {"1": ["010103", "260111"], "2": ["010201"], "3": ["270915"], "4": []}
+        async with async_sessionmaker(engine)() as session:
+            for number, codes in rows.items():
+                trademark = TradeMark(applicationNumber=number)
+                session.add(trademark)
+                session.add_all([TrademarkViennaCode(code=code, trademark=trademark) for code in codes])
+            await session.commit()
+            
+            async def matched(codes):
+                builder = TrademarkQueryBuilder(use_cache=False).with_vienna_code(codes)
+                stmt = builder.build().with_only_columns(TradeMark.applicationNumber)
+                result = await session.execute(stmt, builder.params)
+                return set(result.scalars().all())
+            
+            # 실행 (Act)
+            category = await matched(["01"])
+            division = await matched(["01.01"])
+            section = await matched(["26.01.11"])
+            any_of = await matched(["01.02", "27"])
+        await engine.dispose()
+        
+        # 검증 (Assert)
+        assert category == {"1", "2"}
+        assert division == {"1"}
+        assert section == {"1"}
+        assert any_of == {"2", "3"}
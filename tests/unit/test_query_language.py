@@ -0,0 +1,167 @@
+"""검색식 파서 및 컴파일러 단위 테스트"""
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.db.base import Base
+from app.models.trademark import TradeMark
+from app.models.trademark_vienna_code import TrademarkViennaCode
+from app.services.query_language import (
+    And,
+    Not,
+    Or,
+    QuerySyntaxError,
+    Term,
+    compile_query,
+    parse_query,
+)
+from app.services.trademark_service import TrademarkQueryBuilder, statement_cache
+from app.utils.name_normalization import normalize_name
+from app.utils.vienna import normalize_vienna_code
+
+
+class TestParseQuery:
+    """검색식 구문 분석 테스트"""
+
+    def test_operators_and_implicit_and(self):
+        """AND/NOT 연산자와 연산자 없는 나열을 AND로 해석"""
+        # 실행 (Act)
+        node = parse_query('name:"프레스*" AND class:30 NOT status:거절')
+
+        # 검증 (Assert)
+        assert node == And((
+            Term("name", "프레스*", phrase=True),
+            Term("class", "30"),
+            Not(Term("status", "거절")),
+        ))
+
+    def test_or_binds_looser_than_and(self):
+        """OR는 AND보다 우선순위가 낮고 괄호로 묶을 수 있음"""
+        # 실행 (Act)
+        flat = parse_query("a b OR c")
+        grouped = parse_query("a (b OR c)")
+
+        # 검증 (Assert)
+        assert flat == Or((And((Term("name", "a"), Term("name", "b"))), Term("name", "c")))
+        assert grouped == And((Term("name", "a"), Or((Term("name", "b"), Term("name", "c")))))
+
+    @pytest.mark.parametrize("query", [
+        "",
+        "(a",
+        "a)",
+        "foo:bar",
+        "status:",
+        "a AND",
+        "OR a",
+        "date:2020-01",
+        "date:20201340",
+        "date:..",
+        "vienna:1",
+    ])
+    def test_invalid_queries(self, query):
+        """잘못된 검색식은 QuerySyntaxError"""
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(QuerySyntaxError):
+            compile_query(query)
+
+
+class TestCompileQuery:
+    """검색식 컴파일 테스트"""
+
+    def test_same_structure_shares_shape(self):
+        """값만 다른 검색식은 같은 형태(문장 캐시 키)를 가짐"""
+        # 실행 (Act)
+        _, first_params, first_shape = compile_query("name:프레* class:30 NOT status:거절")
+        _, second_params, second_shape = compile_query("name:구글* class:09 NOT status:등록")
+        _, _, other_shape = compile_query("name:구글 class:09 NOT status:등록")
+
+        # 검증 (Assert)
+        assert first_shape == second_shape
+        assert first_shape != other_shape
+        assert first_params != second_params
+
+    def test_builder_reuses_statement_for_same_shape(self):
+        """구조가 같은 검색식은 캐시된 문장을 재사용"""
+        # 준비 (Arrange)
+        statement_cache.clear()
+
+        # 실행 (Act)
+        first = TrademarkQueryBuilder().with_query("class:30 NOT status:거절").build()
+        second = TrademarkQueryBuilder().with_query("class:09 NOT status:등록").build()
+
+        # 검증 (Assert)
+        assert first is second
+
+    def test_date_bounds(self):
+        """연도/월/범위 표기를 구간으로 변환"""
+        # 실행 (Act)
+        _, year_params, _ = compile_query("date:2020")
+        _, month_params, _ = compile_query("date:202002")
+        _, open_params, open_shape = compile_query("date:20200115..")
+
+        # 검증 (Assert)
+        assert list(year_params.values()) == [date(2020, 1, 1), date(2020, 12, 31)]
+        assert list(month_params.values()) == [date(2020, 2, 1), date(2020, 2, 29)]
+        assert list(open_params.values()) == [date(2020, 1, 15)]
+        assert open_shape == ("date", True, False)
+
+
+class TestQueryEvaluation:
+    """검색식을 실제 DB에서 한 번에 평가하는 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("query, expected", [
+        ('name:"프레스*" AND class:30 NOT status:거절', {"1"}),
+        ('name:"프레스카"', {"1"}),
+        ("eng:fres*", {"1", "2"}),
+        ("fresca OR google", {"1", "3"}),
+        ("class:3*", {"1", "2", "4"}),
+        # %, _는 와일드카드가 아닌 문자 그대로 비교
+        ("class:3_", set()),
+        ("class:%*", set()),
+        ("vienna:01.01", {"3"}),
+        ("vienna:02", {"3"}),
+        ("vienna:01.02", set()),
+        ("NOT status:등록", {"2", "4"}),
+        ("date:2020..2021 NOT class:09", {"2"}),
+    ])
+    async def test_query_results(self, query, expected):
+        """검색식 조건 조합의 결과 검증"""
+        # 준비 (Arrange)
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        rows = [
+            ("1", "프레스카", "FRESCA", "등록", date(1995, 11, 17), ["30"], None),
+            ("2", "프레스토", "Fresto", "거절", date(2020, 3, 1), ["30", "31"], None),
+            ("3", None, "GOOGLE", "등록", date(2021, 6, 1), ["09"], ["01.01.05", "02.03.01"]),
+            ("4", "상표", None, None, None, ["35"], None),
+        ]
+        async with session_factory() as session:
+            for number, name, name_eng, status, application_date, classes, vienna in rows:
+                trademark = TradeMark(
+                    applicationNumber=number, productName=name, productNameEng=name_eng,
+                    productNameNorm=normalize_name(name), productNameEngNorm=normalize_name(name_eng),
+                    registerStatus=status, applicationDate=application_date,
+                    asignProductMainCodeList=classes, viennaCodeList=vienna
+                )
+                session.add(trademark)
+                session.add_all([
+                    TrademarkViennaCode(code=normalize_vienna_code(code), trademark=trademark)
+                    for code in vienna or []
+                ])
+            await session.commit()
+
+            # 실행 (Act)
+            builder = TrademarkQueryBuilder(use_cache=False).with_query(query)
+            stmt = builder.build().with_only_columns(TradeMark.applicationNumber)
+            result = await session.execute(stmt, builder.params)
+            matched = set(result.scalars().all())
+
+        await engine.dispose()
+
+        # 검증 (Assert)
+        assert matched == expected
@@ -0,0 +1,107 @@
+"""SlowQueryMonitor 단위 테스트"""
+import time
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from app.db.query_monitor import SlowQueryMonitor, normalize_sql
+
+
+class TestNormalizeSql:
+    """normalize_sql 함수 테스트"""
+
+    def test_replaces_literals_and_whitespace(self):
+        """리터럴 치환 및 공백 압축 테스트"""
+        # 실행 (Act)
+        result = normalize_sql("SELECT *\n  FROM t WHERE a = 'x' AND b = 10")
+
+        # 검증 (Assert)
+        assert result == "SELECT * FROM t WHERE a = ? AND b = ?"
+
+    def test_collapses_in_list(self):
+        """IN 목록 압축 테스트"""
+        # 실행 (Act)
+        result = normalize_sql("SELECT * FROM t WHERE id IN (?, ?, ?)")
+
+        # 검증 (Assert)
+        assert result == "SELECT * FROM t WHERE id IN (...)"
+
+
+class TestSlowQueryMonitor:
+    """SlowQueryMonitor 클래스 테스트"""
+
+    @pytest.fixture
+    def engine(self):
+        """이벤트 리스너를 붙일 동기 SQLite 엔진"""
+        engine = create_engine("sqlite://")
+        yield engine
+        engine.dispose()
+
+    def test_records_statements_over_threshold(self, engine):
+        """임계값 이상 문장 기록 테스트"""
+        # 준비 (Arrange)
+        monitor = SlowQueryMonitor(threshold_ms=0)
+        monitor.attach(engine)
+
+        # 실행 (Act)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :value"), {"value": 1})
+
+        # 검증 (Assert)
+        records = monitor.snapshot()
+        assert monitor.total_statements == 1
+        assert monitor.slow_statements == 1
+        assert records[0]["statement"] == "SELECT ?"
+        assert records[0]["explain"] is None
+
+    def test_ignores_fast_statements(self, engine):
+        """임계값 미만 문장 무시 테스트"""
+        # 준비 (Arrange)
+        monitor = SlowQueryMonitor(threshold_ms=10_000)
+        monitor.attach(engine)
+
+        # 실행 (Act)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        # 검증 (Assert)
+        assert monitor.total_statements == 1
+        assert monitor.snapshot() == []
+
+    def test_captures_explain(self, engine):
+        """EXPLAIN 수집 테스트"""
+        # 준비 (Arrange)
+        monitor = SlowQueryMonitor(threshold_ms=0, capture_explain=True)
+        monitor.attach(engine)
+
+        # 실행 (Act)
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        # 검증 (Assert)
+        records = monitor.snapshot()
+        assert records[0]["explain"]
+
+    def test_keeps_only_worst_statements(self):
+        """링 버퍼가 가장 느린 N개만 유지하는지 테스트"""
+        # 준비 (Arrange)
+        monitor = SlowQueryMonitor(threshold_ms=0, buffer_size=2)
+
+        # 실행 (Act)
+        for elapsed in (5.0, 1.0, 9.0, 3.0):
+            monitor._after_cursor_execute(
+                _FakeConnection(elapsed), None, f"SELECT {elapsed}", (), None, False
+            )
+
+        # 검증 (Assert)
+        records = monitor.snapshot()
+        assert monitor.slow_statements == 4
+        assert len(records) == 2
+        assert records[0]["elapsed_ms"] >= records[1]["elapsed_ms"]
+
+
+class _FakeConnection:
+    """지정한 시간만큼 걸린 것처럼 보이게 하는 연결 대역"""
+
+    def __init__(self, elapsed_seconds: float):
+        self.info = {"query_start_time": [time.perf_counter() - elapsed_seconds]}
@@ -0,0 +1,169 @@
+"""QueryPlanner 및 컬럼 통계 단위 테스트"""
+from datetime import date
+
+import pytest
+from sqlalchemy.dialects import mysql
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.db.base import Base
+from app.models.trademark import TradeMark
+from app.services.query_planner import (
+    ColumnStatistics,
+    QueryPlanner,
+    refresh_column_statistics,
+    load_column_statistics,
+)
+from app.services.trademark_service import SearchParams, TrademarkQueryBuilder
+
+
+@pytest.fixture
+def statistics():
+    """등록 상태가 편중되고 출원일이 넓게 분포한 통계"""
+    return ColumnStatistics(
+        total_rows=1000,
+        status_counts={"등록": 600, "거절": 300, "출원": 100},
+        year_histogram={2019: 400, 2020: 400, 2021: 200},
+        class_counts={"30": 50, "09": 500},
+    )
+
+
+class TestColumnStatistics:
+    """ColumnStatistics 선택도 추정 테스트"""
+
+    def test_status_selectivity(self, statistics):
+        """상태 값 빈도 기반 선택도 테스트"""
+        # 검증 (Assert)
+        assert statistics.status_selectivity("등록") == 0.6
+        assert statistics.status_selectivity("없는상태") == 0.0
+
+    def test_date_range_selectivity(self, statistics):
+        """연도 히스토그램 기반 날짜 범위 선택도 테스트"""
+        # 실행 (Act)
+        full_year = statistics.date_range_selectivity(date(2021, 1, 1), date(2021, 12, 31))
+        one_month = statistics.date_range_selectivity(date(2020, 1, 1), date(2020, 1, 31))
+
+        # 검증 (Assert)
+        assert full_year == pytest.approx(0.2)
+        assert one_month == pytest.approx(0.4 * 31 / 366)
+
+    def test_product_code_selectivity_follows_substring_match(self, statistics):
+        """검색 필터와 같이 코드 부분 일치로 추정 (일치하는 모든 코드의 빈도 합, 상한 1)"""
+        # 준비 (Arrange)
+        crowded = ColumnStatistics(total_rows=10, class_counts={"30": 8, "03": 6})
+
+        # 실행 및 검증 (Act & Assert)
+        assert statistics.product_code_selectivity("30") == pytest.approx(0.05)
+        assert statistics.product_code_selectivity("0") == pytest.approx(0.55)
+        assert statistics.product_code_selectivity("99") == 0.0
+        assert crowded.product_code_selectivity("3") == 1.0
+
+
+class TestQueryPlanner:
+    """QueryPlanner 클래스 테스트"""
+
+    def test_prefers_narrow_date_range_over_status(self, statistics):
+        """좁은 날짜 범위가 상태 인덱스보다 우선 선택되는지 테스트"""
+        # 준비 (Arrange)
+        params = SearchParams(
+            status="등록",
+            application_date_from="20200101",
+            application_date_to="20200115"
+        )
+
+        # 실행 (Act)
+        plan = QueryPlanner(statistics).plan(params)
+
+        # 검증 (Assert)
+        assert plan.driving_index == "ix_trademarks_applicationDate"
+        assert plan.filter_order == ["application_date", "status"]
+
+    def test_no_hint_when_filters_not_selective(self, statistics):
+        """선택도가 낮으면 인덱스를 강제하지 않는지 테스트"""
+        # 실행 (Act)
+        plan = QueryPlanner(statistics).plan(SearchParams(status="등록"))
+
+        # 검증 (Assert)
+        assert plan.driving_index is None
+        assert plan.filter_order == ["status"]
+
+    @pytest.mark.parametrize("extra", [
+        {"vienna_code": ["0301"]},
+        {"sub_code": "G0301"},
+        {"q": "class:30"},
+    ])
+    def test_unestimated_filter_is_left_to_optimizer(self, statistics, extra):
+        """선택도를 추정하지 않는 필터가 있으면 선택적인 상태라도 인덱스를 강제하지 않음"""
+        # 실행 (Act)
+        plan = QueryPlanner(statistics).plan(SearchParams(status="출원", **extra))
+
+        # 검증 (Assert)
+        assert plan.filter_order == ["status"]
+        assert plan.driving_index is None
+
+    def test_exact_name_match_is_left_to_optimizer(self, statistics):
+        """정규화 상표명 완전 일치가 있으면 상태 인덱스를 강제하지 않음"""
+        # 준비 (Arrange)
+        params = SearchParams(status="출원", name="FRESCA", name_match="exact")
+
+        # 실행 (Act)
+        plan = QueryPlanner(statistics).plan(params)
+
+        # 검증 (Assert)
+        assert plan.filter_order[0] == "name"
+        assert plan.driving_index is None
+
+    def test_builder_renders_mysql_index_hint(self, statistics):
+        """실행 계획이 MySQL 인덱스 힌트로 렌더링되는지 테스트"""
+        # 준비 (Arrange)
+        params = SearchParams(status="출원", keyword="테스트")
+        plan = QueryPlanner(statistics).plan(params)
+
+        # 실행 (Act)
+        stmt = (TrademarkQueryBuilder()
+            .with_keyword(params.keyword)
+            .with_status(params.status)
+            .with_plan(plan)
+            .build()
+        )
+
+        # 검증 (Assert)
+        sql = str(stmt.compile(dialect=mysql.dialect()))
+        assert "USE INDEX (ix_trademarks_registerStatus)" in sql
+        # 선택도가 높은 상태 필터가 키워드 필터보다 먼저 적용
+        assert sql.index("registerStatus") < sql.index("LIKE")
+
+
+class TestColumnStatisticsPersistence:
+    """컬럼 통계 계산 및 저장 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_refresh_and_load(self):
+        """적재된 데이터로 통계를 계산하고 다시 읽을 수 있는지 테스트"""
+        # 준비 (Arrange)
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async with session_factory() as session:
+            session.add_all([
+                TradeMark(applicationNumber="1", registerStatus="등록",
+                          applicationDate=date(2020, 5, 1), asignProductMainCodeList=["30", "09"]),
+                TradeMark(applicationNumber="2", registerStatus="등록",
+                          applicationDate=date(2021, 5, 1), asignProductMainCodeList=["30"]),
+                TradeMark(applicationNumber="3", registerStatus=None,
+                          applicationDate=None, asignProductMainCodeList=None),
+            ])
+            await session.commit()
+
+            # 실행 (Act)
+            await refresh_column_statistics(session)
+            loaded = await load_column_statistics(session)
+
+        await engine.dispose()
+
+        # 검증 (Assert)
+        assert loaded.total_rows == 3
+        assert loaded.status_counts["등록"] == 2
+        assert loaded.year_histogram == {2020: 1, 2021: 1}
+        assert loaded.class_counts == {"30": 2, "09": 1}
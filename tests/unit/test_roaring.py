@@ -0,0 +1,106 @@
+"""롤링 압축 비트맵 단위 테스트"""
+import random
+from array import array
+
+import pytest
+
+from app.search_index.roaring import ARRAY_MAX_SIZE, RoaringBitmap, union_all
+
+
+def make_sets():
+    """희소 구간(배열 컨테이너)과 밀집 구간(비트맵 컨테이너)이 섞인 두 집합"""
+    generator = random.Random(7)
+    first = set(generator.sample(range(200_000), 3_000)) | set(range(70_000, 80_000))
+    second = set(generator.sample(range(200_000), 3_000)) | set(range(75_000, 140_000))
+    return first, second
+
+
+class TestRoaringBitmap:
+    """집합 연산 결과가 파이썬 집합과 같은지 검증"""
+
+    @pytest.mark.parametrize("operation", ["and", "or", "sub"])
+    def test_set_operations(self, operation):
+        """AND/OR/AND NOT이 집합 연산과 같은 결과"""
+        # 준비 (Arrange)
+        first, second = make_sets()
+        left, right = RoaringBitmap.from_sorted(sorted(first)), RoaringBitmap.from_sorted(sorted(second))
+
+        # 실행 (Act)
+        result = {"and": left & right, "or": left | right, "sub": left - right}[operation]
+        expected = {"and": first & second, "or": first | second, "sub": first - second}[operation]
+
+        # 검증 (Assert)
+        assert list(result) == sorted(expected)
+        assert len(result) == len(expected)
+
+    def test_flip_within_universe(self):
+        """보수는 [0, universe) 범위 안에서 계산"""
+        # 준비 (Arrange)
+        first, _ = make_sets()
+        bitmap = RoaringBitmap.from_sorted(sorted(first))
+
+        # 실행 (Act)
+        flipped = bitmap.flip(150_000)
+
+        # 검증 (Assert)
+        assert list(flipped) == sorted(set(range(150_000)) - first)
+
+    def test_range_and_membership(self):
+        """연속 구간은 컨테이너 경계를 넘어도 정확히 생성"""
+        # 실행 (Act)
+        bitmap = RoaringBitmap.from_range(65_530, 131_080)
+
+        # 검증 (Assert)
+        assert len(bitmap) == 131_080 - 65_530
+        assert bitmap.keys == [0, 1, 2]
+        assert 65_530 in bitmap and 131_079 in bitmap
+        assert 65_529 not in bitmap and 131_080 not in bitmap
+        assert not RoaringBitmap.from_range(5, 5)
+
+    def test_container_kind_follows_cardinality(self):
+        """원소가 적으면 배열, 많으면 비트맵 컨테이너로 바뀌고 연산 후에도 다시 맞춰짐"""
+        # 준비 (Arrange)
+        dense = RoaringBitmap.from_range(0, ARRAY_MAX_SIZE + 1)
+        sparse = RoaringBitmap.from_sorted(range(0, ARRAY_MAX_SIZE * 2, 2))
+
+        # 실행 (Act)
+        narrowed = dense & RoaringBitmap.from_range(0, 10)
+
+        # 검증 (Assert)
+        assert isinstance(dense.containers[0], int)
+        assert isinstance(sparse.containers[0], array)
+        assert isinstance(narrowed.containers[0], array)
+        assert isinstance((sparse | RoaringBitmap.from_sorted(range(1, ARRAY_MAX_SIZE * 2, 2))).containers[0], int)
+
+    def test_select_pages_in_order(self):
+        """offset/limit 선택은 정렬 목록의 슬라이스와 같음"""
+        # 준비 (Arrange)
+        first, _ = make_sets()
+        bitmap = RoaringBitmap.from_sorted(sorted(first))
+        expected = sorted(first)
+
+        # 검증 (Assert)
+        for offset in (0, 9, 2_000, 12_000, len(expected) - 3, len(expected) + 5):
+            assert bitmap.select(offset, 10) == expected[offset:offset + 10]
+
+    def test_serialize_round_trip(self):
+        """직렬화 후 memoryview에서 복원해도 같은 비트맵"""
+        # 준비 (Arrange)
+        first, second = make_sets()
+        bitmap = RoaringBitmap.from_sorted(sorted(first | second))
+
+        # 실행 (Act)
+        restored = RoaringBitmap.deserialize(memoryview(bitmap.serialize()))
+
+        # 검증 (Assert)
+        assert restored == bitmap
+        assert RoaringBitmap.deserialize(RoaringBitmap().serialize()) == RoaringBitmap()
+
+    def test_union_all(self):
+        """여러 비트맵의 합집합 (입력이 없으면 빈 비트맵)"""
+        # 실행 (Act)
+        result = union_all([RoaringBitmap.from_sorted([1, 5]), RoaringBitmap.from_sorted([3, 70_000])])
+
+        # 검증 (Assert)
+        assert list(result) == [1, 3, 5, 70_000]
+        assert not union_all([])
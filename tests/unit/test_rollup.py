@@ -0,0 +1,102 @@
+"""집계 테이블 단위 테스트"""
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.db.base import Base
+from app.models.trademark_rollup import TrademarkRollup
+from app.routers.trademark_routes import get_statistics_api
+from app.services.rollup import ALL_CLASSES, RollupAccumulator, query_rollups, rollup_keys
+
+
+RECORDS = [
+    {"registerStatus": "등록", "applicationDate": "2020-01-01", "asignProductMainCodeList": ["30", "09"]},
+    {"registerStatus": "등록", "applicationDate": "2020-06-01", "asignProductMainCodeList": ["30"]},
+    {"registerStatus": "거절", "applicationDate": "2021-03-01", "asignProductMainCodeList": ["09"]},
+    {"registerStatus": None, "applicationDate": None, "asignProductMainCodeList": None},
+]
+
+
+@pytest_asyncio.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        yield db
+    await engine.dispose()
+
+
+async def load(db, records):
+    accumulator = RollupAccumulator()
+    for record in records:
+        accumulator.add(record)
+    await accumulator.apply(db)
+    await db.commit()
+
+
+class TestRollupKeys:
+    """집계 키 추출 테스트"""
+
+    def test_keys_per_class_plus_total(self):
+        """분류별 키와 분류 무관 전체 키를 생성"""
+        # 실행 (Act)
+        keys = rollup_keys(RECORDS[0])
+
+        # 검증 (Assert)
+        assert keys == [("등록", ALL_CLASSES, 2020), ("등록", "09", 2020), ("등록", "30", 2020)]
+
+    def test_missing_values(self):
+        """값이 없으면 빈 문자열/0으로 집계"""
+        # 검증 (Assert)
+        assert rollup_keys(RECORDS[3]) == [("", ALL_CLASSES, 0), ("", "", 0)]
+
+
+class TestRollupQueries:
+    """집계 테이블 갱신 및 조회 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_incremental_apply_adds_to_existing_rows(self, session):
+        """두 번 적재하면 기존 행에 건수를 더함"""
+        # 실행 (Act)
+        await load(session, RECORDS)
+        await load(session, RECORDS[:1])
+
+        # 검증 (Assert)
+        rows = (await session.execute(select(func.count()).select_from(TrademarkRollup))).scalar_one()
+        items = await query_rollups(session, ["status"], status="등록")
+        assert rows == 7
+        assert items == [{"status": "등록", "count": 3}]
+
+    @pytest.mark.asyncio
+    async def test_group_by_without_class_does_not_double_count(self, session):
+        """여러 분류를 가진 상표도 분류 무관 집계에서는 한 번만 계산"""
+        # 준비 (Arrange)
+        await load(session, RECORDS)
+
+        # 실행 (Act)
+        by_status = await query_rollups(session, ["status"])
+        by_class = await query_rollups(session, ["class"], year_from=2020, year_to=2020)
+        total = await query_rollups(session, [])
+
+        # 검증 (Assert)
+        assert by_status == [
+            {"status": None, "count": 1},
+            {"status": "거절", "count": 1},
+            {"status": "등록", "count": 2},
+        ]
+        assert by_class == [{"class": "09", "count": 1}, {"class": "30", "count": 2}]
+        assert total == [{"count": 4}]
+
+    @pytest.mark.asyncio
+    async def test_statistics_api_rejects_unknown_dimension(self, mock_db_session, make_request):
+        """알 수 없는 집계 기준은 400"""
+        # 실행 및 검증 (Act & Assert)
+        with pytest.raises(HTTPException) as excinfo:
+            await get_statistics_api(
+                request=make_request(), response=Response(), group_by="status,owner",
+                status=None, product_code=None, year_from=None, year_to=None, db=mock_db_session
+            )
+        assert excinfo.value.status_code == 400
@@ -1,17 +1,19 @@
 """라우터 단위 테스트"""
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import HTTPException
+from datetime import datetime
+from fastapi import HTTPException, Response
 
 from app.routers.trademark_routes import search_trademarks_api, get_trademark_api
 from app.services.trademark_service import SearchParams, TrademarkService
+from app.services.dataset_version import dataset_version_cache, DatasetVersionInfo
 
 
 class TestTrademarkRoutes:
     """상표 라우터 테스트"""
     
     @pytest.mark.asyncio
-    async def test_search_trademarks_api(self, mock_db_session):
+    async def test_search_trademarks_api(self, mock_db_session, make_request):
         """상표 검색 API 테스트"""
         # 준비 (Arrange)
         expected_result = {
@@ -31,11 +33,18 @@ class TestTrademarkRoutes:
             
             # 실행 (Act)
             result = await search_trademarks_api(
+                request=make_request(),
+                response=Response(),
                 keyword="테스트",
                 status="등록",
                 application_date_from="20200101",
                 application_date_to="20201231",
                 product_code="G01",
+                sub_code=None,
+                name=None,
+                name_match=None,
+                q=None,
+                vienna_code=None,
                 page=1,
                 size=10,
                 db=mock_db_session
@@ -51,7 +60,7 @@ class TestTrademarkRoutes:
             assert result == expected_result
     
     @pytest.mark.asyncio
-    async def test_search_trademarks_api_error(self, mock_db_session):
+    async def test_search_trademarks_api_error(self, mock_db_session, make_request):
         """상표 검색 API 오류 처리 테스트"""
         # 준비 (Arrange)
         # 예외 발생 상황 시뮬레이션
@@ -64,6 +73,8 @@ class TestTrademarkRoutes:
             # 실행 및 검증 (Act & Assert)
             with pytest.raises(HTTPException) as excinfo:
                 await search_trademarks_api(
+                    request=make_request(),
+                    response=Response(),
                     keyword="테스트",
                     db=mock_db_session
                 )
@@ -73,7 +84,7 @@ class TestTrademarkRoutes:
             assert "내부 서버 오류" in excinfo.value.detail
     
     @pytest.mark.asyncio
-    async def test_get_trademark_api(self, mock_db_session, sample_trademark_data):
+    async def test_get_trademark_api(self, mock_db_session, sample_trademark_data, make_request):
         """출원번호로 상표 조회 API 테스트"""
         # 준비 (Arrange)
         app_number = "4020200012345"
@@ -87,6 +98,8 @@ class TestTrademarkRoutes:
             
             # 실행 (Act)
             result = await get_trademark_api(
+                request=make_request(),
+                response=Response(),
                 application_number=app_number,
                 db=mock_db_session
             )
@@ -96,7 +109,7 @@ class TestTrademarkRoutes:
             assert result == sample_trademark_data
     
     @pytest.mark.asyncio
-    async def test_get_trademark_api_not_found(self, mock_db_session):
+    async def test_get_trademark_api_not_found(self, mock_db_session, make_request):
         """존재하지 않는 상표 조회 API 테스트"""
         # 준비 (Arrange)
         app_number = "9999999999999"
@@ -111,10 +124,135 @@ class TestTrademarkRoutes:
             # 실행 및 검증 (Act & Assert)
             with pytest.raises(HTTPException) as excinfo:
                 await get_trademark_api(
+                    request=make_request(),
+                    response=Response(),
                     application_number=app_number,
                     db=mock_db_session
                 )
             
             # 올바른 상태 코드로 예외가 발생했는지 확인
             assert excinfo.value.status_code == 404
-            assert app_number in excinfo.value.detail 
\ No newline at end of file
+            assert app_number in excinfo.value.detail
+
+
+class TestConditionalRequests:
+    """데이터셋 버전 기반 조건부 요청(ETag/304) 테스트"""
+    
+    @pytest.fixture(autouse=True)
+    def dataset_version(self):
+        """테스트 동안 현재 데이터셋 버전을 고정"""
+        previous = dataset_version_cache.current
+        dataset_version_cache.current = DatasetVersionInfo(
+            version="v1", loaded_at=datetime(2024, 1, 1, 9, 0, 0), row_count=1
+        )
+        yield dataset_version_cache.current
+        dataset_version_cache.current = previous
+    
+    @pytest.mark.asyncio
+    async def test_detail_sets_cache_headers(self, mock_db_session, sample_trademark_data, make_request):
+        """상세 조회 응답에 ETag/Last-Modified/Cache-Control이 설정되는지 테스트"""
+        # 준비 (Arrange)
+        response = Response()
+        
+        with patch.object(
+            TrademarkService,
+            'get_trademark_by_application_number',
+            return_value=sample_trademark_data
+        ):
+            # 실행 (Act)
+            await get_trademark_api(
+                request=make_request(),
+                response=response,
+                application_number="4020200012345",
+                db=mock_db_session
+            )
+        
+        # 검증 (Assert)
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Last-Modified"] == "Mon, 01 Jan 2024 09:00:00 GMT"
+        assert "max-age" in response.headers["Cache-Control"]
+    
+    @pytest.mark.asyncio
+    async def test_detail_returns_304_without_query(self, mock_db_session, make_request):
+        """If-None-Match가 일치하면 조회 없이 304를 반환하는지 테스트"""
+        # 준비 (Arrange)
+        first = Response()
+        with patch.object(
+            TrademarkService,
+            'get_trademark_by_application_number',
+            return_value={"id": 1}
+        ):
+            await get_trademark_api(
+                request=make_request(), response=first,
+                application_number="4020200012345", db=mock_db_session
+            )
+        etag = first.headers["ETag"]
+        
+        with patch.object(TrademarkService, 'get_trademark_by_application_number') as mock_get:
+            # 실행 (Act)
+            result = await get_trademark_api(
+                request=make_request({"If-None-Match": f"W/{etag}"}),
+                response=Response(),
+                application_number="4020200012345",
+                db=mock_db_session
+            )
+        
+            # 검증 (Assert)
+            mock_get.assert_not_called()
+        assert result.status_code == 304
+        assert result.headers["ETag"] == etag
+    
+    @pytest.mark.asyncio
+    async def test_search_returns_304_without_query(self, mock_db_session, make_request):
+        """검색도 ETag가 일치하면 검색 없이 304를 반환하는지 테스트"""
+        # 준비 (Arrange)
+        first = Response()
+        with patch.object(TrademarkService, 'search_trademarks', return_value={"items": []}):
+            await search_trademarks_api(
+                request=make_request(), response=first,
+                keyword="테스트", status=None, application_date_from=None,
+                application_date_to=None, product_code=None, sub_code=None, name=None, name_match=None, q=None, vienna_code=None, page=1, size=10,
+                db=mock_db_session
+            )
+        etag = first.headers["ETag"]
+        
+        with patch.object(TrademarkService, 'search_trademarks') as mock_search:
+            # 실행 (Act)
+            result = await search_trademarks_api(
+                request=make_request({"If-None-Match": etag}), response=Response(),
+                keyword="테스트", status=None, application_date_from=None,
+                application_date_to=None, product_code=None, sub_code=None, name=None, name_match=None, q=None, vienna_code=None, page=1, size=10,
+                db=mock_db_session
+            )
+        
+            # 검증 (Assert)
+            mock_search.assert_not_called()
+        assert result.status_code == 304
+        # 협상된 200 응답과 같은 Vary (다른 표현의 캐시 사본을 갱신하지 않도록)
+        assert result.headers["Vary"] == first.headers["Vary"] == "Accept, Accept-Encoding"
+    
+    @pytest.mark.asyncio
+    async def test_new_dataset_version_changes_etag(self, mock_db_session, make_request):
+        """데이터셋 버전이 바뀌면 ETag도 바뀌는지 테스트"""
+        # 준비 (Arrange)
+        responses = []
+        with patch.object(
+            TrademarkService,
+            'get_trademark_by_application_number',
+            return_value={"id": 1}
+        ):
+            for version in ("v1", "v2"):
+                dataset_version_cache.current = DatasetVersionInfo(
+                    version=version, loaded_at=datetime(2024, 1, 1), row_count=1
+                )
+                response = Response()
+                
+                # 실행 (Act)
+                await get_trademark_api(
+                    request=make_request(), response=response,
+                    application_number="4020200012345", db=mock_db_session
+                )
+                responses.append(response)
+        
+        # 검증 (Assert)
+        assert responses[0].headers["ETag"] != responses[1].headers["ETag"]
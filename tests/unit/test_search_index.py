@@ -0,0 +1,363 @@
+"""공유 검색 인덱스 단위 테스트"""
+import asyncio
+from contextlib import nullcontext
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.search_index import shared
+from app.search_index.builder import IndexRow, build_index_bytes
+from app.search_index.index import SearchIndex
+from app.search_index.layout import FORMAT_VERSION, IndexFormatError, IndexReader
+from app.search_index.manager import IndexGeneration, SearchIndexManager
+from app.search_index.snapshot import open_snapshot, write_snapshot
+from app.services.trademark_service import SearchParams, TrademarkRepository
+
+
+ROWS = [
+    IndexRow(1, "테스트상표", "Test Mark", date(2020, 1, 1), "등록", ["G01", "G02"], ["G0301", "G0302"]),
+    IndexRow(2, "상표나라", "Mark Land", date(2021, 5, 3), "출원", ["G03"], ["G0301"]),
+    IndexRow(3, "마크클라우드", "MarkCloud", None, "등록", ["G01"], ["G030101"]),
+    IndexRow(4, "클라우드", None, date(2019, 12, 31), "거절", []),
+    IndexRow(5, "테스트", "test", date(2021, 5, 3), "등록", ["G10"]),
+]
+
+
+def reference_search(params: SearchParams):
+    """SQL 검색 조건을 그대로 옮긴 기준 구현"""
+    matched = []
+    for row in ROWS:
+        if params.keyword:
+            keyword = params.keyword.lower()
+            names = [(row.product_name or "").lower(), (row.product_name_eng or "").lower()]
+            if not any(keyword in name for name in names):
+                continue
+        if params.status and row.register_status != params.status:
+            continue
+        if params.application_date_from:
+            if row.application_date is None or row.application_date.strftime("%Y%m%d") < params.application_date_from:
+                continue
+        if params.application_date_to:
+            if row.application_date is None or row.application_date.strftime("%Y%m%d") > params.application_date_to:
+                continue
+        if params.product_code and not any(params.product_code.lower() in code.lower() for code in row.main_codes):
+            continue
+        if params.sub_code and params.sub_code.upper() not in row.sub_codes:
+            continue
+        matched.append(row)
+    matched.sort(key=lambda row: (row.application_date is None, -(row.application_date.toordinal() if row.application_date else 0), row.id))
+    offset = (params.page - 1) * params.size
+    return [row.id for row in matched[offset:offset + params.size]], len(matched)
+
+
+@pytest.fixture
+def index():
+    return SearchIndex(build_index_bytes(ROWS, dataset_version="v1"))
+
+
+class TestSearchIndex:
+    """SearchIndex 검색 결과가 SQL 검색과 같은지 검증"""
+
+    @pytest.mark.parametrize("conditions", [
+        {},
+        {"keyword": "테스트"},
+        {"keyword": "MARK"},
+        {"keyword": "k"},
+        {"keyword": "없는상표"},
+        {"status": "등록"},
+        {"status": "등록", "keyword": "cloud"},
+        {"application_date_from": "20200101"},
+        {"application_date_to": "20201231"},
+        {"application_date_from": "20200102", "application_date_to": "20210503"},
+        {"product_code": "G0"},
+        {"product_code": "G1", "status": "등록"},
+        {"product_code": "g03"},
+        {"sub_code": "G0301"},
+        {"sub_code": "g0301", "status": "등록"},
+        {"sub_code": "G0301", "application_date_to": "20201231"},
+        {"sub_code": "G03"},
+        {"sub_code": "G030101", "keyword": "cloud"},
+        {"page": 2, "size": 2},
+        {"status": "등록", "page": 2, "size": 1},
+    ])
+    def test_matches_sql_semantics(self, index, conditions):
+        """조건 조합별로 기준 구현과 같은 결과 순서와 건수 반환"""
+        # 준비 (Arrange)
+        params = SearchParams(**conditions)
+
+        # 실행 (Act)
+        row_ids, total = index.search(params)
+
+        # 검증 (Assert)
+        assert (row_ids, total) == reference_search(params)
+
+    @pytest.mark.parametrize("conditions, expected", [
+        ({"q": "class:G01 NOT status:출원"}, [1, 3]),
+        ({"q": "NOT class:G0*"}, [5, 4]),
+        ({"q": "status:거절 OR class:G10"}, [5, 4]),
+        ({"q": "NOT (status:등록 OR status:출원)", "keyword": "클라우드"}, [4]),
+        ({"q": "NOT status:등록", "sub_code": "G0301"}, [2]),
+    ])
+    def test_query_with_not(self, index, conditions, expected):
+        """상태/분류 검색식은 비트맵의 AND/OR/NOT(전체 보수)으로 평가"""
+        # 준비 (Arrange)
+        params = SearchParams(**conditions)
+
+        # 실행 (Act)
+        row_ids, total = index.search(params)
+
+        # 검증 (Assert)
+        assert index.supports(params)
+        assert (row_ids, total) == (expected, len(expected))
+
+    @pytest.mark.parametrize("q", ["name:마크", "class:G01 OR date:2020", "(status:등록"])
+    def test_other_queries_use_sql_path(self, index, q):
+        """상표명/날짜/비엔나 조건이나 구문 오류가 있는 검색식은 SQL 경로에서 처리"""
+        # 실행 및 검증 (Act & Assert)
+        assert not index.supports(SearchParams(q=q))
+
+    def test_invalid_date_is_ignored(self, index):
+        """잘못된 날짜는 SQL 경로와 같이 필터를 적용하지 않음"""
+        # 실행 (Act)
+        row_ids, total = index.search(SearchParams(application_date_from="20201399"))
+
+        # 검증 (Assert)
+        assert total == len(ROWS)
+
+    def test_header_and_format_check(self, index):
+        """헤더의 데이터셋 버전을 읽고, 매직 값이 다르면 거부"""
+        # 검증 (Assert)
+        assert index.dataset_version == "v1"
+        assert index.row_count == len(ROWS)
+        with pytest.raises(IndexFormatError):
+            IndexReader(b"X" * 128)
+
+
+class TestSharedIndexSegment:
+    """공유 세그먼트 구축 및 연결 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_builds_once_and_reuses_matching_version(self, tmp_path):
+        """같은 데이터셋 버전의 세그먼트가 있으면 다시 구축하지 않고 매핑"""
+        # 준비 (Arrange)
+        path = str(tmp_path / "search.idx")
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock(return_value=MagicMock())
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+
+        # 실행 (Act)
+        with patch.object(shared, "fetch_index_rows", AsyncMock(return_value=ROWS)) as mock_fetch:
+            first = await shared.attach_shared_index(path, session_factory, "v1")
+            second = await shared.attach_shared_index(path, session_factory, "v1")
+            third = await shared.attach_shared_index(path, session_factory, "v2")
+
+        # 검증 (Assert)
+        assert mock_fetch.await_count == 2
+        assert first.dataset_version == "v1"
+        assert second.index.search(SearchParams(keyword="mark")) == first.index.search(SearchParams(keyword="mark"))
+        # 새 버전으로 파일이 교체되어도 이미 매핑한 세그먼트는 이전 내용을 유지
+        assert first.dataset_version == "v1"
+        assert third.dataset_version == "v2"
+        assert shared.read_segment_version(path) == "v2"
+        for segment in (first, second, third):
+            segment.close()
+
+    def test_read_segment_version_of_missing_or_corrupt_file(self, tmp_path):
+        """파일이 없거나 손상되었으면 버전 없음"""
+        # 준비 (Arrange)
+        corrupt = tmp_path / "corrupt.idx"
+        corrupt.write_bytes(b"garbage")
+
+        # 검증 (Assert)
+        assert shared.read_segment_version(str(tmp_path / "missing.idx")) is None
+        assert shared.read_segment_version(str(corrupt)) is None
+
+
+class TestRepositoryWithIndex:
+    """레포지토리가 인덱스 경로를 사용하는지 검증"""
+
+    @pytest.mark.asyncio
+    async def test_search_uses_index_and_keeps_order(self, mock_db_session, index):
+        """인덱스가 고른 ID 순서대로 행을 반환하고 건수 쿼리는 실행하지 않음"""
+        # 준비 (Arrange)
+        rows = []
+        for row_id in (1, 5, 3):
+            item = MagicMock()
+            item.id = row_id
+            rows.append(item)
+        mock_result = MagicMock()
+        mock_result.scalars.return_value.all.return_value = rows
+        mock_db_session.execute.return_value = mock_result
+        repo = TrademarkRepository(mock_db_session)
+
+        # 실행 (Act)
+        with patch.object(repo, "search_index", return_value=nullcontext(index)):
+            items, total = await repo.search(SearchParams(status="등록"))
+
+        # 검증 (Assert)
+        assert [item.id for item in items] == [5, 1, 3]
+        assert total == 3
+        mock_db_session.execute.assert_called_once()
+
+    @pytest.mark.parametrize("params, supported", [
+        (SearchParams(keyword="마크"), True),
+        (SearchParams(keyword="마크_1"), False),
+        (SearchParams(keyword="100%"), False),
+        (SearchParams(product_code="0_"), False),
+    ])
+    def test_like_wildcards_use_sql_path(self, index, params, supported):
+        """LIKE 와일드카드가 든 키워드/상품 분류 코드는 SQL 경로의 와일드카드 의미를 따름"""
+        # 실행 및 검증 (Act & Assert)
+        assert index.supports(params) is supported
+
+    def test_stale_index_is_not_used(self, index):
+        """인덱스 버전이 현재 데이터셋 버전과 다르면 사용하지 않음"""
+        # 준비 (Arrange)
+        manager = SearchIndexManager(path="unused", enabled=True)
+        manager.active = IndexGeneration(MagicMock(dataset_version="v1", index=index), 1, "snapshot")
+
+        # 검증 (Assert)
+        with manager.acquire("v1") as current:
+            assert current is index
+        with manager.acquire("v2") as current:
+            assert current is None
+        with manager.acquire(None) as current:
+            assert current is None
+
+
+class TestSnapshot:
+    """로더가 기록하는 버전 스냅숏 테스트"""
+
+    def test_open_matching_snapshot(self, tmp_path):
+        """데이터셋 버전이 같은 스냅숏은 재구축 없이 바로 매핑"""
+        # 준비 (Arrange)
+        path = str(tmp_path / "data" / "search.snapshot")
+        write_snapshot(path, ROWS, "v1")
+
+        # 실행 (Act)
+        segment = open_snapshot(path, "v1")
+
+        # 검증 (Assert)
+        assert segment is not None
+        assert segment.index.search(SearchParams(status="등록")) == reference_search(SearchParams(status="등록"))
+        segment.close()
+
+    def test_version_or_format_mismatch_returns_none(self, tmp_path):
+        """데이터셋 버전이나 포맷 버전이 다르면 스냅숏을 사용하지 않음"""
+        # 준비 (Arrange)
+        path = tmp_path / "search.snapshot"
+        write_snapshot(str(path), ROWS, "v1")
+        other_format = tmp_path / "other_format.snapshot"
+        data = bytearray(path.read_bytes())
+        data[8:12] = (FORMAT_VERSION + 1).to_bytes(4, "little")
+        other_format.write_bytes(bytes(data))
+
+        # 검증 (Assert)
+        assert open_snapshot(str(path), "v2") is None
+        assert open_snapshot(str(path), None) is None
+        assert open_snapshot(str(other_format), "v1") is None
+        assert open_snapshot(str(tmp_path / "missing.snapshot"), "v1") is None
+
+    @pytest.mark.asyncio
+    async def test_manager_prefers_snapshot_and_falls_back_to_rebuild(self, tmp_path):
+        """스냅숏이 맞으면 사용하고, 맞지 않으면 DB에서 다시 구축"""
+        # 준비 (Arrange)
+        snapshot_path = str(tmp_path / "search.snapshot")
+        write_snapshot(snapshot_path, ROWS, "v1")
+        rebuilt = MagicMock(dataset_version="v2")
+
+        # 실행 (Act)
+        with patch("app.search_index.manager.attach_shared_index", AsyncMock(return_value=rebuilt)) as mock_attach:
+            from_snapshot = SearchIndexManager(str(tmp_path / "shm.idx"), enabled=True, snapshot_path=snapshot_path)
+            await from_snapshot.start(MagicMock(), "v1")
+            from_rebuild = SearchIndexManager(str(tmp_path / "shm.idx"), enabled=True, snapshot_path=snapshot_path)
+            await from_rebuild.start(MagicMock(), "v2")
+
+        # 검증 (Assert)
+        assert from_snapshot.source == "snapshot"
+        assert from_rebuild.source == "rebuild"
+        assert from_rebuild.segment is rebuilt
+        mock_attach.assert_awaited_once()
+        from_snapshot.close()
+
+
+class TestIndexGenerations:
+    """이중 버퍼 세대 교체 테스트"""
+
+    @staticmethod
+    def make_manager(tmp_path):
+        manager = SearchIndexManager(str(tmp_path / "shm.idx"), enabled=True)
+        manager._session_factory = MagicMock()
+        return manager
+
+    @staticmethod
+    def segment(version):
+        return MagicMock(dataset_version=version, index=MagicMock(name=f"index-{version}"))
+
+    @pytest.mark.asyncio
+    async def test_in_flight_request_finishes_on_old_generation(self, tmp_path):
+        """교체 후에도 이전 세대를 사용 중인 요청이 끝날 때까지 닫지 않음"""
+        # 준비 (Arrange)
+        manager = self.make_manager(tmp_path)
+        old, new = self.segment("v1"), self.segment("v2")
+
+        with patch.object(manager, "_open_or_build", AsyncMock(side_effect=[(old, "rebuild"), (new, "rebuild")])):
+            await manager.start(manager._session_factory, "v1")
+
+            # 실행 (Act)
+            with manager.acquire("v1") as index:
+                await manager.reload("v2")
+                # 검증 (Assert)
+                assert index is old.index
+                assert manager.active.segment is new
+                old.close.assert_not_called()
+
+        old.close.assert_called_once()
+        with manager.acquire("v2") as index:
+            assert index is new.index
+        assert manager.stats()["generation"] == 2
+
+    @pytest.mark.asyncio
+    async def test_version_published_during_build_is_built_next(self, tmp_path):
+        """구축 중 새 버전이 발행되면 끝난 뒤 최신 버전으로 다시 구축"""
+        # 준비 (Arrange)
+        manager = self.make_manager(tmp_path)
+        release_first = asyncio.Event()
+        built = []
+
+        async def open_or_build(version):
+            if version == "v2":
+                await release_first.wait()
+            built.append(version)
+            return self.segment(version), "rebuild"
+
+        with patch.object(manager, "_open_or_build", side_effect=open_or_build):
+            # 실행 (Act)
+            manager.on_dataset_version(MagicMock(version="v2"))
+            await asyncio.sleep(0)
+            manager.on_dataset_version(MagicMock(version="v3"))
+            release_first.set()
+            await manager._build_task
+
+        # 검증 (Assert)
+        assert built == ["v2", "v3"]
+        assert manager.active.dataset_version == "v3"
+
+    @pytest.mark.asyncio
+    async def test_failed_build_keeps_previous_generation(self, tmp_path):
+        """구축에 실패하면 기존 세대를 유지"""
+        # 준비 (Arrange)
+        manager = self.make_manager(tmp_path)
+        old = self.segment("v1")
+
+        with patch.object(manager, "_open_or_build", AsyncMock(side_effect=[(old, "snapshot"), OSError("disk full")])):
+            await manager.start(manager._session_factory, "v1")
+
+            # 실행 (Act)
+            result = await manager.reload("v2")
+
+        # 검증 (Assert)
+        assert result is None
+        assert manager.active.segment is old
+        assert manager.reload_failures == 1
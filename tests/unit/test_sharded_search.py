@@ -0,0 +1,261 @@
+"""샤드 scatter-gather 검색 단위 테스트"""
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.base import Base
+from app.db.shards import ShardRegistry, parse_shard
+from app.models.trademark import TradeMark
+from app.services.trademark_service import (
+    ResultWindowExceeded,
+    SearchParams,
+    ShardedTrademarkRepository,
+    ShardsUnavailable,
+    TrademarkRepository,
+    _merge_order_key,
+)
+
+
+# (출원번호, 상표명, 출원일, 등록 상태, 샤드)
+MARKS = [
+    ("4020050000001", "테스트 하나", date(2005, 3, 1), "등록", "-2009"),
+    ("4020070000002", "테스트 둘", date(2007, 8, 15), "거절", "-2009"),
+    ("4020090000003", "마크 셋", date(2009, 12, 31), "등록", "-2009"),
+    ("4020100000004", "테스트 넷", date(2010, 1, 1), "등록", "2010-2015"),
+    ("4020120000005", "마크 다섯", date(2012, 6, 30), "출원", "2010-2015"),
+    ("4020150000006", "테스트 여섯", date(2015, 11, 2), "등록", "2010-2015"),
+    ("4020160000007", "테스트 일곱", date(2016, 2, 29), "등록", "2016-"),
+    ("4020200000008", "마크 여덟", date(2020, 7, 7), "실효", "2016-"),
+    ("4020230000009", "테스트 아홉", date(2023, 1, 9), "등록", "2016-"),
+    ("US0000000010", "테스트 열", date(2011, 4, 4), "등록", "US"),
+    ("US0000000011", "마크 열하나", date(2018, 9, 9), "등록", "US"),
+    ("US0000000012", "테스트 열둘", None, "출원", "US"),
+]
+SHARD_KEYS = ["-2009", "2010-2015", "2016-", "US"]
+
+
+def row(number, name, application_date, status):
+    return {
+        "applicationNumber": number,
+        "productName": name,
+        "applicationDate": application_date,
+        "registerStatus": status,
+    }
+
+
+async def make_engine(path, rows):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        if rows:
+            await conn.execute(insert(TradeMark), rows)
+    return engine
+
+
+@pytest_asyncio.fixture
+async def databases(tmp_path):
+    """샤드별 SQLite 파일과 같은 행을 모두 담은 단일 DB"""
+    engines = []
+    single = await make_engine(tmp_path / "single.db", [row(*mark[:4]) for mark in MARKS])
+    engines.append(single)
+    shards = []
+    for index, key in enumerate(SHARD_KEYS):
+        path = tmp_path / f"shard{index}.db"
+        engine = await make_engine(path, [row(*mark[:4]) for mark in MARKS if mark[4] == key])
+        engines.append(engine)
+        shard = parse_shard(f"{key}=sqlite+aiosqlite:///{path}")
+        shard.engine = engine
+        shard.session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        shards.append(shard)
+    yield async_sessionmaker(single, expire_on_commit=False), ShardRegistry(shards, timeout_ms=1000)
+    for engine in engines:
+        await engine.dispose()
+
+
+async def search_both(databases, params):
+    single_factory, registry = databases
+    async with single_factory() as db:
+        items, total = await TrademarkRepository(db).search(params)
+        expected = ([item.applicationNumber for item in items], total)
+    async with single_factory() as db:
+        repo = ShardedTrademarkRepository(db, registry)
+        items, total = await repo.search(params)
+    return ([item.applicationNumber for item in items], total), expected, repo
+
+
+class TestShardConfig:
+    """샤드 설정 해석 및 연도 조건 샤드 선택 테스트"""
+
+    def test_parse_year_and_jurisdiction_keys(self):
+        """연도 구간/단일 연도/관할 키 해석"""
+        # 실행 (Act)
+        closed = parse_shard("2010-2015=sqlite+aiosqlite:///a.db")
+        open_start = parse_shard("-2009=sqlite+aiosqlite:///b.db")
+        single_year = parse_shard("2024 = sqlite+aiosqlite:///c.db")
+        jurisdiction = parse_shard("US=mysql+aiomysql://user:pw@host/tm?charset=utf8mb4")
+
+        # 검증 (Assert)
+        assert (closed.year_from, closed.year_to) == (2010, 2015)
+        assert (open_start.year_from, open_start.year_to) == (None, 2009)
+        assert (single_year.year_from, single_year.year_to) == (2024, 2024)
+        assert not jurisdiction.by_year
+        assert jurisdiction.url.endswith("charset=utf8mb4")
+        with pytest.raises(ValueError):
+            parse_shard("no-url")
+
+    def test_select_prunes_year_shards(self):
+        """출원 연도 조건과 겹치지 않는 연도 샤드만 제외 (관할 샤드는 항상 포함)"""
+        # 준비 (Arrange)
+        registry = ShardRegistry([parse_shard(f"{key}=sqlite://") for key in SHARD_KEYS])
+
+        # 실행 및 검증 (Act & Assert)
+        assert [shard.name for shard in registry.select(2016, None)] == ["2016-", "US"]
+        assert [shard.name for shard in registry.select(None, 2009)] == ["-2009", "US"]
+        assert [shard.name for shard in registry.select(2012, 2013)] == ["2010-2015", "US"]
+        assert len(registry.select()) == len(SHARD_KEYS)
+
+
+class TestShardedSearch:
+    """샤드 병합 결과가 단일 DB 검색과 같은지 검증"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("conditions", [
+        {},
+        {"size": 5},
+        {"size": 5, "page": 2},
+        {"size": 5, "page": 3},
+        {"keyword": "테스트", "size": 3, "page": 2},
+        {"status": "등록"},
+        {"application_date_from": "20100101", "application_date_to": "20181231"},
+        {"application_date_from": "20160101", "size": 2, "page": 2},
+    ])
+    async def test_merged_pages_match_single_database(self, databases, conditions):
+        """출원일 순 k-way 병합 페이지와 건수 합이 단일 DB 결과와 같음"""
+        # 실행 (Act)
+        actual, expected, repo = await search_both(databases, SearchParams(**conditions))
+
+        # 검증 (Assert)
+        assert actual == expected
+        assert repo.skipped_shards == []
+
+    @pytest.mark.asyncio
+    async def test_date_filter_skips_other_year_shards(self, databases):
+        """출원일 조건과 겹치지 않는 연도 샤드에는 쿼리를 보내지 않음"""
+        # 준비 (Arrange)
+        single_factory, registry = databases
+        opened = []
+        for shard in registry.shards:
+            factory = shard.session_factory
+            shard.session_factory = lambda factory=factory, name=shard.name: opened.append(name) or factory()
+
+        # 실행 (Act)
+        async with single_factory() as db:
+            items, total = await ShardedTrademarkRepository(db, registry).search(
+                SearchParams(application_date_from="20160101")
+            )
+
+        # 검증 (Assert)
+        assert sorted(opened) == ["2016-", "US"]
+        assert total == 4
+
+    @pytest.mark.asyncio
+    async def test_page_beyond_result_window_rejected(self, databases):
+        """page × size가 SHARD_MAX_RESULT_WINDOW를 넘으면 샤드에 보내지 않고 ResultWindowExceeded"""
+        # 준비 (Arrange)
+        single_factory, registry = databases
+        registry.max_result_window = 10
+        opened = []
+        for shard in registry.shards:
+            factory = shard.session_factory
+            shard.session_factory = lambda factory=factory, name=shard.name: opened.append(name) or factory()
+
+        # 실행 (Act)
+        async with single_factory() as db:
+            repo = ShardedTrademarkRepository(db, registry)
+            last_page, _ = await repo.search(SearchParams(size=5, page=2))
+            opened_before = list(opened)
+            with pytest.raises(ResultWindowExceeded) as exc_info:
+                await repo.search(SearchParams(size=5, page=3))
+
+        # 검증 (Assert)
+        assert len(last_page) == 5
+        assert exc_info.value.window == 15
+        assert opened == opened_before
+
+    def test_merge_order_breaks_date_ties_by_id(self):
+        """출원일이 같은 행은 id 오름차순 (SQL 정렬과 같음)"""
+        # 준비 (Arrange)
+        rows = [
+            TradeMark(id=7, applicationDate=date(2020, 1, 1)),
+            TradeMark(id=3, applicationDate=None),
+            TradeMark(id=5, applicationDate=date(2020, 1, 1)),
+            TradeMark(id=9, applicationDate=date(2021, 1, 1)),
+            TradeMark(id=1, applicationDate=None),
+        ]
+
+        # 실행 (Act)
+        ordered = sorted(rows, key=_merge_order_key)
+
+        # 검증 (Assert)
+        assert [row.id for row in ordered] == [9, 5, 7, 1, 3]
+
+    @pytest.mark.asyncio
+    async def test_slow_shard_is_skipped(self, databases):
+        """기한 안에 응답하지 않은 샤드는 제외하고 나머지 결과와 제외 목록 반환"""
+        # 준비 (Arrange)
+        single_factory, registry = databases
+        registry.timeout_ms = 100
+        slow_engine = registry.shards[3].engine
+        original_search = TrademarkRepository.search
+
+        async def search(repository, params):
+            if repository.db.bind is slow_engine:
+                await asyncio.sleep(1)
+            return await original_search(repository, params)
+
+        # 실행 (Act)
+        with patch("app.services.trademark_service._ShardRepository.search", search):
+            async with single_factory() as db:
+                repo = ShardedTrademarkRepository(db, registry)
+                items, total = await repo.search(SearchParams(size=20))
+
+        # 검증 (Assert)
+        assert repo.skipped_shards == ["US"]
+        assert total == 9
+        assert not any(item.applicationNumber.startswith("US") for item in items)
+
+    @pytest.mark.asyncio
+    async def test_all_shards_failing_raises(self, databases, tmp_path):
+        """모든 샤드가 실패하면 ShardsUnavailable"""
+        # 준비 (Arrange)
+        single_factory, _ = databases
+        broken = parse_shard(f"KR=sqlite+aiosqlite:///{tmp_path}/missing/none.db")
+        registry = ShardRegistry([broken])
+        registry.connect()
+
+        # 실행 및 검증 (Act & Assert)
+        async with single_factory() as db:
+            with pytest.raises(ShardsUnavailable):
+                await ShardedTrademarkRepository(db, registry).search(SearchParams())
+        await registry.dispose()
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_application_number(self, databases):
+        """출원번호 조회는 모든 샤드에 보내 찾은 상표 반환"""
+        # 준비 (Arrange)
+        single_factory, registry = databases
+
+        # 실행 (Act)
+        async with single_factory() as db:
+            repo = ShardedTrademarkRepository(db, registry)
+            found = await repo.get_by_application_number("US0000000011")
+            missing = await repo.get_by_application_number("없는번호")
+
+        # 검증 (Assert)
+        assert found.productName == "마크 열하나"
+        assert missing is None
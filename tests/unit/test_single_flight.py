@@ -0,0 +1,184 @@
+"""SingleFlight 단위 테스트"""
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.services.single_flight import SingleFlight
+from app.services.trademark_service import SearchParams
+
+
+class TestSingleFlight:
+    """SingleFlight 클래스 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_calls(self):
+        """동시에 들어온 같은 키의 요청이 한 번만 실행되는지 테스트"""
+        # 준비 (Arrange)
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"total_count": 3}
+
+        # 실행 (Act)
+        results = await asyncio.gather(*[flight.do("key", work) for _ in range(5)])
+
+        # 검증 (Assert)
+        assert calls == 1
+        assert all(result == {"total_count": 3} for result in results)
+        assert flight.stats()["executions"] == 1
+        assert flight.stats()["coalesced"] == 4
+        assert flight.stats()["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """다른 키는 각각 실행되는지 테스트"""
+        # 준비 (Arrange)
+        flight = SingleFlight()
+
+        async def work(value):
+            await asyncio.sleep(0)
+            return value
+
+        # 실행 (Act)
+        results = await asyncio.gather(
+            flight.do("a", lambda: work(1)),
+            flight.do("b", lambda: work(2))
+        )
+
+        # 검증 (Assert)
+        assert results == [1, 2]
+        assert flight.stats()["coalesced"] == 0
+
+    @pytest.mark.asyncio
+    async def test_error_is_shared(self):
+        """리더의 예외가 대기 중인 요청에도 전달되는지 테스트"""
+        # 준비 (Arrange)
+        flight = SingleFlight()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("DB 오류")
+
+        # 실행 (Act)
+        results = await asyncio.gather(
+            flight.do("key", failing),
+            flight.do("key", failing),
+            return_exceptions=True
+        )
+
+        # 검증 (Assert)
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_does_not_affect_followers(self):
+        """리더 요청이 취소되어도 대기 요청은 결과를 받는지 테스트"""
+        # 준비 (Arrange)
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        leader = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+
+        # 실행 (Act)
+        leader.cancel()
+
+        # 검증 (Assert)
+        assert await follower == "done"
+
+
+def session_factory(sessions):
+    """flight 소유 세션 팩토리 (연 세션을 sessions에 기록)"""
+    @asynccontextmanager
+    async def factory():
+        db = MagicMock()
+        db.invalidate = AsyncMock()
+        sessions.append(db)
+        yield db
+    return factory
+
+
+class TestSingleFlightOwnedSession:
+    """flight 소유 세션으로 실행하는 do_in_session 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_leader_detaches_immediately(self):
+        """리더가 취소되면 공유 실행이 끝나기를 기다리지 않고 반환하고 대기자는 결과를 받음"""
+        # 준비 (Arrange)
+        sessions = []
+        flight = SingleFlight()
+        flight.configure(session_factory(sessions))
+        release = asyncio.Event()
+
+        async def work(db):
+            await release.wait()
+            return db
+
+        leader = asyncio.ensure_future(flight.do_in_session("key", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(flight.do_in_session("key", work))
+        await asyncio.sleep(0)
+
+        # 실행 (Act)
+        leader.cancel()
+        await asyncio.sleep(0)
+        detached = leader.done()
+        release.set()
+        result = await follower
+
+        # 검증 (Assert)
+        assert detached and leader.cancelled()
+        assert result is sessions[0]
+        sessions[0].invalidate.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_last_waiter_leaving_invalidates_connection(self):
+        """모든 대기자가 취소되면 실행을 취소하고 flight 세션의 연결을 무효화"""
+        # 준비 (Arrange)
+        sessions = []
+        flight = SingleFlight()
+        flight.configure(session_factory(sessions))
+
+        async def work(db):
+            await asyncio.sleep(10)
+
+        leader = asyncio.ensure_future(flight.do_in_session("key", work))
+        await asyncio.sleep(0)
+
+        # 실행 (Act)
+        leader.cancel()
+        await asyncio.gather(leader, return_exceptions=True)
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # 검증 (Assert)
+        sessions[0].invalidate.assert_awaited_once()
+        assert flight.stats()["cancelled"] == 1
+        assert flight.stats()["in_flight"] == 0
+
+
+class TestSearchParamsNormalizedKey:
+    """SearchParams.normalized_key 테스트"""
+
+    def test_empty_string_equals_none(self):
+        """빈 문자열 필터가 None과 같은 키를 갖는지 테스트"""
+        # 검증 (Assert)
+        assert (
+            SearchParams(keyword="", status="등록").normalized_key()
+            == SearchParams(status="등록").normalized_key()
+        )
+
+    def test_different_page_differs(self):
+        """페이지가 다르면 다른 키인지 테스트"""
+        # 검증 (Assert)
+        assert SearchParams(page=1).normalized_key() != SearchParams(page=2).normalized_key()